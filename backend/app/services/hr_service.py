@@ -3,6 +3,8 @@ from datetime import datetime
 import logging
 from typing import Dict, List, Optional
 
+from utils.employee_cache import employee_cache
+
 class HRService:
     """인사 관리 서비스 클래스
     
@@ -25,19 +27,14 @@ class HRService:
     def load_employee_data(self) -> pd.DataFrame:
         """직원 데이터 로드 및 전처리
         
+        직원 정보 캐시의 employees.csv 스냅샷(날짜 컬럼 변환 완료) 사본을 반환합니다.
+        파일이 바뀐 경우에만 다시 읽습니다.
+        
         Returns:
             pd.DataFrame: 처리된 직원 데이터
         """
         try:
-            df = pd.read_csv(self.config.EMPLOYEE_DATA)
-            
-            # 날짜 형식 변환
-            date_columns = ['join_date', 'birth', 'resignation_date']
-            for col in date_columns:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col])
-            
-            return df
+            return employee_cache.csv(self.config.EMPLOYEE_DATA).frame()
             
         except Exception as e:
             self.logger.error(f"직원 데이터 로드 실패: {str(e)}")
@@ -84,13 +81,13 @@ class HRService:
             Dict: 직원 상세 정보
         """
         try:
-            df = self.load_employee_data()
-            employee = df[df['employee_id'] == employee_id]
+            snapshot = employee_cache.csv(self.config.EMPLOYEE_DATA)
+            index = snapshot.index_of(employee_id)
             
-            if employee.empty:
+            if index is None:
                 return None
                 
-            return employee.iloc[0].to_dict()
+            return snapshot.frame((index,)).iloc[0].to_dict()
             
         except Exception as e:
             self.logger.error(f"직원 상세 정보 조회 실패: {str(e)}")
@@ -106,14 +103,14 @@ class HRService:
             List[Dict]: 검색 결과 직원 목록
         """
         try:
-            df = self.load_employee_data()
-            filtered_df = df.copy()
+            # 부서/직급 조건은 스냅샷 색인으로 적용
+            snapshot = employee_cache.csv(self.config.EMPLOYEE_DATA)
+            filtered_df = snapshot.frame(snapshot.positions(
+                department=query.get('department') or None,
+                position=query.get('position') or None,
+            ))
             
             # 검색 조건 적용
-            if query.get('department'):
-                filtered_df = filtered_df[filtered_df['department'] == query['department']]
-            if query.get('position'):
-                filtered_df = filtered_df[filtered_df['position'] == query['position']]
             if query.get('status'):
                 filtered_df = filtered_df[filtered_df['status'] == query['status']]
             if query.get('name'):
@@ -152,8 +149,9 @@ def update_employee(self, employee_id: str, update_data: Dict) -> Optional[Dict]
         # 데이터 업데이트
         df.loc[df['employee_id'] == employee_id, update_data.keys()] = update_data.values()
         
-        # 파일 저장
+        # 파일 저장 (직원 정보 캐시 무효화)
         df.to_csv(self.config.EMPLOYEE_DATA, index=False)
+        employee_cache.invalidate()
         
         # 업데이트된 직원 정보 반환
         updated_employee = df[df['employee_id'] == employee_id].iloc[0].to_dict()
@@ -1,45 +1,108 @@
 import pandas as pd
 import logging
+import multiprocessing
 import os
-import hashlib
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional
 import uuid
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 from config.database import get_db_session
 from models.models import (
     Payroll,
     PayrollAudit,
+    PayrollCalculationTrace,
     PayrollDocument,
     Attendance,
     AttendanceAudit,
-    Employee,
 )
 from utils.pay_calculator import PayCalculator
 from utils.insurance_calculator import InsuranceCalculator
+from utils.payroll_batch import (
+    iter_batch_values,
+    calculate_payroll_values,
+    employee_scalars,
+)
+from utils.attendance_diff import (
+    backfill_row_hashes,
+    clean_attendance_frame,
+    find_changed_rows,
+)
+from utils.attendance_tail import capture_tail_state, read_appended_rows
+from utils.attendance_upsert import frame_to_rows, upsert_attendance
+from utils.file_fingerprint import FileFingerprinter
+from utils.sync_scheduler import SyncScheduler
+from utils.partition_files import month_key
+from utils.payroll_summary import refresh_payroll_summary
+from utils.payroll_archive import PayrollArchive
+from utils.employee_cache import employee_cache
+from utils.payroll_trace import (
+    TRACE_ENCODING,
+    TRACE_FULL,
+    TRACE_NONE,
+    TRACE_SUMMARY,
+    build_summary,
+    build_trace,
+    decode_trace,
+    encode_trace,
+)
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 # 파일 시스템 감시 기능 위한 이벤트
 FILE_CHANGED_EVENT = threading.Event()
 
+# 금액 관련 급여 컬럼 (저장된 초안을 계산 결과 형식으로 반환할 때 사용)
+PAYROLL_AMOUNT_COLUMNS = [
+    "base_pay",
+    "overtime_pay",
+    "night_shift_pay",
+    "holiday_pay",
+    "total_allowances",
+    "gross_pay",
+    "income_tax",
+    "residence_tax",
+    "national_pension",
+    "health_insurance",
+    "long_term_care",
+    "employment_insurance",
+    "total_deductions",
+    "net_pay",
+]
+
+# 일괄 조회 시 IN 조건 하나에 넣는 최대 ID 수 (SQLite 바인드 변수 제한 고려)
+BATCH_QUERY_CHUNK_SIZE = 500
+
+
+def _chunked(items, size):
+    """리스트를 size 개씩 나누어 반환"""
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
 
 # 파일 시스템 이벤트 핸들러 정의
 class AttendanceFileHandler(FileSystemEventHandler):
     def __init__(self, service):
         self.service = service
 
+    def _notify(self, event, path):
+        # 동기화는 스케줄러 작업 스레드에서 실행 (watchdog 스레드를 막지 않음)
+        if not event.is_directory and path == self.service.attendance_file_path:
+            self.service.sync_scheduler.notify()
+
     def on_modified(self, event):
-        if (
-            not event.is_directory
-            and event.src_path == self.service.attendance_file_path
-        ):
-            self.service.logger.info(f"파일 변경 감지: {event.src_path}")
-            sync_result = self.service.sync_attendance_if_changed()
-            if sync_result:
-                self.service._notify_change_event()
+        self._notify(event, event.src_path)
+
+    def on_created(self, event):
+        self._notify(event, event.src_path)
+
+    def on_moved(self, event):
+        # 임시 파일 작성 후 os.replace 로 교체하는 저장 방식
+        self._notify(event, event.dest_path)
 
 
 class PayrollService:
@@ -48,10 +111,13 @@ class PayrollService:
     급여 계산, 수당 계산, 세금 계산 등 급여 관련 모든 비즈니스 로직을 처리합니다.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, watch_files=None):
         """
         Args:
             config: 애플리케이션 설정 객체
+            watch_files (bool): 근태 파일 감시(watchdog)와 동기화 스케줄러 시작 여부.
+                None 이면 급여 계산 작업자 프로세스(multiprocessing 자식)가 아닐 때만
+                시작합니다 (spawn 작업자가 서버 모듈을 다시 import 하는 경우).
         """
         self.config = config
         self.setup_logging()
@@ -63,6 +129,9 @@ class PayrollService:
             "data",
             "attendance.csv",
         )
+        # 파일 감시 스레드와 요청 스레드가 같은 변경을 중복 처리하지 않도록 보호
+        self._file_check_lock = threading.Lock()
+        self._attendance_sync_lock = threading.Lock()
         # 타임스탬프 및 해시값 초기화
         self.attendance_file_last_modified = self._get_attendance_file_modified_time()
         self.attendance_file_hash = self._calculate_file_hash()
@@ -73,10 +142,69 @@ class PayrollService:
         # 웹소켓 이벤트 핸들러 리스트
         self.change_event_handlers = []
 
+        # 마지막 근태 동기화에서 변경된 (employee_id, date) 집합
+        self.last_attendance_changes = set()
+
+        # 파일 변경 이벤트를 모아 전용 작업 스레드에서 동기화하는 스케줄러
+        self.sync_scheduler = SyncScheduler(
+            self.attendance_file_path,
+            self.sync_attendance_if_changed,
+            on_synced=self._notify_change_event,
+            quiet_seconds=getattr(config, "ATTENDANCE_SYNC_QUIET_SECONDS", 0.5),
+            max_wait_seconds=getattr(config, "ATTENDANCE_SYNC_MAX_WAIT_SECONDS", 5.0),
+            queue_size=getattr(config, "ATTENDANCE_SYNC_QUEUE_SIZE", 4),
+            logger=self.logger,
+        )
+
         # Watchdog Observer 설정
         self.observer = None
         self.event_handler = None
-        self.start_file_watcher()
+        if watch_files is None:
+            watch_files = multiprocessing.parent_process() is None
+        if watch_files:
+            self.start_file_watcher()
+
+    @property
+    def attendance_file_path(self):
+        """감시 중인 근태 파일 경로"""
+        return self._attendance_file_path
+
+    @attendance_file_path.setter
+    def attendance_file_path(self, path):
+        # 파일 지문 계산기 (stat 이 바뀌지 않으면 파일을 다시 읽지 않음)
+        self._attendance_file_path = path
+        self.attendance_fingerprinter = FileFingerprinter(path)
+        # 마지막으로 DB 에 반영한 CSV 위치와 앞부분 해시 (추가분 읽기용)
+        self.attendance_tail_state = None
+        if getattr(self, "sync_scheduler", None) is not None:
+            self.sync_scheduler.path = path
+
+    @contextmanager
+    def attendance_self_write(self):
+        """서버가 근태 파일을 직접 쓰는 구간
+
+        쓰기 세대 토큰을 발급해 쓰기 중과 쓰기 직후의 파일 이벤트로 다시 동기화하지
+        않게 하고, 쓴 내용은 DB 와 같으므로 현재 해시와 추가분 읽기 위치로 기록합니다.
+        """
+        token = self.sync_scheduler.begin_self_write()
+        try:
+            yield token
+        finally:
+            try:
+                self._accept_attendance_file()
+            finally:
+                self.sync_scheduler.end_self_write(token)
+
+    def _accept_attendance_file(self):
+        """현재 근태 파일을 DB 와 동기화된 상태로 기록"""
+        with self._file_check_lock:
+            fingerprint = self.attendance_fingerprinter.fingerprint()
+            self.attendance_file_hash = fingerprint["digest"]
+            self.attendance_file_last_modified = fingerprint["mtime_ns"] / 1e9
+        try:
+            self.attendance_tail_state = capture_tail_state(self.attendance_file_path)
+        except OSError:
+            self.attendance_tail_state = None
 
     def setup_logging(self):
         """로깅 설정"""
@@ -98,13 +226,13 @@ class PayrollService:
             return 0
 
     def _calculate_file_hash(self) -> str:
-        """파일 내용의 해시값 계산하여 반환합니다."""
-        try:
-            if not os.path.exists(self.attendance_file_path):
-                return ""
+        """파일 내용의 해시값을 반환합니다.
 
-            with open(self.attendance_file_path, "rb") as f:
-                return hashlib.md5(f.read()).hexdigest()
+        stat 정보(크기, 수정 시간, inode)가 바뀌지 않았으면 캐시된 값을 반환하고,
+        바뀐 경우에만 파일을 청크 단위로 읽어 해시합니다.
+        """
+        try:
+            return self.attendance_fingerprinter.digest()
         except Exception as e:
             self.logger.error(f"파일 해시 계산 오류: {str(e)}")
             return ""
@@ -112,28 +240,33 @@ class PayrollService:
     def check_attendance_file_changed(self) -> bool:
         """근태 파일이 변경되었는지 확인합니다.
 
-        내용 기반(해시값)과 타임스탬프 두 가지 방식으로 검사합니다.
+        파일 지문(stat 빠른 경로 + 내용 해시)으로 검사하므로, 변경이 없을 때는
+        stat 호출만 하고 파일을 읽지 않습니다. 수정 시간만 바뀌고 내용이 같으면
+        변경으로 보지 않습니다.
 
         Returns:
             bool: 파일이 변경되었으면 True, 그렇지 않으면 False
         """
-        # 현재 수정 시간 및 해시값 확인
-        current_modified_time = self._get_attendance_file_modified_time()
-        current_hash = self._calculate_file_hash()
+        try:
+            fingerprint = self.attendance_fingerprinter.fingerprint()
+        except Exception as e:
+            self.logger.error(f"파일 지문 확인 오류: {str(e)}")
+            return False
 
-        # 변경 여부 확인 (시간 또는 해시값 변경)
-        time_changed = current_modified_time > self.attendance_file_last_modified
-        content_changed = current_hash != self.attendance_file_hash
+        current_modified_time = fingerprint["mtime_ns"] / 1e9
+        current_hash = fingerprint["digest"]
+        with self._file_check_lock:
+            if current_hash == self.attendance_file_hash:
+                self.attendance_file_last_modified = current_modified_time
+                return False
 
-        if time_changed or content_changed:
-            self.logger.info(
-                f"근태 파일 변경 감지: 수정시간 변경={time_changed}, 내용 변경={content_changed}"
-            )
             self.logger.info(
-                f"이전 정보: 시간={self.attendance_file_last_modified}, 해시={self.attendance_file_hash}"
+                f"근태 파일 변경 감지: 이전 정보: 시간={self.attendance_file_last_modified}, "
+                f"해시={self.attendance_file_hash}"
             )
             self.logger.info(
-                f"현재 정보: 시간={current_modified_time}, 해시={current_hash}"
+                f"현재 정보: 시간={current_modified_time}, 해시={current_hash} "
+                f"({fingerprint['algorithm']}, {fingerprint['size']} bytes)"
             )
 
             # 상태 업데이트
@@ -141,8 +274,6 @@ class PayrollService:
             self.attendance_file_hash = current_hash
             return True
 
-        return False
-
     def sync_attendance_if_changed(self) -> bool:
         """근태 파일이 변경되었는지 확인하고, 변경되었으면 데이터베이스를 동기화합니다.
         변경된 데이터만 선택적으로 업데이트하여 성능을 향상시킵니다.
@@ -151,77 +282,210 @@ class PayrollService:
         Returns:
             bool: 동기화 되었으면 True, 그렇지 않으면 False
         """
-        # 파일 변경 확인 (해시값 비교)
-        if not self.check_attendance_file_changed():
-            return False
+        # 스케줄러 작업 스레드와 요청 스레드의 동기화를 한 번에 하나씩 실행
+        with self._attendance_sync_lock:
+            # 파일 변경 확인 (해시값 비교)
+            if not self.check_attendance_file_changed():
+                return False
 
-        self.logger.info("근태 파일 변경 감지: 데이터베이스 선택적 동기화 시작")
-        try:
-            # CSV 파일 데이터 로드
-            csv_data = self._load_csv_data()
-            if not csv_data:
-                self.logger.warning("CSV 파일에서 로드된 데이터가 없습니다.")
+            self.logger.info("근태 파일 변경 감지: 데이터베이스 선택적 동기화 시작")
+            try:
+                if getattr(self.config, "ATTENDANCE_DIFF_MODE", "hash") == "full":
+                    changes = self._sync_attendance_full_diff()
+                else:
+                    changes = self._sync_attendance_hash_diff()
+                if not changes:
+                    return False
+
+                # 영향받는 초안 급여만 재계산 표시
+                self.last_attendance_changes = changes
+                self.mark_payrolls_stale(changes)
+
+                return True
+
+            except Exception as e:
+                self.logger.error(f"근태 데이터 선택적 동기화 오류: {str(e)}")
                 return False
 
-            # 데이터베이스 데이터 로드
-            db_data = self._load_db_attendance_data()
+    def _sync_attendance_hash_diff(self):
+        """저장된 내용 해시와 키 순서 병합 비교 후 신규/변경 행만 UPSERT
+
+        DB 에서는 (employee_id, date, row_hash) 투영만 스트리밍 조회하므로
+        ORM 객체를 만들지 않고, 비교 후 보관하는 데이터는 변경 행뿐입니다.
+        이전 동기화 이후 파일 끝에 행이 추가되기만 했으면 추가분만 반영합니다.
+
+        Returns:
+            set: 변경된 근태 기록의 (employee_id, date) 집합
+        """
+        if getattr(self.config, "ATTENDANCE_TAIL_INGEST", True):
+            tail = self._read_attendance_tail()
+            if tail is not None:
+                return self._sync_attendance_tail(tail)
 
-            # 변경된 기록 감지 및 업데이트
-            updates, inserts, unchanged = self._detect_attendance_changes(
-                csv_data, db_data
+        # 비교 시작 전 위치를 기록 (비교 중 추가된 행은 다음 추가분 읽기에서 반영)
+        try:
+            tail_state = capture_tail_state(self.attendance_file_path)
+        except OSError as e:
+            self.logger.warning(f"근태 파일 위치 기록 실패: {str(e)}")
+            tail_state = None
+
+        df = self._load_csv_frame()
+        if df is None or df.empty:
+            self.logger.warning("CSV 파일에서 로드된 데이터가 없습니다.")
+            return set()
+
+        changes = self._sync_attendance_frame(df)
+        self.attendance_tail_state = tail_state
+        return changes
+
+    def _read_attendance_tail(self):
+        """이전 동기화 이후 추가된 근태 행 읽기 (전체 비교가 필요하면 None)"""
+        if self.attendance_tail_state is None:
+            return None
+        try:
+            tail = read_appended_rows(
+                self.attendance_file_path,
+                self.attendance_tail_state,
+                encoding=self._attendance_csv_encoding(),
             )
+        except Exception as e:
+            self.logger.warning(
+                f"근태 파일 추가분 읽기 오류, 전체 비교로 전환: {str(e)}"
+            )
+            return None
+        if tail is None:
+            self.logger.info("근태 파일 앞부분이 변경되어 전체 비교를 수행합니다.")
+        return tail
+
+    def _sync_attendance_tail(self, tail):
+        """근태 파일 추가분만 UPSERT
+
+        Returns:
+            set: 변경된 근태 기록의 (employee_id, date) 집합
+        """
+        df = clean_attendance_frame(tail["frame"])
+        self.logger.info(
+            f"근태 파일 추가분 {tail['bytes']} bytes, {len(df)}개 행을 반영합니다."
+        )
+        changes = set()
+        if not df.empty:
+            session = get_db_session()
+            try:
+                backfill_row_hashes(session)
+                result = upsert_attendance(session, frame_to_rows(df))
+                session.commit()
+                self.logger.info(
+                    f"{result['updated']}개 기록 업데이트, {result['inserted']}개 기록 새로 추가됨"
+                )
+                changes = result["changes"]
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        self.attendance_tail_state = tail["state"]
+        return changes
+
+    def _sync_attendance_frame(self, df):
+        """전체 CSV DataFrame 을 DB 와 해시 비교 후 신규/변경 행만 UPSERT
+
+        Returns:
+            set: 변경된 근태 기록의 (employee_id, date) 집합
+        """
+        session = get_db_session()
+        try:
+            backfilled = backfill_row_hashes(session)
+            if backfilled:
+                self.logger.info(f"근태 기록 {backfilled}건의 내용 해시를 채웠습니다.")
 
+            diff = find_changed_rows(session, df)
             self.logger.info(
-                f"변경 감지 결과: 업데이트={len(updates)}, 삽입={len(inserts)}, 변경없음={len(unchanged)}"
+                f"변경 감지 결과: 업데이트={diff['updated']}, 삽입={diff['inserted']}, "
+                f"변경없음={diff['unchanged']}, 형식오류={diff['skipped']}"
             )
-
-            # 변경 사항이 없으면 종료
-            if not updates and not inserts:
+            if not diff["rows"]:
+                session.commit()
                 self.logger.info("변경된 근태 기록이 없습니다.")
-                return False
+                return set()
+
+            result = upsert_attendance(session, diff["rows"])
+            session.commit()
+            self.logger.info(
+                f"{result['updated']}개 기록 업데이트, {result['inserted']}개 기록 새로 추가됨"
+            )
+            return result["changes"]
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
-            # 변경 사항을 데이터베이스에 반영
-            self._apply_attendance_changes(updates, inserts)
+    def _sync_attendance_full_diff(self):
+        """모든 근태 기록을 불러와 필드별로 비교하는 이전 방식 (ATTENDANCE_DIFF_MODE=full)
 
-            return True
+        Returns:
+            set: 변경된 근태 기록의 (employee_id, date) 집합
+        """
+        # CSV 파일 데이터 로드
+        csv_data = self._load_csv_data()
+        if not csv_data:
+            self.logger.warning("CSV 파일에서 로드된 데이터가 없습니다.")
+            return set()
 
-        except Exception as e:
-            self.logger.error(f"근태 데이터 선택적 동기화 오류: {str(e)}")
-            return False
+        # 데이터베이스 데이터 로드
+        db_data = self._load_db_attendance_data()
 
-    def _load_csv_data(self) -> List[Dict]:
-        """CSV 파일에서 근태 데이터 로드"""
+        # 변경된 기록 감지 및 업데이트
+        updates, inserts, unchanged = self._detect_attendance_changes(csv_data, db_data)
+
+        self.logger.info(
+            f"변경 감지 결과: 업데이트={len(updates)}, 삽입={len(inserts)}, 변경없음={len(unchanged)}"
+        )
+
+        # 변경 사항이 없으면 종료
+        if not updates and not inserts:
+            self.logger.info("변경된 근태 기록이 없습니다.")
+            return set()
+
+        # 변경 사항을 데이터베이스에 반영
+        return self._apply_attendance_changes(updates, inserts)
+
+    def _load_csv_frame(self) -> Optional[pd.DataFrame]:
+        """CSV 파일에서 근태 데이터를 전처리된 DataFrame 으로 로드"""
         try:
             if not os.path.exists(self.attendance_file_path):
                 self.logger.error(
                     f"근태 파일이 존재하지 않습니다: {self.attendance_file_path}"
                 )
-                return []
+                return None
 
             df = pd.read_csv(
-                self.attendance_file_path, encoding="utf-8", on_bad_lines="warn"
+                self.attendance_file_path,
+                encoding=self._attendance_csv_encoding(),
+                on_bad_lines="warn",
             )
 
             # 데이터 전처리
-            df["check_in"] = df["check_in"].fillna("").astype(str).str.strip()
-            df["check_out"] = df["check_out"].fillna("").astype(str).str.strip()
-            df["attendance_type"] = (
-                df["attendance_type"].fillna("정상").astype(str).str.strip()
-            )
-            df["date"] = df["date"].fillna("").astype(str).str.strip()
-            if "remarks" not in df.columns:
-                df["remarks"] = ""
-            else:
-                df["remarks"] = df["remarks"].fillna("").astype(str).str.strip()
+            df = clean_attendance_frame(df)
 
-            # 딕셔너리 리스트로 변환
-            data = df.to_dict("records")
-            self.logger.info(f"CSV 파일에서 {len(data)}개의 근태 기록을 로드했습니다.")
-            return data
+            self.logger.info(f"CSV 파일에서 {len(df)}개의 근태 기록을 로드했습니다.")
+            return df
 
         except Exception as e:
             self.logger.error(f"CSV 파일 로드 오류: {str(e)}")
+            return None
+
+    def _attendance_csv_encoding(self):
+        """근태 CSV 인코딩 (DB → CSV 내보내기와 같은 설정)"""
+        return getattr(self.config, "ATTENDANCE_CSV_ENCODING", "utf-8")
+
+    def _load_csv_data(self) -> List[Dict]:
+        """CSV 파일에서 근태 데이터 로드"""
+        df = self._load_csv_frame()
+        if df is None:
             return []
+        # 딕셔너리 리스트로 변환
+        return df.to_dict("records")
 
     def _load_db_attendance_data(self) -> Dict[str, Attendance]:
         """데이터베이스에서 근태 데이터 로드하여 매핑 딕셔너리 반환"""
@@ -239,7 +503,7 @@ class PayrollService:
     def _detect_attendance_changes(self, csv_data, db_data_dict):
         """CSV 데이터와 DB 데이터를 비교하여 변경된 레코드 감지"""
         updates = []  # 업데이트할 레코드
-        inserts = []  # 새로 추가할 레코드
+        inserts = {}  # 새로 추가할 레코드 (직원+날짜별 1건, 중복 시 마지막 기록)
         unchanged = []  # 변경 없는 레코드
 
         # CSV의 모든 레코드 처리
@@ -288,16 +552,21 @@ class PayrollService:
                         unchanged.append(record_key)
                 else:
                     # DB에 없는 레코드 - 새로 추가
-                    inserts.append({"csv_record": record, "date_obj": date_obj})
+                    inserts[record_key] = {"csv_record": record, "date_obj": date_obj}
             except Exception as e:
                 self.logger.error(f"레코드 변경 감지 오류: {str(e)}")
                 continue
 
-        return updates, inserts, unchanged
+        return updates, list(inserts.values()), unchanged
 
     def _apply_attendance_changes(self, updates, inserts):
-        """데이터베이스에 변경 사항 적용"""
+        """데이터베이스에 변경 사항 적용
+
+        Returns:
+            set: 변경된 근태 기록의 (employee_id, date) 집합
+        """
         session = get_db_session()
+        changes = set()
         try:
             # 감사 기록 생성을 위한 시간과 사용자 정보
             change_time = datetime.now()
@@ -305,8 +574,11 @@ class PayrollService:
 
             # 변경된 레코드 업데이트
             for update_info in updates:
+                # 다른 세션에서 조회된 객체이므로 현재 세션에 다시 연결
                 db_record = update_info["db_record"]
+                session.add(db_record)
                 csv_record = update_info["csv_record"]
+                changes.add((db_record.employee_id, db_record.date))
 
                 # 변경 전 값 저장
                 old_check_in = db_record.check_in
@@ -330,8 +602,8 @@ class PayrollService:
                             old_value=old_check_in,
                             new_value=db_record.check_in,
                             change_type="update",
-                            change_time=change_time,
-                            change_user=change_user,
+                            changed_at=change_time,
+                            changed_by=change_user,
                         )
                     )
 
@@ -344,8 +616,8 @@ class PayrollService:
                             old_value=old_check_out,
                             new_value=db_record.check_out,
                             change_type="update",
-                            change_time=change_time,
-                            change_user=change_user,
+                            changed_at=change_time,
+                            changed_by=change_user,
                         )
                     )
 
@@ -358,8 +630,8 @@ class PayrollService:
                             old_value=old_type,
                             new_value=db_record.attendance_type,
                             change_type="update",
-                            change_time=change_time,
-                            change_user=change_user,
+                            changed_at=change_time,
+                            changed_by=change_user,
                         )
                     )
 
@@ -372,8 +644,8 @@ class PayrollService:
                             old_value=old_remarks,
                             new_value=db_record.remarks,
                             change_type="update",
-                            change_time=change_time,
-                            change_user=change_user,
+                            changed_at=change_time,
+                            changed_by=change_user,
                         )
                     )
 
@@ -392,6 +664,7 @@ class PayrollService:
                     remarks=csv_record.get("remarks", ""),
                 )
                 session.add(new_record)
+                changes.add((csv_record["employee_id"], date_obj))
 
                 # 감사 기록 추가
                 session.add(
@@ -402,8 +675,8 @@ class PayrollService:
                         old_value="",
                         new_value="새 근태 기록 생성",
                         change_type="create",
-                        change_time=change_time,
-                        change_user=change_user,
+                        changed_at=change_time,
+                        changed_by=change_user,
                     )
                 )
 
@@ -412,6 +685,7 @@ class PayrollService:
             self.logger.info(
                 f"{len(updates)}개 기록 업데이트, {len(inserts)}개 기록 새로 추가됨"
             )
+            return changes
 
         except Exception as e:
             session.rollback()
@@ -420,15 +694,47 @@ class PayrollService:
         finally:
             session.close()
 
-    def load_payroll_data(self) -> tuple[pd.DataFrame, str]:
+    @property
+    def payroll_archive(self) -> PayrollArchive:
+        """급여 이력 아카이브 (처음 사용할 때 생성)"""
+        if getattr(self, "_payroll_archive", None) is None:
+            self._payroll_archive = PayrollArchive(
+                getattr(
+                    self.config,
+                    "PAYROLL_ARCHIVE_DIR",
+                    os.path.join(self.config.DATA_DIR, "payroll_archive"),
+                )
+            )
+        return self._payroll_archive
+
+    def load_payroll_data(
+        self, columns: Optional[List[str]] = None
+    ) -> tuple[pd.DataFrame, str]:
         """급여 데이터 로드 및 전처리
 
+        payroll.csv 는 바뀐 경우에만 아카이브로 가져오고, 아카이브에서 최근 급여월
+        조각만 읽습니다.
+
+        Args:
+            columns: 읽을 payroll.csv 컬럼 (None 이면 전체)
+
         Returns:
             tuple: (처리된 데이터프레임, 현재 지급월)
         """
         try:
-            # 급여 데이터 로드
-            df = pd.read_csv(self.config.PAYROLL_DATA)
+            archive = self.payroll_archive
+            if os.path.exists(self.config.PAYROLL_DATA):
+                archive.import_csv(self.config.PAYROLL_DATA)
+            latest = archive.latest_month()
+            if latest is None:
+                raise FileNotFoundError(
+                    f"급여 이력 데이터가 없습니다: {self.config.PAYROLL_DATA}"
+                )
+
+            # 최근 급여월 조각만 로드
+            if columns is not None:
+                columns = list(dict.fromkeys(["payment_date", *columns]))
+            df = archive.read(columns, start_month=latest, end_month=latest)
             df["payment_date"] = pd.to_datetime(df["payment_date"])
 
             # 최근 지급월 필터링
@@ -464,7 +770,15 @@ class PayrollService:
             Dict: 통계 정보
         """
         try:
-            df, _ = self.load_payroll_data()
+            df, _ = self.load_payroll_data(
+                columns=[
+                    "gross_salary",
+                    "base_salary",
+                    "national_pension",
+                    "health_insurance",
+                    "employment_insurance",
+                ]
+            )
 
             stats = {
                 "총 지급액": df["총지급액"].sum(),
@@ -497,46 +811,68 @@ class PayrollService:
         Returns:
             List[Dict]: 중복된 급여 데이터 목록
         """
+        overlaps = self.find_overlapping_payrolls(
+            [employee_id], period_start, period_end, payroll_type
+        )
+        return overlaps.get(employee_id, [])
+
+    def find_overlapping_payrolls(
+        self,
+        employee_ids: List[str],
+        period_start: datetime,
+        period_end: datetime,
+        payroll_type: str = "regular",
+        session: Optional[Session] = None,
+    ) -> Dict[str, List[Dict]]:
+        """여러 직원의 급여 기간 중복을 한 번의 조회로 확인
+
+        Args:
+            employee_ids: 직원 ID 목록
+            period_start: 급여 기간 시작일
+            period_end: 급여 기간 종료일
+            payroll_type: 급여 유형 (regular: 정기급여, special: 특별급여)
+            session: 사용할 세션 (없으면 새 세션을 열고 닫음)
+
+        Returns:
+            Dict[str, List[Dict]]: 직원 ID 별 중복된 급여 데이터 목록 (중복 없는 직원 제외)
+        """
+        employee_ids = list(dict.fromkeys(employee_ids))
+        if not employee_ids:
+            return {}
+
+        own_session = session is None
         try:
-            session = get_db_session()
+            if own_session:
+                session = get_db_session()
             try:
-                # 기간이 겹치는 급여 데이터 조회
-                # 1. 시작일이 기존 기간 내에 있는 경우
-                # 2. 종료일이 기존 기간 내에 있는 경우
-                # 3. 기존 기간을 완전히 포함하는 경우
-                query = session.query(Payroll).filter(
-                    Payroll.employee_id == employee_id,
+                # 기간이 겹치는 급여 데이터 조회 (기존 시작일 <= 종료일, 기존 종료일 >= 시작일)
+                # 시작일/종료일이 기존 기간 내에 있거나 기존 기간을 완전히 포함하는 경우
+                query = select(
+                    Payroll.payroll_code,
+                    Payroll.employee_id,
+                    Payroll.payment_period_start,
+                    Payroll.payment_period_end,
+                    Payroll.status,
+                    Payroll.payroll_type,
+                    Payroll.confirmed_at,
+                ).where(
+                    Payroll.employee_id.in_(employee_ids),
                     Payroll.status.in_(["confirmed", "paid"]),
-                    (
-                        # 시작일이 기존 기간 내에 있는 경우
-                        (
-                            period_start >= Payroll.payment_period_start,
-                            period_start <= Payroll.payment_period_end,
-                        )
-                        |
-                        # 종료일이 기존 기간 내에 있는 경우
-                        (
-                            period_end >= Payroll.payment_period_start,
-                            period_end <= Payroll.payment_period_end,
-                        )
-                        |
-                        # 기존 기간을 완전히 포함하는 경우
-                        (
-                            period_start <= Payroll.payment_period_start,
-                            period_end >= Payroll.payment_period_end,
-                        )
-                    ),
+                    Payroll.payment_period_start <= period_end,
+                    Payroll.payment_period_end >= period_start,
                 )
 
                 # 같은 유형의 급여만 중복으로 간주
                 if payroll_type == "regular":
-                    query = query.filter(Payroll.payroll_type == "regular")
+                    query = query.where(Payroll.payroll_type == "regular")
 
-                overlapping_payrolls = query.all()
+                query = query.order_by(
+                    Payroll.employee_id, Payroll.payment_period_start, Payroll.id
+                )
 
-                result = []
-                for payroll in overlapping_payrolls:
-                    result.append(
+                result = {}
+                for payroll in session.execute(query):
+                    result.setdefault(payroll.employee_id, []).append(
                         {
                             "payroll_code": payroll.payroll_code,
                             "employee_id": payroll.employee_id,
@@ -558,7 +894,8 @@ class PayrollService:
 
                 return result
             finally:
-                session.close()
+                if own_session:
+                    session.close()
         except Exception as e:
             self.logger.error(f"급여 기간 중복 확인 중 오류 발생: {str(e)}")
             raise
@@ -600,15 +937,14 @@ class PayrollService:
                 ).date()
                 period_end = datetime.strptime(payment_period["end"], "%Y-%m-%d").date()
 
-                # 각 직원별로 중복 기간 확인
-                overlapping_data = {}
-                for item in payroll_data:
-                    employee_id = item["employee_id"]
-                    overlaps = self.check_overlapping_periods(
-                        employee_id, period_start, period_end, payroll_type
-                    )
-                    if overlaps:
-                        overlapping_data[employee_id] = overlaps
+                # 전체 직원의 중복 기간을 한 번에 확인
+                overlapping_data = self.find_overlapping_payrolls(
+                    [item["employee_id"] for item in payroll_data],
+                    period_start,
+                    period_end,
+                    payroll_type,
+                    session=session,
+                )
 
                 # 중복 데이터가 있으면 오류 반환
                 if overlapping_data:
@@ -691,6 +1027,9 @@ class PayrollService:
                         }
                     )
 
+                # 확정한 급여월의 월별 요약을 같은 트랜잭션에서 다시 집계
+                refresh_payroll_summary(session, {month_key(period_start)})
+
                 # 모든 레코드 커밋
                 session.commit()
                 self.logger.info(f"급여 확정 완료: {len(saved_payrolls)}건 저장됨")
@@ -715,8 +1054,248 @@ class PayrollService:
             self.logger.error(f"급여 확정 처리 중 오류 발생: {str(e)}")
             raise Exception(f"급여 확정 처리 중 오류가 발생했습니다: {str(e)}")
 
+    def mark_payrolls_stale(self, changes=None):
+        """
+        근태 변경 집합에 해당하는 초안 급여에 재계산 필요 시각(stale_at) 기록
+
+        상태는 draft 그대로 두므로 화면/조회/확정 처리는 기존과 같고,
+        stale_at 이 기록된 초안은 다음 급여 계산 시 다시 계산되며 변경과 무관한
+        초안은 그대로 재사용됩니다. 확정/지급된 급여는 변경하지 않고 경고만 남깁니다.
+
+        Args:
+            changes (iterable): 변경된 (employee_id, date) 집합.
+                None 이면 모든 초안을 stale 처리합니다 (전체 재동기화 등).
+
+        Returns:
+            int: stale 처리된 급여 건수
+        """
+        session = get_db_session()
+        try:
+            if changes is None:
+                count = (
+                    session.query(Payroll)
+                    .filter(Payroll.status == "draft")
+                    .update({Payroll.stale_at: func.now()}, synchronize_session=False)
+                )
+                session.commit()
+                self.logger.info(f"전체 초안 급여 {count}건을 stale 처리했습니다.")
+                return count
+
+            dates_by_employee = {}
+            for employee_id, changed_date in changes:
+                dates_by_employee.setdefault(employee_id, []).append(changed_date)
+            if not dates_by_employee:
+                return 0
+
+            stale_ids = []
+            for chunk in _chunked(dates_by_employee, BATCH_QUERY_CHUNK_SIZE):
+                changed_dates = [
+                    changed_date
+                    for employee_id in chunk
+                    for changed_date in dates_by_employee[employee_id]
+                ]
+                # 변경 날짜 범위와 겹치는 급여 기간만 조회
+                payrolls = session.query(
+                    Payroll.id,
+                    Payroll.payroll_code,
+                    Payroll.employee_id,
+                    Payroll.payment_period_start,
+                    Payroll.payment_period_end,
+                    Payroll.status,
+                ).filter(
+                    Payroll.employee_id.in_(chunk),
+                    Payroll.payment_period_start <= max(changed_dates),
+                    Payroll.payment_period_end >= min(changed_dates),
+                    Payroll.status.in_(["draft", "confirmed", "paid"]),
+                )
+                for payroll in payrolls:
+                    if not any(
+                        payroll.payment_period_start
+                        <= changed_date
+                        <= payroll.payment_period_end
+                        for changed_date in dates_by_employee[payroll.employee_id]
+                    ):
+                        continue
+                    if payroll.status == "draft":
+                        stale_ids.append(payroll.id)
+                    else:
+                        self.logger.warning(
+                            f"{payroll.status} 상태 급여({payroll.payroll_code})의 "
+                            f"근태 기록이 변경되었습니다: 직원 ID {payroll.employee_id}"
+                        )
+
+            for chunk in _chunked(stale_ids, BATCH_QUERY_CHUNK_SIZE):
+                session.query(Payroll).filter(Payroll.id.in_(chunk)).update(
+                    {Payroll.stale_at: func.now()}, synchronize_session=False
+                )
+            session.commit()
+
+            self.logger.info(
+                f"근태 변경 {sum(len(d) for d in dates_by_employee.values())}건으로 "
+                f"초안 급여 {len(stale_ids)}건을 stale 처리했습니다."
+            )
+            return len(stale_ids)
+        except Exception as e:
+            session.rollback()
+            self.logger.error(f"초안 급여 stale 처리 중 오류 발생: {str(e)}")
+            raise
+        finally:
+            session.close()
+
+    def _attendance_to_records(self, attendance_records):
+        """Attendance 모델 목록을 PayCalculator에서 사용할 형식으로 변환"""
+        return [
+            {
+                "date": record.date.strftime("%Y-%m-%d"),
+                "check_in": record.check_in,
+                "check_out": record.check_out,
+                "attendance_type": record.attendance_type,
+                "remarks": record.remarks,
+            }
+            for record in attendance_records
+        ]
+
+    def _existing_payroll_result(self, payroll, employee):
+        """이미 확정/지급된 급여 기록의 반환 형식"""
+        return {
+            "payroll_code": payroll.payroll_code,
+            "employee_id": payroll.employee_id,
+            "employee_name": employee.name,
+            "department": employee.department,
+            "position": employee.position,
+            "payment_period_start": payroll.payment_period_start.strftime("%Y-%m-%d"),
+            "payment_period_end": payroll.payment_period_end.strftime("%Y-%m-%d"),
+            "base_pay": payroll.base_pay,
+            "overtime_pay": payroll.overtime_pay,
+            "night_shift_pay": payroll.night_shift_pay,
+            "holiday_pay": payroll.holiday_pay,
+            "gross_pay": payroll.gross_pay,
+            "net_pay": payroll.net_pay,
+            "status": payroll.status,
+        }
+
+    def _trace_row(
+        self,
+        payroll_code,
+        employee,
+        start_date,
+        end_date,
+        values,
+        calculator,
+        insurance_calc,
+    ):
+        """full 수준 계산 내역 저장 행 (PayrollCalculationTrace 컬럼 값)"""
+        return {
+            "payroll_code": payroll_code,
+            "employee_id": employee.employee_id,
+            "encoding": TRACE_ENCODING,
+            "data": encode_trace(
+                build_trace(
+                    employee, start_date, end_date, values, calculator, insurance_calc
+                )
+            ),
+        }
+
+    def _delete_draft_traces(self, session, *criteria):
+        """조건에 맞는 초안 급여의 계산 내역 삭제"""
+        session.query(PayrollCalculationTrace).filter(
+            PayrollCalculationTrace.payroll_code.in_(
+                select(Payroll.payroll_code).where(Payroll.status == "draft", *criteria)
+            )
+        ).delete(synchronize_session=False)
+
+    def get_payroll_trace(self, payroll_code):
+        """
+        저장된 급여 계산 내역 조회
+
+        Args:
+            payroll_code (str): 급여 코드
+
+        Returns:
+            dict: 계산 내역 (trace=full 로 계산하지 않았으면 None)
+        """
+        session = get_db_session()
+        try:
+            row = (
+                session.query(PayrollCalculationTrace)
+                .filter(PayrollCalculationTrace.payroll_code == payroll_code)
+                .first()
+            )
+            if row is None:
+                return None
+            return decode_trace(row.data)
+        finally:
+            session.close()
+
+    def _draft_payroll_row(
+        self, payroll_code, employee_id, start_date, end_date, values
+    ):
+        """초안 급여 기록(Payroll) 컬럼 값"""
+        return {
+            "payroll_code": payroll_code,
+            "employee_id": employee_id,
+            "payment_period_start": start_date,
+            "payment_period_end": end_date,
+            "payment_date": None,  # 지급일은 아직 설정하지 않음
+            "base_pay": values["base_pay"],
+            "overtime_pay": values["overtime_pay"],
+            "night_shift_pay": values["night_shift_pay"],
+            "holiday_pay": values["holiday_pay"],
+            "total_allowances": values["total_allowances"],
+            "gross_pay": values["gross_pay"],
+            "income_tax": values["income_tax"],
+            "residence_tax": values["residence_tax"],
+            "national_pension": values["national_pension"],
+            "health_insurance": values["health_insurance"],
+            "long_term_care": values["long_term_care"],
+            "employment_insurance": values["employment_insurance"],
+            "total_deductions": values["total_deductions"],
+            "net_pay": values["net_pay"],
+            "status": "draft",
+            "payroll_type": "regular",
+        }
+
+    def _draft_payroll_result(
+        self, payroll_code, employee, start_date, end_date, values, trace=TRACE_NONE
+    ):
+        """새로 계산된 초안 급여의 반환 형식 (trace 수준에 따라 계산 내역 요약 포함)"""
+        result = {
+            "payroll_code": payroll_code,
+            "employee_id": employee.employee_id,
+            "employee_name": employee.name,
+            "department": employee.department,
+            "position": employee.position,
+            "payment_period_start": start_date.strftime("%Y-%m-%d"),
+            "payment_period_end": end_date.strftime("%Y-%m-%d"),
+            "base_pay": values["base_pay"],
+            "overtime_pay": values["overtime_pay"],
+            "night_shift_pay": values["night_shift_pay"],
+            "holiday_pay": values["holiday_pay"],
+            "gross_pay": values["gross_pay"],
+            "income_tax": values["income_tax"],
+            "residence_tax": values["residence_tax"],
+            "national_pension": values["national_pension"],
+            "health_insurance": values["health_insurance"],
+            "long_term_care": values["long_term_care"],
+            "employment_insurance": values["employment_insurance"],
+            "total_deductions": values["total_deductions"],
+            "net_pay": values["net_pay"],
+            "status": "draft",
+        }
+        if trace in (TRACE_SUMMARY, TRACE_FULL):
+            result["calculation_summary"] = build_summary(values)
+        if trace == TRACE_FULL:
+            # 전체 계산 내역은 GET /api/payroll/<payroll_code>/trace 로 조회
+            result["trace_available"] = True
+        return result
+
     def calculate_and_save_payroll(
-        self, employee_id, start_date, end_date, force_recalculate=False
+        self,
+        employee_id,
+        start_date,
+        end_date,
+        force_recalculate=False,
+        trace=TRACE_NONE,
     ):
         """
         직원의 급여를 계산하고 데이터베이스에 저장하는 메서드
@@ -726,6 +1305,7 @@ class PayrollService:
             start_date (date): 급여 기간 시작일
             end_date (date): 급여 기간 종료일
             force_recalculate (bool): 기존 급여 데이터가 있어도 강제로 재계산할지 여부
+            trace (str): 계산 내역 수준 (none | summary | full)
 
         Returns:
             dict: 계산된 급여 정보
@@ -739,12 +1319,8 @@ class PayrollService:
             session = get_db_session()
 
             try:
-                # 직원 정보 조회
-                employee = (
-                    session.query(Employee)
-                    .filter(Employee.employee_id == employee_id)
-                    .first()
-                )
+                # 직원 정보 조회 (직원 정보 캐시 스냅샷)
+                employee = employee_cache.database(session).get(employee_id)
 
                 if not employee:
                     self.logger.error(
@@ -769,26 +1345,7 @@ class PayrollService:
                         self.logger.info(
                             f"직원 ID {employee_id}의 해당 기간에 대한 급여가 이미 계산되어 있습니다."
                         )
-                        return {
-                            "payroll_code": existing_payroll.payroll_code,
-                            "employee_id": existing_payroll.employee_id,
-                            "employee_name": employee.name,
-                            "department": employee.department,
-                            "position": employee.position,
-                            "payment_period_start": existing_payroll.payment_period_start.strftime(
-                                "%Y-%m-%d"
-                            ),
-                            "payment_period_end": existing_payroll.payment_period_end.strftime(
-                                "%Y-%m-%d"
-                            ),
-                            "base_pay": existing_payroll.base_pay,
-                            "overtime_pay": existing_payroll.overtime_pay,
-                            "night_shift_pay": existing_payroll.night_shift_pay,
-                            "holiday_pay": existing_payroll.holiday_pay,
-                            "gross_pay": existing_payroll.gross_pay,
-                            "net_pay": existing_payroll.net_pay,
-                            "status": existing_payroll.status,
-                        }
+                        return self._existing_payroll_result(existing_payroll, employee)
 
                 # 해당 기간의 근태 기록 조회
                 attendance_records = (
@@ -800,239 +1357,19 @@ class PayrollService:
                     )
                     .all()
                 )
-
-                # 근태 기록을 PayCalculator에서 사용할 형식으로 변환
-                attendance_data = []
-                for record in attendance_records:
-                    attendance_data.append(
-                        {
-                            "date": record.date.strftime("%Y-%m-%d"),
-                            "check_in": record.check_in,
-                            "check_out": record.check_out,
-                            "attendance_type": record.attendance_type,
-                            "remarks": record.remarks,
-                        }
-                    )
-
-                # 계산 로깅 시작 - 문자열에 수집
-                calculation_logs = []
-                calculation_logs.append("=" * 80)
-                calculation_logs.append(
-                    f"급여 계산 시작: 직원 ID {employee_id}, 이름: {employee.name}"
-                )
-                calculation_logs.append(
-                    f"계산 기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
-                )
-                calculation_logs.append("=" * 80)
-
-                # PayCalculator 인스턴스 생성
-                calculator = PayCalculator()
+                attendance_data = self._attendance_to_records(attendance_records)
 
                 # 급여 계산
-                base_salary = employee.base_salary
-                join_date = (
-                    employee.join_date.strftime("%Y-%m-%d")
-                    if employee.join_date
-                    else None
-                )
-                resignation_date = (
-                    employee.resignation_date.strftime("%Y-%m-%d")
-                    if employee.resignation_date
-                    else None
-                )
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("1. 기본 정보")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(f"연봉: {base_salary:,}원")
-                calculation_logs.append(f"입사일: {join_date or '정보 없음'}")
-                calculation_logs.append(f"퇴사일: {resignation_date or '재직중'}")
-
-                # 시간당 임금 계산
-                hourly_rate = (base_salary / 12) / calculator.WORK_HOURS_PER_MONTH
-                calculation_logs.append(
-                    f"시간당 임금: {hourly_rate:,.2f}원 (연봉 ÷ 12개월 ÷ {calculator.WORK_HOURS_PER_MONTH}시간)"
-                )
-
-                # 각 항목별 급여 계산
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("2. 기본급 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append("계산식: 월 기본급 × 근무일수 비율")
-
-                base_pay = calculator.calculate_base_pay(
-                    base_salary,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
-                    attendance_data,
-                    join_date,
-                    resignation_date,
-                )
-                calculation_logs.append(f"계산결과: {base_pay:,}원")
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("3. 연장근로수당 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append("계산식: 연장근로시간 × 시간당 임금 × 1.5")
-
-                overtime_pay = calculator.calculate_overtime_pay(
-                    attendance_data, hourly_rate
-                )
-                calculation_logs.append(f"계산결과: {overtime_pay:,}원")
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("4. 야간근로수당 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(
-                    "계산식: 야간근로시간(22:00~06:00) × 시간당 임금 × 0.5"
-                )
-
-                night_shift_pay = calculator.calculate_night_pay(
-                    attendance_data, hourly_rate
-                )
-                calculation_logs.append(f"계산결과: {night_shift_pay:,}원")
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("5. 휴일근로수당 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append("계산식: 휴일근로시간 × 시간당 임금 × 1.5")
-
-                holiday_pay = calculator.calculate_holiday_pay(
-                    attendance_data, hourly_rate
-                )
-                calculation_logs.append(f"계산결과: {holiday_pay:,}원")
-
-                # 총 수당 계산
-                total_allowances = overtime_pay + night_shift_pay + holiday_pay
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("6. 총 수당 합계")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(
-                    f"연장근로수당 + 야간근로수당 + 휴일근로수당 = {overtime_pay:,} + {night_shift_pay:,} + {holiday_pay:,}"
-                )
-                calculation_logs.append(f"계산결과: {total_allowances:,}원")
-
-                # 총 지급액 계산
-                gross_pay = base_pay + total_allowances
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("7. 총 지급액 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(
-                    f"기본급 + 총 수당 = {base_pay:,} + {total_allowances:,}"
-                )
-                calculation_logs.append(f"계산결과: {gross_pay:,}원")
-
-                # 공제액 계산 - InsuranceCalculator 사용하여 정교한 계산
+                calculator = PayCalculator()
                 insurance_calc = InsuranceCalculator()
-
-                # 부양가족 수 가져오기 (가족 수와 자녀 수를 합산)
-                dependents = employee.family_count or 1  # 기본값 1 (본인)
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("8. 4대 보험 및 세금 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(f"총 지급액: {gross_pay:,}원")
-                calculation_logs.append(f"부양가족 수: {dependents}명")
-
-                # 4대 보험 계산
-                insurances = insurance_calc.calculate_insurances(gross_pay)
-                national_pension = insurances["nationalPension"]
-                health_insurance = insurances["healthInsurance"]
-                long_term_care = insurances["longTermCare"]
-                employment_insurance = insurances["employmentInsurance"]
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.1 국민연금")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append(
-                    f"계산식: {gross_pay:,} × {insurance_calc.RATES['NATIONAL_PENSION']:.3f}"
-                )
-                calculation_logs.append(f"계산결과: {national_pension:,}원")
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.2 건강보험")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append(
-                    f"계산식: {gross_pay:,} × {insurance_calc.RATES['HEALTH_INSURANCE']:.5f}"
-                )
-                calculation_logs.append(f"계산결과: {health_insurance:,}원")
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.3 장기요양보험")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append(
-                    f"계산식: {health_insurance:,} × {insurance_calc.RATES['LONG_TERM_CARE']:.4f} × 0.5(직원부담분)"
-                )
-                calculation_logs.append(f"계산결과: {long_term_care:,}원")
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.4 고용보험")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append(
-                    f"계산식: {gross_pay:,} × {insurance_calc.RATES['EMPLOYMENT_INSURANCE']:.4f}"
-                )
-                calculation_logs.append(f"계산결과: {employment_insurance:,}원")
-
-                # 세금 계산
-                taxes = insurance_calc.calculate_taxes(gross_pay, dependents)
-                income_tax = taxes["incomeTax"]
-                residence_tax = taxes["localIncomeTax"]
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.5 소득세")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append("계산식: 세액표 기준 계산")
-                calculation_logs.append(
-                    f"월 급여: {gross_pay:,}원, 부양가족: {dependents}명"
-                )
-                calculation_logs.append(f"계산결과: {income_tax:,}원")
-
-                calculation_logs.append("\n" + "-" * 40)
-                calculation_logs.append("8.6 지방소득세")
-                calculation_logs.append("-" * 40)
-                calculation_logs.append(f"계산식: 소득세({income_tax:,}) × 0.1")
-                calculation_logs.append(f"계산결과: {residence_tax:,}원")
-
-                # 총 공제액 계산
-                total_deductions = (
-                    income_tax
-                    + residence_tax
-                    + national_pension
-                    + health_insurance
-                    + long_term_care
-                    + employment_insurance
-                )
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("9. 총 공제액 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(
-                    f"소득세 + 지방소득세 + 국민연금 + 건강보험 + 장기요양보험 + 고용보험"
-                )
-                calculation_logs.append(
-                    f"{income_tax:,} + {residence_tax:,} + {national_pension:,} + {health_insurance:,} + {long_term_care:,} + {employment_insurance:,}"
-                )
-                calculation_logs.append(f"계산결과: {total_deductions:,}원")
-
-                # 실수령액 계산
-                net_pay = gross_pay - total_deductions
-
-                calculation_logs.append("\n" + "-" * 80)
-                calculation_logs.append("10. 실수령액 계산")
-                calculation_logs.append("-" * 80)
-                calculation_logs.append(
-                    f"총 지급액 - 총 공제액 = {gross_pay:,} - {total_deductions:,}"
-                )
-                calculation_logs.append(f"계산결과: {net_pay:,}원")
-
-                calculation_logs.append("\n" + "=" * 80)
-                calculation_logs.append(
-                    f"급여 계산 완료: 직원 ID {employee_id}, 이름: {employee.name}"
+                values = calculate_payroll_values(
+                    employee,
+                    attendance_data,
+                    start_date,
+                    end_date,
+                    calculator,
+                    insurance_calc,
                 )
-                calculation_logs.append(f"실수령액: {net_pay:,}원")
-                calculation_logs.append("=" * 80 + "\n")
 
                 # 급여 코드 생성 (UUID 사용)
                 payroll_code = str(uuid.uuid4())
@@ -1050,65 +1387,47 @@ class PayrollService:
                 )
 
                 if existing_draft:
+                    session.query(PayrollCalculationTrace).filter(
+                        PayrollCalculationTrace.payroll_code
+                        == existing_draft.payroll_code
+                    ).delete(synchronize_session=False)
                     session.delete(existing_draft)
                     session.flush()
 
-                # 새 급여 기록 생성
-                new_payroll = Payroll(
-                    payroll_code=payroll_code,
-                    employee_id=employee_id,
-                    payment_period_start=start_date,
-                    payment_period_end=end_date,
-                    payment_date=None,  # 지급일은 아직 설정하지 않음
-                    base_pay=int(base_pay),
-                    overtime_pay=int(overtime_pay),
-                    night_shift_pay=int(night_shift_pay),
-                    holiday_pay=int(holiday_pay),
-                    total_allowances=int(total_allowances),
-                    gross_pay=int(gross_pay),
-                    income_tax=income_tax,
-                    residence_tax=residence_tax,
-                    national_pension=national_pension,
-                    health_insurance=health_insurance,
-                    long_term_care=long_term_care,
-                    employment_insurance=employment_insurance,
-                    total_deductions=total_deductions,
-                    net_pay=int(net_pay),
-                    status="draft",
-                    payroll_type="regular",
+                # 새 급여 기록 생성 후 데이터베이스에 저장
+                session.add(
+                    Payroll(
+                        **self._draft_payroll_row(
+                            payroll_code, employee_id, start_date, end_date, values
+                        )
+                    )
                 )
-
-                # 데이터베이스에 저장
-                session.add(new_payroll)
+                if trace == TRACE_FULL:
+                    session.add(
+                        PayrollCalculationTrace(
+                            **self._trace_row(
+                                payroll_code,
+                                employee,
+                                start_date,
+                                end_date,
+                                values,
+                                calculator,
+                                insurance_calc,
+                            )
+                        )
+                    )
                 session.commit()
 
                 self.logger.info(f"직원 ID {employee_id}의 급여 계산 및 저장 완료")
 
-                # 결과 반환
-                return {
-                    "payroll_code": payroll_code,
-                    "employee_id": employee_id,
-                    "employee_name": employee.name,
-                    "department": employee.department,
-                    "position": employee.position,
-                    "payment_period_start": start_date.strftime("%Y-%m-%d"),
-                    "payment_period_end": end_date.strftime("%Y-%m-%d"),
-                    "base_pay": int(base_pay),
-                    "overtime_pay": int(overtime_pay),
-                    "night_shift_pay": int(night_shift_pay),
-                    "holiday_pay": int(holiday_pay),
-                    "gross_pay": int(gross_pay),
-                    "income_tax": income_tax,
-                    "residence_tax": residence_tax,
-                    "national_pension": national_pension,
-                    "health_insurance": health_insurance,
-                    "long_term_care": long_term_care,
-                    "employment_insurance": employment_insurance,
-                    "total_deductions": total_deductions,
-                    "net_pay": int(net_pay),
-                    "status": "draft",
-                    "calculation_logs": calculation_logs,  # 계산 로그 포함
-                }
+                return self._draft_payroll_result(
+                    payroll_code,
+                    employee,
+                    start_date,
+                    end_date,
+                    values,
+                    trace,
+                )
 
             except Exception as e:
                 session.rollback()
@@ -1121,6 +1440,329 @@ class PayrollService:
             self.logger.error(f"급여 계산 및 저장 중 오류 발생: {str(e)}")
             raise Exception(f"급여 계산 및 저장 중 오류가 발생했습니다: {str(e)}")
 
+    def iter_payroll_batch(
+        self,
+        employee_ids,
+        start_date,
+        end_date,
+        force_recalculate=False,
+        workers=None,
+        reuse_drafts=False,
+        trace=TRACE_NONE,
+    ):
+        """
+        여러 직원의 급여를 일괄 계산하고 저장하는 제너레이터
+
+        직원, 기존 급여, 근태 기록을 IN/기간 조건의 소수 쿼리로 한 번에 조회한 뒤
+        읽기 세션을 닫고 메모리에서 계산합니다. 없는 직원, 확정/지급된 급여, 재사용한
+        초안은 먼저 전달하고, 계산 대상은 묶음(utils.payroll_batch.SHARD_SIZE 명)
+        계산이 끝날 때마다 그 묶음의 초안을 별도 트랜잭션으로 일괄 삭제/삽입한 뒤
+        직원별 진행 이벤트를 전달합니다. 이벤트는 입력 순서가 아닐 수 있으며
+        index 가 입력 위치입니다. 저장에 실패하면 예외가 발생하고, 이미 전달한
+        묶음의 초안은 저장된 상태로 남습니다.
+
+        reuse_drafts 가 True 이면 근태 변경으로 재계산 표시(stale_at)되지 않았고,
+        직원 정보와 해당 기간 근태 기록의 마지막 수정 이후에 계산된 초안은 다시
+        계산하지 않고 그대로 반환합니다. 수정일시는 초 단위이므로 같은 초에
+        수정된 경우에는 다시 계산합니다.
+        trace 가 full 이면 전체 계산 내역을 저장해야 하므로 초안을 재사용하지 않습니다.
+
+        Args:
+            employee_ids (list): 직원 ID 목록
+            start_date (date): 급여 기간 시작일
+            end_date (date): 급여 기간 종료일
+            force_recalculate (bool): 확정/지급된 급여가 있어도 재계산할지 여부
+            workers (int): 계산 작업자 프로세스 수 (None 이면 Config.PAYROLL_WORKERS)
+            reuse_drafts (bool): 최신 초안 급여를 재사용할지 여부
+            trace (str): 계산 내역 수준 (none | summary | full)
+
+        Yields:
+            dict: index, employee_id, status("calculated" | "reused" | "existing"
+                  | "not_found" | "error") 와 payroll(계산 결과) 또는 error(오류 메시지)
+        """
+        self.logger.info(
+            f"급여 일괄 계산 시작: {len(employee_ids)}명 (기간: {start_date} ~ {end_date})"
+        )
+        if trace == TRACE_FULL:
+            reuse_drafts = False
+        try:
+            # 조회는 짧은 읽기 세션에서 끝내고, 계산 중에는 세션을 열어 두지 않음
+            session = get_db_session()
+            try:
+                employees = {}
+                existing_payrolls = {}
+                fresh_drafts = {}
+
+                # 직원 정보는 캐시 스냅샷에서 조회
+                snapshot = employee_cache.database(session)
+                for employee_id in employee_ids:
+                    employee = snapshot.get(employee_id)
+                    if employee is not None:
+                        employees[employee_id] = employee
+
+                if not force_recalculate:
+                    reusable_statuses = ["confirmed", "paid"]
+                    if reuse_drafts:
+                        reusable_statuses.append("draft")
+                    for chunk in _chunked(employee_ids, BATCH_QUERY_CHUNK_SIZE):
+                        for payroll in session.query(Payroll).filter(
+                            Payroll.employee_id.in_(chunk),
+                            Payroll.payment_period_start == start_date,
+                            Payroll.payment_period_end == end_date,
+                            Payroll.status.in_(reusable_statuses),
+                        ):
+                            if payroll.status == "draft":
+                                fresh_drafts.setdefault(payroll.employee_id, payroll)
+                            else:
+                                existing_payrolls.setdefault(
+                                    payroll.employee_id, payroll
+                                )
+
+                # 초안 대상 직원별 기간 내 근태 기록의 마지막 수정일시
+                attendance_updated_at = {}
+                for chunk in _chunked(fresh_drafts, BATCH_QUERY_CHUNK_SIZE):
+                    attendance_updated_at.update(
+                        session.query(
+                            Attendance.employee_id, func.max(Attendance.updated_at)
+                        )
+                        .filter(
+                            Attendance.employee_id.in_(chunk),
+                            Attendance.date >= start_date,
+                            Attendance.date <= end_date,
+                        )
+                        .group_by(Attendance.employee_id)
+                    )
+
+                # 재계산 표시되었거나 직원 정보/근태가 초안 계산 이후(같은 초 포함)
+                # 변경되었으면 재계산
+                for employee_id, draft in list(fresh_drafts.items()):
+                    employee = employees.get(employee_id)
+                    attendance_changed_at = attendance_updated_at.get(employee_id)
+                    if (
+                        employee is None
+                        or employee_id in existing_payrolls
+                        or draft.stale_at is not None
+                        or not draft.updated_at
+                        or not employee.updated_at
+                        or draft.updated_at <= employee.updated_at
+                        or (
+                            attendance_changed_at is not None
+                            and draft.updated_at <= attendance_changed_at
+                        )
+                    ):
+                        del fresh_drafts[employee_id]
+
+                # 계산 대상 직원 (확정/지급된 급여나 재사용할 초안이 없는 직원)
+                targets = [
+                    employee_id
+                    for employee_id in dict.fromkeys(employee_ids)
+                    if employee_id in employees
+                    and employee_id not in existing_payrolls
+                    and employee_id not in fresh_drafts
+                ]
+
+                # 계산 대상 직원의 근태 기록만 조회
+                attendance_by_employee = {employee_id: [] for employee_id in targets}
+                for chunk in _chunked(targets, BATCH_QUERY_CHUNK_SIZE):
+                    for record in (
+                        session.query(Attendance)
+                        .filter(
+                            Attendance.employee_id.in_(chunk),
+                            Attendance.date >= start_date,
+                            Attendance.date <= end_date,
+                        )
+                        .order_by(Attendance.id)
+                    ):
+                        attendance_by_employee[record.employee_id].append(record)
+
+                attendance_data = {
+                    employee_id: self._attendance_to_records(
+                        attendance_by_employee[employee_id]
+                    )
+                    for employee_id in targets
+                }
+            finally:
+                session.close()
+
+            if workers is None:
+                workers = getattr(self.config, "PAYROLL_WORKERS", 1)
+            calculator = PayCalculator()
+            insurance_calc = InsuranceCalculator()
+
+            # 계산 없이 결과가 정해지는 직원은 먼저 전달
+            target_index = {}
+            for index, employee_id in enumerate(employee_ids):
+                event = {"index": index, "employee_id": employee_id}
+                employee = employees.get(employee_id)
+
+                if employee is None:
+                    self.logger.error(
+                        f"직원 ID {employee_id}에 해당하는 직원을 찾을 수 없습니다."
+                    )
+                    event["status"] = "not_found"
+                elif employee_id in existing_payrolls:
+                    event["status"] = "existing"
+                    event["payroll"] = self._existing_payroll_result(
+                        existing_payrolls[employee_id], employee
+                    )
+                elif employee_id in fresh_drafts:
+                    draft = fresh_drafts.pop(employee_id)
+                    event["status"] = "reused"
+                    event["payroll"] = self._draft_payroll_result(
+                        draft.payroll_code,
+                        employee,
+                        start_date,
+                        end_date,
+                        {
+                            column: getattr(draft, column)
+                            for column in PAYROLL_AMOUNT_COLUMNS
+                        },
+                        trace,
+                    )
+                else:
+                    # 계산 대상 (중복 요청된 직원 ID 는 처음 위치만 사용)
+                    target_index.setdefault(employee_id, index)
+                    continue
+
+                yield event
+
+            # 급여 항목을 묶음 단위로 계산 (작업자 수가 2 이상이면 프로세스 풀에서
+            # 병렬 계산), 묶음이 끝날 때마다 초안을 저장한 뒤 진행 이벤트 전달
+            saved = 0
+            for indices, shard_values in iter_batch_values(
+                [employee_scalars(employees[employee_id]) for employee_id in targets],
+                [attendance_data[employee_id] for employee_id in targets],
+                start_date,
+                end_date,
+                workers,
+            ):
+                rows = []
+                trace_rows = []
+                events = []
+                for position, values in zip(indices, shard_values):
+                    employee_id = targets[position]
+                    employee = employees[employee_id]
+                    event = {
+                        "index": target_index[employee_id],
+                        "employee_id": employee_id,
+                    }
+                    try:
+                        if "error" in values:
+                            raise Exception(values["error"])
+                        payroll_code = str(uuid.uuid4())
+                        rows.append(
+                            self._draft_payroll_row(
+                                payroll_code, employee_id, start_date, end_date, values
+                            )
+                        )
+                        if trace == TRACE_FULL:
+                            trace_rows.append(
+                                self._trace_row(
+                                    payroll_code,
+                                    employee,
+                                    start_date,
+                                    end_date,
+                                    values,
+                                    calculator,
+                                    insurance_calc,
+                                )
+                            )
+                        event["status"] = "calculated"
+                        event["payroll"] = self._draft_payroll_result(
+                            payroll_code, employee, start_date, end_date, values, trace
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            f"직원 ID {employee_id}의 급여 계산 중 오류 발생: {str(e)}"
+                        )
+                        event["status"] = "error"
+                        event["error"] = str(e)
+                    events.append(event)
+
+                self._save_draft_rows(start_date, end_date, rows, trace_rows)
+                saved += len(rows)
+                yield from events
+
+            self.logger.info(f"급여 일괄 계산 및 저장 완료: {saved}건")
+
+        except Exception as e:
+            self.logger.error(f"급여 일괄 계산 중 오류 발생: {str(e)}")
+            raise Exception(f"급여 일괄 계산 및 저장 중 오류가 발생했습니다: {str(e)}")
+
+    def _save_draft_rows(self, start_date, end_date, rows, trace_rows):
+        """
+        계산한 초안 급여 저장 (같은 기간 기존 초안 일괄 삭제 후 일괄 삽입, 단일 트랜잭션)
+
+        진행 이벤트를 전달하기 전에 별도 세션에서 커밋하므로, 응답 스트림이 중간에
+        끊겨도 이미 전달한 묶음의 초안은 저장되어 있습니다.
+        """
+        if not rows:
+            return
+        session = get_db_session()
+        try:
+            calculated_ids = [row["employee_id"] for row in rows]
+            for chunk in _chunked(calculated_ids, BATCH_QUERY_CHUNK_SIZE):
+                self._delete_draft_traces(
+                    session,
+                    Payroll.employee_id.in_(chunk),
+                    Payroll.payment_period_start == start_date,
+                    Payroll.payment_period_end == end_date,
+                )
+                session.query(Payroll).filter(
+                    Payroll.employee_id.in_(chunk),
+                    Payroll.payment_period_start == start_date,
+                    Payroll.payment_period_end == end_date,
+                    Payroll.status == "draft",
+                ).delete(synchronize_session=False)
+            session.execute(insert(Payroll), rows)
+            if trace_rows:
+                session.execute(insert(PayrollCalculationTrace), trace_rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def calculate_payroll_batch(
+        self,
+        employee_ids,
+        start_date,
+        end_date,
+        force_recalculate=False,
+        workers=None,
+        reuse_drafts=False,
+        trace=TRACE_NONE,
+    ):
+        """
+        여러 직원의 급여를 일괄 계산하고 저장하는 메서드
+
+        Returns:
+            dict: results (계산/조회된 급여 목록), not_found (없는 직원 ID),
+                  errors (직원 ID별 오류 메시지)
+        """
+        results = []
+        not_found = []
+        errors = {}
+        events = self.iter_payroll_batch(
+            employee_ids,
+            start_date,
+            end_date,
+            force_recalculate,
+            workers,
+            reuse_drafts,
+            trace,
+        )
+        # 입력 순서대로 정리
+        for event in sorted(events, key=lambda event: event["index"]):
+            if event["status"] == "not_found":
+                not_found.append(event["employee_id"])
+            elif event["status"] == "error":
+                errors[event["employee_id"]] = event["error"]
+            else:
+                results.append(event["payroll"])
+        return {"results": results, "not_found": not_found, "errors": errors}
+
     def start_file_watcher(self):
         """파일 시스템 감시 서비스 시작 (watchdog 사용)"""
         if self.observer is not None and self.observer.is_alive():
@@ -1128,6 +1770,8 @@ class PayrollService:
             return
 
         try:
+            self.sync_scheduler.start()
+
             # 이벤트 핸들러 및 Observer 설정
             self.event_handler = AttendanceFileHandler(self)
             self.observer = Observer()
@@ -1160,6 +1804,7 @@ class PayrollService:
                 self.logger.error(f"파일 감시 서비스 중지 오류: {str(e)}")
         else:
             self.logger.info("파일 감시 서비스가 실행 중이 아닙니다.")
+        self.sync_scheduler.stop()
 
     def _notify_change_event(self):
         """근태 파일 변경을 알리는 글로벌 이벤트를 설정합니다."""
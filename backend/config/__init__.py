@@ -21,3 +21,52 @@ class Config:
     EMPLOYEE_DATA = os.path.join(DATA_DIR, "employees.csv")
     ATTENDANCE_DATA = os.path.join(DATA_DIR, "attendance.csv")
     PAYROLL_DATA = os.path.join(DATA_DIR, "payroll.csv")
+    # 급여 이력 연/월 분할 아카이브 (payroll.csv 를 가져와 조회, utils/payroll_archive.py)
+    PAYROLL_ARCHIVE_DIR = os.environ.get("PAYROLL_ARCHIVE_DIR") or os.path.join(
+        DATA_DIR, "payroll_archive"
+    )
+
+    # 휴일 달력 설정 (공휴일 + 주말 + 회사 지정 휴무일)
+    HOLIDAY_CALENDAR_START_YEAR = int(
+        os.environ.get("HOLIDAY_CALENDAR_START_YEAR") or 2020
+    )
+    HOLIDAY_CALENDAR_END_YEAR = int(os.environ.get("HOLIDAY_CALENDAR_END_YEAR") or 2035)
+    # 회사 지정 휴무일 (예: "2025-05-02,2025-12-31")
+    COMPANY_CLOSURE_DAYS = [
+        day.strip()
+        for day in (os.environ.get("COMPANY_CLOSURE_DAYS") or "").split(",")
+        if day.strip()
+    ]
+
+    # 급여 일괄 계산 작업자 프로세스 수 (1 이면 요청 처리 프로세스에서 계산)
+    PAYROLL_WORKERS = int(os.environ.get("PAYROLL_WORKERS") or 1)
+
+    # 데이터베이스 프로필 (dev | prod | bulk, config/database.py 의 DB_PROFILES 참고)
+    # 기본값은 SQL 로깅이 없는 prod, 개발 중 SQL 로그가 필요하면 DB_PROFILE=dev 로 실행
+    DB_PROFILE = os.environ.get("DB_PROFILE") or "prod"
+
+    # 근태 CSV 변경 감지 방식
+    # - hash: 저장된 내용 해시(attendance.row_hash)와 키 순서 병합 비교 (기본값)
+    # - full: 모든 근태 기록을 ORM 객체로 불러와 필드별 비교 (이전 방식)
+    ATTENDANCE_DIFF_MODE = os.environ.get("ATTENDANCE_DIFF_MODE") or "hash"
+
+    # hash 방식에서 파일 끝에 행이 추가되기만 했으면 추가분만 반영 (0 이면 항상 전체 비교)
+    ATTENDANCE_TAIL_INGEST = os.environ.get("ATTENDANCE_TAIL_INGEST", "1") != "0"
+
+    # 근태 파일 감시 동기화 스케줄러
+    # - 마지막 파일 이벤트 후 이 시간(초) 동안 추가 이벤트가 없으면 한 번만 동기화
+    # - 이벤트가 계속 와도 첫 이벤트 후 최대 대기 시간(초)이 지나면 동기화
+    # - 동기화 작업 큐 최대 길이
+    ATTENDANCE_SYNC_QUIET_SECONDS = float(
+        os.environ.get("ATTENDANCE_SYNC_QUIET_SECONDS") or 0.5
+    )
+    ATTENDANCE_SYNC_MAX_WAIT_SECONDS = float(
+        os.environ.get("ATTENDANCE_SYNC_MAX_WAIT_SECONDS") or 5.0
+    )
+    ATTENDANCE_SYNC_QUEUE_SIZE = int(os.environ.get("ATTENDANCE_SYNC_QUEUE_SIZE") or 4)
+
+    # 근태 CSV 인코딩 (읽기와 DB → CSV 내보내기에 같은 값 사용)
+    ATTENDANCE_CSV_ENCODING = os.environ.get("ATTENDANCE_CSV_ENCODING") or "utf-8"
+
+    # 근태 CSV 내보내기 백업(gzip) 보관 개수
+    ATTENDANCE_BACKUP_KEEP = int(os.environ.get("ATTENDANCE_BACKUP_KEEP") or 20)
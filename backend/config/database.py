@@ -4,10 +4,14 @@
 """
 
 import os
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+from config import Config
+
 # 현재 디렉토리 기준 상대 경로
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -20,12 +24,97 @@ DB_URL = f"sqlite:///{DB_PATH}"
 # 데이터베이스 저장 디렉토리 확인 및 생성
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
-# 엔진 생성
-engine = create_engine(
-    DB_URL,
-    echo=True,  # SQL 쿼리 로깅 활성화 (개발 환경에서만 사용)
-    connect_args={"check_same_thread": False}  # SQLite에서 다중 스레드 지원
-)
+# 데이터베이스 프로필 (SQL 로깅 여부와 연결마다 적용할 SQLite PRAGMA)
+# - dev: SQL 쿼리 로깅, 기본 캐시 (개발 환경, DB_PROFILE=dev 로 선택)
+# - prod: 로깅 없음 (기본값), WAL 모드로 동기화 스레드의 쓰기 중에도 API 읽기 가능
+# - bulk: 대량 적재용, 디스크 동기화 생략 (전원 장애 시 마지막 트랜잭션 유실 가능)
+DB_PROFILES = {
+    "dev": {
+        "echo": True,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -2000,  # 음수는 KiB 단위 (약 2MB)
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,  # 밀리초
+    },
+    "prod": {
+        "echo": False,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # 약 64MB
+        "mmap_size": 268435456,  # 256MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "bulk": {
+        "echo": False,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,  # 약 256MB
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+
+def get_db_profile(name=None):
+    """
+    데이터베이스 프로필 설정 반환
+
+    Args:
+        name (str): 프로필 이름 (None 이면 Config.DB_PROFILE)
+
+    Raises:
+        ValueError: 존재하지 않는 프로필인 경우
+    """
+    name = (name or Config.DB_PROFILE).lower()
+    if name not in DB_PROFILES:
+        raise ValueError(
+            f"지원하지 않는 DB 프로필입니다: {name} ({', '.join(DB_PROFILES)})"
+        )
+    return DB_PROFILES[name]
+
+
+def _apply_sqlite_pragmas(dbapi_connection, profile):
+    """새 SQLite 연결에 프로필의 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+        cursor.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+        cursor.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+        cursor.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+        cursor.execute(f"PRAGMA temp_store = {profile['temp_store']}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url=DB_URL, profile=None):
+    """
+    프로필을 적용한 SQLAlchemy 엔진 생성
+
+    Args:
+        url (str): 데이터베이스 URL
+        profile (str): 프로필 이름 (None 이면 Config.DB_PROFILE)
+    """
+    settings = get_db_profile(profile)
+    db_engine = create_engine(
+        url,
+        echo=settings["echo"],  # SQL 쿼리 로깅 (dev 프로필에서만 사용)
+        connect_args={"check_same_thread": False},  # SQLite에서 다중 스레드 지원
+    )
+
+    @event.listens_for(db_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _apply_sqlite_pragmas(dbapi_connection, settings)
+
+    return db_engine
+
+
+# 엔진 생성 (DB_PROFILE 환경 변수로 프로필 선택)
+engine = create_db_engine()
 
 # 세션 팩토리 생성
 session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -33,6 +122,9 @@ session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # 스레드 로컬 세션 생성 (멀티스레드 환경에서 안전)
 Session = scoped_session(session_factory)
 
+# 근태 UPSERT(ON CONFLICT)에 필요한 (employee_id, date) 고유 인덱스
+ATTENDANCE_UNIQUE_INDEX = "uq_attendance_employee_date"
+
 # 모델 베이스 클래스 생성
 Base = declarative_base()
 
@@ -43,8 +135,105 @@ def init_db():
     주의: 이 함수는 애플리케이션 시작 시 한 번만 호출해야 함
     """
     Base.metadata.create_all(bind=engine)
+    ensure_columns()
+    ensure_indexes()
     print(f"데이터베이스 테이블이 '{DB_PATH}'에 생성되었습니다.")
 
+# 모델에 추가된 컬럼 생성 함수
+def ensure_columns(db_engine=None):
+    """
+    모델에 정의된 컬럼 중 기존 DB 테이블에 없는 nullable 컬럼 추가 (ALTER TABLE)
+
+    create_all 은 이미 존재하는 테이블에 컬럼을 추가하지 않으므로,
+    기존 DB 파일에서도 새 컬럼(예: attendance.row_hash)을 조회할 수 있도록
+    init_db 에서 함께 호출합니다. NOT NULL 컬럼은 별도 마이그레이션이 필요합니다.
+
+    Returns:
+        list: 새로 추가한 "테이블.컬럼" 목록
+    """
+    db_engine = db_engine or engine
+    inspector = inspect(db_engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                logging.getLogger(__name__).warning(
+                    f"NOT NULL 컬럼 {table.name}.{column.name} 은 자동으로 추가하지 않습니다."
+                )
+                continue
+            column_type = column.type.compile(dialect=db_engine.dialect)
+            with db_engine.begin() as connection:
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                )
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+# 모델에 정의된 인덱스 생성 함수
+def ensure_indexes(db_engine=None):
+    """
+    모델(__table_args__)에 정의된 인덱스 중 기존 DB에 없는 인덱스 생성
+
+    create_all 은 이미 존재하는 테이블의 인덱스를 추가하지 않으므로,
+    기존 DB 파일에도 인덱스가 적용되도록 init_db 에서 함께 호출합니다.
+    근태 (employee_id, date) 중복 기록이 있으면 고유 인덱스를 만들 수 없으므로,
+    직원+날짜별 가장 최근 기록만 남기고 정리한 뒤 생성합니다 (근태 UPSERT 에 필요).
+    그 밖의 중복 데이터로 생성에 실패한 인덱스는 경고만 남기고 건너뜁니다.
+
+    Returns:
+        list: 새로 생성한 인덱스 이름 목록
+    """
+    db_engine = db_engine or engine
+    inspector = inspect(db_engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(bind=db_engine, checkfirst=True)
+                created.append(index.name)
+            except IntegrityError as e:
+                if index.name != ATTENDANCE_UNIQUE_INDEX:
+                    logging.getLogger(__name__).warning(
+                        f"인덱스 {index.name} 생성 실패 (중복 데이터): {e.orig}"
+                    )
+                    continue
+                removed = remove_duplicate_attendance(db_engine)
+                logging.getLogger(__name__).warning(
+                    f"근태 (직원, 날짜) 중복 기록 {removed}건을 삭제했습니다 "
+                    "(직원+날짜별 최근 기록 유지)."
+                )
+                index.create(bind=db_engine, checkfirst=True)
+                created.append(index.name)
+    return created
+
+# 근태 (employee_id, date) 중복 기록 정리 함수
+def remove_duplicate_attendance(db_engine=None):
+    """
+    직원+날짜별로 가장 최근에 추가된 근태 기록(id 가 가장 큰 기록)만 남기고 삭제
+
+    Returns:
+        int: 삭제한 기록 수
+    """
+    db_engine = db_engine or engine
+    with db_engine.begin() as connection:
+        result = connection.exec_driver_sql(
+            "DELETE FROM attendance WHERE id NOT IN "
+            "(SELECT MAX(id) FROM attendance GROUP BY employee_id, date)"
+        )
+    return result.rowcount
+
 # 데이터베이스 세션 가져오기
 def get_db_session():
     """
@@ -15,17 +15,17 @@ from sqlalchemy import (
     Date,
     JSON,
     Boolean,
+    LargeBinary,
+    Index,
+    event,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import logging
 
 from config.database import Base
-
-logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+from utils.attendance_diff import attendance_row_hash
 
 
 class Employee(Base):
@@ -69,6 +69,18 @@ class Attendance(Base):
     """근태 기록 모델"""
 
     __tablename__ = "attendance"
+    __table_args__ = (
+        # 직원별 하루 1건 (직원+날짜 조회와 기간 조회에 사용)
+        Index("uq_attendance_employee_date", "employee_id", "date", unique=True),
+        # 직원 구분 없는 기간 조회 (급여 일괄 계산, 변경 기간 확인)
+        Index("ix_attendance_date", "date"),
+        # 내용 해시가 비어 있는 기록만 담는 부분 인덱스 (해시 채우기 확인을 상수 비용으로)
+        Index(
+            "ix_attendance_row_hash_missing",
+            "id",
+            sqlite_where=text("row_hash IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="ID")
     employee_id = Column(
@@ -84,6 +96,7 @@ class Attendance(Base):
         String(20), nullable=False, default="정상", comment="근태유형"
     )
     remarks = Column(Text, nullable=True, comment="비고")
+    row_hash = Column(BigInteger, nullable=True, comment="내용 해시 (CSV 변경 감지용)")
     created_at = Column(
         DateTime, nullable=False, default=func.now(), comment="생성일시"
     )
@@ -98,17 +111,49 @@ class Attendance(Base):
     # 관계 설정
     employee = relationship("Employee", back_populates="attendances")
 
+    def refresh_row_hash(self):
+        """내용 필드로 row_hash 갱신"""
+        self.row_hash = attendance_row_hash(
+            self.check_in, self.check_out, self.attendance_type, self.remarks
+        )
+
     def __repr__(self):
         return f"<Attendance(id={self.id}, employee_id={self.employee_id}, date={self.date})>"
 
 
+@event.listens_for(Attendance, "before_insert")
+@event.listens_for(Attendance, "before_update")
+def _set_attendance_row_hash(mapper, connection, target):
+    """ORM 으로 저장되는 근태 기록의 내용 해시 갱신"""
+    target.refresh_row_hash()
+
+
 class Payroll(Base):
     """급여 데이터 모델"""
 
     __tablename__ = "payroll"
+    __table_args__ = (
+        # 직원별 급여 기간/상태 조회 (단건 계산, 초안 교체)
+        Index(
+            "ix_payroll_employee_period_status",
+            "employee_id",
+            "payment_period_start",
+            "payment_period_end",
+            "status",
+        ),
+        # 기간별 일괄 조회 (일괄 계산, 재계산 대상 표시)
+        Index(
+            "ix_payroll_period_status",
+            "payment_period_start",
+            "payment_period_end",
+            "status",
+        ),
+        # 급여 기록 키셋 페이지/스트리밍 조회 ((기간 시작일, id) 순서)
+        Index("ix_payroll_period_start_id", "payment_period_start", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="ID")
-    payroll_code = Column(String(20), unique=True, nullable=False, comment="급여코드")
+    payroll_code = Column(String(36), unique=True, nullable=False, comment="급여코드")
     employee_id = Column(
         String(10),
         ForeignKey("employees.employee_id"),
@@ -141,6 +186,8 @@ class Payroll(Base):
     )
     net_pay = Column(BigInteger, nullable=False, comment="실수령액")
     status = Column(String(20), nullable=False, default="draft", comment="상태")
+    # 초안 계산 이후 근태가 변경된 시각 (값이 있으면 재사용하지 않고 다시 계산)
+    stale_at = Column(DateTime, nullable=True, comment="재계산필요일시")
     payroll_type = Column(
         String(20), nullable=False, default="regular", comment="급여유형"
     )
@@ -166,10 +213,39 @@ class Payroll(Base):
         return f"<Payroll(code={self.payroll_code}, employee_id={self.employee_id})>"
 
 
+class PayrollCalculationTrace(Base):
+    """급여 계산 내역 모델
+
+    trace=full 로 계산한 급여의 계산 내역을 zlib 압축 JSON 으로 저장합니다.
+    """
+
+    __tablename__ = "payroll_calculation_traces"
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="ID")
+    payroll_code = Column(
+        String(36), unique=True, nullable=False, index=True, comment="급여코드"
+    )
+    employee_id = Column(String(10), nullable=False, comment="직원 ID")
+    encoding = Column(
+        String(20), nullable=False, default="json+zlib", comment="저장형식"
+    )
+    data = Column(LargeBinary, nullable=False, comment="계산내역")
+    created_at = Column(
+        DateTime, nullable=False, default=func.now(), comment="생성일시"
+    )
+
+    def __repr__(self):
+        return f"<PayrollCalculationTrace(payroll_code={self.payroll_code}, employee_id={self.employee_id})>"
+
+
 class PayrollAudit(Base):
     """급여 감사 추적 모델"""
 
     __tablename__ = "payroll_audit"
+    __table_args__ = (
+        # 대상별 변경 이력 조회 (최신순)
+        Index("ix_payroll_audit_target", "target_type", "target_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="ID")
     action = Column(String(50), nullable=False, comment="작업유형")
@@ -195,7 +271,13 @@ class PayrollDocument(Base):
 
     __tablename__ = "payroll_documents"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment="ID")
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가하므로 SQLite 에서는 Integer 로 생성
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+        comment="ID",
+    )
     payroll_id = Column(
         BigInteger, ForeignKey("payroll.id"), nullable=False, comment="급여ID"
     )
@@ -213,6 +295,83 @@ class PayrollDocument(Base):
         return f"<PayrollDocument(id={self.id}, payroll_id={self.payroll_id}, type={self.document_type})>"
 
 
+class PayrollMonthlySummary(Base):
+    """월별 급여 요약 모델
+
+    확정/지급된 급여를 (급여월, 부서, 직급, 급여유형) 단위로 미리 집계합니다.
+    급여월은 급여기간 시작일 기준이며, 부서/직급은 집계 시점의 직원 정보입니다.
+    급여 확정/지급 시 같은 트랜잭션에서 해당 월을 다시 집계합니다
+    (utils.payroll_summary).
+    """
+
+    __tablename__ = "payroll_monthly_summary"
+
+    month = Column(String(7), primary_key=True, comment="급여월 (YYYY-MM)")
+    department = Column(String(50), primary_key=True, comment="부서")
+    position = Column(String(50), primary_key=True, comment="직급")
+    payroll_type = Column(String(20), primary_key=True, comment="급여유형")
+    payroll_count = Column(Integer, nullable=False, default=0, comment="급여 건수")
+    paid_count = Column(Integer, nullable=False, default=0, comment="지급 건수")
+    max_period_end = Column(Date, nullable=False, comment="급여기간 종료일 최대")
+    sum_base_pay = Column(BigInteger, nullable=False, default=0, comment="기본급 합계")
+    min_base_pay = Column(BigInteger, nullable=False, default=0, comment="기본급 최소")
+    max_base_pay = Column(BigInteger, nullable=False, default=0, comment="기본급 최대")
+    sum_overtime_pay = Column(
+        BigInteger, nullable=False, default=0, comment="초과근무수당 합계"
+    )
+    min_overtime_pay = Column(
+        BigInteger, nullable=False, default=0, comment="초과근무수당 최소"
+    )
+    max_overtime_pay = Column(
+        BigInteger, nullable=False, default=0, comment="초과근무수당 최대"
+    )
+    sum_night_shift_pay = Column(
+        BigInteger, nullable=False, default=0, comment="야간근무수당 합계"
+    )
+    min_night_shift_pay = Column(
+        BigInteger, nullable=False, default=0, comment="야간근무수당 최소"
+    )
+    max_night_shift_pay = Column(
+        BigInteger, nullable=False, default=0, comment="야간근무수당 최대"
+    )
+    sum_holiday_pay = Column(
+        BigInteger, nullable=False, default=0, comment="휴일근무수당 합계"
+    )
+    min_holiday_pay = Column(
+        BigInteger, nullable=False, default=0, comment="휴일근무수당 최소"
+    )
+    max_holiday_pay = Column(
+        BigInteger, nullable=False, default=0, comment="휴일근무수당 최대"
+    )
+    sum_gross_pay = Column(
+        BigInteger, nullable=False, default=0, comment="총 지급액 합계"
+    )
+    min_gross_pay = Column(
+        BigInteger, nullable=False, default=0, comment="총 지급액 최소"
+    )
+    max_gross_pay = Column(
+        BigInteger, nullable=False, default=0, comment="총 지급액 최대"
+    )
+    sum_total_deductions = Column(
+        BigInteger, nullable=False, default=0, comment="총 공제액 합계"
+    )
+    min_total_deductions = Column(
+        BigInteger, nullable=False, default=0, comment="총 공제액 최소"
+    )
+    max_total_deductions = Column(
+        BigInteger, nullable=False, default=0, comment="총 공제액 최대"
+    )
+    sum_net_pay = Column(BigInteger, nullable=False, default=0, comment="실수령액 합계")
+    min_net_pay = Column(BigInteger, nullable=False, default=0, comment="실수령액 최소")
+    max_net_pay = Column(BigInteger, nullable=False, default=0, comment="실수령액 최대")
+    updated_at = Column(
+        DateTime, nullable=False, default=func.now(), comment="집계일시"
+    )
+
+    def __repr__(self):
+        return f"<PayrollMonthlySummary(month={self.month}, department={self.department}, position={self.position})>"
+
+
 class AttendanceAudit(Base):
     """근태 기록 변경 이력 모델
 
@@ -220,6 +379,12 @@ class AttendanceAudit(Base):
     """
 
     __tablename__ = "attendance_audit"
+    __table_args__ = (
+        # 직원별 기간 이력 조회
+        Index("ix_attendance_audit_employee_date", "employee_id", "date", "changed_at"),
+        # 전체 이력 최신순 조회
+        Index("ix_attendance_audit_changed_at", "changed_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     employee_id = Column(String(20), nullable=False)
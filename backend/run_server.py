@@ -1,11 +1,12 @@
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
+from sqlalchemy import insert
 import pandas as pd
 import os
 import json
 import logging
+import multiprocessing
 from datetime import datetime, timedelta
-import sys
 from flask_socketio import SocketIO, emit
 import threading
 import time
@@ -21,6 +22,30 @@ logger = logging.getLogger(__name__)
 # 기존 모듈 임포트
 from utils.pay_calculator import PayCalculator
 from utils.insurance_calculator import InsuranceCalculator
+from utils.payroll_trace import normalize_trace_level, render_trace_lines
+from utils.payroll_batch import clamp_workers
+from utils.read_layer import (
+    ATTENDANCE_AUDIT,
+    ATTENDANCE_LIST,
+    ATTENDANCE_RECORDS,
+    EMPLOYEE_LIST,
+)
+from utils.payroll_records import (
+    NDJSON_MIMETYPE,
+    build_records_query,
+    fetch_page,
+    fetch_records,
+    iter_records,
+    negotiated_format,
+    parse_page_size,
+)
+from utils.payroll_analytics import analyze_payrolls
+from utils.employee_cache import employee_cache
+from utils.conditional_get import conditional_get
+from utils.partition_files import month_key
+from utils.payroll_summary import ensure_payroll_summary, refresh_payroll_summary
+from utils.attendance_upsert import frame_to_rows, records_to_rows, upsert_attendance
+from sync_attendance_db_to_csv import sync_db_to_csv
 
 # 새로 추가: 데이터베이스 연결 및 모델 임포트
 from config.database import init_db, get_db_session
@@ -34,7 +59,12 @@ from models.models import (
 )
 
 # 새로 추가: 급여 서비스 임포트
-from app.services.payroll_service import PayrollService, FILE_CHANGED_EVENT
+from app.services.payroll_service import (
+    BATCH_QUERY_CHUNK_SIZE,
+    FILE_CHANGED_EVENT,
+    PayrollService,
+    _chunked,
+)
 from config import Config
 
 # 새로 추가: 인증 라우트 임포트
@@ -57,9 +87,17 @@ CORS(
                 "Cache-Control",
                 "Expires",
                 "Pragma",
+                # 조건부 GET (utils/conditional_get.py)
+                "If-None-Match",
+                "If-Modified-Since",
             ],
             "supports_credentials": True,
-            "expose_headers": ["Content-Type", "Authorization"],
+            "expose_headers": [
+                "Content-Type",
+                "Authorization",
+                "ETag",
+                "Last-Modified",
+            ],
             "max_age": 3600,
         }
     },
@@ -103,6 +141,8 @@ socketio = SocketIO(
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 EMPLOYEES_CSV = os.path.join(BASE_DIR, "data", "employees.csv")
+# /api/employees 응답 필드 (직원 정보 캐시 레코드에서 추출)
+EMPLOYEE_LIST_FIELDS = tuple(column.key for column in EMPLOYEE_LIST.columns)
 ATTENDANCE_CSV = os.path.join(BASE_DIR, "data", "attendance.csv")
 
 # 급여 지급일 설정 (매월 25일로 가정)
@@ -144,7 +184,9 @@ def watch_file_change_event():
 file_watcher_thread = threading.Thread(
     target=watch_file_change_event, daemon=True, name="FileChangeEventWatcher"
 )
-file_watcher_thread.start()
+# 급여 계산 작업자 프로세스(spawn)가 이 모듈을 다시 import 할 때는 시작하지 않음
+if multiprocessing.parent_process() is None:
+    file_watcher_thread.start()
 
 # 변경 감지 핸들러 등록
 payroll_service.register_change_handler(handle_file_change)
@@ -207,29 +249,22 @@ def handle_check_changes():
 
 # 수정: CSV 파일에서 직원 데이터 로드하는 함수
 def load_employees():
+    """
+    재직중 직원 목록 (/api/employees)
+
+    직원 정보 캐시(utils/employee_cache.py)의 employees 테이블 스냅샷을 사용하고,
+    재직중 직원이 없으면 employees.csv 스냅샷으로 폴백합니다.
+    """
     try:
         # 데이터베이스에서 직원 데이터 로드 시도
         session = get_db_session()
         try:
-            employees = (
-                session.query(Employee).filter(Employee.status == "재직중").all()
-            )
+            employees = [
+                {field: getattr(record, field) for field in EMPLOYEE_LIST_FIELDS}
+                for record in employee_cache.database(session).filter(status="재직중")
+            ]
             if employees:
-                print(
-                    f"데이터베이스에서 {len(employees)}명의 직원 데이터를 로드했습니다."
-                )
-                return [
-                    {
-                        "employee_id": emp.employee_id,
-                        "name": emp.name,
-                        "department": emp.department,
-                        "position": emp.position,
-                        "base_salary": emp.base_salary,
-                        "family_count": emp.family_count,
-                        "status": emp.status,
-                    }
-                    for emp in employees
-                ]
+                return employees
         except Exception as e:
             print(f"데이터베이스 조회 오류: {e}")
         finally:
@@ -240,35 +275,8 @@ def load_employees():
             print(f"Error: {EMPLOYEES_CSV} 파일이 존재하지 않습니다.")
             return []
 
-        print(f"CSV 파일에서 직원 데이터 로드 중: {EMPLOYEES_CSV}")
-        with open(EMPLOYEES_CSV, "r", encoding="utf-8") as f:
-            print(f"First few lines of {EMPLOYEES_CSV}:")
-            for i, line in enumerate(f):
-                if i < 3:
-                    print(line.strip())
-                else:
-                    break
-
-        df = pd.read_csv(
-            EMPLOYEES_CSV,
-            encoding="utf-8",
-            delimiter=",",
-            dtype={
-                "employee_id": str,
-                "base_salary": "int",
-                "family_count": "int",
-                "num_children": "int",
-                "name": str,
-                "department": str,
-                "status": str,
-                "position": str,
-            },
-            on_bad_lines="warn",
-        )
-
-        print(f"Total rows in CSV: {len(df)}")
-        df = df[df["status"].str.strip().str.lower() == "재직중"]
-        print(f"Filtered rows where status is '재직중': {len(df)} rows")
+        df = employee_cache.csv(EMPLOYEES_CSV).frame()
+        df = df[df["status"].astype(str).str.strip().str.lower() == "재직중"]
 
         if df.empty:
             print("Warning: '재직중' 상태의 직원이 없습니다.")
@@ -292,19 +300,7 @@ def load_employees():
             print("Warning: 유효한 직원 데이터가 없습니다.")
             return []
 
-        result = valid_data[
-            [
-                "employee_id",
-                "name",
-                "department",
-                "position",
-                "base_salary",
-                "family_count",
-                "status",
-            ]
-        ].to_dict("records")
-        print(f"Loaded {len(result)} valid employees from CSV")
-        return result
+        return valid_data[list(EMPLOYEE_LIST_FIELDS)].to_dict("records")
     except Exception as e:
         print(f"Error loading employees: {e}")
         return []
@@ -316,26 +312,12 @@ def load_attendance():
         # 데이터베이스에서 근태 데이터 로드 시도
         session = get_db_session()
         try:
-            attendance_records = session.query(Attendance).all()
+            attendance_records = ATTENDANCE_LIST.all(session, ATTENDANCE_LIST.select())
             if attendance_records:
                 print(
                     f"데이터베이스에서 {len(attendance_records)}개의 근태 기록을 로드했습니다."
                 )
-                return [
-                    {
-                        "employee_id": record.employee_id,
-                        "date": (
-                            record.date.strftime("%Y-%m-%d")
-                            if hasattr(record.date, "strftime")
-                            else str(record.date)
-                        ),
-                        "check_in": record.check_in or "",
-                        "check_out": record.check_out or "",
-                        "attendance_type": record.attendance_type or "정상",
-                        "remarks": record.remarks or "",
-                    }
-                    for record in attendance_records
-                ]
+                return attendance_records
         except Exception as e:
             print(f"데이터베이스 조회 오류: {e}")
         finally:
@@ -349,7 +331,10 @@ def load_attendance():
         # CSV 파일 존재하고 데이터베이스가 비어있는 경우 자동으로 동기화 시도
         print(f"CSV 파일에서 근태 데이터 로드 중: {ATTENDANCE_CSV}")
         df = pd.read_csv(
-            ATTENDANCE_CSV, encoding="utf-8", delimiter=",", on_bad_lines="warn"
+            ATTENDANCE_CSV,
+            encoding=Config.ATTENDANCE_CSV_ENCODING,
+            delimiter=",",
+            on_bad_lines="warn",
         )
 
         df["check_in"] = df["check_in"].fillna("").astype(str).str.strip()
@@ -391,41 +376,19 @@ def _sync_attendance_to_db(attendance_data):
 
     session = get_db_session()
     try:
-        # 모든 기존 데이터 삭제
-        deleted_count = session.query(Attendance).delete()
-        print(f"{deleted_count}개의 기존 근태 기록이 삭제되었습니다.")
-
-        # 새 데이터 추가
-        records_added = 0
-        for record in attendance_data:
-            try:
-                # 날짜 문자열을 date 객체로 변환
-                if isinstance(record["date"], str):
-                    date_obj = datetime.strptime(record["date"], "%Y-%m-%d").date()
-                else:
-                    date_obj = record["date"]
-
-                # 새 근태 기록 생성
-                attendance = Attendance(
-                    employee_id=record["employee_id"],
-                    date=date_obj,
-                    check_in=record.get("check_in", ""),
-                    check_out=record.get("check_out", ""),
-                    attendance_type=record.get("attendance_type", "정상"),
-                    remarks=record.get("remarks", ""),
-                )
-                session.add(attendance)
-                records_added += 1
-            except Exception as e:
-                print(
-                    f"근태 기록 추가 오류 ({record['employee_id']}, {record['date']}): {e}"
-                )
-                continue
-
-        # 변경사항 커밋
+        # 스테이징 후 UPSERT (변경된 기록만 갱신, CSV 에 없는 기록 삭제)
+        result = upsert_attendance(
+            session, records_to_rows(attendance_data), delete_missing=True
+        )
         session.commit()
-        print(f"{records_added}개의 근태 기록이 DB에 성공적으로 추가되었습니다.")
-        return records_added
+        print(
+            f"근태 동기화 완료: 추가 {result['inserted']}개, 변경 {result['updated']}개, "
+            f"삭제 {result['deleted']}개, 변경 없음 {result['unchanged']}개"
+        )
+
+        # 변경된 근태 기간의 초안 급여만 재계산 대상으로 표시
+        payroll_service.mark_payrolls_stale(result["changes"])
+        return result["staged"]
     except Exception as e:
         session.rollback()
         print(f"근태 데이터 동기화 오류: {e}")
@@ -434,7 +397,33 @@ def _sync_attendance_to_db(attendance_data):
         session.close()
 
 
+def _export_attendance_csv(changes):
+    """
+    DB 근태를 attendance.csv 로 내보내기 (변경된 월만, 실패하면 전체 내보내기 재시도)
+
+    내보내기는 임시 파일 작성 후 교체하므로 실패해도 기존 CSV 는 그대로 남고,
+    DB 에 근태 기록이 없으면 CSV 를 덮어쓰지 않습니다.
+
+    Returns:
+        bool: 내보내기 성공 여부
+    """
+    print("\n근태 기록 변경 후 CSV 파일 자동 동기화 시작...")
+    # 서버가 쓰는 CSV 는 파일 감시 동기화 대상에서 제외
+    with payroll_service.attendance_self_write():
+        exported = sync_db_to_csv(changes)
+        if not exported:
+            print("변경된 월 내보내기 실패, 전체 내보내기를 다시 시도합니다...")
+            exported = sync_db_to_csv()
+
+    if exported:
+        print("근태 기록 변경과 CSV 파일 동기화가 모두 완료되었습니다.")
+    else:
+        print("근태 CSV 파일을 내보내지 못했습니다. 기존 CSV 파일은 그대로 유지됩니다.")
+    return exported
+
+
 @app.route("/api/employees", methods=["GET"])
+@conditional_get("employees", files=(EMPLOYEES_CSV,))
 def get_employees():
     employees = load_employees()
     print(f"Returning {len(employees)} employees via /api/employees")
@@ -458,6 +447,18 @@ def calculate_payroll():
         start_date_str = data.get("start_date")
         end_date_str = data.get("end_date")
         force_recalculate = data.get("force_recalculate", False)
+        # 계산 작업자 프로세스 수 (없으면 Config.PAYROLL_WORKERS, 최대 CPU 수)
+        workers = data.get("workers")
+        if workers is not None:
+            try:
+                workers = clamp_workers(workers)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+        # 계산 내역 수준 (none | summary | full, 기본값 none)
+        try:
+            trace = normalize_trace_level(data.get("trace"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         # 시작일과 종료일 필요
         if not start_date_str or not end_date_str:
@@ -470,8 +471,10 @@ def calculate_payroll():
         if not employee_ids:
             session = get_db_session()
             try:
-                employees = session.query(Employee).all()
-                employee_ids = [e.id for e in employees]
+                employee_ids = [
+                    employee_id
+                    for (employee_id,) in session.query(Employee.employee_id)
+                ]
             finally:
                 session.close()
 
@@ -479,10 +482,10 @@ def calculate_payroll():
         try:
             file_changed = payroll_service.sync_attendance_if_changed()
             if file_changed:
+                # 변경된 근태의 초안 급여만 재계산 표시되어 다시 계산됩니다
                 print(
                     "근태 데이터 파일 변경이 감지되어 데이터베이스와 동기화되었습니다."
                 )
-                force_recalculate = True
         except Exception as sync_error:
             print(f"근태 데이터 동기화 중 오류 발생: {sync_error}")
             # 오류가 발생해도 계속 진행
@@ -514,57 +517,68 @@ def calculate_payroll():
             start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
             end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
 
-            # 각 직원별로 급여 계산
+            # 전체 직원을 일괄 계산하고, 계산 묶음이 저장될 때마다 직원별 결과 전달
             results = []
-            for i, employee_id in enumerate(employee_ids):
-                # 진행 상황 메시지 전송
-                current_progress = int((i / total_steps) * 100)
-                yield json.dumps(
-                    {
-                        "status": "progress",
-                        "message": f"직원 ID {employee_id}의 급여를 계산 중...",
-                        "progress": current_progress,
-                        "total": 100,
-                        "employee_id": employee_id,
-                    }
-                ) + "\n"
-
-                try:
-                    # 급여 계산 및 저장
-                    payroll_data = payroll_service.calculate_and_save_payroll(
-                        employee_id, start_date, end_date, force_recalculate
-                    )
-
-                    if payroll_data:
-                        # 계산 로그 추출
-                        calculation_logs = payroll_data.pop("calculation_logs", [])
-
-                        # 계산 로그 전송
-                        if calculation_logs:
-                            yield json.dumps(
-                                {
-                                    "status": "calculation_logs",
-                                    "employee_id": employee_id,
-                                    "logs": calculation_logs,
-                                }
-                            ) + "\n"
-
-                        results.append(payroll_data)
-                    else:
-                        print(
-                            f"직원 ID {employee_id}에 대한 급여 계산 결과가 없습니다."
-                        )
-                except Exception as e:
-                    print(f"직원 ID {employee_id}의 급여 계산 중 오류 발생: {e}")
-                    # 오류가 발생해도 다른 직원 계산 계속 진행
+            done = 0
+            try:
+                # 강제 재계산이 아니면 직원 정보와 근태가 바뀌지 않은 최신 초안은 재사용
+                for event in payroll_service.iter_payroll_batch(
+                    employee_ids,
+                    start_date,
+                    end_date,
+                    force_recalculate,
+                    workers,
+                    reuse_drafts=not force_recalculate,
+                    trace=trace,
+                ):
+                    employee_id = event["employee_id"]
+                    done += 1
+
+                    # 진행 상황 메시지 전송 (이벤트는 입력 순서가 아닐 수 있음)
+                    current_progress = int((done / total_steps) * 100)
                     yield json.dumps(
                         {
-                            "status": "error",
-                            "message": f"직원 ID {employee_id}의 급여 계산 중 오류 발생: {str(e)}",
+                            "status": "progress",
+                            "message": f"직원 ID {employee_id}의 급여를 계산 중...",
+                            "progress": current_progress,
+                            "total": 100,
                             "employee_id": employee_id,
                         }
                     ) + "\n"
 
+                    if event["status"] == "not_found":
+                        print(
+                            f"직원 ID {employee_id}에 대한 급여 계산 결과가 없습니다."
+                        )
+                        continue
+
+                    if event["status"] == "error":
+                        print(
+                            f"직원 ID {employee_id}의 급여 계산 중 오류 발생: {event['error']}"
+                        )
+                        # 오류가 발생해도 다른 직원 계산 계속 진행
+                        yield json.dumps(
+                            {
+                                "status": "error",
+                                "message": f"직원 ID {employee_id}의 급여 계산 중 오류 발생: {event['error']}",
+                                "employee_id": employee_id,
+                            }
+                        ) + "\n"
+                        continue
+
+                    # 계산 내역은 trace 옵션에 따라 결과에 요약만 포함되며,
+                    # 전체 내역은 /api/payroll/<payroll_code>/trace 로 조회
+                    results.append(event["payroll"])
+            except Exception as e:
+                # 저장에 실패한 묶음부터는 저장되지 않음 (이미 전달한 결과는 저장됨)
+                print(f"급여 일괄 계산 중 오류 발생: {e}")
+                yield json.dumps(
+                    {
+                        "status": "error",
+                        "message": f"급여 일괄 계산 중 오류 발생: {str(e)}",
+                    }
+                ) + "\n"
+
             # 최종 결과 전송
             yield json.dumps(
                 {
@@ -583,6 +597,30 @@ def calculate_payroll():
         return jsonify({"error": f"급여 계산 중 오류 발생: {str(e)}"}), 500
 
 
+@app.route("/api/payroll/<payroll_code>/trace", methods=["GET"])
+def get_payroll_trace(payroll_code):
+    """
+    급여 계산 내역 조회 API
+
+    trace=full 로 계산한 급여의 계산 내역을 반환합니다.
+    format=text 이면 사람이 읽는 문자열 목록(lines)을 함께 반환합니다.
+    """
+    try:
+        trace = payroll_service.get_payroll_trace(payroll_code)
+        if trace is None:
+            return (
+                jsonify({"error": f"급여 코드 {payroll_code}의 계산 내역이 없습니다."}),
+                404,
+            )
+
+        response = {"payroll_code": payroll_code, "trace": trace}
+        if request.args.get("format") == "text":
+            response["lines"] = render_trace_lines(trace)
+        return jsonify(response)
+    except Exception as e:
+        return jsonify({"error": f"계산 내역 조회 중 오류 발생: {str(e)}"}), 500
+
+
 # 새로 추가: 급여 확정 API 엔드포인트 (날짜 처리 수정)
 @app.route("/api/payroll/confirm", methods=["PUT"])
 def confirm_payroll():
@@ -659,11 +697,21 @@ def process_payment():
     session = get_db_session()
     try:
         paid_payrolls = []
+        audits = []
+        paid_months = set()
+
+        # 요청한 급여를 한 번에 조회 (IN 조건은 BATCH_QUERY_CHUNK_SIZE 개씩)
+        payrolls = {}
+        for chunk in _chunked(payroll_ids, BATCH_QUERY_CHUNK_SIZE):
+            payrolls.update(
+                (payroll.payroll_code, payroll)
+                for payroll in session.query(Payroll).filter(
+                    Payroll.payroll_code.in_(chunk)
+                )
+            )
 
         for payroll_code in payroll_ids:
-            payroll = (
-                session.query(Payroll).filter_by(payroll_code=payroll_code).first()
-            )
+            payroll = payrolls.get(payroll_code)
             if not payroll or payroll.status != "confirmed":
                 continue
 
@@ -679,26 +727,27 @@ def process_payment():
             payroll.status = "paid"
             payroll.payment_date = payment_date
             payroll.payment_method = payment_method
+            paid_months.add(month_key(payroll.payment_period_start))
 
-            # 감사 로그 추가
-            audit = PayrollAudit(
-                action="PAYMENT",
-                user_id=user_id,
-                timestamp=datetime.now(),
-                target_type="payroll",
-                target_id=payroll_code,
-                old_value=json.dumps(old_value),
-                new_value=json.dumps(
-                    {
-                        "status": "paid",
-                        "payment_date": payment_date_str,
-                        "payment_method": payment_method,
-                    }
-                ),
-                ip_address=request.remote_addr,
+            # 감사 로그 추가 (커밋 전에 한 번에 INSERT)
+            audits.append(
+                {
+                    "action": "PAYMENT",
+                    "user_id": user_id,
+                    "timestamp": datetime.now(),
+                    "target_type": "payroll",
+                    "target_id": payroll_code,
+                    "old_value": json.dumps(old_value),
+                    "new_value": json.dumps(
+                        {
+                            "status": "paid",
+                            "payment_date": payment_date_str,
+                            "payment_method": payment_method,
+                        }
+                    ),
+                    "ip_address": request.remote_addr,
+                }
             )
-
-            session.add(audit)
             paid_payrolls.append(
                 {
                     "payroll_id": payroll.id,
@@ -708,6 +757,10 @@ def process_payment():
                 }
             )
 
+        if audits:
+            session.execute(insert(PayrollAudit), audits)
+        # 지급 처리한 급여월의 월별 요약을 같은 트랜잭션에서 다시 집계
+        refresh_payroll_summary(session, paid_months)
         session.commit()
 
         if not paid_payrolls:
@@ -730,8 +783,18 @@ def process_payment():
         session.close()
 
 
-# 새로 추가: 급여 기록 조회 API 엔드포인트 (날짜 처리 수정)
+# 급여 기록 조회 API 엔드포인트
+# - 기본: 전체 결과를 JSON 배열로 응답 (기존 응답 형식)
+# - limit/cursor: (급여기간 시작일, id) 키셋 페이지 {records, next_cursor, has_more, limit}
+# - format=ndjson (또는 Accept: application/x-ndjson): 한 줄에 한 건씩 스트리밍
+#   (첫 행을 조회한 뒤 응답을 시작하므로 조회 오류는 500 으로 응답)
 @app.route("/api/payroll/records", methods=["GET"])
+@conditional_get(
+    "payroll",
+    "employees",
+    variant=lambda: negotiated_format(request),
+    vary=("Accept",),
+)
 def get_payroll_records():
     # 쿼리 파라미터 파싱
     employee_id = request.args.get("employee_id")
@@ -740,129 +803,96 @@ def get_payroll_records():
     status = request.args.get(
         "status"
     )  # draft, confirmed, paid 또는 comma로 구분된 여러 상태
+    cursor = request.args.get("cursor")
+    limit = request.args.get("limit")
+    output_format = negotiated_format(request)
 
     print(
-        f"급여 기록 요청: employee_id={employee_id}, status={status}, start_date={start_date}, end_date={end_date}"
+        f"급여 기록 요청: employee_id={employee_id}, status={status}, start_date={start_date}, end_date={end_date}, "
+        f"cursor={cursor}, limit={limit}, format={output_format}"
     )
 
-    # 데이터베이스 세션 시작
-    session = get_db_session()
-
     try:
-        # 기본 쿼리 생성
-        query = session.query(Payroll)
-
-        # 필터 적용
-        if employee_id:
-            query = query.filter(Payroll.employee_id == employee_id)
-
-        if start_date:
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            query = query.filter(Payroll.payment_period_start >= start_date_obj)
-
-        if end_date:
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            query = query.filter(Payroll.payment_period_end <= end_date_obj)
-
-        if status:
-            status_list = status.split(",")
-            query = query.filter(Payroll.status.in_(status_list))
-
-        # 결과 가져오기
-        payrolls = query.all()
-        print(f"급여 기록 조회 결과: {len(payrolls)}건")
-
-        # 직원 정보 조회를 위한 ID 목록
-        employee_ids = [p.employee_id for p in payrolls]
-        employee_records = (
-            session.query(Employee).filter(Employee.employee_id.in_(employee_ids)).all()
+        query = build_records_query(
+            employee_id=employee_id,
+            start_date=(
+                datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
+            ),
+            end_date=(
+                datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
+            ),
+            status=status.split(",") if status else None,
         )
-        employees = {
-            emp.employee_id: {
-                "name": emp.name,
-                "department": emp.department,
-                "position": emp.position,
-            }
-            for emp in employee_records
-        }
-
-        # 응답 데이터 포맷팅 - 기존 필드명 유지
-        results = []
-        for payroll in payrolls:
-            employee_info = employees.get(
-                payroll.employee_id,
-                {"name": "Unknown", "department": "Unknown", "position": "Unknown"},
-            )
+        page_size = parse_page_size(limit)
+    except ValueError as e:
+        return jsonify({"error": f"잘못된 조회 조건입니다: {str(e)}"}), 400
 
-            # date 객체를 문자열로 변환
-            payment_period_start = (
-                payroll.payment_period_start.strftime("%Y-%m-%d")
-                if payroll.payment_period_start
-                else None
-            )
-            payment_period_end = (
-                payroll.payment_period_end.strftime("%Y-%m-%d")
-                if payroll.payment_period_end
-                else None
+    # 키셋 페이지 조회
+    if cursor or limit:
+        session = get_db_session()
+        try:
+            page = fetch_page(session, query, page_size, cursor)
+            print(
+                f"급여 기록 페이지 조회 결과: {len(page['records'])}건, has_more={page['has_more']}"
             )
-            payment_date = (
-                payroll.payment_date.strftime("%Y-%m-%d")
-                if payroll.payment_date
-                else None
+            return jsonify(page)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return (
+                jsonify({"error": f"급여 기록 조회 중 오류가 발생했습니다: {str(e)}"}),
+                500,
             )
+        finally:
+            session.close()
 
-            # 결과 데이터 구성
-            result = {
-                "payroll_id": payroll.id,
-                "payroll_code": payroll.payroll_code,
-                "employee_id": payroll.employee_id,
-                "employee_name": employee_info["name"],
-                "department": employee_info["department"],
-                "position": employee_info["position"],
-                "payment_period_start": payment_period_start,
-                "payment_period_end": payment_period_end,
-                "payment_date": payment_date,
-                "basePay": payroll.base_pay,  # 모델은 base_pay이지만 응답은 basePay
-                "overtimePay": payroll.overtime_pay,  # 모델은 overtime_pay이지만 응답은 overtimePay
-                "nightPay": payroll.night_shift_pay,  # 모델은 night_shift_pay이지만 응답은 nightPay
-                "holidayPay": payroll.holiday_pay,  # 모델은 holiday_pay이지만 응답은 holidayPay
-                "totalAllowances": payroll.total_allowances,
-                "totalPay": payroll.gross_pay,  # 모델은 gross_pay이지만 응답은 totalPay
-                "income_tax": payroll.income_tax,
-                "residence_tax": payroll.residence_tax,
-                "national_pension": payroll.national_pension,
-                "health_insurance": payroll.health_insurance,
-                "employment_insurance": payroll.employment_insurance,
-                "total_deductions": payroll.total_deductions,
-                "netPay": payroll.net_pay,  # 모델은 net_pay이지만 응답은 netPay
-                "status": payroll.status,
-                "confirmed_at": (
-                    payroll.confirmed_at.isoformat() if payroll.confirmed_at else None
-                ),
-                "confirmed_by": payroll.confirmed_by,
-                "payment_method": payroll.payment_method,
-                "remarks": payroll.remarks,
-            }
-
-            results.append(result)
-
-        print(f"응답 데이터 구성 완료: {len(results)}건")
-        if results:
-            print(
-                f"첫 번째 급여 데이터 샘플: {results[0]['payroll_id']}, {results[0]['employee_name']}, {results[0]['payment_date']}"
+    session = get_db_session()
+    if output_format != "ndjson":
+        try:
+            records = fetch_records(session, query)
+            print(f"응답 데이터 구성 완료: {len(records)}건")
+            return jsonify(records)
+        except Exception as e:
+            return (
+                jsonify({"error": f"급여 기록 조회 중 오류가 발생했습니다: {str(e)}"}),
+                500,
             )
+        finally:
+            session.close()
 
-        return jsonify(results)
+    # NDJSON 스트리밍: 첫 행까지 조회한 뒤 응답 시작
+    try:
+        records = iter_records(session, query)
+        first = next(records, None)
     except Exception as e:
+        session.close()
         return (
             jsonify({"error": f"급여 기록 조회 중 오류가 발생했습니다: {str(e)}"}),
             500,
         )
-    finally:
-        session.close()
+
+    def generate():
+        # 세션은 스트리밍이 끝날 때까지 유지
+        count = 0
+        try:
+            if first is not None:
+                yield json.dumps(first, ensure_ascii=False) + "\n"
+                count += 1
+                for record in records:
+                    yield json.dumps(record, ensure_ascii=False) + "\n"
+                    count += 1
+            print(f"급여 기록 스트리밍 완료: {count}건")
+        finally:
+            session.close()
+
+    response = Response(generate(), mimetype=NDJSON_MIMETYPE)
+    # 스트리밍을 시작하지 않고 응답이 닫혀도 세션 정리
+    response.call_on_close(session.close)
+    return response
 
 
 @app.route("/api/attendance", methods=["GET"])
+@conditional_get("attendance", files=(ATTENDANCE_CSV,))
 def get_attendance():
     attendance = load_attendance()
     print(f"Returning {len(attendance)} attendance records via /api/attendance")
@@ -902,6 +932,20 @@ def check_attendance_changes():
         return jsonify({"error": f"근태 파일 변경 확인 중 오류 발생: {str(e)}"}), 500
 
 
+@app.route("/api/attendance/sync-metrics", methods=["GET"])
+def attendance_sync_metrics():
+    """
+    근태 파일 감시 동기화 스케줄러 지표 API
+
+    파일 이벤트/병합/자체 쓰기 무시 건수, 동기화 횟수와 소요 시간(초),
+    현재 작업 큐 길이를 반환합니다.
+    """
+    try:
+        return jsonify(payroll_service.sync_scheduler.metrics())
+    except Exception as e:
+        return jsonify({"error": f"동기화 지표 조회 중 오류 발생: {str(e)}"}), 500
+
+
 # 새로 추가: 근태 파일 수동 동기화 API
 @app.route("/api/attendance/sync-file", methods=["POST"])
 def sync_attendance_file():
@@ -972,7 +1016,10 @@ def sync_attendance_csv():
 
         # CSV 파일 로드
         df = pd.read_csv(
-            ATTENDANCE_CSV, encoding="utf-8", delimiter=",", on_bad_lines="warn"
+            ATTENDANCE_CSV,
+            encoding=Config.ATTENDANCE_CSV_ENCODING,
+            delimiter=",",
+            on_bad_lines="warn",
         )
 
         # 데이터 전처리
@@ -991,109 +1038,33 @@ def sync_attendance_csv():
         session = get_db_session()
 
         try:
-            # 모든 근태 기록을 일단 삭제 (완전히 초기화)
-            deleted_count = session.query(Attendance).delete()
-            print(f"{deleted_count}개의 기존 근태 기록이 삭제되었습니다.")
-
-            # CSV 데이터 삽입
-            records_added = 0
-            for _, row in df.iterrows():
-                try:
-                    # 날짜 문자열을 date 객체로 변환
-                    date_obj = datetime.strptime(row["date"], "%Y-%m-%d").date()
-
-                    # 새 근태 기록 생성
-                    attendance = Attendance(
-                        employee_id=row["employee_id"],
-                        date=date_obj,
-                        check_in=row["check_in"],
-                        check_out=row["check_out"],
-                        attendance_type=row["attendance_type"],
-                        remarks=row.get("remarks", ""),
-                    )
-                    session.add(attendance)
-                    records_added += 1
-                except Exception as e:
-                    print(
-                        f"근태 기록 추가 오류 ({row['employee_id']}, {row['date']}): {e}"
-                    )
-                    continue
-
-            # 변경사항 커밋
+            # 스테이징 후 UPSERT (전체 삭제 없이 변경된 기록만 갱신, CSV 에 없는 기록 삭제)
+            result = upsert_attendance(session, frame_to_rows(df), delete_missing=True)
             session.commit()
             print(
-                f"CSV에서 {records_added}개의 근태 기록이 DB에 성공적으로 추가되었습니다."
+                f"CSV 동기화 완료: 추가 {result['inserted']}개, 변경 {result['updated']}개, "
+                f"삭제 {result['deleted']}개, 변경 없음 {result['unchanged']}개, "
+                f"형식 오류 {result['skipped']}개"
             )
 
-            # 변경된 데이터가 있으면 CSV 파일도 업데이트
-            total_changes = records_added
-            if total_changes > 0:
-                try:
-                    print("\n근태 기록 변경 후 CSV 파일 자동 동기화 시작...")
-
-                    # 새로 추가: sync_attendance_db_to_csv 함수 사용
-                    # 현재 디렉토리 경로 추가
-                    script_dir = os.path.dirname(os.path.abspath(__file__))
-                    if script_dir not in sys.path:
-                        sys.path.append(script_dir)
-
-                    # sync_attendance_db_to_csv 함수 임포트
-                    from sync_attendance_db_to_csv import sync_db_to_csv
-
-                    # 데이터베이스 내용을 CSV 파일로 동기화
-                    sync_result = sync_db_to_csv()
-
-                    if sync_result:
-                        print("근태 기록 변경과 CSV 파일 동기화가 모두 완료되었습니다.")
-                    else:
-                        # 동기화 실패 시 기존 방식으로 백업
-                        print("동기화 실패, 기존 방식으로 CSV 파일 업데이트 시도...")
-
-                        # 모든 근태 데이터 조회
-                        all_attendance = session.query(Attendance).all()
-
-                        # 데이터프레임으로 변환
-                        attendance_data = []
-                        for record in all_attendance:
-                            attendance_data.append(
-                                {
-                                    "employee_id": record.employee_id,
-                                    "date": (
-                                        record.date.strftime("%Y-%m-%d")
-                                        if hasattr(record.date, "strftime")
-                                        else str(record.date)
-                                    ),
-                                    "check_in": record.check_in or "",
-                                    "check_out": record.check_out or "",
-                                    "attendance_type": record.attendance_type or "정상",
-                                    "remarks": record.remarks or "",
-                                }
-                            )
-
-                        # 데이터프레임 생성 및 CSV 파일로 저장
-                        df = pd.DataFrame(attendance_data)
-                        df.to_csv(
-                            ATTENDANCE_CSV, index=False, encoding="euc-kr"
-                        )  # 인코딩을 euc-kr로 변경
-                        print(
-                            f"기존 방식으로 CSV 파일이 업데이트되었습니다: {ATTENDANCE_CSV}"
-                        )
-
-                    # 파일 수정 시간 갱신
-                    payroll_service.attendance_file_last_modified = (
-                        payroll_service._get_attendance_file_modified_time()
-                    )
+            # 변경된 근태 기간의 초안 급여만 재계산 대상으로 표시
+            payroll_service.mark_payrolls_stale(result["changes"])
 
-                except Exception as csv_error:
-                    print(f"근태 CSV 파일 업데이트 중 오류 발생: {csv_error}")
-                    # CSV 오류는 API 응답에 영향을 주지 않음
+            # 변경된 데이터가 있으면 CSV 파일도 업데이트 (실패해도 기존 CSV 유지)
+            csv_synced = True
+            if result["changes"]:
+                csv_synced = _export_attendance_csv(result["changes"])
 
             return jsonify(
                 {
                     "status": "success",
-                    "message": f"CSV 파일에서 {records_added}개의 근태 기록이 DB에 동기화되었습니다.",
-                    "records_added": records_added,
-                    "previous_records_deleted": deleted_count,
+                    "message": f"CSV 파일에서 {result['staged']}개의 근태 기록이 DB에 동기화되었습니다.",
+                    "records_added": result["inserted"],
+                    "records_updated": result["updated"],
+                    "records_unchanged": result["unchanged"],
+                    "records_skipped": result["skipped"],
+                    "previous_records_deleted": result["deleted"],
+                    "csv_sync": "success" if csv_synced else "failed",
                 }
             )
 
@@ -1174,6 +1145,7 @@ def update_attendance():
             updated_count = 0
             created_count = 0
             audit_records = []  # 변경 이력 저장용
+            changes = set()  # 실제로 변경된 (직원 ID, 날짜)
 
             for record in updated_records:
                 employee_id = record.get("employee_id")
@@ -1203,6 +1175,7 @@ def update_attendance():
                     .first()
                 )
 
+                audit_count = len(audit_records)
                 if attendance:
                     # 기존 기록이 있으면 선택적으로 업데이트
                     # 각 필드별로 변경 여부 확인 후 변경된 필드만 업데이트 및 기록
@@ -1312,6 +1285,9 @@ def update_attendance():
 
                     created_count += 1
 
+                if len(audit_records) > audit_count:
+                    changes.add((employee_id, date_obj))
+
             # 변경 이력 저장
             if audit_records:
                 session.add_all(audit_records)
@@ -1319,75 +1295,14 @@ def update_attendance():
             # 데이터베이스 커밋
             session.commit()
 
-            # 변경된 데이터가 있으면 CSV 파일도 업데이트
-            total_changes = updated_count + created_count
-            if total_changes > 0:
-                try:
-                    # 현재 파일의 디렉토리 경로 추가
-                    script_dir = os.path.dirname(os.path.abspath(__file__))
-                    if script_dir not in sys.path:
-                        sys.path.append(script_dir)
-
-                    # 자동 동기화 함수 임포트 및 실행
-                    print("\n근태 기록 변경 후 CSV 파일 자동 동기화 시작...")
-
-                    # 파일 시스템 경로가 아닌 모듈 경로로 임포트
-                    from sync_attendance_db_to_csv import sync_db_to_csv
-
-                    sync_result = sync_db_to_csv()
-
-                    if sync_result:
-                        print("근태 기록 변경과 CSV 파일 동기화가 모두 완료되었습니다.")
-                    else:
-                        print("CSV 파일 동기화 실패: 백업 방법 시도")
-
-                        # CSV 동기화 실패 시 기존 방식으로도 시도
-                        all_attendance = session.query(Attendance).all()
-                        attendance_data = []
-
-                        for record in all_attendance:
-                            attendance_data.append(
-                                {
-                                    "employee_id": record.employee_id,
-                                    "date": (
-                                        record.date.strftime("%Y-%m-%d")
-                                        if hasattr(record.date, "strftime")
-                                        else str(record.date)
-                                    ),
-                                    "check_in": record.check_in or "",
-                                    "check_out": record.check_out or "",
-                                    "attendance_type": record.attendance_type or "정상",
-                                    "remarks": record.remarks or "",
-                                }
-                            )
-
-                        # CSV 파일 저장 - euc-kr 인코딩 사용
-                        import csv
-
-                        with open(
-                            ATTENDANCE_CSV, "w", newline="", encoding="euc-kr"
-                        ) as f:
-                            writer = csv.DictWriter(
-                                f,
-                                fieldnames=[
-                                    "employee_id",
-                                    "date",
-                                    "check_in",
-                                    "check_out",
-                                    "attendance_type",
-                                    "remarks",
-                                ],
-                            )
-                            writer.writeheader()
-                            writer.writerows(attendance_data)
+            # 변경된 근태가 포함된 초안 급여만 재계산 대상으로 표시
+            if changes:
+                payroll_service.mark_payrolls_stale(changes)
 
-                    # 파일 수정 시간 갱신
-                    payroll_service.attendance_file_last_modified = (
-                        payroll_service._get_attendance_file_modified_time()
-                    )
-                except Exception as csv_error:
-                    print(f"근태 CSV 파일 업데이트 중 오류 발생: {str(csv_error)}")
-                    # CSV 오류는 API 응답에 영향을 주지 않음
+            # 변경된 데이터가 있으면 CSV 파일도 업데이트 (실패해도 기존 CSV 유지)
+            csv_synced = True
+            if updated_count + created_count > 0:
+                csv_synced = _export_attendance_csv(changes)
 
             return jsonify(
                 {
@@ -1396,7 +1311,7 @@ def update_attendance():
                     "updated_count": updated_count,
                     "created_count": created_count,
                     "audit_count": len(audit_records),
-                    "csv_sync": "success",
+                    "csv_sync": "success" if csv_synced else "failed",
                 }
             )
 
@@ -1440,49 +1355,49 @@ def send_payslips():
     session = get_db_session()
     try:
         results = []
-
-        for payroll_item in payroll_data:
-            payroll_code = payroll_item.get("payroll_code")
-            if not payroll_code:
-                continue
-
-            # 급여 데이터 조회
-            payroll = (
-                session.query(Payroll).filter_by(payroll_code=payroll_code).first()
+        documents = []
+        year_month = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y%m")
+
+        # 급여와 직원 정보를 한 번에 조회
+        payroll_codes = [
+            item.get("payroll_code")
+            for item in payroll_data
+            if item.get("payroll_code")
+        ]
+        payrolls = {}
+        for chunk in _chunked(payroll_codes, BATCH_QUERY_CHUNK_SIZE):
+            payrolls.update(
+                (payroll.payroll_code, (payroll, employee))
+                for payroll, employee in session.query(Payroll, Employee)
+                .join(Employee, Employee.employee_id == Payroll.employee_id)
+                .filter(Payroll.payroll_code.in_(chunk))
             )
-            if not payroll:
-                continue
 
-            # 직원 정보 조회
-            employee = (
-                session.query(Employee)
-                .filter_by(employee_id=payroll.employee_id)
-                .first()
-            )
-            if not employee:
+        for payroll_code in payroll_codes:
+            if payroll_code not in payrolls:
                 continue
+            payroll, employee = payrolls[payroll_code]
 
             # 파일명 생성: payslip_직원ID_YYYYMM.pdf (실제 PDF 생성 아님)
-            year_month = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y%m")
             file_name = f"payslip_{employee.employee_id}_{year_month}.pdf"
             file_path = os.path.join(PAYSLIPS_DIR, file_name)
 
             # 실제 구현에서는 여기서 PDF 생성 로직이 들어갑니다
             # 현재는 파일 경로만 기록
 
-            # 명세서 정보 DB에 저장
-            document = PayrollDocument(
-                payroll_id=payroll.id,
-                document_type="급여명세서",
-                document_path=file_path,
-                created_by=user_id,
-                sent=True,  # 개발용 시뮬레이션이므로 true로 설정
-                sent_at=datetime.now(),
-                sent_to=f"{employee.name} <{employee.employee_id}@example.com>",  # 실제 이메일은 DB에 없으므로 가상 이메일 사용
+            # 명세서 정보 DB에 저장 (커밋 전에 한 번에 INSERT)
+            documents.append(
+                {
+                    "payroll_id": payroll.id,
+                    "document_type": "급여명세서",
+                    "document_path": file_path,
+                    "created_by": user_id,
+                    "sent": True,  # 개발용 시뮬레이션이므로 true로 설정
+                    "sent_at": datetime.now(),
+                    "sent_to": f"{employee.name} <{employee.employee_id}@example.com>",  # 실제 이메일은 DB에 없으므로 가상 이메일 사용
+                }
             )
 
-            session.add(document)
-
             results.append(
                 {
                     "employee_id": employee.employee_id,
@@ -1492,6 +1407,8 @@ def send_payslips():
                 }
             )
 
+        if documents:
+            session.execute(insert(PayrollDocument), documents)
         session.commit()
         return jsonify(
             {
@@ -1519,10 +1436,14 @@ def get_payroll_analysis():
     """
     급여 분석 데이터 조회 API
     요청 파라미터:
-    - period_type: 'monthly', 'quarterly', 'yearly' (기간 유형)
+    - period_type: 'monthly', 'quarterly', 'yearly', 'all' (기간 유형)
     - start_date: 시작일 (YYYY-MM-DD)
     - end_date: 종료일 (YYYY-MM-DD)
-    - group_by: 'department', 'position' (그룹화 기준)
+    - group_by: 'department', 'position', 'month', 'quarter', 'year' (그룹화 기준)
+
+    집계는 utils.payroll_analytics 가 SQL GROUP BY 한 번으로 수행합니다.
+    analysis_data 의 각 행은 level(detail/period/group/total)과 period 를 가지며,
+    마지막 행이 전체("전체") 집계입니다.
     """
     # 쿼리 파라미터 파싱
     period_type = request.args.get("period_type", "monthly")
@@ -1549,141 +1470,23 @@ def get_payroll_analysis():
 
     session = get_db_session()
     try:
-        # 기본 급여 데이터 쿼리
-        query = (
-            session.query(
-                Payroll.employee_id,
-                Payroll.payment_period_start,
-                Payroll.payment_period_end,
-                Payroll.base_pay,
-                Payroll.overtime_pay,
-                Payroll.night_shift_pay,
-                Payroll.holiday_pay,
-                Payroll.gross_pay,
-                Payroll.net_pay,
-                Employee.department,
-                Employee.position,
-            )
-            .join(Employee, Payroll.employee_id == Employee.employee_id)
-            .filter(
-                Payroll.payment_period_start >= start_date_obj,
-                Payroll.payment_period_end <= end_date_obj,
-                Payroll.status.in_(["confirmed", "paid"]),  # 확정/지급된 급여만 포함
+        try:
+            results = analyze_payrolls(
+                session, start_date_obj, end_date_obj, group_by, period_type
             )
-        )
-
-        # 쿼리 실행
-        records = query.all()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        if not records:
+        if not results:
             return (
                 jsonify({"warning": "해당 기간에 분석할 급여 데이터가 없습니다."}),
                 200,
             )
 
-        # 분석 결과 생성
-        results = []
-
-        # 그룹화 기준에 따라 데이터 집계
-        if group_by == "department":
-            # 부서별 분석
-            departments = {}
-            for record in records:
-                dept = record.department
-                if dept not in departments:
-                    departments[dept] = {
-                        "count": 0,
-                        "total_base_pay": 0,
-                        "total_allowances": 0,
-                        "total_gross_pay": 0,
-                        "total_net_pay": 0,
-                    }
-
-                departments[dept]["count"] += 1
-                departments[dept]["total_base_pay"] += record.base_pay
-                departments[dept]["total_allowances"] += (
-                    record.overtime_pay + record.night_shift_pay + record.holiday_pay
-                )
-                departments[dept]["total_gross_pay"] += record.gross_pay
-                departments[dept]["total_net_pay"] += record.net_pay
-
-            # 평균 계산
-            for dept, data in departments.items():
-                count = data["count"]
-                results.append(
-                    {
-                        "group": dept,
-                        "employee_count": count,
-                        "avg_base_pay": round(data["total_base_pay"] / count),
-                        "avg_allowances": round(data["total_allowances"] / count),
-                        "avg_gross_pay": round(data["total_gross_pay"] / count),
-                        "avg_net_pay": round(data["total_net_pay"] / count),
-                        "period_type": period_type,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                    }
-                )
-        else:
-            # 직급별 분석
-            positions = {}
-            for record in records:
-                pos = record.position
-                if pos not in positions:
-                    positions[pos] = {
-                        "count": 0,
-                        "total_base_pay": 0,
-                        "total_allowances": 0,
-                        "total_gross_pay": 0,
-                        "total_net_pay": 0,
-                    }
-
-                positions[pos]["count"] += 1
-                positions[pos]["total_base_pay"] += record.base_pay
-                positions[pos]["total_allowances"] += (
-                    record.overtime_pay + record.night_shift_pay + record.holiday_pay
-                )
-                positions[pos]["total_gross_pay"] += record.gross_pay
-                positions[pos]["total_net_pay"] += record.net_pay
-
-            # 평균 계산
-            for pos, data in positions.items():
-                count = data["count"]
-                results.append(
-                    {
-                        "group": pos,
-                        "employee_count": count,
-                        "avg_base_pay": round(data["total_base_pay"] / count),
-                        "avg_allowances": round(data["total_allowances"] / count),
-                        "avg_gross_pay": round(data["total_gross_pay"] / count),
-                        "avg_net_pay": round(data["total_net_pay"] / count),
-                        "period_type": period_type,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                    }
-                )
-
-        # 전체 평균 추가
-        total_count = len(records)
-        total_base_pay = sum(r.base_pay for r in records)
-        total_allowances = sum(
-            r.overtime_pay + r.night_shift_pay + r.holiday_pay for r in records
-        )
-        total_gross_pay = sum(r.gross_pay for r in records)
-        total_net_pay = sum(r.net_pay for r in records)
-
-        results.append(
-            {
-                "group": "전체",
-                "employee_count": total_count,
-                "avg_base_pay": round(total_base_pay / total_count),
-                "avg_allowances": round(total_allowances / total_count),
-                "avg_gross_pay": round(total_gross_pay / total_count),
-                "avg_net_pay": round(total_net_pay / total_count),
-                "period_type": period_type,
-                "start_date": start_date,
-                "end_date": end_date,
-            }
-        )
+        for row in results:
+            row.update(
+                period_type=period_type, start_date=start_date, end_date=end_date
+            )
 
         return jsonify(
             {
@@ -1924,6 +1727,7 @@ def simulate_llm_insights(analysis_type, data):
 
 # 새로 추가: 근태 변경 이력 조회 API
 @app.route("/api/attendance/audit", methods=["GET"])
+@conditional_get("attendance_audit")
 def get_attendance_audit():
     """
     근태 변경 이력 조회 API
@@ -1974,49 +1778,23 @@ def get_attendance_audit():
 
         try:
             # 기본 쿼리 생성
-            query = session.query(AttendanceAudit)
+            query = ATTENDANCE_AUDIT.select()
 
             # 필터 적용
             if employee_id:
-                query = query.filter(AttendanceAudit.employee_id == employee_id)
+                query = query.where(AttendanceAudit.employee_id == employee_id)
 
             if from_date:
-                query = query.filter(AttendanceAudit.date >= from_date)
+                query = query.where(AttendanceAudit.date >= from_date)
 
             if to_date:
-                query = query.filter(AttendanceAudit.date <= to_date)
+                query = query.where(AttendanceAudit.date <= to_date)
 
             # 변경 시간 기준 내림차순 정렬 (최신순)
             query = query.order_by(AttendanceAudit.changed_at.desc())
 
             # 결과 조회 (최대 500개로 제한)
-            audit_records = query.limit(500).all()
-
-            # 결과 변환
-            result = []
-            for record in audit_records:
-                result.append(
-                    {
-                        "id": record.id,
-                        "employee_id": record.employee_id,
-                        "date": (
-                            record.date.strftime("%Y-%m-%d")
-                            if hasattr(record.date, "strftime")
-                            else str(record.date)
-                        ),
-                        "field_name": record.field_name,
-                        "old_value": record.old_value,
-                        "new_value": record.new_value,
-                        "change_type": record.change_type,
-                        "changed_by": record.changed_by,
-                        "changed_at": (
-                            record.changed_at.isoformat()
-                            if hasattr(record.changed_at, "isoformat")
-                            else str(record.changed_at)
-                        ),
-                        "ip_address": record.ip_address,
-                    }
-                )
+            result = ATTENDANCE_AUDIT.all(session, query.limit(500))
 
             return jsonify(
                 {
@@ -2052,6 +1830,14 @@ def initialize_app():
         # 데이터베이스 초기화
         init_db()
 
+        # 월별 급여 요약이 비어 있으면 기존 급여로 채움
+        session = get_db_session()
+        try:
+            if ensure_payroll_summary(session):
+                logger.info("기존 급여 데이터로 월별 급여 요약을 생성했습니다.")
+        finally:
+            session.close()
+
         # 근태 파일 변경 확인 및 동기화
         if payroll_service.check_attendance_file_changed():
             logger.info(
@@ -2122,17 +1908,15 @@ def check_existing_payrolls():
         # 세션 생성
         session = get_db_session()
         try:
-            # 이미 확정된 급여 데이터 확인
-            existing_payrolls = []
-
-            for employee_id in employee_ids:
-                # 중복 검사 함수 사용
-                overlaps = payroll_service.check_overlapping_periods(
-                    employee_id, period_start, period_end, "regular"
-                )
-
-                if overlaps:
-                    existing_payrolls.extend(overlaps)
+            # 이미 확정된 급여 데이터 확인 (전체 직원을 한 번에 조회)
+            overlaps = payroll_service.find_overlapping_payrolls(
+                employee_ids, period_start, period_end, "regular", session=session
+            )
+            existing_payrolls = [
+                payroll
+                for employee_id in dict.fromkeys(employee_ids)
+                for payroll in overlaps.get(employee_id, [])
+            ]
 
             # 중복 데이터가 있는지 여부 반환
             return jsonify(
@@ -2186,34 +1970,30 @@ def get_attendance_records():
         # 세션 생성
         session = get_db_session()
         try:
-            # 근태 데이터 조회
-            result = []
-
-            for employee_id in employee_ids:
-                # 해당 직원의 근태 기록 조회
-                attendance_records = (
-                    session.query(Attendance)
-                    .filter(
-                        Attendance.employee_id == employee_id,
+            # 전체 직원의 근태 데이터를 한 번에 조회 (응답 형식으로 바로 변환,
+            # IN 조건은 BATCH_QUERY_CHUNK_SIZE 명씩)
+            records = []
+            for chunk in _chunked(dict.fromkeys(employee_ids), BATCH_QUERY_CHUNK_SIZE):
+                records += ATTENDANCE_RECORDS.all(
+                    session,
+                    ATTENDANCE_RECORDS.select()
+                    .where(
+                        Attendance.employee_id.in_(chunk),
                         Attendance.date >= start_date,
                         Attendance.date <= end_date,
                     )
-                    .all()
+                    .order_by(Attendance.employee_id, Attendance.date),
                 )
 
-                # 응답 형식으로 변환
-                for record in attendance_records:
-                    result.append(
-                        {
-                            "id": record.id,
-                            "employee_id": record.employee_id,
-                            "date": record.date.strftime("%Y-%m-%d"),
-                            "check_in": record.check_in,
-                            "check_out": record.check_out,
-                            "attendance_type": record.attendance_type,
-                            "remarks": record.remarks,
-                        }
-                    )
+            # 요청한 직원 순서대로 정렬
+            by_employee = {}
+            for record in records:
+                by_employee.setdefault(record["employee_id"], []).append(record)
+            result = [
+                record
+                for employee_id in employee_ids
+                for record in by_employee.get(employee_id, [])
+            ]
 
             return jsonify({"data": result})
         finally:
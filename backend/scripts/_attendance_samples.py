@@ -0,0 +1,74 @@
+"""
+합성 근태 기록 생성 도우미 (수당 정합성 테스트, 급여 계산 벤치마크 공용)
+
+주말/공휴일, 철야, 다일 근무, 24:00:00 퇴근, 퇴근 기록 누락 등 수당 계산의
+경계 사례가 섞인 무작위 근태 기록을 만듭니다. 같은 시드면 항상 같은 기록입니다.
+"""
+
+from datetime import datetime, timedelta
+
+
+def generate_shift(rng, work_date):
+    """무작위 근무 1건 생성"""
+    kind = rng.random()
+    if kind < 0.55:
+        # 일반 주간 근무
+        start = datetime.combine(work_date, datetime.min.time()) + timedelta(
+            minutes=rng.randint(6 * 60, 11 * 60)
+        )
+        end = start + timedelta(minutes=rng.randint(4 * 60, 13 * 60))
+    elif kind < 0.8:
+        # 저녁 출근 철야 근무
+        start = datetime.combine(work_date, datetime.min.time()) + timedelta(
+            minutes=rng.randint(15 * 60, 23 * 60 + 59)
+        )
+        end = start + timedelta(minutes=rng.randint(2 * 60, 16 * 60))
+    elif kind < 0.95:
+        # 새벽 출근
+        start = datetime.combine(work_date, datetime.min.time()) + timedelta(
+            seconds=rng.randint(0, 6 * 3600)
+        )
+        end = start + timedelta(seconds=rng.randint(3600, 14 * 3600))
+    else:
+        # 2~3일 연속 근무
+        start = datetime.combine(work_date, datetime.min.time()) + timedelta(
+            minutes=rng.randint(0, 24 * 60 - 1)
+        )
+        end = start + timedelta(minutes=rng.randint(24 * 60, 60 * 60))
+
+    check_in = start.strftime("%Y-%m-%d %H:%M:%S")
+    check_out = end.strftime("%Y-%m-%d %H:%M:%S")
+
+    # 자정 퇴근은 일부를 24:00:00 형식으로 표기
+    if end.time() == datetime.min.time() and rng.random() < 0.5:
+        check_out = (end - timedelta(days=1)).strftime("%Y-%m-%d") + " 24:00:00"
+    elif rng.random() < 0.03:
+        end = datetime.combine(work_date + timedelta(days=1), datetime.min.time())
+        check_out = work_date.strftime("%Y-%m-%d") + " 24:00:00"
+
+    attendance_type = "휴일" if rng.random() < 0.05 else "정상"
+    record = {
+        "date": work_date.strftime("%Y-%m-%d"),
+        "check_in": check_in,
+        "check_out": check_out,
+        "attendance_type": attendance_type,
+        "remarks": "",
+    }
+
+    # 퇴근 기록 누락
+    if rng.random() < 0.02:
+        record["check_out"] = ""
+    return record
+
+
+def generate_employee_records(rng, period_start, days):
+    """직원 1명의 근태 기록 생성"""
+    records = []
+    for offset in range(days):
+        work_date = period_start + timedelta(days=offset)
+        if work_date.weekday() >= 5 and rng.random() > 0.15:
+            continue
+        if rng.random() < 0.1:
+            continue
+        records.append(generate_shift(rng, work_date))
+    return records
@@ -0,0 +1,142 @@
+"""
+검증/벤치마크 스크립트 공용 도우미 (scripts/check_*.py, scripts/bench_*.py)
+
+- Checker: 확인 결과([OK]/[실패]) 출력과 실패 건수 집계, 마지막에 성공/실패 출력 후
+  실패가 있으면 종료 코드 1
+- measure / timed / best_time: 실행 시간 측정
+- temp_database: 임시 디렉토리의 SQLite 파일 엔진 (스키마 생성, 끝나면 삭제)
+- app_client: 전역 세션을 임시 DB 에 연결하고 run_server 의 Flask 테스트 클라이언트 생성
+
+backend 디렉토리가 sys.path 에 있어야 하므로, 스크립트의 "상위 디렉토리 경로 추가"
+다음에 import 합니다.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+import config.database as database
+from config.database import Base, create_db_engine
+
+# 불일치 상세를 출력하는 최대 건수 (나머지는 건수만 집계)
+MISMATCH_PRINT_LIMIT = 10
+
+TempDatabase = namedtuple("TempDatabase", "workdir path engine")
+
+
+class Checker:
+    """확인 결과 출력과 실패 건수 집계"""
+
+    def __init__(self, indent="  "):
+        self.indent = indent
+        self.failures = 0
+
+    def __call__(self, description, condition, detail=None):
+        """
+        확인 결과 출력
+
+        Args:
+            description (str): 확인 내용
+            condition: 참이면 통과
+            detail (str): 실패 시 추가로 출력할 내용
+
+        Returns:
+            bool: 통과 여부
+        """
+        print(f"{self.indent}[{'OK' if condition else '실패'}] {description}")
+        if not condition:
+            self.failures += 1
+            if detail:
+                print(detail)
+        return bool(condition)
+
+    def mismatch(self, detail):
+        """비교 불일치 집계 (처음 MISMATCH_PRINT_LIMIT 건만 상세 출력)"""
+        self.failures += 1
+        if self.failures <= MISMATCH_PRINT_LIMIT:
+            print(detail)
+
+    def finish(self, success, failure_label=None):
+        """
+        실패가 있으면 건수를 출력하고 종료 코드 1, 없으면 성공 메시지 출력
+
+        Args:
+            success (str): 성공 메시지 ("성공: " 뒤에 출력)
+            failure_label (str): 실패 건수 앞에 붙일 설명 (예: 불일치)
+        """
+        if self.failures:
+            label = f"{failure_label} " if failure_label else ""
+            print(f"실패: {label}{self.failures}건")
+            sys.exit(1)
+        print(f"성공: {success}")
+
+
+def format_seconds(seconds):
+    """1초 미만은 ms, 이상은 초 단위 문자열"""
+    if seconds < 1:
+        return f"{seconds * 1000:,.1f}ms"
+    return f"{seconds:,.2f}초"
+
+
+def measure(func, *args):
+    """func(*args) 실행 결과와 걸린 시간(초)"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def timed(label, func, *args):
+    """func(*args) 실행 시간을 출력하고 결과 반환"""
+    result, seconds = measure(func, *args)
+    print(f"  {label}: {format_seconds(seconds)}")
+    return result
+
+
+def best_time(func, repeat=5):
+    """func() 를 repeat 번 실행한 가장 짧은 시간(초)"""
+    return min(measure(func)[1] for _ in range(repeat))
+
+
+@contextmanager
+def temp_database(prefix, filename="check.db", profile="prod"):
+    """
+    임시 디렉토리의 SQLite 파일 엔진 (스키마 생성)
+
+    끝나면 전역 세션을 정리하고 엔진과 임시 디렉토리를 삭제합니다.
+
+    Yields:
+        TempDatabase: (임시 디렉토리, DB 파일 경로, 엔진)
+    """
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    path = os.path.join(workdir, filename)
+    engine = create_db_engine(f"sqlite:///{path}", profile)
+    try:
+        Base.metadata.create_all(engine)
+        yield TempDatabase(workdir, path, engine)
+    finally:
+        database.Session.remove()
+        engine.dispose()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def app_client(engine):
+    """
+    전역 세션(config.database.Session)을 engine 에 연결하고 run_server 를 불러옴
+
+    실제 근태 파일 감시는 중지합니다. run_server 를 import 하므로 서버 실행 환경
+    (.env 의 OPENAI_API_KEY 등)이 필요합니다.
+
+    Returns:
+        tuple: (run_server 모듈, Flask 테스트 클라이언트)
+    """
+    database.Session.remove()
+    database.Session.configure(bind=engine)
+
+    import run_server
+
+    run_server.payroll_service.stop_file_watcher()
+    return run_server, run_server.app.test_client()
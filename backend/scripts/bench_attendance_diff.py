@@ -0,0 +1,130 @@
+"""
+근태 CSV 변경 감지 벤치마크 (전체 ORM 비교 vs 내용 해시 병합 비교)
+
+임시 SQLite 파일에 근태 기록을 적재한 뒤, 일부 행을 수정/추가한 CSV 데이터로
+- full: 모든 근태 기록을 ORM 객체로 불러와 필드별 비교 (이전 PayrollService 방식)
+- hash: utils.attendance_diff.find_changed_rows ((employee_id, date, row_hash) 스트리밍 병합)
+의 실행 시간과 tracemalloc 최대 메모리를 측정하고, 두 방식이 찾은 변경 키가 같은지 확인합니다.
+메모리는 CSV DataFrame 을 만든 이후 변경 감지 단계에서 추가로 할당된 양입니다.
+
+사용법: python scripts/bench_attendance_diff.py [행 수] [변경 비율]
+"""
+
+import sys
+import os
+import gc
+import random
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, current_dir)
+
+from bench_attendance_upsert import generate_rows
+from _harness import Checker, measure, temp_database
+from models.models import Attendance
+from utils.attendance_diff import find_changed_rows
+from utils.attendance_upsert import upsert_attendance
+
+COLUMNS = ["employee_id", "date", "check_in", "check_out", "attendance_type", "remarks"]
+
+
+def full_diff(session, df):
+    """이전 방식: 모든 근태 ORM 객체 로드 후 필드별 비교 (변경 키 집합 반환)"""
+    records = session.query(Attendance).all()
+    db_data = {f"{r.employee_id}_{r.date}": r for r in records}
+    changed = set()
+    for record in df.to_dict("records"):
+        date_obj = datetime.strptime(record["date"], "%Y-%m-%d").date()
+        db_record = db_data.get(f"{record['employee_id']}_{date_obj}")
+        if db_record is None or (
+            record.get("check_in", "") != db_record.check_in
+            or record.get("check_out", "") != db_record.check_out
+            or record.get("attendance_type", "정상") != db_record.attendance_type
+            or record.get("remarks", "") != db_record.remarks
+        ):
+            changed.add((record["employee_id"], record["date"]))
+    return changed
+
+
+def hash_diff(session, df):
+    """내용 해시 병합 비교 (변경 키 집합 반환)"""
+    result = find_changed_rows(session, df)
+    return {(row[0], row[1]) for row in result["rows"]}
+
+
+def measure_diff(Session, func, df, trace_memory):
+    """실행 시간(초)과 최대 추가 메모리(MB), 결과 반환"""
+    session = Session()
+    gc.collect()
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        result, elapsed = measure(func, session, df)
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return elapsed, peak / 1024 / 1024, result
+    finally:
+        session.rollback()
+        session.close()
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    rng = random.Random(20240101)
+    check = Checker()
+
+    with temp_database("attendance_diff_", "diff.db") as db:
+        Session = sessionmaker(bind=db.engine)
+
+        rows = generate_rows(row_count, rng)
+        session = Session()
+        try:
+            upsert_attendance(session, iter(rows))
+            session.commit()
+        finally:
+            session.close()
+
+        # 일부 행 수정 + 새 행 추가한 CSV 데이터
+        changed = max(1, int(len(rows) * ratio))
+        for position in rng.sample(range(len(rows)), changed):
+            rows[position] = rows[position][:5] + ("수정",)
+        rows += [
+            ("E99999", f"2019-12-{day:02d}", "", "", "정상", "")
+            for day in range(1, min(changed, 31) + 1)
+        ]
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        del rows
+        print(
+            f"근태 {row_count:,}행, CSV 변경 {changed:,}행 + 신규 {min(changed, 31)}행"
+        )
+
+        results = {}
+        for label, func in (("full", full_diff), ("hash", hash_diff)):
+            elapsed, _, result = measure_diff(Session, func, df, False)
+            _, peak, _ = measure_diff(Session, func, df, True)
+            results[label] = result
+            print(
+                f"  {label}: {elapsed:.2f}초, 최대 추가 메모리 {peak:,.1f}MB, "
+                f"변경 {len(result):,}건"
+            )
+        check(
+            f"변경 키 일치 (full 에만 {len(results['full'] - results['hash'])}건, "
+            f"hash 에만 {len(results['hash'] - results['full'])}건)",
+            results["full"] == results["hash"],
+        )
+
+    check.finish("두 방식이 같은 변경 기록을 찾았습니다.")
+
+
+if __name__ == "__main__":
+    main()
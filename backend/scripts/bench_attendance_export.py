@@ -0,0 +1,211 @@
+"""
+근태 DB → CSV 내보내기 벤치마크 및 정합성 검증
+
+임시 SQLite/CSV 파일로 근태 한 건 수정 후 CSV 내보내기 비용을 두 방식으로 측정합니다.
+- legacy: 전체 ORM 조회 + 타임스탬프 백업 복사 + try_encodings 방식 쓰기 (이전 sync_db_to_csv)
+- export: utils.attendance_export.AttendanceCsvExporter (변경 월 조각만 다시 쓰고 조립)
+
+각 단계 후 attendance.csv 내용이 DB 와 같은지, 백업 개수가 보관 개수 이하인지,
+attendance.csv 를 외부에서 수정하면 전체 내보내기로 전환되는지, 설정 인코딩
+(utf-8-sig, euc-kr)으로 읽을 수 있는지 확인합니다.
+
+사용법: python scripts/bench_attendance_export.py [직원 수] [일수]
+"""
+
+import sys
+import os
+import csv
+import glob
+import shutil
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, temp_database, timed
+from models.models import Attendance
+from utils.attendance_export import EXPORT_FIELDS, AttendanceCsvExporter
+
+START_DATE = date(2023, 1, 1)
+BACKUP_KEEP = 5
+
+
+def seed(session, employee_count, days):
+    """합성 근태 기록 적재"""
+    rows = []
+    for d in range(days):
+        day = START_DATE + timedelta(days=d)
+        for i in range(employee_count):
+            rows.append(
+                {
+                    "employee_id": f"E{i:05d}",
+                    "date": day,
+                    "check_in": f"{day} 09:00:00",
+                    "check_out": f"{day} 18:00:00",
+                    "attendance_type": "정상",
+                    "remarks": "",
+                }
+            )
+            if len(rows) >= 50000:
+                session.execute(insert(Attendance), rows)
+                rows = []
+    if rows:
+        session.execute(insert(Attendance), rows)
+    session.commit()
+
+
+def legacy_export(session, csv_path):
+    """이전 방식: 전체 ORM 조회, 백업 복사, 인코딩 시도하며 쓰기"""
+    data = [
+        {
+            "employee_id": record.employee_id,
+            "date": record.date,
+            "check_in": record.check_in,
+            "check_out": record.check_out,
+            "attendance_type": record.attendance_type,
+            "remarks": record.remarks if record.remarks else "",
+        }
+        for record in session.query(Attendance).all()
+    ]
+    if os.path.exists(csv_path):
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        shutil.copy2(csv_path, csv_path + f".legacy_backup_{stamp}")
+    for encoding in ("euc-kr", "cp949", "utf-8-sig"):
+        with open(csv_path, "w", newline="", encoding=encoding) as f:
+            writer = csv.DictWriter(f, fieldnames=list(EXPORT_FIELDS))
+            writer.writeheader()
+            writer.writerows(data)
+        with open(csv_path, "r", encoding=encoding) as f:
+            if "정상" in "".join(next(f) for _ in range(5)):
+                return encoding
+    return None
+
+
+def csv_matches_db(session, csv_path, encoding):
+    """attendance.csv 내용이 DB 와 같은지 확인"""
+    df = pd.read_csv(csv_path, encoding=encoding, dtype=str, keep_default_na=False)
+    expected = set(
+        session.query(
+            Attendance.employee_id,
+            func.strftime("%Y-%m-%d", Attendance.date),
+            Attendance.check_in,
+            Attendance.check_out,
+            Attendance.attendance_type,
+            func.coalesce(Attendance.remarks, ""),
+        )
+    )
+    actual = set(df[list(EXPORT_FIELDS)].itertuples(index=False, name=None))
+    return list(df.columns) == list(EXPORT_FIELDS) and actual == expected
+
+
+def edit_one(session, day, remarks):
+    """근태 한 건 수정 (변경된 (직원, 날짜) 목록 반환)"""
+    session.execute(
+        update(Attendance)
+        .where(Attendance.employee_id == "E00001", Attendance.date == day)
+        .values(remarks=remarks)
+    )
+    session.commit()
+    return [("E00001", day)]
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 730
+
+    check = Checker()
+
+    with temp_database("attendance_export_", "export.db") as db:
+        workdir, _, engine = db
+        session = sessionmaker(bind=engine)()
+        seed(session, employee_count, days)
+        print(f"근태 {employee_count * days:,}행, 한 건 수정 후 내보내기")
+
+        legacy_path = os.path.join(workdir, "legacy", "attendance.csv")
+        os.makedirs(os.path.dirname(legacy_path))
+        timed("legacy 최초", legacy_export, session, legacy_path)
+        edit_one(session, START_DATE, "legacy")
+        timed("legacy 한 건 수정", legacy_export, session, legacy_path)
+
+        csv_path = os.path.join(workdir, "data", "attendance.csv")
+        os.makedirs(os.path.dirname(csv_path))
+        exporter = AttendanceCsvExporter(csv_path, backup_keep=BACKUP_KEEP)
+        result = timed("export 최초 (full)", exporter.export, session)
+        check(
+            f"최초 전체 내보내기 월 {len(result['months'])}개", result["mode"] == "full"
+        )
+
+        day = START_DATE + timedelta(days=days // 2)
+        changed = edit_one(session, day, "수정")
+        result = timed(
+            "export 한 건 수정 (incremental)", exporter.export, session, changed
+        )
+        check(
+            f"증분 내보내기 월 {result['months']}, {result['rows']}행",
+            result["mode"] == "incremental"
+            and result["months"] == [day.strftime("%Y-%m")],
+        )
+        check("CSV 내용이 DB 와 같음", csv_matches_db(session, csv_path, "utf-8"))
+
+        # 월의 모든 기록 삭제 → 조각 삭제
+        last_day = START_DATE + timedelta(days=days - 1)
+        session.query(Attendance).filter(
+            Attendance.date >= last_day.replace(day=1)
+        ).delete()
+        session.commit()
+        result = exporter.export(session, [last_day])
+        check(
+            "빈 월 조각 삭제",
+            result["mode"] == "incremental"
+            and not os.path.exists(
+                os.path.join(exporter.partition_dir, f"attendance_{last_day:%Y-%m}.csv")
+            )
+            and csv_matches_db(session, csv_path, "utf-8"),
+        )
+
+        for i in range(BACKUP_KEEP + 3):
+            exporter.export(session, edit_one(session, day, f"수정{i}"))
+        backups = glob.glob(os.path.join(exporter.backup_dir, "*.csv.gz"))
+        check(
+            f"백업 {len(backups)}개 (최대 {BACKUP_KEEP})", len(backups) == BACKUP_KEEP
+        )
+
+        # 외부 수정 → 전체 내보내기
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("E99999,2020-01-01,,,정상,\n")
+        result = exporter.export(session, edit_one(session, day, "외부 수정 후"))
+        check(
+            "외부 수정 후 전체 내보내기로 전환",
+            result["mode"] == "full" and csv_matches_db(session, csv_path, "utf-8"),
+        )
+        check(
+            "임시 파일 남지 않음",
+            not glob.glob(
+                os.path.join(workdir, "data", "**", ".*.tmp"), recursive=True
+            ),
+        )
+
+        for encoding in ("utf-8-sig", "euc-kr"):
+            other = AttendanceCsvExporter(
+                os.path.join(workdir, encoding, "attendance.csv"), encoding=encoding
+            )
+            os.makedirs(os.path.dirname(other.csv_path))
+            other.export(session)
+            other.export(session, edit_one(session, day, f"{encoding} 수정"))
+            check(
+                f"{encoding} 인코딩으로 읽기",
+                csv_matches_db(session, other.csv_path, encoding),
+            )
+        session.close()
+
+    check.finish("변경된 월만 다시 써도 CSV 내용이 DB 와 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
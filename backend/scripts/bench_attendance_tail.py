@@ -0,0 +1,176 @@
+"""
+근태 CSV 추가분(tail) 반영 벤치마크 및 정합성 검증
+
+임시 CSV/SQLite 파일로 하루치 행이 추가되었을 때의 반영 비용을 두 방식으로 측정합니다.
+- full: 전체 CSV 파싱 + 해시 병합 비교 + 변경 행 UPSERT (PayrollService 전체 비교)
+- tail: utils.attendance_tail.read_appended_rows 로 추가분만 파싱 + UPSERT
+
+반영 후 DB 내용이 CSV 전체와 같은지 확인하고, 다음 경우의 동작을 검증합니다.
+- 줄바꿈 없이 기록 중인 마지막 행: 다음 번에 반영
+- 앞부분 행 수정, 파일 축소: None 반환 (전체 비교로 전환)
+
+사용법: python scripts/bench_attendance_tail.py [직원 수] [일수]
+"""
+
+import sys
+import os
+from datetime import date, timedelta
+
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, temp_database, timed
+from models.models import Attendance
+from utils.attendance_diff import (
+    backfill_row_hashes,
+    clean_attendance_frame,
+    find_changed_rows,
+)
+from utils.attendance_tail import capture_tail_state, read_appended_rows
+from utils.attendance_upsert import frame_to_rows, upsert_attendance
+
+HEADER = "employee_id,date,check_in,check_out,attendance_type,remarks\n"
+START_DATE = date(2020, 1, 1)
+
+
+def day_lines(employee_count, day):
+    """하루치 근태 CSV 행"""
+    return "".join(
+        f"E{i:05d},{day},{day} 09:00:00,{day} 18:00:00,정상,\n"
+        for i in range(employee_count)
+    )
+
+
+def full_sync(Session, path):
+    """전체 CSV 파싱 + 해시 병합 비교 + UPSERT (반영 건수, 새 상태 반환)"""
+    state = capture_tail_state(path)
+    df = clean_attendance_frame(pd.read_csv(path, encoding="utf-8"))
+    session = Session()
+    try:
+        backfill_row_hashes(session)
+        diff = find_changed_rows(session, df)
+        result = upsert_attendance(session, diff["rows"])
+        session.commit()
+    finally:
+        session.close()
+    return len(result["changes"]), state
+
+
+def tail_sync(Session, path, state):
+    """추가분만 파싱 + UPSERT (반영 건수, 새 상태 반환, 전체 비교 필요 시 None)"""
+    tail = read_appended_rows(path, state)
+    if tail is None:
+        return None
+    df = clean_attendance_frame(tail["frame"])
+    changes = 0
+    if not df.empty:
+        session = Session()
+        try:
+            backfill_row_hashes(session)
+            result = upsert_attendance(session, frame_to_rows(df))
+            session.commit()
+            changes = len(result["changes"])
+        finally:
+            session.close()
+    return changes, tail["state"]
+
+
+def table_matches_csv(Session, path):
+    """DB 근태 내용이 CSV 전체(키 중복 시 마지막 행)와 같은지 확인"""
+    df = clean_attendance_frame(pd.read_csv(path, encoding="utf-8"))
+    df = df.drop_duplicates(["employee_id", "date"], keep="last")
+    expected = set(
+        zip(
+            df["employee_id"],
+            df["date"],
+            df["check_in"],
+            df["check_out"],
+            df["attendance_type"],
+            df["remarks"],
+        )
+    )
+    session = Session()
+    try:
+        actual = set(
+            session.query(
+                Attendance.employee_id,
+                func.strftime("%Y-%m-%d", Attendance.date),
+                Attendance.check_in,
+                Attendance.check_out,
+                Attendance.attendance_type,
+                Attendance.remarks,
+            )
+        )
+    finally:
+        session.close()
+    return actual == expected
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 730
+
+    check = Checker()
+
+    with temp_database("attendance_tail_", "tail.db") as db:
+        workdir, _, engine = db
+        Session = sessionmaker(bind=engine)
+        path = os.path.join(workdir, "attendance.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(HEADER)
+            for d in range(days):
+                f.write(day_lines(employee_count, START_DATE + timedelta(days=d)))
+        print(f"근태 {employee_count * days:,}행, 하루 추가 {employee_count:,}행")
+
+        _, state = timed("최초 전체 반영", full_sync, Session, path)
+
+        # 하루치 추가: 추가분 반영 vs 전체 비교
+        next_day = START_DATE + timedelta(days=days)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(day_lines(employee_count, next_day))
+        changes, state = timed("하루 추가 (tail)", tail_sync, Session, path, state)
+        check(f"tail 반영 {changes:,}건", changes == employee_count)
+        changes, _ = timed("하루 추가 (full, 변경 없음 확인)", full_sync, Session, path)
+        check("tail 반영 후 전체 비교 변경 없음", changes == 0)
+        check("DB 내용이 CSV 와 같음", table_matches_csv(Session, path))
+
+        print("추가분 읽기 경계")
+        day = next_day + timedelta(days=1)
+        line = f"E00000,{day},{day} 09:00:00,{day} 18:00:00,정상,\n"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line[:20])
+        changes, state = tail_sync(Session, path, state)
+        check("기록 중인 마지막 행은 건너뜀", changes == 0)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line[20:])
+        changes, state = tail_sync(Session, path, state)
+        check("행이 완성되면 반영", changes == 1)
+
+        # 앞부분 수정 (첫 행 출근 09시 → 08시) → 전체 비교 필요
+        with open(path, "r+b") as f:
+            f.seek(len(HEADER) + len("E00000,2020-01-01,2020-01-01 0"))
+            f.write(b"8")
+        check(
+            "앞부분 수정 시 전체 비교로 전환", tail_sync(Session, path, state) is None
+        )
+        changes, state = full_sync(Session, path)
+        check(
+            f"전체 비교로 수정분 반영 {changes}건",
+            changes == 1 and table_matches_csv(Session, path),
+        )
+
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) // 2)
+        check("파일 축소 시 전체 비교로 전환", tail_sync(Session, path, state) is None)
+
+    check.finish("추가분만 반영한 결과가 전체 비교와 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+근태 일괄 UPSERT 벤치마크 및 정합성 검증
+
+임시 SQLite 파일에서 CSV 근태 동기화를 두 방식으로 측정합니다.
+- legacy: 전체 삭제 후 행마다 ORM 객체로 재삽입 (변경 전 sync-csv 방식)
+- upsert: utils.attendance_upsert (스테이징 + INSERT ... ON CONFLICT DO UPDATE)
+
+upsert 는 최초 적재, 변경 없는 재동기화, 일부 변경(수정/추가/삭제) 재동기화를
+측정하고, 결과 테이블이 입력과 같은지와 감사 이력 건수가 변경 건수와 같은지 확인합니다.
+동기화 중 다른 연결의 근태 조회 건수가 0 이 되는 순간이 있었는지도 기록합니다.
+
+사용법: python scripts/bench_attendance_upsert.py [행 수] [legacy 행 수] [변경 비율]
+"""
+
+import sys
+import os
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, temp_database, timed
+from models.models import Attendance, AttendanceAudit
+from utils.attendance_upsert import upsert_attendance
+
+START_DATE = date(2020, 1, 1)
+
+
+def generate_rows(count, rng):
+    """CSV 전처리 결과와 같은 형태의 근태 행 (employee_id, date, ...) 생성"""
+    days = 365
+    rows = []
+    for i in range(count):
+        day = START_DATE + timedelta(days=i % days + 365 * (i // (days * 1000)))
+        employee_id = f"E{(i // days) % 1000:05d}"
+        check_in = f"{day} 09:{rng.randint(0, 59):02d}:00"
+        rows.append(
+            (employee_id, day.isoformat(), check_in, f"{day} 18:00:00", "정상", "")
+        )
+    return rows
+
+
+def mutate(rows, ratio, rng):
+    """일부 행 수정/삭제 후 새 행 추가 (기대 결과와 변경 건수 반환)"""
+    rows = list(rows)
+    changed = max(1, int(len(rows) * ratio))
+    positions = rng.sample(range(len(rows)), changed * 2)
+    for position in positions[:changed]:
+        row = rows[position]
+        rows[position] = row[:3] + (row[3][:-2] + "30",) + row[4:5] + ("수정",)
+    removed = set(positions[changed:])
+    rows = [row for i, row in enumerate(rows) if i not in removed]
+    for i in range(changed):
+        day = (START_DATE - timedelta(days=i + 1)).isoformat()
+        rows.append(("E99999", day, f"{day} 09:00:00", f"{day} 18:00:00", "정상", ""))
+    return rows, {"updated": changed, "deleted": changed, "inserted": changed}
+
+
+def legacy_sync(session, rows):
+    """변경 전 방식: 전체 삭제 후 ORM 객체로 재삽입"""
+    session.query(Attendance).delete()
+    for employee_id, day, check_in, check_out, attendance_type, remarks in rows:
+        session.add(
+            Attendance(
+                employee_id=employee_id,
+                date=datetime.strptime(day, "%Y-%m-%d").date(),
+                check_in=check_in,
+                check_out=check_out,
+                attendance_type=attendance_type,
+                remarks=remarks,
+            )
+        )
+    session.commit()
+
+
+def table_contents(session):
+    """근태 테이블 내용 집합"""
+    return set(
+        session.query(
+            Attendance.employee_id,
+            func.strftime("%Y-%m-%d", Attendance.date),
+            Attendance.check_in,
+            Attendance.check_out,
+            Attendance.attendance_type,
+            Attendance.remarks,
+        )
+    )
+
+
+def watch_reader(Session, stop, empty_reads):
+    """동기화 중 근태 건수를 반복 조회하여 0 건이 보이는지 확인"""
+    session = Session()
+    try:
+        while not stop.is_set():
+            if session.query(func.count(Attendance.id)).scalar() == 0:
+                empty_reads.append(time.perf_counter())
+            session.rollback()
+            time.sleep(0.05)
+    finally:
+        session.close()
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    legacy_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    ratio = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+    rng = random.Random(20240101)
+
+    check = Checker()
+
+    with temp_database("attendance_upsert_", "upsert.db") as db:
+        Session = sessionmaker(bind=db.engine)
+
+        rows = generate_rows(row_count, rng)
+        print(f"근태 {len(rows):,}행 (upsert)")
+
+        def sync(rows):
+            session = Session()
+            try:
+                result = upsert_attendance(session, iter(rows), delete_missing=True)
+                session.commit()
+                return result
+            finally:
+                session.close()
+
+        timed("최초 적재", sync, rows)
+        result = timed("변경 없는 재동기화", sync, rows)
+        check(
+            f"변경 없는 재동기화: 변경 {len(result['changes'])}건",
+            len(result["changes"]) == 0,
+        )
+
+        # 일부 변경 재동기화 (다른 연결에서 조회하며 빈 테이블이 보이는지 확인)
+        mutated, expected = mutate(rows, ratio, rng)
+        stop, empty_reads = threading.Event(), []
+        reader = threading.Thread(
+            target=watch_reader, args=(Session, stop, empty_reads)
+        )
+        reader.start()
+        try:
+            result = timed(f"일부 변경 재동기화 ({ratio:.1%})", sync, mutated)
+        finally:
+            stop.set()
+            reader.join()
+
+        session = Session()
+        try:
+            for key, count in expected.items():
+                check(
+                    f"{key}: 기대 {count}건, 결과 {result[key]}건",
+                    result[key] == count,
+                )
+            check(
+                "근태 테이블 내용이 입력과 같음",
+                table_contents(session) == set(mutated),
+            )
+            audit_count = (
+                session.query(func.count(AttendanceAudit.id))
+                .filter(AttendanceAudit.change_type != "create")
+                .scalar()
+            )
+            # 수정 행은 check_out, remarks 두 필드 이력
+            expected_audits = expected["updated"] * 2 + expected["deleted"]
+            check(
+                f"감사 이력: 기대 {expected_audits}건, 결과 {audit_count}건",
+                audit_count == expected_audits,
+            )
+        finally:
+            session.close()
+        print(f"  동기화 중 빈 테이블 조회: {len(empty_reads)}회")
+
+    # 변경 전 방식 (행 수를 줄여 측정)
+    with temp_database("attendance_upsert_", "legacy.db") as db:
+        legacy_rows = rows[:legacy_count]
+        print(f"근태 {len(legacy_rows):,}행 (legacy)")
+        session = sessionmaker(bind=db.engine)()
+        try:
+            timed("최초 적재", legacy_sync, session, legacy_rows)
+            timed("재동기화", legacy_sync, session, legacy_rows)
+        finally:
+            session.close()
+
+    check.finish("UPSERT 결과가 입력과 같고 감사 이력이 변경 건수와 일치합니다.")
+
+
+if __name__ == "__main__":
+    main()
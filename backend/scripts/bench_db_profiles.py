@@ -0,0 +1,287 @@
+"""
+데이터베이스 프로필 벤치마크
+
+임시 SQLite 파일에 합성 직원/근태 데이터를 적재한 뒤, 프로필별로
+- 초기 적재 시간
+- 근태 동기화 스레드와 같은 소규모 쓰기 트랜잭션(1건씩 커밋) 시간
+- 급여 일괄 계산(조회 → 계산 → 초안 일괄 삭제/삽입) 처리량
+- 위 쓰기 작업이 진행되는 동안 다른 스레드의 읽기 지연 시간(p50/p95/최대)
+을 측정합니다. legacy 는 변경 전 설정(echo=True, 기본 저널 모드, PRAGMA 없음)입니다.
+SQL 로그는 측정에 포함되지만 화면에는 출력하지 않습니다.
+
+사용법: python scripts/bench_db_profiles.py [직원 수] [소규모 트랜잭션 수] [시드]
+"""
+
+import sys
+import os
+import logging
+import random
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, current_dir)
+
+from _attendance_samples import generate_employee_records
+from _harness import measure
+from config.database import DB_PROFILES, Base, create_db_engine
+from models.models import Attendance, Employee, Payroll
+from utils.payroll_batch import calculate_batch_values, employee_scalars
+
+PERIOD_START = date(2024, 9, 1)
+PERIOD_END = date(2024, 9, 30)
+
+
+def make_engine(path, profile):
+    """프로필별 엔진 생성 (legacy 는 변경 전 설정)"""
+    url = f"sqlite:///{path}"
+    if profile == "legacy":
+        return create_engine(url, echo=True, connect_args={"check_same_thread": False})
+    return create_db_engine(url, profile)
+
+
+def seed(Session, employee_count, seed_value):
+    """합성 직원/근태 데이터 일괄 적재"""
+    rng = random.Random(seed_value)
+    days = (PERIOD_END - PERIOD_START).days + 1
+    employees = []
+    attendance = []
+    for i in range(employee_count):
+        employee_id = f"P{i:06d}"
+        employees.append(
+            {
+                "employee_id": employee_id,
+                "name": f"직원{i}",
+                "department": rng.choice(["개발", "영업", "인사"]),
+                "position": rng.choice(["사원", "대리", "과장", "부장"]),
+                "join_date": date(2020, 1, 1),
+                "base_salary": rng.randint(28_000_000, 150_000_000),
+                "family_count": rng.randint(0, 5),
+            }
+        )
+        for record in generate_employee_records(rng, PERIOD_START, days):
+            attendance.append(
+                {
+                    "employee_id": employee_id,
+                    "date": datetime.strptime(record["date"], "%Y-%m-%d").date(),
+                    "check_in": record["check_in"],
+                    "check_out": record["check_out"],
+                    "attendance_type": record["attendance_type"],
+                    "remarks": record["remarks"],
+                }
+            )
+
+    session = Session()
+    try:
+        session.execute(insert(Employee), employees)
+        session.execute(insert(Attendance), attendance)
+        session.commit()
+    finally:
+        Session.remove()
+    return [row["employee_id"] for row in employees]
+
+
+def small_transactions(Session, employee_ids, count, seed_value):
+    """근태 기록 1건 수정 후 커밋을 반복 (근태 동기화 스레드의 쓰기 형태)"""
+    rng = random.Random(seed_value)
+    session = Session()
+    try:
+        for _ in range(count):
+            record = (
+                session.query(Attendance)
+                .filter(Attendance.employee_id == rng.choice(employee_ids))
+                .first()
+            )
+            if record is not None:
+                record.remarks = f"수정 {rng.randint(0, 9999)}"
+            session.commit()
+    finally:
+        Session.remove()
+
+
+def payroll_batch(Session):
+    """급여 일괄 계산 후 초안 급여 일괄 교체"""
+    session = Session()
+    try:
+        employees = session.query(Employee).order_by(Employee.employee_id).all()
+        groups = {employee.employee_id: [] for employee in employees}
+        for record in session.query(Attendance).filter(
+            Attendance.date >= PERIOD_START, Attendance.date <= PERIOD_END
+        ):
+            groups[record.employee_id].append(
+                {
+                    "date": record.date.strftime("%Y-%m-%d"),
+                    "check_in": record.check_in,
+                    "check_out": record.check_out,
+                    "attendance_type": record.attendance_type,
+                    "remarks": record.remarks,
+                }
+            )
+
+        values = calculate_batch_values(
+            [employee_scalars(employee) for employee in employees],
+            [groups[employee.employee_id] for employee in employees],
+            PERIOD_START,
+            PERIOD_END,
+        )
+        rows = [
+            {
+                "payroll_code": str(uuid.uuid4()),
+                "employee_id": employee.employee_id,
+                "payment_period_start": PERIOD_START,
+                "payment_period_end": PERIOD_END,
+                "base_pay": v["base_pay"],
+                "overtime_pay": v["overtime_pay"],
+                "night_shift_pay": v["night_shift_pay"],
+                "holiday_pay": v["holiday_pay"],
+                "total_allowances": v["total_allowances"],
+                "gross_pay": v["gross_pay"],
+                "income_tax": v["income_tax"],
+                "residence_tax": v["residence_tax"],
+                "national_pension": v["national_pension"],
+                "health_insurance": v["health_insurance"],
+                "long_term_care": v["long_term_care"],
+                "employment_insurance": v["employment_insurance"],
+                "total_deductions": v["total_deductions"],
+                "net_pay": v["net_pay"],
+                "status": "draft",
+                "payroll_type": "regular",
+            }
+            for employee, v in zip(employees, values)
+            if "error" not in v
+        ]
+
+        session.query(Payroll).filter(
+            Payroll.payment_period_start == PERIOD_START,
+            Payroll.payment_period_end == PERIOD_END,
+            Payroll.status == "draft",
+        ).delete(synchronize_session=False)
+        session.execute(insert(Payroll), rows)
+        session.commit()
+        return len(rows)
+    finally:
+        Session.remove()
+
+
+def reader(Session, employee_ids, stop, latencies, errors, seed_value):
+    """쓰기 작업 중 반복 조회하며 지연 시간 기록"""
+    rng = random.Random(seed_value)
+    session = Session()
+    try:
+        while not stop.is_set():
+            employee_id = rng.choice(employee_ids)
+            started = time.perf_counter()
+            try:
+                session.query(Payroll.net_pay).filter(
+                    Payroll.employee_id == employee_id
+                ).all()
+                session.query(func.count(Attendance.id)).filter(
+                    Attendance.employee_id == employee_id
+                ).scalar()
+                session.rollback()  # 읽기 트랜잭션 종료
+                latencies.append(time.perf_counter() - started)
+            except Exception:
+                session.rollback()
+                errors.append(time.perf_counter() - started)
+            time.sleep(0.001)
+    finally:
+        Session.remove()
+
+
+def percentile(values, ratio):
+    """정렬 후 백분위 값 (밀리초)"""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] * 1000
+
+
+def run_profile(profile, workdir, employee_count, tx_count, seed_value):
+    """프로필 1개 측정"""
+    path = os.path.join(workdir, f"{profile}.db")
+    engine = make_engine(path, profile)
+    Base.metadata.create_all(engine)
+    Session = scoped_session(
+        sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+
+    employee_ids, seed_time = measure(seed, Session, employee_count, seed_value)
+
+    # 첫 급여 계산으로 조회 대상 초안 생성
+    payroll_batch(Session)
+
+    stop = threading.Event()
+    latencies, errors = [], []
+    reader_thread = threading.Thread(
+        target=reader,
+        args=(Session, employee_ids, stop, latencies, errors, seed_value),
+    )
+    reader_thread.start()
+    try:
+        _, tx_time = measure(
+            small_transactions, Session, employee_ids, tx_count, seed_value
+        )
+        calculated, batch_time = measure(payroll_batch, Session)
+    finally:
+        stop.set()
+        reader_thread.join()
+        engine.dispose()
+
+    return {
+        "profile": profile,
+        "seed_time": seed_time,
+        "tx_time": tx_time,
+        "batch_rate": calculated / batch_time,
+        "reads": len(latencies),
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "max": max(latencies) * 1000 if latencies else float("nan"),
+        "errors": len(errors),
+    }
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tx_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    seed_value = int(sys.argv[3]) if len(sys.argv) > 3 else 20240101
+
+    print(f"직원 {employee_count:,}명, 소규모 트랜잭션 {tx_count}건")
+    print(
+        f"{'프로필':>8} {'적재(초)':>9} {'트랜잭션(초)':>12} {'급여(명/초)':>11} "
+        f"{'읽기 p50':>9} {'p95':>8} {'최대':>8} {'읽기 실패':>8}"
+    )
+
+    # SQL 로그(echo)는 생성 비용만 측정하고 화면에는 출력하지 않음
+    engine_logger = logging.getLogger("sqlalchemy.engine.Engine")
+    for handler in list(engine_logger.handlers):
+        engine_logger.removeHandler(handler)
+    devnull = open(os.devnull, "w")
+    engine_logger.addHandler(logging.StreamHandler(devnull))
+
+    workdir = tempfile.mkdtemp(prefix="db_profiles_")
+    try:
+        for profile in ["legacy", *DB_PROFILES]:
+            result = run_profile(profile, workdir, employee_count, tx_count, seed_value)
+            print(
+                f"{result['profile']:>8} {result['seed_time']:>9.2f} "
+                f"{result['tx_time']:>12.2f} {result['batch_rate']:>11.0f} "
+                f"{result['p50']:>7.2f}ms {result['p95']:>6.2f}ms "
+                f"{result['max']:>6.1f}ms {result['errors']:>8}"
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        devnull.close()
+
+
+if __name__ == "__main__":
+    main()
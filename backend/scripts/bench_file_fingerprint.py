@@ -0,0 +1,148 @@
+"""
+근태 파일 지문 벤치마크 및 변경 감지 검증
+
+임시 CSV 파일로 변경 확인(폴링) 비용을 두 방식으로 측정합니다.
+- legacy: 매번 f.read() 로 파일 전체를 읽어 MD5 (이전 _calculate_file_hash)
+- fingerprint: utils.file_fingerprint.FileFingerprinter (stat 빠른 경로 + 청크 해시)
+
+폴링 시간과 tracemalloc 최대 메모리를 출력하고, 다음 경우의 감지 결과를 확인합니다.
+- 변경 없음: 파일을 읽지 않아야 함
+- 수정 시간만 변경(touch): 다시 해시하되 지문은 같아야 함
+- 같은 크기로 내용 변경, 행 추가, 파일 교체(os.replace), 삭제: 지문이 달라야 함
+
+사용법: python scripts/bench_file_fingerprint.py [MB] [폴링 횟수]
+"""
+
+import sys
+import os
+import hashlib
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, measure, timed
+from utils.file_fingerprint import HASH_ALGORITHM, FileFingerprinter
+
+ROW = "E{:05d},2024-01-{:02d},2024-01-{:02d} 09:00:00,2024-01-{:02d} 18:00:00,정상,\n"
+
+
+def write_csv(path, size_mb):
+    """약 size_mb MB 크기의 근태 CSV 생성"""
+    target = size_mb * 1024 * 1024
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("employee_id,date,check_in,check_out,attendance_type,remarks\n")
+        written, i = 0, 0
+        while written < target:
+            day = i % 28 + 1
+            line = ROW.format(i // 28, day, day, day)
+            f.write(line)
+            written += len(line.encode("utf-8"))
+            i += 1
+
+
+def settle(path):
+    """해시 시점과 mtime 이 가까워 캐시를 신뢰하지 않는 경우를 피하도록 mtime 을 과거로"""
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def legacy_hash(path):
+    """이전 방식: 파일 전체 읽기 + MD5"""
+    if not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def measure_polls(label, func, polls):
+    """폴링 시간과 최대 메모리 측정"""
+
+    def poll():
+        for _ in range(polls):
+            func()
+
+    tracemalloc.start()
+    _, elapsed = measure(poll)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label}: {polls}회 {elapsed:.3f}초 (1회 {elapsed / polls * 1000:.3f}ms), "
+        f"최대 메모리 {peak / 1024 / 1024:,.1f}MB"
+    )
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    polls = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    workdir = tempfile.mkdtemp(prefix="file_fingerprint_")
+    check = Checker()
+
+    try:
+        path = os.path.join(workdir, "attendance.csv")
+        write_csv(path, size_mb)
+        settle(path)
+        print(
+            f"근태 CSV {os.path.getsize(path) / 1024 / 1024:,.1f}MB ({HASH_ALGORITHM})"
+        )
+
+        fingerprinter = FileFingerprinter(path)
+        measure_polls("legacy 폴링", lambda: legacy_hash(path), polls)
+        base = timed("fingerprint 최초 해시", fingerprinter.fingerprint)
+        measure_polls("fingerprint 폴링", fingerprinter.fingerprint, polls)
+
+        print("변경 감지")
+        check(
+            "변경 없음: 파일을 다시 읽지 않음",
+            fingerprinter.stats["hashes"] == 1
+            and fingerprinter.stats["stat_hits"] == polls,
+        )
+
+        os.utime(path)
+        settle(path)
+        touched = fingerprinter.fingerprint()
+        check(
+            "touch: 다시 해시하고 지문은 같음",
+            fingerprinter.stats["hashes"] == 2 and touched["digest"] == base["digest"],
+        )
+
+        with open(path, "r+b") as f:
+            f.seek(os.path.getsize(path) // 2)
+            f.write(b"X")
+        settle(path)
+        check(
+            "같은 크기 내용 변경: 지문 변경",
+            fingerprinter.digest() != base["digest"],
+        )
+
+        previous = fingerprinter.digest()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(ROW.format(99999, 1, 1, 1))
+        check("행 추가: 지문 변경", fingerprinter.digest() != previous)
+
+        previous = fingerprinter.digest()
+        replacement = os.path.join(workdir, "attendance.tmp")
+        write_csv(replacement, 1)
+        os.replace(replacement, path)
+        check("파일 교체(os.replace): 지문 변경", fingerprinter.digest() != previous)
+
+        os.remove(path)
+        missing = fingerprinter.fingerprint()
+        check(
+            "파일 삭제: 존재하지 않음",
+            not missing["exists"] and missing["digest"] == "",
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    check.finish("변경이 없으면 파일을 읽지 않고, 내용 변경은 모두 감지합니다.")
+
+
+if __name__ == "__main__":
+    main()
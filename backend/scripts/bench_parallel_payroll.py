@@ -0,0 +1,95 @@
+"""
+급여 일괄 계산 병렬 처리 벤치마크
+
+합성 직원 데이터(기본 10,000명)로 utils.payroll_batch.calculate_batch_values 를
+작업자 수별로 실행하여 소요 시간을 비교하고, 모든 결과가 작업자 1개와 동일한지 확인합니다.
+
+사용법: python scripts/bench_parallel_payroll.py [직원 수] [최대 작업자 수] [시드]
+"""
+
+import sys
+import os
+import random
+from datetime import date, timedelta
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, current_dir)
+
+from _attendance_samples import generate_employee_records
+from _harness import Checker, measure
+from utils.payroll_batch import EmployeeScalars, calculate_batch_values
+
+
+def generate_employees(rng, count, period_start, days):
+    """합성 직원 및 근태 데이터 생성"""
+    employees = []
+    attendance_groups = []
+    for i in range(count):
+        join_date = (
+            date(2020, 1, 1)
+            if rng.random() < 0.95
+            else period_start + timedelta(days=rng.randint(1, days - 1))
+        )
+        employees.append(
+            EmployeeScalars(
+                employee_id=f"B{i:06d}",
+                base_salary=rng.randint(28_000_000, 150_000_000),
+                join_date=join_date,
+                resignation_date=None,
+                family_count=rng.randint(0, 6),
+            )
+        )
+        attendance_groups.append(generate_employee_records(rng, period_start, days))
+    return employees, attendance_groups
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 20240101
+    rng = random.Random(seed)
+
+    period_start = date(2024, 9, 1)
+    period_end = date(2024, 9, 30)
+    employees, attendance_groups = generate_employees(
+        rng, employee_count, period_start, (period_end - period_start).days + 1
+    )
+    record_count = sum(len(records) for records in attendance_groups)
+    print(
+        f"직원 {employee_count:,}명, 근태 기록 {record_count:,}건 "
+        f"(CPU {os.cpu_count()}개, 최대 작업자 {max_workers}개)"
+    )
+
+    worker_counts = sorted(
+        {1, max_workers, *[w for w in (2, 4, 8, 16) if w < max_workers]}
+    )
+
+    check = Checker()
+    baseline = None
+    baseline_time = None
+    print(f"{'작업자':>6} {'소요 시간(초)':>14} {'배속':>8}")
+    for workers in worker_counts:
+        results, elapsed = measure(
+            calculate_batch_values,
+            employees,
+            attendance_groups,
+            period_start,
+            period_end,
+            workers,
+        )
+
+        if baseline is None:
+            baseline, baseline_time = results, elapsed
+        elif results != baseline:
+            check.mismatch(f"  작업자 {workers}개의 결과가 작업자 1개와 다릅니다.")
+
+        print(f"{workers:>6} {elapsed:>14.3f} {baseline_time / elapsed:>7.2f}x")
+
+    check.finish("모든 작업자 수에서 결과가 동일합니다.", "결과가 다른 작업자 수")
+
+
+if __name__ == "__main__":
+    main()
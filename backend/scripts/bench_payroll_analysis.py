@@ -0,0 +1,241 @@
+"""
+급여 분석 집계 벤치마크 (/api/payroll/analysis)
+
+임시 SQLite 파일에 합성 직원/급여를 행 수를 늘려 가며 적재하고, 이전 방식(확정/지급
+급여 전체를 Python 으로 가져와 딕셔너리로 집계)과 utils.payroll_analytics 의
+SQL GROUP BY 집계를 비교합니다.
+
+- period_type=all 의 그룹별/전체 행이 이전 응답과 같은지
+- 기간별(monthly/quarterly/yearly) 행의 합이 전체 행과 같은지
+- 집계가 SQL 1문장으로 끝나는지
+- 월별 요약(payroll_monthly_summary)에서 집계한 결과가 급여 테이블 집계와 같은지
+- 급여 행 수에 따른 응답 시간 (이전 방식 / 급여 테이블 집계 / 월별 요약 집계)
+
+사용법: python scripts/bench_payroll_analysis.py [직원 수 목록 (쉼표 구분)]
+"""
+
+import sys
+import os
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, best_time, temp_database
+from models.models import Employee, Payroll
+from utils.payroll_analytics import GROUP_BY_OPTIONS, TOTAL_LABEL, analyze_payrolls
+from utils.payroll_summary import rebuild_payroll_summary
+from utils.query_counter import QueryCounter
+
+START_DATE = date(2023, 1, 1)
+MONTHS = 24
+END_DATE = date(2024, 12, 31)
+REPEAT = 3
+
+
+def seed(session, employee_count):
+    """합성 직원과 월별 급여 적재 (일부는 초안 상태로 집계 제외)"""
+    rng = random.Random(employee_count)
+    employee_ids = [f"A{i:05d}" for i in range(employee_count)]
+    session.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": employee_id,
+                "name": f"직원{employee_id}",
+                "department": rng.choice(["개발", "영업", "인사", "재무"]),
+                "position": rng.choice(["사원", "대리", "과장", "부장"]),
+                "base_salary": 40_000_000,
+            }
+            for employee_id in employee_ids
+        ],
+    )
+    payrolls = []
+    month_start = START_DATE
+    for _ in range(MONTHS):
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        for employee_id in employee_ids:
+            base_pay = rng.randint(2_500_000, 6_000_000)
+            overtime, night, holiday = (rng.randint(0, 500_000) for _ in range(3))
+            gross = base_pay + overtime + night + holiday
+            payrolls.append(
+                {
+                    "payroll_code": f"{employee_id}-{month_start:%Y%m}",
+                    "employee_id": employee_id,
+                    "payment_period_start": month_start,
+                    "payment_period_end": next_month - timedelta(days=1),
+                    "base_pay": base_pay,
+                    "overtime_pay": overtime,
+                    "night_shift_pay": night,
+                    "holiday_pay": holiday,
+                    "gross_pay": gross,
+                    "net_pay": round(gross * 0.88),
+                    "status": rng.choice(["confirmed", "paid", "paid", "draft"]),
+                    "payroll_type": "regular",
+                }
+            )
+        month_start = next_month
+    session.execute(insert(Payroll), payrolls)
+    session.commit()
+    return len(payrolls)
+
+
+def legacy_analysis(session, group_by):
+    """이전 방식: 전체 급여를 가져와 부서/직급별로 Python 집계"""
+    records = (
+        session.query(
+            Payroll.base_pay,
+            Payroll.overtime_pay,
+            Payroll.night_shift_pay,
+            Payroll.holiday_pay,
+            Payroll.gross_pay,
+            Payroll.net_pay,
+            Employee.department,
+            Employee.position,
+        )
+        .join(Employee, Payroll.employee_id == Employee.employee_id)
+        .filter(
+            Payroll.payment_period_start >= START_DATE,
+            Payroll.payment_period_end <= END_DATE,
+            Payroll.status.in_(["confirmed", "paid"]),
+        )
+        .all()
+    )
+    groups = {}
+    for record in records:
+        key = record.department if group_by == "department" else record.position
+        data = groups.setdefault(key, [0, 0, 0, 0, 0])
+        data[0] += 1
+        data[1] += record.base_pay
+        data[2] += record.overtime_pay + record.night_shift_pay + record.holiday_pay
+        data[3] += record.gross_pay
+        data[4] += record.net_pay
+    groups[TOTAL_LABEL] = [
+        len(records),
+        sum(r.base_pay for r in records),
+        sum(r.overtime_pay + r.night_shift_pay + r.holiday_pay for r in records),
+        sum(r.gross_pay for r in records),
+        sum(r.net_pay for r in records),
+    ]
+    return {
+        key: (
+            count,
+            round(base / count),
+            round(allowances / count),
+            round(gross / count),
+            round(net / count),
+        )
+        for key, (count, base, allowances, gross, net) in groups.items()
+    }
+
+
+def summarize(rows):
+    return {
+        row["group"]: (
+            row["employee_count"],
+            row["avg_base_pay"],
+            row["avg_allowances"],
+            row["avg_gross_pay"],
+            row["avg_net_pay"],
+        )
+        for row in rows
+    }
+
+
+def main():
+    sizes = (
+        [int(size) for size in sys.argv[1].split(",")]
+        if len(sys.argv) > 1
+        else [100, 1000, 5000]
+    )
+    check = Checker()
+
+    print(f"{'급여 행':>10}{'이전 방식':>12}{'SQL 집계':>12}{'요약 집계':>12}")
+    for employee_count in sizes:
+        with temp_database("payroll_analysis_", "analysis.db") as db:
+            engine = db.engine
+            session = sessionmaker(bind=engine)()
+            payroll_count = seed(session, employee_count)
+            # Core INSERT 로 적재했으므로 백필과 같이 요약 전체 다시 집계
+            rebuild_payroll_summary(session)
+
+            for group_by in ("department", "position"):
+                rows = analyze_payrolls(
+                    session, START_DATE, END_DATE, group_by, "all", use_summary=False
+                )
+                check(
+                    f"{payroll_count:,}행 {group_by}: 이전 방식과 같은 집계",
+                    summarize(rows) == legacy_analysis(session, group_by),
+                )
+
+            for group_by in GROUP_BY_OPTIONS:
+                for period_type in ("monthly", "quarterly", "yearly", "all"):
+                    with QueryCounter(engine) as counter:
+                        rows = analyze_payrolls(
+                            session, START_DATE, END_DATE, group_by, period_type
+                        )
+                    from_payroll = analyze_payrolls(
+                        session,
+                        START_DATE,
+                        END_DATE,
+                        group_by,
+                        period_type,
+                        use_summary=False,
+                    )
+                    total = rows[-1]
+                    by_level = {}
+                    for row in rows:
+                        by_level.setdefault(row["level"], []).append(row)
+                    sums_match = all(
+                        sum(row["total_gross_pay"] for row in by_level[level])
+                        == total["total_gross_pay"]
+                        and sum(row["employee_count"] for row in by_level[level])
+                        == total["employee_count"]
+                        for level in by_level
+                    )
+                    same = rows == from_payroll
+                    if not (counter.count == 1 and sums_match and same):
+                        check(
+                            f"{payroll_count:,}행 {group_by}/{period_type}: "
+                            f"SQL {counter.count}문장, 합계 일치 {sums_match}, "
+                            f"요약/급여 테이블 집계 일치 {same}",
+                            False,
+                        )
+
+            legacy_seconds = best_time(
+                lambda: legacy_analysis(session, "department"), REPEAT
+            )
+            sql_seconds, summary_seconds = (
+                best_time(
+                    lambda: analyze_payrolls(
+                        session,
+                        START_DATE,
+                        END_DATE,
+                        "department",
+                        "monthly",
+                        use_summary=use_summary,
+                    ),
+                    REPEAT,
+                )
+                for use_summary in (False, True)
+            )
+            print(
+                f"{payroll_count:>10,}{legacy_seconds * 1000:>10.1f}ms"
+                f"{sql_seconds * 1000:>10.1f}ms{summary_seconds * 1000:>10.1f}ms"
+            )
+            session.close()
+
+    check.finish(
+        "SQL 집계가 이전 방식과 같고, 월별 요약 집계도 같으며 "
+        "모든 조합이 SQL 1문장으로 집계됩니다."
+    )
+
+
+if __name__ == "__main__":
+    main()
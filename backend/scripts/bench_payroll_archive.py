@@ -0,0 +1,321 @@
+"""
+급여 이력 아카이브 벤치마크 (/api/payroll/summary, /api/payroll/current-month)
+
+임시 디렉토리에 합성 payroll.csv(직원 수 × 개월 수)를 만들고, 이전 방식(요청마다
+payroll.csv 전체를 pd.read_csv 후 최근 지급일만 남김)과 급여 이력 아카이브를 읽는
+PayrollService.load_payroll_data / calculate_monthly_stats 를 비교합니다.
+
+- 결과가 이전 방식과 같은지, 응답 시간
+- payroll.csv 가 바뀌지 않으면 다시 가져오지 않는지, 새 달이 추가되면 반영되는지
+- 조건 조회가 통계로 조각을 건너뛰고 전체 조회 후 거른 결과와 같은지
+- payroll.csv 에서 행/달을 지우고 다시 가져오면 아카이브에서도 지워지는지
+- SQLite payroll 테이블 가져오기 (payroll.csv 조각과 섞이지 않고, 확정이 취소된
+  급여는 다시 가져올 때 지워지는지)
+
+PayrollService 를 사용하므로 서버 실행 환경(.env 의 OPENAI_API_KEY 등)이 필요합니다.
+
+사용법: python scripts/bench_payroll_archive.py [직원 수] [개월 수]
+"""
+
+import sys
+import os
+import random
+import shutil
+import tempfile
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from config import Config
+from _harness import Checker, best_time
+from config.database import Base, create_db_engine
+from models.models import Employee, Payroll
+from utils.payroll_archive import ARCHIVE_COLUMNS, PayrollArchive
+
+REPEAT = 5
+FIRST_MONTH = date(2019, 10, 25)
+
+
+def payment_dates(months):
+    """매월 25일 지급일 목록"""
+    return [
+        date(
+            FIRST_MONTH.year + (FIRST_MONTH.month - 1 + i) // 12,
+            (FIRST_MONTH.month - 1 + i) % 12 + 1,
+            25,
+        )
+        for i in range(months)
+    ]
+
+
+def synthetic_rows(employee_count, dates, seed):
+    """payroll.csv 형식 합성 행"""
+    rng = random.Random(seed)
+    rows = []
+    for payment_date in dates:
+        for i in range(employee_count):
+            employee_id = f"DV{i:04d}"
+            amounts = {
+                "base_salary": rng.randint(2_500_000, 9_000_000),
+                "position_allowance": rng.choice([0, 0, 150_000, 300_000]),
+                "overtime_pay": rng.randint(0, 400_000),
+                "night_shift_pay": rng.randint(0, 200_000),
+                "holiday_pay": rng.randint(0, 200_000),
+                "meal_allowance": 100_000,
+                "transportation_allowance": 100_000,
+                "bonus": rng.choice([0, 0, 0, 1_000_000]),
+            }
+            gross = sum(amounts.values())
+            deductions = {
+                "national_pension": round(gross * 0.045),
+                "health_insurance": round(gross * 0.035),
+                "long_term_care": round(gross * 0.0045),
+                "employment_insurance": round(gross * 0.009),
+                "income_tax": round(gross * 0.08),
+                "local_income_tax": round(gross * 0.008),
+            }
+            rows.append(
+                {
+                    "payment_id": f"{payment_date:%Y%m}{employee_id}",
+                    "employee_id": employee_id,
+                    "payment_date": f"{payment_date}",
+                    **amounts,
+                    "gross_salary": gross,
+                    **deductions,
+                    "net_salary": gross - sum(deductions.values()),
+                }
+            )
+    return pd.DataFrame(rows, columns=list(ARCHIVE_COLUMNS))
+
+
+def legacy_load(path):
+    """이전 방식: payroll.csv 전체 로드 후 최근 지급일만 남김"""
+    df = pd.read_csv(path)
+    df["payment_date"] = pd.to_datetime(df["payment_date"])
+    latest_payment_date = df["payment_date"].max()
+    df_latest = df[df["payment_date"] == latest_payment_date].copy()
+    return df_latest, latest_payment_date.strftime("%Y년 %m월")
+
+
+def legacy_stats(df):
+    return {
+        "총 지급액": df["gross_salary"].sum(),
+        "평균 급여": df["base_salary"].mean(),
+        "총 인원": len(df),
+        "4대보험 총액": df[
+            ["national_pension", "health_insurance", "employment_insurance"]
+        ]
+        .sum()
+        .sum(),
+    }
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    check = Checker()
+
+    workdir = tempfile.mkdtemp(prefix="payroll_archive_")
+    csv_path = os.path.join(workdir, "payroll.csv")
+    archive_dir = os.path.join(workdir, "payroll_archive")
+
+    class BenchConfig(Config):
+        PAYROLL_DATA = csv_path
+        PAYROLL_ARCHIVE_DIR = archive_dir
+
+    from app.services.payroll_service import PayrollService
+
+    service = PayrollService(BenchConfig)
+    # 실제 근태 파일 감시는 사용하지 않음
+    service.stop_file_watcher()
+    engine = None
+    try:
+        dates = payment_dates(months)
+        history = synthetic_rows(employee_count, dates, seed=1)
+        history.to_csv(csv_path, index=False)
+        print(
+            f"payroll.csv {len(history):,}행 ({months}개월), "
+            f"아카이브 형식 {service.payroll_archive.file_format}"
+        )
+
+        print("이전 방식과 비교")
+        legacy_frame, legacy_month = legacy_load(csv_path)
+        frame, month_label = service.load_payroll_data()
+        renamed_legacy = legacy_frame.rename(
+            columns=dict(zip(legacy_frame.columns, frame.columns))
+        )
+        check(
+            f"load_payroll_data: {len(frame)}행, {month_label}",
+            month_label == legacy_month
+            and frame.reset_index(drop=True).equals(
+                renamed_legacy.reset_index(drop=True)
+            ),
+        )
+        check(
+            "calculate_monthly_stats",
+            service.calculate_monthly_stats() == legacy_stats(legacy_frame),
+        )
+        check(
+            "payroll.csv 가 바뀌지 않으면 다시 가져오지 않음",
+            service.payroll_archive.import_csv(csv_path) is None,
+        )
+
+        legacy_seconds = best_time(
+            lambda: legacy_stats(legacy_load(csv_path)[0]), REPEAT
+        )
+        archive_seconds = best_time(service.calculate_monthly_stats, REPEAT)
+        print(
+            f"  월별 통계: 이전 방식 {legacy_seconds * 1000:.1f}ms, "
+            f"아카이브 {archive_seconds * 1000:.1f}ms "
+            f"({legacy_seconds / archive_seconds:.1f}x)"
+        )
+
+        print("새 달 추가")
+        next_date = payment_dates(months + 1)[-1]
+        appended = synthetic_rows(employee_count, [next_date], seed=2)
+        appended.to_csv(csv_path, mode="a", header=False, index=False)
+        frame, month_label = service.load_payroll_data()
+        check(
+            f"추가한 {next_date:%Y-%m} 반영: {month_label}",
+            month_label == f"{next_date:%Y년 %m월}" and len(frame) == employee_count,
+        )
+
+        print("조건 조회 (통계로 조각 건너뛰기)")
+        archive = service.payroll_archive
+        history = pd.concat([history, appended], ignore_index=True)
+        threshold = int(history["bonus"].max())
+        # 상여가 없는 달은 통계로 건너뜀
+        history.loc[history["payment_date"] < f"{dates[months // 2]}", "bonus"] = 0
+        history.to_csv(csv_path, index=False)
+        archive.import_csv(csv_path)
+        where = {"bonus": (threshold, None)}
+        selected = archive.select_partitions(where=where)
+        result = archive.read(["payment_id", "bonus"], where=where)
+        expected = history[history["bonus"] >= threshold]
+        check(
+            f"상여 조건: 조각 {len(selected)}/{len(archive.months())}개 읽음, "
+            f"{len(result)}행",
+            len(selected) < len(archive.months())
+            and sorted(result["payment_id"]) == sorted(expected["payment_id"]),
+        )
+        ranged = archive.read(
+            ["payment_id"],
+            start_month=f"{dates[1]:%Y-%m}",
+            end_month=f"{dates[2]:%Y-%m}",
+        )
+        check(f"월 범위 조회: {len(ranged)}행", len(ranged) == employee_count * 2)
+
+        print("payroll.csv 다시 가져오기 (삭제 반영)")
+        last_month = f"{next_date:%Y-%m}"
+        # 첫 달 전체와 마지막 달의 한 행만 남기고 나머지 행 삭제
+        shrunk = history[history["payment_date"] != f"{dates[0]}"]
+        latest_rows = shrunk["payment_date"] == f"{next_date}"
+        shrunk = pd.concat([shrunk[~latest_rows], shrunk[latest_rows].head(1)])
+        shrunk.to_csv(csv_path, index=False)
+        result = archive.import_csv(csv_path)
+        latest = archive.read(start_month=last_month, end_month=last_month)
+        check(
+            f"지운 급여월 {result['removed']}, {last_month} {len(latest)}행",
+            result["removed"] == [f"{dates[0]:%Y-%m}"]
+            and archive.months()[0] == f"{dates[1]:%Y-%m}"
+            and latest["payment_id"].tolist()
+            == shrunk["payment_id"].iloc[-1:].tolist(),
+        )
+        csv_months = archive.months()
+
+        print("SQLite payroll 테이블 가져오기")
+        engine = create_db_engine(
+            f"sqlite:///{os.path.join(workdir, 'db.sqlite')}", "prod"
+        )
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.execute(
+            insert(Employee),
+            [
+                {
+                    "employee_id": "DB0001",
+                    "name": "직원",
+                    "department": "개발",
+                    "position": "사원",
+                    "base_salary": 40_000_000,
+                }
+            ],
+        )
+        session.execute(
+            insert(Payroll),
+            [
+                {
+                    "payroll_code": f"PAY-{status.upper()}",
+                    "employee_id": "DB0001",
+                    "payment_period_start": date(2030, 1, 1),
+                    "payment_period_end": date(2030, 1, 31),
+                    "payment_date": date(2030, 2, 10) if status == "paid" else None,
+                    "base_pay": 3_000_000,
+                    "gross_pay": 3_300_000,
+                    "residence_tax": 10_000,
+                    "net_pay": 2_900_000,
+                    "status": status,
+                }
+                for status in ("paid", "confirmed", "draft")
+            ],
+        )
+        session.commit()
+        result = archive.import_payroll_table(session)
+        session.close()
+        imported = archive.read(start_month="2030-01", end_month="2030-02")
+        check(
+            f"확정/지급 급여 {result['rows']}건 ({', '.join(result['months'])})",
+            result["rows"] == 2
+            and sorted(imported["payment_id"]) == ["PAY-CONFIRMED", "PAY-PAID"]
+            and set(imported["local_income_tax"]) == {10_000},
+        )
+        again = archive.import_payroll_table(sessionmaker(bind=engine)())
+        check(
+            "다시 가져와도 행이 늘지 않음",
+            again["rows"] == 2
+            and len(archive.read(start_month="2030-01", end_month="2030-02")) == 2,
+        )
+        archive.import_csv(csv_path, force=True)
+        check(
+            "payroll.csv 를 다시 가져와도 payroll 테이블 조각은 유지",
+            len(archive.read(start_month="2030-01", end_month="2030-02")) == 2
+            and archive.months() == csv_months + ["2030-01", "2030-02"],
+        )
+        session = sessionmaker(bind=engine)()
+        session.query(Payroll).filter(Payroll.status == "paid").update(
+            {"status": "draft"}
+        )
+        session.commit()
+        result = archive.import_payroll_table(session)
+        session.close()
+        check(
+            f"확정 취소 반영: 지운 급여월 {result['removed']}",
+            result["removed"] == ["2030-02"]
+            and archive.months() == csv_months + ["2030-01"]
+            and len(archive.read(start_month=csv_months[0])) == len(shrunk) + 1,
+        )
+
+        print("아카이브 다시 열기")
+        reopened = PayrollArchive(archive_dir)
+        check(
+            f"형식 {reopened.file_format}, {len(reopened.months())}개월",
+            reopened.months() == archive.months()
+            and reopened.file_format == archive.file_format,
+        )
+    finally:
+        if engine is not None:
+            engine.dispose()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    check.finish("급여 이력 아카이브 조회 결과가 이전 방식과 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+급여 기록 조회(/api/payroll/records) 메모리/시간 벤치마크
+
+임시 SQLite 파일에 합성 급여 기록을 적재하고 세 방식의 최대 메모리(tracemalloc)와
+시간을 비교합니다.
+- legacy: Payroll ORM 객체 전체 조회 + 직원 IN 조회 + 딕셔너리 목록 + JSON 배열 (이전 방식)
+- stream: utils.payroll_records.iter_records 로 한 행씩 NDJSON 직렬화 (결과는 버림)
+- pages: fetch_page 로 키셋 페이지를 끝까지 순회
+
+세 방식의 결과가 같은지, 페이지 순회 시 뒤 페이지 조회 시간이 앞 페이지와 비슷한지
+확인합니다.
+
+사용법: python scripts/bench_payroll_records.py [직원 수] [개월 수]
+"""
+
+import sys
+import os
+import json
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, measure, temp_database
+from models.models import Employee, Payroll
+from utils.payroll_records import build_records_query, fetch_page, iter_records
+
+START_MONTH = date(2020, 1, 1)
+PAGE_SIZE = 500
+
+
+def seed(session, employee_count, months):
+    """합성 직원/급여 기록 적재"""
+    employee_ids = [f"P{i:05d}" for i in range(employee_count)]
+    session.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": employee_id,
+                "name": f"직원{employee_id}",
+                "department": "개발",
+                "position": "사원",
+                "base_salary": 40_000_000,
+            }
+            for employee_id in employee_ids
+        ],
+    )
+    month_start = START_MONTH
+    for m in range(months):
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        session.execute(
+            insert(Payroll),
+            [
+                {
+                    "payroll_code": f"{employee_id}-{month_start:%Y%m}",
+                    "employee_id": employee_id,
+                    "payment_period_start": month_start,
+                    "payment_period_end": next_month - timedelta(days=1),
+                    "payment_date": next_month + timedelta(days=9),
+                    "base_pay": 3_000_000,
+                    "gross_pay": 3_200_000,
+                    "net_pay": 2_800_000,
+                    "status": "paid",
+                    "payroll_type": "regular",
+                    "remarks": "정기 급여",
+                }
+                for employee_id in employee_ids
+            ],
+        )
+        month_start = next_month
+    session.commit()
+
+
+def legacy_records(session):
+    """이전 방식: ORM 객체 전체 조회 후 응답 목록 구성 (필드 일부만 구성하므로 legacy 에 유리)"""
+    payrolls = session.query(Payroll).all()
+    employee_ids = [p.employee_id for p in payrolls]
+    employees = {
+        emp.employee_id: emp
+        for emp in session.query(Employee).filter(
+            Employee.employee_id.in_(employee_ids)
+        )
+    }
+    results = []
+    for payroll in payrolls:
+        employee = employees.get(payroll.employee_id)
+        results.append(
+            {
+                "payroll_id": payroll.id,
+                "payroll_code": payroll.payroll_code,
+                "employee_id": payroll.employee_id,
+                "employee_name": employee.name if employee else "Unknown",
+                "payment_period_start": payroll.payment_period_start.strftime(
+                    "%Y-%m-%d"
+                ),
+                "netPay": payroll.net_pay,
+                "status": payroll.status,
+            }
+        )
+    return json.dumps(results, ensure_ascii=False)
+
+
+def stream_records(session):
+    """NDJSON 스트리밍 (직렬화한 줄은 응답으로 보낸 것처럼 버림)"""
+    count = 0
+    for record in iter_records(session, build_records_query()):
+        json.dumps(record, ensure_ascii=False)
+        count += 1
+    return count
+
+
+def walk_pages(session):
+    """키셋 페이지 끝까지 순회 (페이지별 조회 시간 목록 반환)"""
+    query = build_records_query()
+    cursor, timings, count = None, [], 0
+    while True:
+        page, seconds = measure(fetch_page, session, query, PAGE_SIZE, cursor)
+        timings.append(seconds)
+        count += len(page["records"])
+        if not page["has_more"]:
+            return count, timings
+        cursor = page["next_cursor"]
+
+
+def measure_memory(label, func, session):
+    """함수 실행 시간과 최대 메모리 측정 (tracemalloc 부담이 시간에 섞이지 않도록 두 번 실행)"""
+    session.expunge_all()
+    _, elapsed = measure(func, session)
+    session.expunge_all()
+    tracemalloc.start()
+    result = func(session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label}: {elapsed:,.2f}초, 최대 메모리 {peak / 1024 / 1024:,.1f}MB")
+    return result, peak
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    check = Checker()
+
+    with temp_database("payroll_records_", "records.db") as db:
+        engine = db.engine
+        session = sessionmaker(bind=engine)()
+        seed(session, employee_count, months)
+        total = employee_count * months
+        print(f"급여 기록 {total:,}건 전체 조회")
+
+        legacy, legacy_peak = measure_memory("legacy", legacy_records, session)
+        streamed, stream_peak = measure_memory("stream", stream_records, session)
+        (paged, timings), _ = measure_memory("pages", walk_pages, session)
+
+        check(
+            f"조회 건수 legacy {len(json.loads(legacy)):,}, stream {streamed:,}, "
+            f"pages {paged:,}",
+            len(json.loads(legacy)) == streamed == paged == total,
+        )
+        check(
+            f"stream 최대 메모리가 legacy 의 1/10 이하 "
+            f"({stream_peak / max(legacy_peak, 1):.1%})",
+            stream_peak * 10 <= legacy_peak,
+        )
+        first = sum(timings[:5]) / len(timings[:5])
+        last = sum(timings[-5:]) / len(timings[-5:])
+        print(
+            f"  페이지 {len(timings)}개: 앞 5페이지 평균 {first * 1000:.1f}ms, "
+            f"뒤 5페이지 평균 {last * 1000:.1f}ms"
+        )
+        check("뒤 페이지 조회 시간이 앞 페이지의 3배 이하", last <= first * 3)
+        session.close()
+
+    check.finish(
+        "스트리밍/키셋 페이지 조회는 결과 크기와 관계없이 메모리가 일정합니다."
+    )
+
+
+if __name__ == "__main__":
+    main()
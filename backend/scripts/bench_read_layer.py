@@ -0,0 +1,341 @@
+"""
+목록 API 읽기 계층 벤치마크
+
+임시 SQLite 파일에 합성 직원/근태/변경 이력/급여 데이터를 적재하고, 목록 API 마다
+이전 방식(ORM 엔티티 전체 로드 후 딕셔너리 복사)과 utils.read_layer 의 컬럼 조회
+방식의 초당 처리 행 수를 비교합니다. 두 방식의 응답이 같은지도 확인합니다.
+
+- /api/employees          load_employees (재직중 직원)
+- /api/attendance         load_attendance (전체 근태)
+- /api/attendance/records 직원 50명의 한 달 근태
+- /api/attendance/audit   최신 변경 이력 500건
+- /api/payroll/records    전체 급여 기록 (직원 정보 포함)
+
+사용법: python scripts/bench_read_layer.py [직원 수] [일수]
+"""
+
+import sys
+import os
+import random
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, measure, temp_database
+from models.models import Attendance, AttendanceAudit, Employee, Payroll
+from utils.payroll_records import build_records_query
+from utils.read_layer import (
+    ATTENDANCE_AUDIT,
+    ATTENDANCE_LIST,
+    ATTENDANCE_RECORDS,
+    EMPLOYEE_LIST,
+    PAYROLL_RECORDS,
+)
+
+START_DATE = date(2024, 1, 1)
+MIN_SECONDS = 1.0
+
+
+def seed(session, employee_count, days):
+    """합성 직원/근태/변경 이력/급여 적재"""
+    rng = random.Random(20240101)
+    employee_ids = [f"R{i:05d}" for i in range(employee_count)]
+    session.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": employee_id,
+                "name": f"직원{employee_id}",
+                "department": rng.choice(["개발", "영업", "인사"]),
+                "position": rng.choice(["사원", "대리", "과장"]),
+                "base_salary": 40_000_000,
+                "family_count": rng.randint(0, 4),
+                "status": "재직중" if rng.random() < 0.9 else "퇴사",
+            }
+            for employee_id in employee_ids
+        ],
+    )
+    dates = [START_DATE + timedelta(days=d) for d in range(days)]
+    session.execute(
+        insert(Attendance),
+        [
+            {
+                "employee_id": employee_id,
+                "date": day,
+                "check_in": f"{day} 09:00:00",
+                "check_out": f"{day} 18:00:00" if rng.random() < 0.95 else None,
+                "attendance_type": "정상",
+                "remarks": None if rng.random() < 0.9 else "외근",
+            }
+            for employee_id in employee_ids
+            for day in dates
+        ],
+    )
+    session.execute(
+        insert(AttendanceAudit),
+        [
+            {
+                "employee_id": rng.choice(employee_ids),
+                "date": rng.choice(dates),
+                "field_name": "check_in",
+                "old_value": "09:00",
+                "new_value": "09:10",
+                "change_type": "update",
+                "changed_by": "admin",
+                "changed_at": datetime(2024, 1, 1) + timedelta(minutes=i),
+            }
+            for i in range(employee_count * 5)
+        ],
+    )
+    payrolls = []
+    month_start = START_DATE
+    while month_start <= dates[-1]:
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        for employee_id in employee_ids:
+            payrolls.append(
+                {
+                    "payroll_code": f"{employee_id}-{month_start:%Y%m}",
+                    "employee_id": employee_id,
+                    "payment_period_start": month_start,
+                    "payment_period_end": next_month - timedelta(days=1),
+                    "base_pay": 3_000_000,
+                    "gross_pay": 3_200_000,
+                    "net_pay": 2_800_000,
+                    "status": "confirmed",
+                    "payroll_type": "regular",
+                    "confirmed_at": datetime(2024, 2, 1, 10, 0),
+                }
+            )
+        month_start = next_month
+    session.execute(insert(Payroll), payrolls)
+    session.commit()
+    return employee_ids
+
+
+# ----------------------------------------------------------------------
+# 이전 방식 (ORM 엔티티 로드 후 딕셔너리 복사)
+# ----------------------------------------------------------------------
+def legacy_employees(session):
+    return [
+        {
+            "employee_id": emp.employee_id,
+            "name": emp.name,
+            "department": emp.department,
+            "position": emp.position,
+            "base_salary": emp.base_salary,
+            "family_count": emp.family_count,
+            "status": emp.status,
+        }
+        for emp in session.query(Employee).filter(Employee.status == "재직중").all()
+    ]
+
+
+def legacy_attendance(session):
+    return [
+        {
+            "employee_id": record.employee_id,
+            "date": record.date.strftime("%Y-%m-%d"),
+            "check_in": record.check_in or "",
+            "check_out": record.check_out or "",
+            "attendance_type": record.attendance_type or "정상",
+            "remarks": record.remarks or "",
+        }
+        for record in session.query(Attendance).all()
+    ]
+
+
+def legacy_attendance_records(session, employee_ids, start, end):
+    result = []
+    for employee_id in employee_ids:
+        for record in (
+            session.query(Attendance)
+            .filter(
+                Attendance.employee_id == employee_id,
+                Attendance.date >= start,
+                Attendance.date <= end,
+            )
+            .all()
+        ):
+            result.append(
+                {
+                    "id": record.id,
+                    "employee_id": record.employee_id,
+                    "date": record.date.strftime("%Y-%m-%d"),
+                    "check_in": record.check_in,
+                    "check_out": record.check_out,
+                    "attendance_type": record.attendance_type,
+                    "remarks": record.remarks,
+                }
+            )
+    return result
+
+
+def legacy_audit(session):
+    return [
+        {
+            "id": record.id,
+            "employee_id": record.employee_id,
+            "date": record.date.strftime("%Y-%m-%d"),
+            "field_name": record.field_name,
+            "old_value": record.old_value,
+            "new_value": record.new_value,
+            "change_type": record.change_type,
+            "changed_by": record.changed_by,
+            "changed_at": record.changed_at.isoformat(),
+            "ip_address": record.ip_address,
+        }
+        for record in session.query(AttendanceAudit)
+        .order_by(AttendanceAudit.changed_at.desc())
+        .limit(500)
+        .all()
+    ]
+
+
+def legacy_payroll_records(session):
+    payrolls = (
+        session.query(Payroll).order_by(Payroll.payment_period_start, Payroll.id).all()
+    )
+    employees = {
+        emp.employee_id: emp
+        for emp in session.query(Employee).filter(
+            Employee.employee_id.in_({p.employee_id for p in payrolls})
+        )
+    }
+
+    def date_str(value):
+        return value.strftime("%Y-%m-%d") if value else None
+
+    result = []
+    for p in payrolls:
+        emp = employees.get(p.employee_id)
+        result.append(
+            {
+                "payroll_id": p.id,
+                "payroll_code": p.payroll_code,
+                "employee_id": p.employee_id,
+                "employee_name": emp.name if emp else "Unknown",
+                "department": emp.department if emp else "Unknown",
+                "position": emp.position if emp else "Unknown",
+                "payment_period_start": date_str(p.payment_period_start),
+                "payment_period_end": date_str(p.payment_period_end),
+                "payment_date": date_str(p.payment_date),
+                "basePay": p.base_pay,
+                "overtimePay": p.overtime_pay,
+                "nightPay": p.night_shift_pay,
+                "holidayPay": p.holiday_pay,
+                "totalAllowances": p.total_allowances,
+                "totalPay": p.gross_pay,
+                "income_tax": p.income_tax,
+                "residence_tax": p.residence_tax,
+                "national_pension": p.national_pension,
+                "health_insurance": p.health_insurance,
+                "employment_insurance": p.employment_insurance,
+                "total_deductions": p.total_deductions,
+                "netPay": p.net_pay,
+                "status": p.status,
+                "confirmed_at": p.confirmed_at.isoformat() if p.confirmed_at else None,
+                "confirmed_by": p.confirmed_by,
+                "payment_method": p.payment_method,
+                "remarks": p.remarks,
+            }
+        )
+    return result
+
+
+def rows_per_second(session, func):
+    """MIN_SECONDS 이상 반복 실행해 초당 응답 행 수 측정"""
+    runs, rows, elapsed = 0, 0, 0.0
+    while elapsed < MIN_SECONDS:
+        session.expunge_all()
+        result, seconds = measure(func, session)
+        elapsed += seconds
+        rows += len(result)
+        runs += 1
+    session.rollback()
+    return rows / elapsed, result
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 180
+
+    check = Checker()
+
+    with temp_database("read_layer_", "read.db") as db:
+        session = sessionmaker(bind=db.engine)()
+        employee_ids = seed(session, employee_count, days)
+        batch_ids = employee_ids[:50]
+        start, end = START_DATE, START_DATE + timedelta(days=30)
+        print(f"직원 {employee_count:,}명, 근태 {employee_count * days:,}행")
+
+        cases = [
+            (
+                "/api/employees",
+                legacy_employees,
+                lambda s: EMPLOYEE_LIST.all(
+                    s, EMPLOYEE_LIST.select().where(Employee.status == "재직중")
+                ),
+            ),
+            (
+                "/api/attendance",
+                legacy_attendance,
+                lambda s: ATTENDANCE_LIST.all(s, ATTENDANCE_LIST.select()),
+            ),
+            (
+                "/api/attendance/records",
+                lambda s: legacy_attendance_records(s, batch_ids, start, end),
+                lambda s: [
+                    record
+                    for employee_id in batch_ids
+                    for record in ATTENDANCE_RECORDS.all(
+                        s,
+                        ATTENDANCE_RECORDS.select().where(
+                            Attendance.employee_id == employee_id,
+                            Attendance.date >= start,
+                            Attendance.date <= end,
+                        ),
+                    )
+                ],
+            ),
+            (
+                "/api/attendance/audit",
+                legacy_audit,
+                lambda s: ATTENDANCE_AUDIT.all(
+                    s,
+                    ATTENDANCE_AUDIT.select()
+                    .order_by(AttendanceAudit.changed_at.desc())
+                    .limit(500),
+                ),
+            ),
+            (
+                "/api/payroll/records",
+                legacy_payroll_records,
+                lambda s: PAYROLL_RECORDS.all(s, build_records_query()),
+            ),
+        ]
+
+        print(f"{'엔드포인트':<26}{'이전 행/초':>14}{'읽기 계층 행/초':>18}{'배율':>8}")
+        for name, legacy, projected in cases:
+            legacy_rate, legacy_result = rows_per_second(session, legacy)
+            projected_rate, projected_result = rows_per_second(session, projected)
+            same = legacy_result == projected_result
+            print(
+                f"{name:<26}{legacy_rate:>14,.0f}{projected_rate:>18,.0f}"
+                f"{projected_rate / legacy_rate:>7.1f}x"
+                f"  {'응답 동일' if same else '응답 불일치'}"
+            )
+            if not same:
+                check.mismatch(f"  {name}: 이전 방식과 응답이 다릅니다.")
+        session.close()
+
+    check.finish("읽기 계층 응답이 이전 방식과 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
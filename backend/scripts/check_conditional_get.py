@@ -0,0 +1,344 @@
+"""
+조회 API 조건부 GET(ETag / Last-Modified) 검증 스크립트
+
+임시 SQLite 파일에 합성 직원/근태/급여를 만들고 세션을 그 파일에 연결한 뒤,
+Flask 테스트 클라이언트로 아래 조회 API 를 호출합니다.
+
+- GET /api/employees, /api/attendance, /api/payroll/records, /api/attendance/audit
+  - 첫 응답 200 에 약한 ETag, Cache-Control: no-cache
+  - 같은 ETag 로 If-None-Match 요청 시 SQL 없이 304
+- 쓰기 후 해당 테이블에 의존하는 API 만 ETag 가 바뀌고 200 본문이 다시 조회한 결과
+  - 근태 동기화(upsert): /api/attendance, /api/attendance/audit (버전은 테이블 단위라
+    필터와 관계없이 모두 변경)
+  - 급여 확정(PUT /api/payroll/confirm): /api/payroll/records
+  - 직원 수정: /api/employees, /api/payroll/records
+  - 변경 없는 근태 동기화: 모든 ETag 유지
+  - 다른 프로세스의 쓰기(SQLAlchemy 를 거치지 않는 sqlite3 연결): 모든 ETag 변경
+- 조회 조건(쿼리 문자열)과 응답 형식(Accept)이 다르면 ETag 가 다르고, Vary: Accept
+- 오류 응답(400)에는 ETag 없음
+- If-Modified-Since (마지막 변경 후 1초 뒤 Last-Modified, 다른 프로세스의 쓰기 포함)
+
+run_server 를 import 하므로 서버 실행 환경(.env 의 OPENAI_API_KEY 등)이 필요합니다.
+
+사용법: python scripts/check_conditional_get.py [직원 수]
+"""
+
+import sys
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import config.database as database
+from _harness import Checker, app_client, best_time, temp_database
+from models.models import Attendance, Employee
+from utils.query_counter import QueryCounter
+
+PERIOD_START = date(2024, 8, 1)
+DAYS = 31
+REPEAT = 10
+ENDPOINTS = (
+    "/api/employees",
+    "/api/attendance",
+    "/api/payroll/records",
+    "/api/payroll/records?status=confirmed&limit=50",
+    "/api/attendance/audit",
+    "/api/attendance/audit?employee_id=C00001",
+)
+
+
+def seed(engine, employee_count):
+    """합성 직원, 8월 근태 적재"""
+    employee_ids = [f"C{i:05d}" for i in range(employee_count)]
+    days = [PERIOD_START + timedelta(days=d) for d in range(DAYS)]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Employee),
+            [
+                {
+                    "employee_id": employee_id,
+                    "name": f"직원{employee_id}",
+                    "department": "개발",
+                    "position": "사원",
+                    "base_salary": 40_000_000,
+                }
+                for employee_id in employee_ids
+            ],
+        )
+        connection.execute(
+            insert(Attendance),
+            [
+                {
+                    "employee_id": employee_id,
+                    "date": day,
+                    "check_in": f"{day} 09:00:00",
+                    "check_out": f"{day} 18:00:00",
+                    "attendance_type": "정상",
+                    "remarks": "",
+                }
+                for employee_id in employee_ids
+                for day in days
+            ],
+        )
+    return employee_ids
+
+
+def attendance_data(employee_ids, late_employee=None):
+    """근태 동기화 입력 (late_employee 는 첫날 지각)"""
+    records = []
+    for employee_id in employee_ids:
+        for d in range(DAYS):
+            day = PERIOD_START + timedelta(days=d)
+            check_in = (
+                "10:00:00" if employee_id == late_employee and d == 0 else "09:00:00"
+            )
+            records.append(
+                {
+                    "employee_id": employee_id,
+                    "date": f"{day}",
+                    "check_in": f"{day} {check_in}",
+                    "check_out": f"{day} 18:00:00",
+                    "attendance_type": "정상",
+                    "remarks": "",
+                }
+            )
+    return records
+
+
+def payroll_items(employee_ids, base_pay):
+    """확정 요청용 급여 계산 결과"""
+    return [
+        {
+            "employee_id": employee_id,
+            "base_pay": base_pay,
+            "gross_pay": base_pay,
+            "total_deductions": base_pay // 10,
+            "net_pay": base_pay - base_pay // 10,
+        }
+        for employee_id in employee_ids
+    ]
+
+
+def rename_employee(employee_id, name):
+    """ORM 으로 직원 이름 수정 후 커밋"""
+    session = database.Session()
+    try:
+        session.get(Employee, employee_id).name = name
+        session.commit()
+    finally:
+        session.close()
+
+
+def external_update(db_path, sql):
+    """다른 프로세스의 쓰기 (SQLAlchemy 이벤트를 거치지 않는 연결)"""
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:
+            connection.execute(sql)
+    finally:
+        connection.close()
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    check = Checker()
+
+    with temp_database("conditional_get_", "conditional.db") as db:
+        engine, db_path = db.engine, db.path
+        employee_ids = seed(engine, employee_count)
+        run_server, client = app_client(engine)
+
+        def etags():
+            return {url: client.get(url).headers.get("ETag") for url in ENDPOINTS}
+
+        def changed_after(description, write, expected):
+            before = etags()
+            write()
+            after = etags()
+            changed = {url for url in ENDPOINTS if before[url] != after[url]}
+            check(
+                f"{description}: ETag 변경 {len(changed)}개",
+                changed == set(expected),
+                f"    변경: {sorted(changed)}\n    기대: {sorted(expected)}",
+            )
+            for url in changed:
+                response = client.get(url, headers={"If-None-Match": before[url]})
+                fresh = client.get(url, headers={"Cache-Control": "no-cache"})
+                if response.status_code != 200 or response.data != fresh.data:
+                    check(f"{url} 이전 ETag 로 요청 시 새 본문", False)
+
+        # 직원 수정과 근태 변경 이력이 생기도록 초기 동기화 (C00001 지각)
+        run_server._sync_attendance_to_db(attendance_data(employee_ids, "C00001"))
+        response = client.put(
+            "/api/payroll/confirm",
+            json={
+                "payroll_data": payroll_items(employee_ids[:10], 3_000_000),
+                "payment_period": {"start": "2024-07-01", "end": "2024-07-31"},
+            },
+        )
+        check(
+            "초기 급여 확정",
+            response.status_code == 200,
+            str(response.get_json())[:300],
+        )
+
+        print("첫 응답과 If-None-Match")
+        for url in ENDPOINTS:
+            response = client.get(url)
+            tag = response.headers.get("ETag", "")
+            with QueryCounter(engine) as counter:
+                revalidated = client.get(url, headers={"If-None-Match": tag})
+            check(
+                f"{url}: 200 {tag}, 304 SQL {counter.count}문장",
+                response.status_code == 200
+                and tag.startswith('W/"')
+                and "no-cache" in response.headers.get("Cache-Control", "")
+                and revalidated.status_code == 304
+                and not revalidated.data
+                and revalidated.headers.get("ETag") == tag
+                and counter.count == 0,
+            )
+
+        print("조회 조건/응답 형식별 ETag")
+        url = "/api/payroll/records"
+        ndjson = {"Accept": "application/x-ndjson"}
+        responses = {
+            "기본": client.get(url),
+            "쿼리 문자열": client.get(f"{url}?status=confirmed"),
+            "NDJSON": client.get(url, headers=ndjson, buffered=True),
+        }
+        tags = {
+            name: response.headers.get("ETag") for name, response in responses.items()
+        }
+        check(
+            f"{url}: 조건/형식마다 다른 ETag {sorted(tags.values())}",
+            len(set(tags.values())) == len(tags),
+        )
+        check(
+            "Vary: Accept",
+            all(
+                "Accept" in ",".join(response.headers.getlist("Vary"))
+                for response in responses.values()
+            ),
+        )
+        response = client.get(
+            url, headers={**ndjson, "If-None-Match": tags["기본"]}, buffered=True
+        )
+        check(
+            "JSON 응답의 ETag 로 NDJSON 요청 시 200",
+            response.status_code == 200 and response.mimetype == ndjson["Accept"],
+        )
+
+        url = "/api/attendance"
+        tag = client.get(url).headers["ETag"]
+        full_seconds = best_time(lambda: client.get(url), REPEAT)
+        not_modified_seconds = best_time(
+            lambda: client.get(url, headers={"If-None-Match": tag}), REPEAT
+        )
+        print(
+            f"  {url} ({employee_count * DAYS:,}건): 200 {full_seconds * 1000:.1f}ms, "
+            f"304 {not_modified_seconds * 1000:.2f}ms "
+            f"({full_seconds / not_modified_seconds:.0f}x)"
+        )
+
+        print("쓰기 후 ETag 변경")
+        changed_after(
+            "근태 동기화 (C00002 지각)",
+            lambda: run_server._sync_attendance_to_db(
+                attendance_data(employee_ids, "C00002")
+            ),
+            [
+                "/api/attendance",
+                "/api/attendance/audit",
+                "/api/attendance/audit?employee_id=C00001",
+            ],
+        )
+        changed_after(
+            "변경 없는 근태 동기화",
+            lambda: run_server._sync_attendance_to_db(
+                attendance_data(employee_ids, "C00002")
+            ),
+            [],
+        )
+        changed_after(
+            "급여 확정",
+            lambda: client.put(
+                "/api/payroll/confirm",
+                json={
+                    "payroll_data": payroll_items(employee_ids[:10], 3_100_000),
+                    "payment_period": {"start": "2024-08-01", "end": "2024-08-31"},
+                },
+            ),
+            [
+                "/api/payroll/records",
+                "/api/payroll/records?status=confirmed&limit=50",
+            ],
+        )
+
+        changed_after(
+            "직원 수정",
+            lambda: rename_employee("C00000", "이름변경"),
+            [
+                "/api/employees",
+                "/api/payroll/records",
+                "/api/payroll/records?status=confirmed&limit=50",
+            ],
+        )
+
+        changed_after(
+            "다른 프로세스의 급여 수정",
+            lambda: external_update(
+                db_path, "UPDATE payroll SET net_pay = net_pay + 1 WHERE id = 1"
+            ),
+            ENDPOINTS,
+        )
+
+        print("오류 응답")
+        response = client.get("/api/attendance/audit?from_date=2024-13-01")
+        check(
+            f"400 응답에는 ETag 없음 ({response.status_code})",
+            response.status_code == 400 and "ETag" not in response.headers,
+        )
+
+        print("If-Modified-Since")
+        time.sleep(1.1)
+        response = client.get("/api/employees")
+        last_modified = response.headers.get("Last-Modified")
+        check(f"Last-Modified: {last_modified}", last_modified is not None)
+        response = client.get(
+            "/api/employees", headers={"If-Modified-Since": last_modified or ""}
+        )
+        check("변경 없으면 304", response.status_code == 304)
+        rename_employee("C00003", "다시변경")
+        response = client.get(
+            "/api/employees", headers={"If-Modified-Since": last_modified or ""}
+        )
+        check(
+            "변경 직후에는 Last-Modified 없이 200",
+            response.status_code == 200 and "Last-Modified" not in response.headers,
+        )
+        time.sleep(1.1)
+        last_modified = client.get("/api/payroll/records").headers.get("Last-Modified")
+        external_update(
+            db_path, "UPDATE payroll SET net_pay = net_pay + 1 WHERE id = 1"
+        )
+        response = client.get(
+            "/api/payroll/records", headers={"If-Modified-Since": last_modified or ""}
+        )
+        check(
+            "다른 프로세스의 쓰기 후에도 200",
+            last_modified is not None and response.status_code == 200,
+        )
+
+    check.finish("조회 API 가 데이터 버전으로 조건부 GET 에 응답합니다.")
+
+
+if __name__ == "__main__":
+    main()
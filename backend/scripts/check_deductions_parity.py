@@ -0,0 +1,104 @@
+"""
+공제 항목 일괄 계산 정합성 검증 스크립트
+
+InsuranceCalculator.calculate_deductions_batch(배열 연산)와 calculate_deductions 의 결과가
+직원별 calculate_insurances + calculate_taxes 조합과 모든 항목에서 동일한지 확인합니다.
+국민연금 상한/하한 전후, 식대 비과세로 과세 소득이 0 이 되는 구간,
+1천만원 전후 고소득 구간, 실수 지급총액(일할 계산)을 포함합니다.
+
+사용법: python scripts/check_deductions_parity.py [건수] [시드]
+"""
+
+import sys
+import os
+import random
+
+import numpy as np
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, measure
+from utils.insurance_calculator import DEDUCTION_COLUMNS, InsuranceCalculator
+
+
+def scalar_deductions(calc, gross_pay, dependents):
+    """직원별 calculate_insurances + calculate_taxes 조합 (기준 결과)"""
+    insurances = calc.calculate_insurances(gross_pay)
+    taxes = calc.calculate_taxes(gross_pay, dependents)
+    total_deductions = (
+        taxes["incomeTax"]
+        + taxes["localIncomeTax"]
+        + insurances["nationalPension"]
+        + insurances["healthInsurance"]
+        + insurances["longTermCare"]
+        + insurances["employmentInsurance"]
+    )
+    return {
+        "national_pension": insurances["nationalPension"],
+        "health_insurance": insurances["healthInsurance"],
+        "long_term_care": insurances["longTermCare"],
+        "employment_insurance": insurances["employmentInsurance"],
+        "income_tax": taxes["incomeTax"],
+        "residence_tax": taxes["localIncomeTax"],
+        "total_deductions": total_deductions,
+        "net_pay": int(gross_pay - total_deductions),
+    }
+
+
+def build_cases(count, rng):
+    """검증할 (지급총액, 부양가족 수) 목록"""
+    gross_pays = [0, 1, 199_999, 200_000, 390_000, 6_170_000, 10_000_000]
+    gross_pays += [rng.randint(0, 40_000_000) for _ in range(count // 2)]
+    # 일할 계산 등으로 발생하는 실수 지급총액
+    gross_pays += [rng.uniform(0, 40_000_000) for _ in range(count - count // 2)]
+    dependents = [rng.randint(0, 13) for _ in gross_pays]
+    return gross_pays, dependents
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 20240101
+    rng = random.Random(seed)
+    calc = InsuranceCalculator()
+
+    gross_pays, dependents = build_cases(count, rng)
+    print(f"{len(gross_pays):,}건 비교")
+
+    expected, scalar_time = measure(
+        lambda: [scalar_deductions(calc, g, d) for g, d in zip(gross_pays, dependents)]
+    )
+    batch, batch_time = measure(
+        calc.calculate_deductions_batch, gross_pays, np.array(dependents)
+    )
+
+    # 정수만 있는 입력도 확인
+    int_positions = [i for i, g in enumerate(gross_pays) if isinstance(g, int)]
+    int_batch = calc.calculate_deductions_batch(
+        [gross_pays[i] for i in int_positions], [dependents[i] for i in int_positions]
+    )
+
+    check = Checker()
+    columns = {column: batch[column].tolist() for column in DEDUCTION_COLUMNS}
+    int_columns = {column: int_batch[column].tolist() for column in DEDUCTION_COLUMNS}
+    int_index = {i: position for position, i in enumerate(int_positions)}
+    for i, (gross_pay, dependent) in enumerate(zip(gross_pays, dependents)):
+        single = calc.calculate_deductions(gross_pay, dependent)
+        for column in DEDUCTION_COLUMNS:
+            values = [columns[column][i], single[column]]
+            if i in int_index:
+                values.append(int_columns[column][int_index[i]])
+            if any(value != expected[i][column] for value in values):
+                check.mismatch(
+                    f"  불일치: 지급총액 {gross_pay}, 부양가족 {dependent}, "
+                    f"{column}: 기준 {expected[i][column]}, 결과 {values}"
+                )
+
+    print(f"직원별 계산 {scalar_time:.3f}초, 일괄 계산 {batch_time:.3f}초")
+    check.finish("모든 공제 항목이 직원별 계산과 동일합니다.", "불일치")
+
+
+if __name__ == "__main__":
+    main()
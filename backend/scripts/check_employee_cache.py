@@ -0,0 +1,278 @@
+"""
+직원 정보 캐시(utils/employee_cache.py) 검증 스크립트
+
+임시 SQLite 파일에 합성 직원을 만들고 세션을 그 파일에 연결한 뒤 아래를 확인합니다.
+
+- GET /api/employees 가 employees 테이블을 직접 조회한 결과와 같고,
+  두 번째 호출부터는 SQL 을 실행하지 않음
+- ORM 수정/커밋, session.execute(update(Employee)), Core INSERT 후 즉시 반영,
+  롤백한 수정은 반영되지 않음
+- 다른 프로세스의 쓰기(SQLAlchemy 를 거치지 않는 sqlite3 연결)도 반영
+- PayrollService.calculate_and_save_payroll 이 캐시 스냅샷의 직원으로 계산하고,
+  다른 프로세스에서 바꾼 기본급으로 다시 계산
+- HRService 조회/검색이 employees.csv 를 직접 읽은 결과와 같고, 파일이 바뀌면 반영,
+  반환한 데이터프레임을 수정해도 스냅샷은 그대로
+
+run_server 를 import 하므로 서버 실행 환경(.env 의 OPENAI_API_KEY 등)이 필요합니다.
+
+사용법: python scripts/check_employee_cache.py
+"""
+
+import sys
+import os
+import random
+import sqlite3
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import insert, update
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import config.database as database
+from config import Config
+from _harness import Checker, app_client, best_time, temp_database
+from models.models import Employee
+from utils.employee_cache import employee_cache
+from utils.query_counter import QueryCounter
+from utils.read_layer import EMPLOYEE_LIST
+
+EMPLOYEE_COUNT = 300
+REPEAT = 20
+DEPARTMENTS = ["개발팀", "영업팀", "인사팀", "경영지원팀"]
+POSITIONS = ["사원", "대리", "과장", "차장", "부장"]
+
+
+def employee_rows(count, seed_value):
+    """합성 직원 (employees.csv 와 같은 컬럼)"""
+    rng = random.Random(seed_value)
+    return [
+        {
+            "employee_id": f"E{i:05d}",
+            "name": f"직원{i}",
+            "department": rng.choice(DEPARTMENTS),
+            "position": rng.choice(POSITIONS),
+            "join_date": date(2015 + rng.randint(0, 8), rng.randint(1, 12), 1),
+            "birth": date(1980 + rng.randint(0, 15), rng.randint(1, 12), 1),
+            "sex": rng.choice(["남", "여"]),
+            "base_salary": rng.randint(30_000_000, 90_000_000),
+            "status": "재직중" if rng.random() < 0.8 else "퇴사",
+            "resignation_date": None,
+            "family_count": rng.randint(0, 4),
+            "num_children": rng.randint(0, 2),
+        }
+        for i in range(count)
+    ]
+
+
+def reference_employees(session):
+    """이전 방식: 요청마다 employees 테이블 조회"""
+    return EMPLOYEE_LIST.all(
+        session, EMPLOYEE_LIST.select().where(Employee.status == "재직중")
+    )
+
+
+def reference_frame(path):
+    """이전 방식: 요청마다 employees.csv 로드 후 날짜 변환"""
+    df = pd.read_csv(path)
+    for col in ["join_date", "birth", "resignation_date"]:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+
+def main():
+    check = Checker()
+
+    with temp_database("employee_cache_", "employees.db") as db:
+        workdir, db_path, engine = db
+        with engine.begin() as connection:
+            connection.execute(insert(Employee), employee_rows(EMPLOYEE_COUNT, 1))
+        run_server, client = app_client(engine)
+        from app.services.hr_service import HRService
+
+        session = database.Session()
+
+        def api_matches(description):
+            session.rollback()
+            body = client.get("/api/employees").get_json()
+            expected = reference_employees(session)
+            check(f"{description}: {len(body)}명", body == expected and bool(body))
+            return body
+
+        print("GET /api/employees")
+        api_matches("직접 조회한 결과와 같음")
+        with QueryCounter(engine) as counter:
+            client.get("/api/employees")
+        check(f"두 번째 호출 SQL {counter.count}문장", counter.count == 0)
+
+        legacy_seconds = best_time(lambda: reference_employees(session), REPEAT)
+        cached_seconds = best_time(run_server.load_employees, REPEAT)
+        print(
+            f"  직원 목록: 직접 조회 {legacy_seconds * 1000:.2f}ms, "
+            f"캐시 {cached_seconds * 1000:.2f}ms "
+            f"({legacy_seconds / cached_seconds:.1f}x)"
+        )
+
+        print("쓰기 후 무효화")
+        employee = session.get(Employee, "E00001")
+        employee.name = "이름변경"
+        employee.status = "재직중"
+        session.commit()
+        body = api_matches("ORM 수정/커밋 반영")
+        check(
+            "변경한 이름 반영",
+            any(e["name"] == "이름변경" for e in body),
+        )
+
+        employee = session.get(Employee, "E00002")
+        employee.name = "롤백"
+        session.flush()
+        session.rollback()
+        body = api_matches("롤백한 수정")
+        check("롤백한 이름은 없음", all(e["name"] != "롤백" for e in body))
+
+        session.execute(
+            update(Employee)
+            .where(Employee.department == "영업팀")
+            .values(base_salary=55_000_000)
+        )
+        session.commit()
+        api_matches("session.execute(update(Employee)) 반영")
+
+        with engine.begin() as connection:
+            connection.execute(
+                insert(Employee),
+                [
+                    {
+                        "employee_id": "N00001",
+                        "name": "신규",
+                        "department": "개발팀",
+                        "position": "사원",
+                        "base_salary": 35_000_000,
+                    }
+                ],
+            )
+        body = api_matches("Core INSERT 반영")
+        check("신규 직원 포함", any(e["employee_id"] == "N00001" for e in body))
+
+        def external_update(sql):
+            """다른 프로세스의 쓰기 (SQLAlchemy 이벤트를 거치지 않는 연결)"""
+            connection = sqlite3.connect(db_path)
+            try:
+                with connection:
+                    connection.execute(sql)
+            finally:
+                connection.close()
+
+        external_update(
+            "UPDATE employees SET name = '외부변경', status = '재직중' "
+            "WHERE employee_id = 'E00003'"
+        )
+        body = api_matches("다른 프로세스의 쓰기 반영")
+        check("외부에서 바꾼 이름 반영", any(e["name"] == "외부변경" for e in body))
+
+        print("급여 계산")
+        service = run_server.payroll_service
+        result = service.calculate_and_save_payroll(
+            "N00001", date(2024, 8, 1), date(2024, 8, 31)
+        )
+        check(
+            "calculate_and_save_payroll: 캐시 스냅샷 직원으로 계산",
+            result is not None and result["employee_id"] == "N00001",
+        )
+        external_update(
+            "UPDATE employees SET base_salary = 70000000 WHERE employee_id = 'N00001'"
+        )
+        recalculated = service.calculate_and_save_payroll(
+            "N00001", date(2024, 8, 1), date(2024, 8, 31)
+        )
+        check(
+            "다른 프로세스에서 바꾼 기본급으로 계산 "
+            f"({result['base_pay']:,} → {recalculated['base_pay']:,})",
+            recalculated["base_pay"] == 70_000_000 // 12,
+        )
+        check(
+            "없는 직원은 None",
+            service.calculate_and_save_payroll(
+                "X99999", date(2024, 8, 1), date(2024, 8, 31)
+            )
+            is None,
+        )
+        session.close()
+
+        print("HRService (employees.csv)")
+        csv_path = os.path.join(workdir, "employees.csv")
+        pd.DataFrame(employee_rows(EMPLOYEE_COUNT, 2)).to_csv(csv_path, index=False)
+
+        class CheckConfig(Config):
+            EMPLOYEE_DATA = csv_path
+
+        hr_service = HRService(CheckConfig)
+        expected = reference_frame(csv_path)
+        check(
+            "load_employee_data 가 직접 읽은 결과와 같음",
+            hr_service.load_employee_data().equals(expected),
+        )
+        check(
+            "get_employee_details",
+            hr_service.get_employee_details("E00010")
+            == expected[expected["employee_id"] == "E00010"].iloc[0].to_dict()
+            and hr_service.get_employee_details("X99999") is None,
+        )
+        mismatches = []
+        for query in (
+            {"department": "개발팀"},
+            {"position": "과장"},
+            {"department": "영업팀", "position": "사원", "status": "재직중"},
+            {"name": "직원1"},
+            {},
+        ):
+            filtered = expected
+            for field in ("department", "position", "status"):
+                if query.get(field):
+                    filtered = filtered[filtered[field] == query[field]]
+            if query.get("name"):
+                filtered = filtered[filtered["name"].str.contains(query["name"])]
+            if hr_service.search_employees(query) != filtered.to_dict("records"):
+                mismatches.append(str(query))
+        check("search_employees", not mismatches, "\n".join(mismatches))
+        check(
+            "get_employee_summary",
+            hr_service.get_employee_summary()["total_employees"] > 0,
+        )
+
+        frame = hr_service.load_employee_data()
+        frame["name"] = "수정"
+        snapshot = employee_cache.csv(csv_path)
+        check(
+            "반환한 데이터프레임을 수정해도 스냅샷은 그대로",
+            hr_service.load_employee_data().equals(expected),
+        )
+        check(
+            "파일이 바뀌지 않으면 다시 읽지 않음",
+            employee_cache.csv(csv_path) is snapshot,
+        )
+
+        pd.DataFrame(employee_rows(EMPLOYEE_COUNT + 5, 3)).to_csv(csv_path, index=False)
+        check(
+            "파일이 바뀌면 다시 읽음",
+            hr_service.load_employee_data().equals(reference_frame(csv_path)),
+        )
+
+        legacy_seconds = best_time(lambda: reference_frame(csv_path), REPEAT)
+        cached_seconds = best_time(hr_service.load_employee_data, REPEAT)
+        print(
+            f"  employees.csv: 직접 읽기 {legacy_seconds * 1000:.2f}ms, "
+            f"캐시 {cached_seconds * 1000:.2f}ms "
+            f"({legacy_seconds / cached_seconds:.1f}x)"
+        )
+
+    check.finish("직원 정보 캐시가 직접 조회한 결과와 같고 쓰기 후 무효화됩니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+월별 급여 요약(payroll_monthly_summary) 유지 검증 스크립트
+
+임시 SQLite 파일에 합성 직원을 만들고 세션을 그 파일에 연결한 뒤, Flask 테스트
+클라이언트로 급여 확정/지급 API 를 호출하면서 요약 테이블이 급여 테이블을 처음부터
+다시 집계한 결과와 항상 같은지 확인합니다.
+
+- PUT /api/payroll/confirm  확정한 급여월 요약 반영
+- 중복 기간 확정 실패 시 요약 변경 없음 (롤백)
+- PUT /api/payroll/pay      지급 건수 반영
+- /api/payroll/analysis 월 단위 기간은 요약, 그 외는 급여 테이블 집계와 같은 결과
+- 빈 요약을 ensure_payroll_summary 로 다시 채움 (서버 시작 시 백필)
+
+run_server 를 import 하므로 서버 실행 환경(.env 의 OPENAI_API_KEY 등)이 필요합니다.
+
+사용법: python scripts/check_payroll_summary.py
+"""
+
+import sys
+import os
+import random
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import config.database as database
+from _harness import Checker, app_client, temp_database
+from models.models import Employee, PayrollMonthlySummary
+from utils.payroll_analytics import analyze_payrolls
+from utils.payroll_summary import build_summary_query, ensure_payroll_summary
+
+EMPLOYEE_COUNT = 60
+SUMMARY_COLUMNS = [
+    column
+    for column in PayrollMonthlySummary.__table__.columns
+    if column.name != "updated_at"
+]
+
+
+def seed(engine):
+    """합성 직원 적재"""
+    rng = random.Random(7)
+    employee_ids = [f"S{i:05d}" for i in range(EMPLOYEE_COUNT)]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Employee),
+            [
+                {
+                    "employee_id": employee_id,
+                    "name": f"직원{employee_id}",
+                    "department": rng.choice(["개발", "영업", "인사"]),
+                    "position": rng.choice(["사원", "대리", "과장"]),
+                    "base_salary": 40_000_000,
+                }
+                for employee_id in employee_ids
+            ],
+        )
+    return employee_ids
+
+
+def payroll_items(employee_ids, seed_value):
+    """확정 요청용 급여 계산 결과"""
+    rng = random.Random(seed_value)
+    items = []
+    for employee_id in employee_ids:
+        base_pay = rng.randint(2_500_000, 6_000_000)
+        overtime, night, holiday = (rng.randint(0, 400_000) for _ in range(3))
+        gross = base_pay + overtime + night + holiday
+        deductions = round(gross * 0.1)
+        items.append(
+            {
+                "employee_id": employee_id,
+                "base_pay": base_pay,
+                "overtime_pay": overtime,
+                "night_shift_pay": night,
+                "holiday_pay": holiday,
+                "total_allowances": overtime + night + holiday,
+                "gross_pay": gross,
+                "total_deductions": deductions,
+                "net_pay": gross - deductions,
+            }
+        )
+    return items
+
+
+def summary_rows(session):
+    """요약 테이블 내용 (집계일시 제외)"""
+    return sorted(tuple(row) for row in session.execute(select(*SUMMARY_COLUMNS)).all())
+
+
+def expected_rows(session):
+    """급여 테이블을 처음부터 다시 집계한 결과"""
+    names, statement = build_summary_query()
+    order = [names.index(column.name) for column in SUMMARY_COLUMNS]
+    return sorted(
+        tuple(row[i] for i in order) for row in session.execute(statement).all()
+    )
+
+
+def main():
+    check = Checker()
+
+    with temp_database("payroll_summary_", "summary.db") as db:
+        employee_ids = seed(db.engine)
+        _, client = app_client(db.engine)
+        session = database.Session()
+
+        def in_sync(description):
+            session.rollback()
+            actual, expected = summary_rows(session), expected_rows(session)
+            check(
+                f"{description}: 요약 {len(actual)}행이 다시 집계한 결과와 같음",
+                actual == expected and bool(actual),
+            )
+
+        print("급여 확정")
+        confirmed = {}
+        for month, (start, end), ids, payroll_type in (
+            ("2024-07", ("2024-07-01", "2024-07-31"), employee_ids, "regular"),
+            ("2024-08", ("2024-08-01", "2024-08-31"), employee_ids[:40], "regular"),
+            ("2024-08", ("2024-08-01", "2024-08-31"), employee_ids[40:50], "special"),
+        ):
+            response = client.put(
+                "/api/payroll/confirm",
+                json={
+                    "payroll_data": payroll_items(ids, f"{month}-{payroll_type}"),
+                    "payment_period": {"start": start, "end": end},
+                    "payroll_type": payroll_type,
+                },
+            )
+            body = response.get_json()
+            check(
+                f"{month} {payroll_type} {len(ids)}건 확정",
+                response.status_code == 200,
+                str(body)[:300],
+            )
+            confirmed.setdefault(month, []).extend(
+                payroll["payroll_code"] for payroll in body["confirmed_payrolls"]
+            )
+            in_sync(f"{month} {payroll_type} 확정 후")
+
+        print("중복 기간 확정 (롤백)")
+        before = summary_rows(session)
+        response = client.put(
+            "/api/payroll/confirm",
+            json={
+                "payroll_data": payroll_items(employee_ids[35:45], "overlap"),
+                "payment_period": {"start": "2024-08-15", "end": "2024-09-14"},
+            },
+        )
+        session.rollback()
+        check(
+            "중복 기간 확정 실패, 요약 변경 없음",
+            response.status_code != 200 and summary_rows(session) == before,
+        )
+
+        print("급여 지급")
+        response = client.put(
+            "/api/payroll/pay",
+            json={
+                "payroll_ids": confirmed["2024-07"][:25],
+                "payment_date": "2024-08-10",
+            },
+        )
+        check("2024-07 25건 지급", response.status_code == 200)
+        in_sync("지급 후")
+        paid_total = session.scalar(
+            select(func.sum(PayrollMonthlySummary.paid_count)).where(
+                PayrollMonthlySummary.month == "2024-07"
+            )
+        )
+        check(f"2024-07 지급 건수 {paid_total}", paid_total == 25)
+
+        print("급여 분석 (요약 / 급여 테이블)")
+        mismatches = []
+        for start, end, period_type in (
+            (date(2024, 7, 1), date(2024, 8, 31), "monthly"),
+            (date(2024, 1, 1), date(2024, 12, 31), "quarterly"),
+            (date(2024, 7, 1), date(2024, 8, 20), "all"),
+            (date(2024, 7, 10), date(2024, 8, 31), "yearly"),
+        ):
+            for group_by in ("department", "position", "month"):
+                from_summary = analyze_payrolls(
+                    session, start, end, group_by, period_type
+                )
+                from_payroll = analyze_payrolls(
+                    session, start, end, group_by, period_type, use_summary=False
+                )
+                if from_summary != from_payroll or not from_summary:
+                    mismatches.append(f"{start}~{end} {group_by}/{period_type}")
+        check(
+            "요약 집계와 급여 테이블 집계가 같음",
+            not mismatches,
+            "\n".join(mismatches),
+        )
+
+        print("빈 요약 다시 채우기")
+        session.execute(delete(PayrollMonthlySummary))
+        session.commit()
+        rebuilt = ensure_payroll_summary(session)
+        check(f"ensure_payroll_summary: {rebuilt}행", rebuilt > 0)
+        in_sync("다시 채운 후")
+        check("요약이 있으면 다시 집계하지 않음", ensure_payroll_summary(session) == 0)
+        session.close()
+
+    check.finish("월별 급여 요약이 급여 확정/지급과 함께 유지됩니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+근태 파일 동기화 스케줄러 동작 검증 스크립트
+
+임시 파일과 가짜 동기화 함수로 utils.sync_scheduler.SyncScheduler 를 확인합니다.
+- 저장 한 번에 여러 이벤트(편집기, 인코딩별 재작성)가 와도 동기화는 한 번
+- 이벤트가 계속 와도 max_wait 가 지나면 동기화
+- 서버 자체 쓰기(쓰기 세대 토큰)로 생긴 이벤트는 동기화하지 않음
+- 동기화 실행 중 들어온 이벤트는 이후 한 번의 동기화로 합침
+- 실제 watchdog Observer 이벤트로도 같은 결과
+
+사용법: python scripts/check_sync_scheduler.py
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker
+from utils.sync_scheduler import SyncScheduler
+
+QUIET = 0.2
+MAX_WAIT = 1.0
+
+
+class FakeSync:
+    """호출 횟수를 세는 가짜 동기화 함수 (duration 초 동안 실행)"""
+
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.calls = 0
+        self.started = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        time.sleep(self.duration)
+        return True
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def settle(seconds=QUIET * 3):
+    time.sleep(seconds)
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="sync_scheduler_")
+    path = os.path.join(workdir, "attendance.csv")
+    write(path, "employee_id,date\n")
+    check = Checker(indent="")
+
+    def scheduler_with(sync):
+        scheduler = SyncScheduler(
+            path, sync, quiet_seconds=QUIET, max_wait_seconds=MAX_WAIT
+        )
+        scheduler.start()
+        return scheduler
+
+    try:
+        # 1. 이벤트 묶음 → 한 번
+        sync = FakeSync()
+        scheduler = scheduler_with(sync)
+        for i in range(20):
+            write(path, f"employee_id,date\nE{i},2024-01-01\n")
+            scheduler.notify()
+        settle()
+        metrics = scheduler.metrics()
+        check("이벤트 20건 → 동기화 1회", sync.calls == 1 and metrics["syncs_run"] == 1)
+        check(
+            "병합된 이벤트 19건", metrics["events_coalesced"] == 19, f"      {metrics}"
+        )
+
+        # 2. 계속되는 이벤트 → max_wait 후 동기화
+        sync.calls = 0
+        started = time.monotonic()
+        while time.monotonic() - started < MAX_WAIT * 1.5:
+            scheduler.notify()
+            time.sleep(QUIET / 4)
+            if sync.calls:
+                break
+        waited = time.monotonic() - started
+        check(
+            f"계속되는 이벤트 → {waited:.2f}초 후 동기화 (max_wait {MAX_WAIT}초)",
+            sync.calls == 1 and waited <= MAX_WAIT + QUIET,
+        )
+        settle()
+
+        # 3. 자체 쓰기 → 무시, 이후 외부 쓰기 → 동기화
+        sync.calls = 0
+        token = scheduler.begin_self_write()
+        for encoding in ("euc-kr", "cp949", "utf-8"):
+            with open(path, "w", encoding=encoding) as f:
+                f.write("employee_id,date,attendance_type\nE1,2024-01-01,정상\n")
+            scheduler.notify()
+            time.sleep(QUIET * 1.5)  # 쓰기가 길어져도 쓰는 중에는 동기화하지 않음
+        scheduler.end_self_write(token)
+        settle()
+        metrics = scheduler.metrics()
+        check(
+            "자체 쓰기 이벤트 → 동기화 없음",
+            sync.calls == 0 and metrics["self_writes_ignored"] == 1,
+            f"      {metrics}",
+        )
+        write(path, "employee_id,date\nE2,2024-01-02\n")
+        scheduler.notify()
+        settle()
+        check("자체 쓰기 이후 외부 쓰기 → 동기화 1회", sync.calls == 1)
+        scheduler.stop()
+
+        # 4. 동기화 중 이벤트 → 이후 한 번으로 합침 (이벤트는 모두 첫 동기화 중에 발생)
+        sync = FakeSync(duration=QUIET * 8)
+        scheduler = scheduler_with(sync)
+        scheduler.notify()
+        sync.started.wait(timeout=5)
+        for _ in range(3):
+            for _ in range(5):
+                scheduler.notify()
+            time.sleep(QUIET * 1.5)
+        settle(QUIET * 16)
+        metrics = scheduler.metrics()
+        check(
+            f"동기화 중 이벤트 → 이후 동기화 합침 (총 {sync.calls}회)",
+            sync.calls == 2 and metrics["queue_depth"] == 0,
+            f"      {metrics}",
+        )
+        check(
+            "동기화 시간 지표 기록",
+            metrics["last_sync_seconds"] >= QUIET * 8
+            and metrics["avg_sync_seconds"] is not None,
+        )
+        scheduler.stop()
+
+        # 5. 실제 watchdog 이벤트
+        sync = FakeSync()
+        scheduler = scheduler_with(sync)
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                target = getattr(event, "dest_path", "") or event.src_path
+                if not event.is_directory and target == path:
+                    scheduler.notify()
+
+        observer = Observer()
+        observer.schedule(Handler(), path=workdir, recursive=False)
+        observer.start()
+        try:
+            time.sleep(0.2)
+            # 인코딩을 바꿔가며 세 번 다시 쓰는 저장 (이전 sync_db_to_csv)
+            for encoding in ("euc-kr", "cp949", "utf-8-sig"):
+                with open(path, "w", encoding=encoding) as f:
+                    f.write("employee_id,date,attendance_type\nE3,2024-01-03,정상\n")
+            settle()
+            metrics = scheduler.metrics()
+            check(
+                f"watchdog 이벤트 {metrics['events_received']}건 → 동기화 {sync.calls}회",
+                sync.calls == 1 and metrics["events_received"] > 1,
+                f"      {metrics}",
+            )
+        finally:
+            observer.stop()
+            observer.join()
+            scheduler.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    check.finish("이벤트를 모아 한 번만 동기화하고 자체 쓰기는 무시합니다.")
+
+
+if __name__ == "__main__":
+    main()
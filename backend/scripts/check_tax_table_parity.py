@@ -0,0 +1,168 @@
+"""
+간이세액표 조회 정합성 검증 스크립트
+
+utils.tax_table.TaxTable 의 조회 결과가 기존 구현(세액표 키를 매번 선형 탐색)과
+모든 소득·부양가족 수에 대해 동일한지 확인합니다.
+
+- monthly_tax / monthly_tax_batch: InsuranceCalculator 의 기존 _lookup_tax_table
+- simplified_tax: generate_payment_data.TaxCalculator 의 기존 _lookup_tax_table
+
+구간 경계값(±1원), 1천만원 전후, 무작위 소득과 세액표에 없는 부양가족 수를 포함합니다.
+
+사용법: python scripts/check_tax_table_parity.py [무작위 소득 수] [시드]
+"""
+
+import sys
+import os
+import json
+import random
+
+import numpy as np
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from _harness import Checker, measure
+from utils.tax_table import DEFAULT_TAX_TABLE_PATH, TaxTable
+
+
+def legacy_monthly_tax(tax_data, income, dependents):
+    """기존 InsuranceCalculator._lookup_tax_table (선형 탐색)"""
+    if income >= 10000000:
+        for bracket, info in tax_data.get("high_income_brackets", {}).items():
+            min_val, max_val = map(int, bracket.split("-"))
+            if min_val <= income < max_val:
+                base_tax = info["base_tax"].get(str(dependents), 0)
+                rate = info["rate"]
+                addition = info["addition"]
+                excess_amount = income - 10000000
+                return int(base_tax + (excess_amount * 0.98 * rate) + addition)
+
+    for bracket, rates in tax_data["tax_brackets"].items():
+        min_val, max_val = map(int, bracket.split("-"))
+        if min_val <= income < max_val:
+            return rates.get(str(dependents), 0)
+    return 0
+
+
+def legacy_simplified_tax(tax_data, income, dependents):
+    """기존 generate_payment_data.TaxCalculator._lookup_tax_table (매번 정렬 후 이진 검색)"""
+    if income <= 10_000_000:
+        brackets = sorted(
+            [
+                (int(start), int(end))
+                for bracket in tax_data["tax_brackets"].keys()
+                for start, end in [bracket.split("-")]
+            ]
+        )
+        left, right = 0, len(brackets) - 1
+        while left <= right:
+            mid = (left + right) // 2
+            start, end = brackets[mid]
+            if start <= income <= end:
+                return tax_data["tax_brackets"][f"{start}-{end}"][str(dependents)]
+            elif income < start:
+                right = mid - 1
+            else:
+                left = mid + 1
+        return 0
+
+    for bracket, calc_info in tax_data["high_income_brackets"].items():
+        start, end = map(int, bracket.split("-"))
+        if start <= income <= end:
+            base_tax = calc_info["base_tax"][str(dependents)]
+            excess_amount = income - 10_000_000
+            return (
+                base_tax
+                + int(excess_amount * 0.98 * calc_info["rate"])
+                + calc_info["addition"]
+            )
+    return 0
+
+
+def call(func, *args):
+    """결과 또는 발생한 예외 종류 반환"""
+    try:
+        return func(*args)
+    except KeyError:
+        return "KeyError"
+
+
+def build_incomes(tax_data, random_count, rng):
+    """검증할 소득 목록 (경계값 ±1원, 1천만원 전후, 무작위 값)"""
+    incomes = {0, 1, 9_999_999, 10_000_000, 10_000_001}
+    for section in ("tax_brackets", "high_income_brackets"):
+        for bracket in tax_data.get(section, {}):
+            for bound in map(int, bracket.split("-")):
+                incomes.update((bound - 1, bound, bound + 1))
+    incomes.update(rng.randint(0, 120_000_000) for _ in range(random_count))
+    return sorted(income for income in incomes if income >= 0)
+
+
+def main():
+    random_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 20240101
+    rng = random.Random(seed)
+
+    with open(DEFAULT_TAX_TABLE_PATH, "r", encoding="utf-8") as f:
+        tax_data = json.load(f)
+
+    table, seconds = measure(TaxTable, tax_data)
+    print(f"세액표 생성: {seconds:.3f}초")
+
+    incomes = build_incomes(tax_data, random_count, rng)
+    dependents_values = list(range(0, 14))
+    print(f"소득 {len(incomes):,}개 × 부양가족 수 {len(dependents_values)}개 비교")
+
+    check = Checker()
+    for dependents in dependents_values:
+        batch = table.monthly_tax_batch(incomes, [dependents] * len(incomes))
+        for income, batch_tax in zip(incomes, batch.tolist()):
+            expected = legacy_monthly_tax(tax_data, income, dependents)
+            actual = table.monthly_tax(income, dependents)
+            if actual != expected or batch_tax != expected:
+                check.mismatch(
+                    f"  monthly_tax 불일치: 소득 {income}, 부양가족 {dependents}: "
+                    f"기존 {expected}, 단건 {actual}, 일괄 {batch_tax}"
+                )
+
+            expected = call(legacy_simplified_tax, tax_data, income, dependents)
+            actual = call(table.simplified_tax, income, dependents)
+            if actual != expected:
+                check.mismatch(
+                    f"  simplified_tax 불일치: 소득 {income}, 부양가족 {dependents}: "
+                    f"기존 {expected}, 신규 {actual}"
+                )
+
+    # 부양가족 수가 섞인 일괄 조회
+    mixed_dependents = [rng.choice(dependents_values) for _ in incomes]
+    batch = table.monthly_tax_batch(incomes, mixed_dependents)
+    for income, dependents, batch_tax in zip(incomes, mixed_dependents, batch.tolist()):
+        expected = legacy_monthly_tax(tax_data, income, dependents)
+        if batch_tax != expected:
+            check.mismatch(
+                f"  monthly_tax_batch 불일치: 소득 {income}, 부양가족 {dependents}: "
+                f"기존 {expected}, 일괄 {batch_tax}"
+            )
+
+    # 조회 속도 비교
+    sample = incomes[:: max(1, len(incomes) // 2000)]
+    _, legacy_time = measure(
+        lambda: [legacy_monthly_tax(tax_data, income, 2) for income in sample]
+    )
+    _, scalar_time = measure(
+        lambda: [table.monthly_tax(income, 2) for income in sample]
+    )
+    _, batch_time = measure(table.monthly_tax_batch, sample, np.full(len(sample), 2))
+    print(
+        f"{len(sample):,}건 조회: 기존 {legacy_time:.4f}초, "
+        f"bisect {scalar_time:.4f}초, searchsorted {batch_time:.4f}초"
+    )
+
+    check.finish("모든 조회 결과가 기존 구현과 동일합니다.", "불일치")
+
+
+if __name__ == "__main__":
+    main()
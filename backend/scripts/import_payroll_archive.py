@@ -0,0 +1,75 @@
+"""
+급여 이력 아카이브 가져오기 스크립트
+
+payroll.csv 와 SQLite payroll 테이블(확정/지급 급여)을 연/월 분할 급여 이력
+아카이브(utils/payroll_archive.py)로 가져옵니다. 원본마다 그 원본에서 온 급여월
+조각 전체를 원본 내용으로 교체하므로, 여러 번 실행해도 행이 늘어나지 않고 원본에서
+지운 행/달은 아카이브에서도 지워집니다.
+
+사용법: python scripts/import_payroll_archive.py [--csv 경로] [--db 경로]
+                                               [--archive 디렉토리] [--skip-db]
+"""
+
+import sys
+import os
+import argparse
+
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from config import Config
+from config.database import DB_PATH, create_db_engine
+from utils.payroll_archive import PayrollArchive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="급여 이력 아카이브 가져오기")
+    parser.add_argument("--csv", default=Config.PAYROLL_DATA, help="payroll.csv 경로")
+    parser.add_argument("--db", default=DB_PATH, help="데이터베이스 파일 경로")
+    parser.add_argument(
+        "--archive", default=Config.PAYROLL_ARCHIVE_DIR, help="아카이브 디렉토리"
+    )
+    parser.add_argument(
+        "--skip-db", action="store_true", help="payroll 테이블은 가져오지 않음"
+    )
+    args = parser.parse_args()
+
+    archive = PayrollArchive(args.archive)
+    print(f"아카이브: {args.archive} ({archive.file_format})")
+
+    if os.path.exists(args.csv):
+        result = archive.import_csv(args.csv, force=True)
+        print(
+            f"payroll.csv: {result['rows']:,}행, {len(result['months'])}개월"
+            f" (삭제 {len(result['removed'])}개월)"
+        )
+    else:
+        print(f"payroll.csv 가 없어 건너뜁니다: {args.csv}")
+
+    if not args.skip_db:
+        if not os.path.exists(args.db):
+            print(f"데이터베이스 파일이 존재하지 않습니다: {args.db}")
+            sys.exit(1)
+        engine = create_db_engine(f"sqlite:///{args.db}")
+        session = sessionmaker(bind=engine)()
+        try:
+            result = archive.import_payroll_table(session)
+        finally:
+            session.close()
+            engine.dispose()
+        print(
+            f"payroll 테이블: {result['rows']:,}행, {len(result['months'])}개월"
+            f" (삭제 {len(result['removed'])}개월)"
+        )
+
+    months = archive.months()
+    if months:
+        print(f"보관 급여월: {months[0]} ~ {months[-1]} ({len(months)}개월)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+인덱스 마이그레이션 스크립트
+
+기존 데이터베이스 파일에 모델에 새로 추가된 nullable 컬럼(attendance.row_hash 등)과
+모델(__table_args__)에 정의된 복합 인덱스를 추가합니다.
+- attendance: (employee_id, date) 고유 인덱스, date 인덱스
+- payroll: (employee_id, 기간, status), (기간, status), (기간 시작일, id)
+- attendance_audit / payroll_audit: 대상별 이력 조회 인덱스
+
+근태 (employee_id, date) 중복 기록이 있으면 고유 인덱스를 만들 수 없습니다.
+--dedupe 옵션을 주면 직원+날짜별로 가장 최근에 추가된 기록(id 가 가장 큰 기록)만
+남기고 나머지를 삭제한 뒤 인덱스를 생성합니다.
+
+사용법: python scripts/migrate_add_indexes.py [--dedupe] [--db 경로]
+"""
+
+import sys
+import os
+import argparse
+
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from config.database import (
+    DB_PATH,
+    Base,
+    create_db_engine,
+    ensure_columns,
+    ensure_indexes,
+    remove_duplicate_attendance,
+)
+from models.models import Attendance
+
+
+def find_duplicate_attendance(session):
+    """직원+날짜가 중복된 근태 기록 목록 [(employee_id, date, 건수, 유지할 id)]"""
+    return (
+        session.query(
+            Attendance.employee_id,
+            Attendance.date,
+            func.count(Attendance.id),
+            func.max(Attendance.id),
+        )
+        .group_by(Attendance.employee_id, Attendance.date)
+        .having(func.count(Attendance.id) > 1)
+        .all()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="복합 인덱스 마이그레이션")
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="근태 중복 기록을 정리한 뒤 고유 인덱스 생성",
+    )
+    parser.add_argument("--db", default=DB_PATH, help="데이터베이스 파일 경로")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일이 존재하지 않습니다: {args.db}")
+        sys.exit(1)
+
+    engine = create_db_engine(f"sqlite:///{args.db}")
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        # 새로 추가된 테이블은 인덱스와 함께 생성, 기존 테이블에는 컬럼 추가
+        Base.metadata.create_all(engine)
+        for name in ensure_columns(engine):
+            print(f"컬럼 추가: {name}")
+
+        duplicates = find_duplicate_attendance(session)
+        if duplicates:
+            print(f"근태 중복 (직원, 날짜) {len(duplicates)}건 발견")
+            for employee_id, date, count, _ in duplicates[:10]:
+                print(f"  - {employee_id} {date}: {count}건")
+            if not args.dedupe:
+                print("--dedupe 옵션으로 중복을 정리한 뒤 다시 실행하세요.")
+                sys.exit(1)
+            removed = remove_duplicate_attendance(engine)
+            print(f"중복 근태 기록 {removed}건 삭제 (직원+날짜별 최근 기록 유지)")
+    finally:
+        session.close()
+
+    created = ensure_indexes(engine)
+    for name in created:
+        print(f"인덱스 생성: {name}")
+
+    inspector = inspect(engine)
+    missing = [
+        index.name
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.name not in {i["name"] for i in inspector.get_indexes(table.name)}
+    ]
+    engine.dispose()
+    if missing:
+        print(f"생성되지 않은 인덱스: {', '.join(missing)}")
+        sys.exit(1)
+    print("모든 인덱스가 적용되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
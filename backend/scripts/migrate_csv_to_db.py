@@ -172,6 +172,7 @@ def migrate_attendance():
         session.commit()
 
         count = 0
+        seen = set()  # 직원+날짜 고유 인덱스 (중복 기록은 첫 기록만 사용)
         for _, row in df.iterrows():
             employee_id = str(row["employee_id"])
 
@@ -189,6 +190,11 @@ def migrate_attendance():
                 print(f"날짜 파싱 오류: {e}")
                 continue
 
+            if (employee_id, date) in seen:
+                print(f"중복 근태 기록 건너뛰기: {employee_id}, {date}")
+                continue
+            seen.add((employee_id, date))
+
             # 출퇴근 시간 처리
             check_in = str(row["check_in"]) if pd.notna(row.get("check_in")) else None
             check_out = (
@@ -0,0 +1,79 @@
+"""
+월별 급여 요약 다시 집계 스크립트 (payroll_monthly_summary)
+
+확정/지급된 급여로 월별 급여 요약을 다시 집계합니다. 요약 테이블이 없으면 만듭니다.
+- 요약 테이블 도입 전 데이터 백필
+- 직원의 부서/직급 변경을 과거 월에도 반영
+- 급여 테이블을 직접 수정한 뒤 요약 맞추기
+
+--month 를 주면 해당 급여월(YYYY-MM)만, 주지 않으면 전체를 다시 집계합니다.
+
+사용법: python scripts/rebuild_payroll_summary.py [--month YYYY-MM ...] [--db 경로]
+"""
+
+import sys
+import os
+import argparse
+import re
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+# 상위 디렉토리 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from config.database import DB_PATH, create_db_engine
+from models.models import PayrollMonthlySummary
+from utils.payroll_summary import refresh_payroll_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월별 급여 요약 다시 집계")
+    parser.add_argument(
+        "--month",
+        action="append",
+        help="다시 집계할 급여월 (YYYY-MM, 여러 번 지정 가능)",
+    )
+    parser.add_argument("--db", default=DB_PATH, help="데이터베이스 파일 경로")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일이 존재하지 않습니다: {args.db}")
+        sys.exit(1)
+    invalid = [
+        month
+        for month in args.month or []
+        if not re.fullmatch(r"\d{4}-(0[1-9]|1[0-2])", month)
+    ]
+    if invalid:
+        print(f"급여월 형식이 올바르지 않습니다 (YYYY-MM): {', '.join(invalid)}")
+        sys.exit(1)
+
+    engine = create_db_engine(f"sqlite:///{args.db}")
+    PayrollMonthlySummary.__table__.create(engine, checkfirst=True)
+    session = sessionmaker(bind=engine)()
+    try:
+        count = refresh_payroll_summary(session, args.month)
+        session.commit()
+        total_query = select(func.sum(PayrollMonthlySummary.payroll_count))
+        if args.month:
+            total_query = total_query.where(PayrollMonthlySummary.month.in_(args.month))
+        total = session.scalar(total_query)
+    except Exception as e:
+        session.rollback()
+        print(f"월별 급여 요약 집계 실패: {str(e)}")
+        sys.exit(1)
+    finally:
+        session.close()
+        engine.dispose()
+
+    target = ", ".join(args.month) if args.month else "전체"
+    print(
+        f"월별 급여 요약 다시 집계 완료 ({target}): 요약 {count}행, 급여 {total or 0}건"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+pytest 공용 설정과 fixture
+
+backend 디렉토리를 sys.path 에 추가하여 앱 코드와 같은 import 경로(config, models,
+utils ...)를 사용합니다.
+
+- db_engine: 테스트마다 새로 만드는 임시 SQLite 파일 엔진 (스키마 생성)
+- app_client: 전역 세션을 db_engine 에 연결한 run_server 의 Flask 테스트 클라이언트
+- temp_engine: 모듈 단위 fixture 에서 임시 DB 를 만들 때 쓰는 도우미
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import config.database as database
+import models.models  # noqa: F401  (모델 테이블을 Base.metadata 에 등록)
+from config.database import Base, create_db_engine
+
+
+@contextmanager
+def temp_engine(directory, filename="test.db", profile="prod"):
+    """
+    directory 안의 SQLite 파일 엔진 (스키마 생성)
+
+    끝나면 전역 세션을 정리하고 엔진을 닫습니다. 파일은 pytest 임시 디렉토리와
+    함께 정리됩니다.
+    """
+    engine = create_db_engine(f"sqlite:///{os.path.join(directory, filename)}", profile)
+    try:
+        Base.metadata.create_all(engine)
+        yield engine
+    finally:
+        database.Session.remove()
+        engine.dispose()
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    """테스트마다 새로 만드는 임시 SQLite 파일 엔진"""
+    with temp_engine(str(tmp_path)) as engine:
+        yield engine
+
+
+@pytest.fixture
+def app_client(db_engine):
+    """
+    전역 세션(config.database.Session)을 db_engine 에 연결한 Flask 테스트 클라이언트
+
+    run_server 를 import 하므로 서버 실행 환경(.env 의 OPENAI_API_KEY 등)이 필요하며,
+    없으면 건너뜁니다. 실제 근태 파일 감시는 중지합니다.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if not os.environ.get("OPENAI_API_KEY"):
+        pytest.skip("run_server 를 불러오려면 OPENAI_API_KEY 가 필요합니다 (.env)")
+
+    database.Session.remove()
+    database.Session.configure(bind=db_engine)
+    try:
+        import run_server
+        from utils.employee_cache import employee_cache
+
+        run_server.payroll_service.stop_file_watcher()
+        # 새 DB 에 연결했으므로 이전 DB 의 직원 스냅샷은 쓰지 않음
+        employee_cache.invalidate()
+        yield run_server.app.test_client()
+    finally:
+        database.Session.remove()
+        database.Session.configure(bind=database.engine)
@@ -0,0 +1,114 @@
+"""
+수당 계산 엔진 정합성 테스트
+
+AllowanceEngine(벡터화)과 PayCalculator(기록별 계산)의 연장/야간/휴일근로수당이
+모든 직원에 대해 정수 단위까지 동일한지 확인합니다.
+PayCalculator.segment_shifts 결과를 세 수당 계산에 공유해도 같은 값이 나오는지,
+계산 후 근태 기록이 변경되지 않는지도 함께 확인합니다.
+무작위 근태 데이터(주말/공휴일, 철야, 다일 근무, 24:00:00 퇴근 등)를 생성해 비교합니다.
+"""
+
+import copy
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from scripts._attendance_samples import generate_employee_records
+from utils.allowance_engine import AllowanceEngine, records_to_shift_arrays
+from utils.pay_calculator import PayCalculator
+
+EMPLOYEE_COUNT = 500
+SEEDS = (20240101, 20250101)
+
+
+def allowances(calculator, records, hourly_rate):
+    """기록별 계산 (기존 방식) 연장/야간/휴일근로수당"""
+    return (
+        calculator.calculate_overtime_pay(records, hourly_rate),
+        calculator.calculate_night_pay(records, hourly_rate),
+        calculator.calculate_holiday_pay(records, hourly_rate),
+    )
+
+
+@pytest.fixture(scope="module", params=SEEDS, ids=lambda seed: f"seed{seed}")
+def samples(request):
+    """(직원별 (근태 기록, 시간당 임금), 기존 방식 수당) - 시드별"""
+    rng = random.Random(request.param)
+    calculator = PayCalculator()
+    employees = []
+    for _ in range(EMPLOYEE_COUNT):
+        # 설/추석 연휴가 포함되도록 기간을 분산
+        period_start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 700))
+        records = generate_employee_records(rng, period_start, rng.randint(20, 35))
+        base_salary = rng.randint(28_000_000, 250_000_000)
+        hourly_rate = (base_salary / 12) / calculator.WORK_HOURS_PER_MONTH
+        employees.append((records, hourly_rate))
+    expected = [
+        allowances(calculator, records, hourly_rate)
+        for records, hourly_rate in employees
+    ]
+    return employees, expected
+
+
+def test_calculation_does_not_modify_records(samples):
+    employees, _ = samples
+    snapshot = copy.deepcopy(employees)
+    calculator = PayCalculator()
+    for records, hourly_rate in employees:
+        allowances(calculator, records, hourly_rate)
+        allowances(calculator, calculator.segment_shifts(records), hourly_rate)
+    AllowanceEngine().calculate_records(employees[0][0], employees[0][1])
+    assert employees == snapshot
+
+
+def test_shared_segments_match_per_record(samples):
+    employees, expected = samples
+    calculator = PayCalculator()
+    for i, (records, hourly_rate) in enumerate(employees):
+        shifts = calculator.segment_shifts(records)
+        assert allowances(calculator, shifts, hourly_rate) == expected[i], f"직원 {i}"
+
+
+def test_engine_batch_matches_per_record(samples):
+    employees, expected = samples
+    check_in, check_out, holiday_type, groups = [], [], [], []
+    for group, (records, _) in enumerate(employees):
+        shifts = records_to_shift_arrays(records)
+        check_in.append(shifts["check_in"])
+        check_out.append(shifts["check_out"])
+        holiday_type.append(shifts["holiday_type"])
+        groups.append(np.full(shifts["check_in"].size, group, dtype=np.int64))
+
+    result = AllowanceEngine().calculate(
+        np.concatenate(check_in),
+        np.concatenate(check_out),
+        np.concatenate(holiday_type),
+        np.array([rate for _, rate in employees]),
+        np.concatenate(groups),
+    )
+
+    mismatches = [
+        (i, expected[i], actual)
+        for i, actual in enumerate(
+            zip(
+                map(int, result["overtime_pay"]),
+                map(int, result["night_pay"]),
+                map(int, result["holiday_pay"]),
+            )
+        )
+        if actual != expected[i]
+    ]
+    assert (
+        not mismatches
+    ), f"불일치 {len(mismatches)}건 (직원, 기존, 엔진): {mismatches[:10]}"
+
+
+def test_engine_single_employee_matches_per_record(samples):
+    employees, expected = samples
+    engine = AllowanceEngine()
+    for i, (records, hourly_rate) in enumerate(employees[:50]):
+        single = engine.calculate_records(records, hourly_rate)
+        actual = (single["overtime_pay"], single["night_pay"], single["holiday_pay"])
+        assert actual == expected[i], f"직원 {i}"
@@ -0,0 +1,143 @@
+"""
+목록 크기별 SQL 실행 횟수 테스트 (N+1 회귀 확인)
+
+임시 SQLite 파일에 합성 직원/근태/급여를 만들고 Flask 테스트 클라이언트로
+아래 API 를 목록 크기 1, 10, 100 으로 호출하면서 utils.query_counter 로
+실행된 SQL 문장 수를 셉니다. 목록 크기와 관계없이 문장 수가 같고 최대값 이하여야 합니다.
+
+- POST /api/attendance/records      근태 조회 1문장
+- POST /api/payroll/check-existing  중복 급여 조회 1문장
+- POST /api/payroll/send-payslips   급여+직원 조회, 명세서 INSERT 2문장
+- PUT  /api/payroll/pay             급여 조회, UPDATE, 감사 로그 INSERT,
+                                    월별 요약 DELETE/INSERT 5문장
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from models.models import Attendance, Employee, Payroll
+from utils.query_counter import assert_max_queries
+
+SIZES = (1, 10, 100)
+PERIOD_START = date(2024, 8, 1)
+PERIOD_END = date(2024, 8, 31)
+
+# API 별 최대 SQL 문장 수
+MAX_QUERIES = {
+    "/api/attendance/records": 1,
+    "/api/payroll/check-existing": 1,
+    "/api/payroll/send-payslips": 2,
+    "/api/payroll/pay": 5,
+}
+
+
+def seed(engine, employee_count):
+    """합성 직원, 8월 근태, 8월 확정 급여 적재"""
+    employee_ids = [f"C{i:05d}" for i in range(employee_count)]
+    days = [PERIOD_START + timedelta(days=d) for d in range(31)]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Employee),
+            [
+                {
+                    "employee_id": employee_id,
+                    "name": f"직원{employee_id}",
+                    "department": "개발",
+                    "position": "사원",
+                    "base_salary": 40_000_000,
+                }
+                for employee_id in employee_ids
+            ],
+        )
+        connection.execute(
+            insert(Attendance),
+            [
+                {
+                    "employee_id": employee_id,
+                    "date": day,
+                    "check_in": f"{day} 09:00:00",
+                    "check_out": f"{day} 18:00:00",
+                    "attendance_type": "정상",
+                }
+                for employee_id in employee_ids
+                for day in days
+            ],
+        )
+        connection.execute(
+            insert(Payroll),
+            [
+                {
+                    "payroll_code": f"PAY-{employee_id}",
+                    "employee_id": employee_id,
+                    "payment_period_start": PERIOD_START,
+                    "payment_period_end": PERIOD_END,
+                    "base_pay": 3_000_000,
+                    "gross_pay": 3_000_000,
+                    "net_pay": 2_700_000,
+                    "status": "confirmed",
+                    "payroll_type": "regular",
+                }
+                for employee_id in employee_ids
+            ],
+        )
+    return employee_ids
+
+
+def request_for(path, employee_ids):
+    """(메서드, 요청 본문, 처리 건수 확인 함수)"""
+    codes = [f"PAY-{employee_id}" for employee_id in employee_ids]
+    period = {"start": f"{PERIOD_START}", "end": f"{PERIOD_END}"}
+    return {
+        "/api/attendance/records": (
+            "post",
+            {
+                "employee_ids": employee_ids,
+                "start_date": f"{PERIOD_START}",
+                "end_date": f"{PERIOD_END}",
+            },
+            lambda body: len(body["data"]) == len(employee_ids) * 31,
+        ),
+        "/api/payroll/check-existing": (
+            "post",
+            {
+                "employee_ids": employee_ids,
+                "start_date": "2024-08-15",
+                "end_date": "2024-09-14",
+            },
+            lambda body: len(body["data"]) == len(employee_ids),
+        ),
+        "/api/payroll/send-payslips": (
+            "post",
+            {
+                "payroll_data": [{"payroll_code": code} for code in codes],
+                "period": period,
+            },
+            lambda body: len(body["results"]) == len(employee_ids),
+        ),
+        "/api/payroll/pay": (
+            "put",
+            {"payroll_ids": codes, "payment_date": "2024-09-10"},
+            lambda body: len(body["paid_payrolls"]) == len(employee_ids),
+        ),
+    }[path]
+
+
+@pytest.mark.parametrize("path", list(MAX_QUERIES))
+def test_query_count_is_constant(app_client, db_engine, path):
+    employee_ids = seed(db_engine, sum(SIZES))
+
+    counts = []
+    offset = 0
+    for size in SIZES:
+        batch = employee_ids[offset : offset + size]
+        offset += size
+        method, body, verify = request_for(path, batch)
+        with assert_max_queries(db_engine, MAX_QUERIES[path]) as counter:
+            response = getattr(app_client, method)(path, json=body)
+        assert response.status_code == 200, response.get_data(as_text=True)[:300]
+        assert verify(response.get_json()), f"{path} {size}건"
+        counts.append(counter.count)
+
+    assert len(set(counts)) == 1, f"{path}: 목록 크기별 SQL 문장 수 {counts}"
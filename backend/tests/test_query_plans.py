@@ -0,0 +1,281 @@
+"""
+주요 조회 쿼리 실행 계획 테스트
+
+임시 SQLite 파일에 모델 스키마와 합성 데이터를 만들고 ANALYZE 한 뒤,
+근태/급여/감사 이력의 주요 조회 쿼리마다 EXPLAIN QUERY PLAN 을 확인하여
+의도한 인덱스를 사용하는지 검증합니다. 모델 인덱스 변경 시 회귀 확인용입니다.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, tuple_, update
+from sqlalchemy.orm import sessionmaker
+
+from conftest import temp_engine
+from models.models import (
+    Attendance,
+    AttendanceAudit,
+    Employee,
+    Payroll,
+    PayrollAudit,
+)
+from utils.attendance_diff import backfill_row_hashes
+from utils.payroll_records import build_records_query
+from utils.payroll_summary import build_summary_query
+
+EMPLOYEE_COUNT = 300
+DAYS = 120
+PERIOD_START = date(2024, 1, 1)
+
+EMPLOYEE_IDS = [f"Q{i:05d}" for i in range(EMPLOYEE_COUNT)]
+EMPLOYEE_ID = EMPLOYEE_IDS[EMPLOYEE_COUNT // 2]
+BATCH_IDS = EMPLOYEE_IDS[:50]
+START = date(2024, 2, 1)
+END = date(2024, 2, 29)
+
+
+def seed(session):
+    """합성 직원/근태/급여/감사 이력 적재"""
+    rng = random.Random(20240101)
+    session.execute(
+        insert(Employee),
+        [
+            {
+                "employee_id": employee_id,
+                "name": employee_id,
+                "department": "개발",
+                "position": "사원",
+                "base_salary": 40_000_000,
+            }
+            for employee_id in EMPLOYEE_IDS
+        ],
+    )
+    dates = [PERIOD_START + timedelta(days=d) for d in range(DAYS)]
+    session.execute(
+        insert(Attendance),
+        [
+            {
+                "employee_id": employee_id,
+                "date": day,
+                "check_in": f"{day} 09:00:00",
+                "check_out": f"{day} 18:00:00",
+                "attendance_type": "정상",
+            }
+            for employee_id in EMPLOYEE_IDS
+            for day in dates
+        ],
+    )
+
+    payrolls = []
+    for employee_id in EMPLOYEE_IDS:
+        month_start = PERIOD_START
+        while month_start <= dates[-1]:
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            payrolls.append(
+                {
+                    "payroll_code": f"{employee_id}-{month_start:%Y%m}",
+                    "employee_id": employee_id,
+                    "payment_period_start": month_start,
+                    "payment_period_end": next_month - timedelta(days=1),
+                    "base_pay": 3_000_000,
+                    "gross_pay": 3_000_000,
+                    "net_pay": 2_700_000,
+                    "status": rng.choice(["draft", "confirmed", "paid"]),
+                    "payroll_type": "regular",
+                }
+            )
+            month_start = next_month
+    session.execute(insert(Payroll), payrolls)
+
+    changed_at = datetime(2024, 1, 1)
+    session.execute(
+        insert(AttendanceAudit),
+        [
+            {
+                "employee_id": rng.choice(EMPLOYEE_IDS),
+                "date": rng.choice(dates),
+                "field_name": "check_in",
+                "change_type": "update",
+                "changed_at": changed_at + timedelta(minutes=i),
+            }
+            for i in range(EMPLOYEE_COUNT * 5)
+        ],
+    )
+    session.execute(
+        insert(PayrollAudit),
+        [
+            {
+                "action": "PAYMENT",
+                "user_id": "admin",
+                "timestamp": changed_at + timedelta(minutes=i),
+                "target_type": "payroll",
+                "target_id": payroll["payroll_code"],
+            }
+            for i, payroll in enumerate(payrolls)
+        ],
+    )
+    session.commit()
+
+
+# (설명, 사용해야 하는 인덱스, 쿼리 생성 함수)
+HOT_QUERIES = [
+    (
+        "근태 직원+날짜 단건 (근태 수정, 변경 반영)",
+        "uq_attendance_employee_date",
+        lambda session: session.query(Attendance).filter(
+            Attendance.employee_id == EMPLOYEE_ID, Attendance.date == START
+        ),
+    ),
+    (
+        "근태 직원별 기간 조회 (단건 급여 계산, 근태 기록 조회)",
+        "uq_attendance_employee_date",
+        lambda session: session.query(Attendance).filter(
+            Attendance.employee_id == EMPLOYEE_ID,
+            Attendance.date >= START,
+            Attendance.date <= END,
+        ),
+    ),
+    (
+        "근태 직원 목록 기간 조회 (급여 일괄 계산)",
+        "uq_attendance_employee_date",
+        lambda session: session.query(Attendance).filter(
+            Attendance.employee_id.in_(BATCH_IDS),
+            Attendance.date >= START,
+            Attendance.date <= END,
+        ),
+    ),
+    (
+        "근태 전체 기간 조회",
+        "ix_attendance_date",
+        lambda session: session.query(Attendance).filter(
+            Attendance.date >= START, Attendance.date <= END
+        ),
+    ),
+    (
+        "근태 내용 해시 채우기 대상 확인 (CSV 동기화마다)",
+        "ix_attendance_row_hash_missing",
+        lambda session: update(Attendance)
+        .where(Attendance.row_hash.is_(None))
+        .values(row_hash=0),
+    ),
+    (
+        "급여 직원+기간+상태 조회 (단건 급여 계산)",
+        "ix_payroll_employee_period_status",
+        lambda session: session.query(Payroll).filter(
+            Payroll.employee_id == EMPLOYEE_ID,
+            Payroll.payment_period_start == START,
+            Payroll.payment_period_end == END,
+            Payroll.status.in_(["confirmed", "paid"]),
+        ),
+    ),
+    (
+        "급여 직원 목록+기간+상태 조회 (급여 일괄 계산)",
+        "ix_payroll_employee_period_status",
+        lambda session: session.query(Payroll).filter(
+            Payroll.employee_id.in_(BATCH_IDS),
+            Payroll.payment_period_start == START,
+            Payroll.payment_period_end == END,
+            Payroll.status.in_(["confirmed", "paid", "draft"]),
+        ),
+    ),
+    (
+        "급여 직원별 상태 조회 (재계산 대상 표시)",
+        "ix_payroll_employee_period_status",
+        lambda session: session.query(Payroll.id).filter(
+            Payroll.employee_id.in_(BATCH_IDS),
+            Payroll.payment_period_start <= END,
+            Payroll.payment_period_end >= START,
+            Payroll.status.in_(["draft", "confirmed", "paid"]),
+        ),
+    ),
+    (
+        "급여 기간+상태 조회 (초안 일괄 교체)",
+        "ix_payroll_period_status",
+        lambda session: session.query(Payroll.id).filter(
+            Payroll.payment_period_start == START,
+            Payroll.payment_period_end == END,
+            Payroll.status == "draft",
+        ),
+    ),
+    (
+        "급여 기록 키셋 페이지 조회 (급여 기록 조회)",
+        "ix_payroll_period_start_id",
+        lambda session: build_records_query(status=["confirmed", "paid"])
+        .where(tuple_(Payroll.payment_period_start, Payroll.id) > tuple_(START, 1000))
+        .limit(101),
+    ),
+    (
+        "급여 월별 요약 다시 집계 (급여 확정/지급)",
+        "ix_payroll_period_start_id",
+        lambda session: build_summary_query({f"{START:%Y-%m}"})[1],
+    ),
+    (
+        "근태 변경 이력 직원별 기간 조회",
+        "ix_attendance_audit_employee_date",
+        lambda session: session.query(AttendanceAudit)
+        .filter(
+            AttendanceAudit.employee_id == EMPLOYEE_ID,
+            AttendanceAudit.date >= START,
+            AttendanceAudit.date <= END,
+        )
+        .order_by(AttendanceAudit.changed_at.desc())
+        .limit(500),
+    ),
+    (
+        "근태 변경 이력 최신순 조회",
+        "ix_attendance_audit_changed_at",
+        lambda session: session.query(AttendanceAudit)
+        .order_by(AttendanceAudit.changed_at.desc())
+        .limit(500),
+    ),
+    (
+        "급여 감사 이력 대상별 조회",
+        "ix_payroll_audit_target",
+        lambda session: session.query(PayrollAudit)
+        .filter(
+            PayrollAudit.target_type == "payroll",
+            PayrollAudit.target_id == f"{EMPLOYEE_ID}-202402",
+        )
+        .order_by(PayrollAudit.timestamp.desc()),
+    ),
+]
+
+
+def explain(connection, query):
+    """쿼리의 EXPLAIN QUERY PLAN 상세 문자열 목록"""
+    statement = getattr(query, "statement", query)
+    compiled = statement.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return [row[3] for row in rows]
+
+
+@pytest.fixture(scope="module")
+def seeded_session(tmp_path_factory):
+    """합성 데이터를 적재하고 ANALYZE 한 임시 DB 세션"""
+    with temp_engine(str(tmp_path_factory.mktemp("query_plans"))) as engine:
+        session = sessionmaker(bind=engine)()
+        try:
+            seed(session)
+            # Core INSERT 는 ORM 이벤트를 거치지 않으므로 동기화 때처럼 해시 채우기
+            backfill_row_hashes(session)
+            session.connection().exec_driver_sql("ANALYZE")
+            session.commit()
+            yield session
+        finally:
+            session.close()
+
+
+@pytest.mark.parametrize(
+    "description, index_name, build",
+    HOT_QUERIES,
+    ids=[description for description, _, _ in HOT_QUERIES],
+)
+def test_hot_query_uses_index(seeded_session, description, index_name, build):
+    plan = explain(seeded_session.connection(), build(seeded_session))
+    assert any(
+        f"INDEX {index_name}" in detail for detail in plan
+    ), f"{description}: {index_name} 인덱스를 사용하지 않습니다. {plan}"
@@ -0,0 +1,477 @@
+"""
+벡터화 수당 계산 엔진
+
+PayCalculator 의 연장/야간/휴일근로수당 계산을 NumPy 구간 연산으로 일괄 처리합니다.
+출퇴근 시각은 에포크 초(int64) 배열로 받으며(근무 1건당 1행), 여러 직원의 근무 기록을
+한 번에 계산합니다.
+
+PayCalculator.calculate_overtime_pay / calculate_night_pay / calculate_holiday_pay 와
+정수 결과가 완전히 동일해야 하므로, 각 근무 조각의 금액은 기존 코드와 같은 순서의
+부동소수점 연산으로 계산하고 직원별 합계도 기존 루프와 같은 순서로 누적합니다.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from utils.holiday_calendar import get_calendar
+from utils.pay_calculator import REGULAR_WORKDAY_END, REGULAR_WORKDAY_START
+
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600
+
+# 1970-01-01 의 date.toordinal() 값 (에포크 일수 → 서수 변환용)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+WORKDAY_START_SECONDS = REGULAR_WORKDAY_START * SECONDS_PER_HOUR  # 09:00
+WORKDAY_END_SECONDS = REGULAR_WORKDAY_END * SECONDS_PER_HOUR  # 18:00
+NIGHT_START_SECONDS = 22 * SECONDS_PER_HOUR  # 22:00
+NIGHT_END_SECONDS = SECONDS_PER_DAY + 6 * SECONDS_PER_HOUR  # 다음날 06:00
+
+HOLIDAY_ATTENDANCE_TYPE = "휴일"
+
+
+def records_to_shift_arrays(attendance_data):
+    """
+    근태 기록(dict) 리스트를 엔진 입력 배열로 변환
+
+    출퇴근 시간이 없는 기록은 제외하며(기존 계산 로직과 동일), 24:00:00 형식의
+    퇴근 시간은 다음날 00:00:00 으로 처리합니다. 입력 데이터는 변경하지 않습니다.
+
+    Returns:
+        dict: check_in, check_out (int64 에포크 초), holiday_type (bool),
+              index (원본 리스트에서의 위치)
+    """
+    check_in_strs = []
+    check_out_strs = []
+    next_day = []
+    holiday_type = []
+    index = []
+
+    for i, record in enumerate(attendance_data):
+        check_in = record.get("check_in")
+        check_out = record.get("check_out")
+        if not check_in or not check_out:
+            continue
+
+        # 24:00:00 형식은 같은 날 00:00:00 + 1일로 변환
+        if " 24:00:00" in check_out:
+            check_out = check_out.split(" ")[0] + " 00:00:00"
+            next_day.append(True)
+        else:
+            next_day.append(False)
+
+        check_in_strs.append(check_in)
+        check_out_strs.append(check_out)
+        holiday_type.append(record.get("attendance_type") == HOLIDAY_ATTENDANCE_TYPE)
+        index.append(i)
+
+    check_in_arr = np.array(check_in_strs, dtype="datetime64[s]").astype(np.int64)
+    check_out_arr = np.array(check_out_strs, dtype="datetime64[s]").astype(np.int64)
+    check_out_arr += np.array(next_day, dtype=np.int64) * SECONDS_PER_DAY
+
+    return {
+        "check_in": check_in_arr,
+        "check_out": check_out_arr,
+        "holiday_type": np.array(holiday_type, dtype=bool),
+        "index": np.array(index, dtype=np.int64),
+    }
+
+
+def _fold_in_order(groups, values, n_groups):
+    """
+    그룹별로 값을 주어진 순서대로 누적 합산
+
+    np.sum 은 pairwise 합산을 사용하므로 Python 루프와 결과가 미세하게 다를 수 있습니다.
+    그룹 내 순번이 같은 값끼리 모아 순번 순으로 더하여
+    `total += piece` 루프와 비트 단위로 같은 결과를 얻습니다.
+    0 인 조각은 합계에 영향을 주지 않으므로 미리 제외합니다.
+    """
+    totals = np.zeros(n_groups, dtype=np.float64)
+    keep = values != 0
+    groups = groups[keep]
+    values = values[keep]
+    if values.size == 0:
+        return totals
+
+    # groups 는 정렬되어 있으므로 그룹 내 순번 = 위치 - 그룹 시작 위치
+    _, first_index, counts = np.unique(groups, return_index=True, return_counts=True)
+    starts = np.repeat(first_index, counts)
+    positions = np.arange(values.size) - starts
+
+    # 순번별로 나누면 같은 순번 안에서는 그룹이 겹치지 않음
+    # (그룹 × 최대 순번 행렬을 만들지 않으므로 조각이 많은 그룹 하나가 메모리를 키우지 않음)
+    by_position = np.argsort(positions, kind="stable")
+    bounds = np.searchsorted(
+        positions[by_position], np.arange(1, int(counts.max())), side="left"
+    )
+    for column_groups, column_values in zip(
+        np.split(groups[by_position], bounds), np.split(values[by_position], bounds)
+    ):
+        totals[column_groups] += column_values
+    return totals
+
+
+def _span_buckets(extra_days):
+    """
+    경과 일수별 계산 구간 번호 (0일, 1일, 2~3일, 4~7일, ...)
+
+    구간 안에서는 가장 긴 근무에 맞춘 (근무 기록 × 일수) 행렬을 만들므로,
+    2의 거듭제곱 단위로 나누어 구간 안의 낭비를 2배 이내로 제한합니다.
+    """
+    return np.frexp(extra_days.astype(np.float64))[1]
+
+
+class AllowanceEngine:
+    """연장/야간/휴일근로수당 일괄 계산 엔진"""
+
+    def __init__(self, calendar=None):
+        # calendar: HolidayCalendar (기본값은 프로세스 공용 달력)
+        self.calendar = calendar if calendar is not None else get_calendar()
+
+    def holiday_mask(self, days):
+        """에포크 일수 배열에 대해 공휴일/주말/회사 휴무일 여부 반환"""
+        return self.calendar.holiday_mask(
+            np.asarray(days, dtype=np.int64) + EPOCH_ORDINAL
+        )
+
+    def calculate(self, check_in, check_out, holiday_type, hourly_rates, groups=None):
+        """
+        근무 기록 배열로 직원(그룹)별 수당 일괄 계산
+
+        Args:
+            check_in (np.ndarray): 출근 시각 에포크 초 (int64, 근무 1건당 1행)
+            check_out (np.ndarray): 퇴근 시각 에포크 초 (int64)
+            holiday_type (np.ndarray): 근태유형이 '휴일'인지 여부 (bool)
+            hourly_rates (np.ndarray): 그룹별 시간당 임금 (float64)
+            groups (np.ndarray): 근무 기록별 그룹 번호 (0 ~ 그룹 수-1).
+                None 이면 모든 기록을 하나의 그룹으로 계산합니다.
+                같은 그룹 안에서는 배열 순서가 기존 루프의 기록 순서가 됩니다.
+
+        Returns:
+            dict: overtime_pay, night_pay, holiday_pay (그룹별 int64) 및
+                  overtime_hours, night_hours, holiday_hours (그룹별 float64)
+        """
+        check_in = np.asarray(check_in, dtype=np.int64)
+        check_out = np.asarray(check_out, dtype=np.int64)
+        holiday_type = np.asarray(holiday_type, dtype=bool)
+        hourly_rates = np.atleast_1d(np.asarray(hourly_rates, dtype=np.float64))
+        n_groups = hourly_rates.size
+
+        if groups is None:
+            groups = np.zeros(check_in.size, dtype=np.int64)
+        groups = np.asarray(groups, dtype=np.int64)
+
+        # 그룹 내 기록 순서를 유지한 채 그룹 순으로 정렬
+        order = np.argsort(groups, kind="stable")
+        check_in = check_in[order]
+        check_out = check_out[order]
+        holiday_type = holiday_type[order]
+        groups = groups[order]
+        rates = hourly_rates[groups]
+
+        n = check_in.size
+        extra_days = np.maximum(
+            check_out // SECONDS_PER_DAY - check_in // SECONDS_PER_DAY, 0
+        )
+
+        # 며칠에 걸친 근무 기록 하나가 배치 전체의 행렬 크기를 키우지 않도록
+        # 경과 일수 구간별로 나누어 계산
+        names = ("overtime", "night", "holiday")
+        hours = {name: np.zeros(n, dtype=np.float64) for name in names}
+        # 수당별 (기록 위치, 조각 번호, 금액) 목록
+        empty = np.zeros(0, dtype=np.int64)
+        parts = {name: [(empty, empty, empty.astype(np.float64))] for name in names}
+        buckets = _span_buckets(extra_days)
+        for bucket in np.unique(buckets):
+            rows = np.flatnonzero(buckets == bucket)
+            bucket_pieces = self._bucket_pieces(
+                check_in[rows], check_out[rows], holiday_type[rows], rates[rows]
+            )
+            for name, (pieces, piece_hours) in zip(names, bucket_pieces):
+                hours[name][rows] = piece_hours
+                piece_rows, piece_columns = np.nonzero(pieces)
+                parts[name].append(
+                    (
+                        rows[piece_rows],
+                        piece_columns,
+                        pieces[piece_rows, piece_columns],
+                    )
+                )
+
+        result = {}
+        for name in names:
+            piece_rows, piece_columns, values = (
+                np.concatenate(arrays) for arrays in zip(*parts[name])
+            )
+            # 기록 순서(그룹 순, 그룹 내 원래 순서) → 조각 순서로 정렬
+            order = np.lexsort((piece_columns, piece_rows))
+            totals = _fold_in_order(groups[piece_rows[order]], values[order], n_groups)
+            result[f"{name}_pay"] = np.trunc(totals).astype(np.int64)
+            result[f"{name}_hours"] = np.bincount(
+                groups, weights=hours[name], minlength=n_groups
+            )
+        return result
+
+    def _bucket_pieces(self, check_in, check_out, holiday_type, rates):
+        """
+        근무 기록별 연장/야간/휴일 조각 금액과 시간
+
+        Returns:
+            tuple: 수당별 (조각 금액 행렬, 기록별 시간) 3개 (연장, 야간, 휴일 순)
+        """
+        first_day = check_in // SECONDS_PER_DAY
+        last_day = check_out // SECONDS_PER_DAY
+        extra_days = np.maximum(last_day - first_day, 0)
+        max_extra = int(extra_days.max()) if extra_days.size else 0
+
+        # (근무 기록, 경과 일수) 별 휴일 여부
+        day_offsets = np.arange(max_extra + 1, dtype=np.int64)
+        day_matrix = first_day[:, None] + day_offsets[None, :]
+        holiday_matrix = self.holiday_mask(day_matrix)
+        first_is_holiday = holiday_type | holiday_matrix[:, 0]
+
+        return (
+            self._overtime_pieces(
+                check_in,
+                check_out,
+                first_day,
+                last_day,
+                extra_days,
+                first_is_holiday,
+                holiday_matrix,
+                rates,
+            ),
+            self._night_pieces(
+                check_in, check_out, first_day, extra_days, rates, max_extra
+            ),
+            self._holiday_pieces(
+                check_in,
+                check_out,
+                first_day,
+                last_day,
+                extra_days,
+                first_is_holiday,
+                holiday_matrix,
+                rates,
+            ),
+        )
+
+    def calculate_groups(self, record_groups, hourly_rates):
+        """
+        여러 직원의 근태 기록(dict 리스트의 리스트)을 한 번에 계산
+
+        Args:
+            record_groups (list): 직원별 근태 기록 리스트
+            hourly_rates (sequence): 직원별 시간당 임금
+
+        Returns:
+            dict: calculate 와 같은 형식 (record_groups 순서의 그룹별 배열)
+        """
+        check_in, check_out, holiday_type, groups = [], [], [], []
+        for group, records in enumerate(record_groups):
+            shifts = records_to_shift_arrays(records)
+            check_in.append(shifts["check_in"])
+            check_out.append(shifts["check_out"])
+            holiday_type.append(shifts["holiday_type"])
+            groups.append(np.full(shifts["check_in"].size, group, dtype=np.int64))
+
+        if not record_groups:
+            empty = np.zeros(0, dtype=np.int64)
+            return self.calculate(empty, empty, empty.astype(bool), np.zeros(0))
+
+        return self.calculate(
+            np.concatenate(check_in),
+            np.concatenate(check_out),
+            np.concatenate(holiday_type),
+            np.asarray(hourly_rates, dtype=np.float64),
+            np.concatenate(groups),
+        )
+
+    def calculate_records(self, attendance_data, hourly_rate):
+        """
+        한 직원의 근태 기록(dict 리스트)으로 수당 계산
+
+        PayCalculator 의 개별 메서드 세 개를 한 번에 대체하는 편의 메서드입니다.
+
+        Returns:
+            dict: overtime_pay, night_pay, holiday_pay (int)
+        """
+        shifts = records_to_shift_arrays(attendance_data)
+        result = self.calculate(
+            shifts["check_in"],
+            shifts["check_out"],
+            shifts["holiday_type"],
+            np.array([hourly_rate], dtype=np.float64),
+        )
+        return {
+            "overtime_pay": int(result["overtime_pay"][0]),
+            "night_pay": int(result["night_pay"][0]),
+            "holiday_pay": int(result["holiday_pay"][0]),
+        }
+
+    def _overtime_pieces(
+        self,
+        check_in,
+        check_out,
+        first_day,
+        last_day,
+        extra_days,
+        first_is_holiday,
+        holiday_matrix,
+        rates,
+    ):
+        """연장근로 조각 금액 (calculate_overtime_pay 와 같은 순서)"""
+        n, span = holiday_matrix.shape
+        pieces = np.zeros((n, span * 2), dtype=np.float64)
+        hours_total = np.zeros(n, dtype=np.float64)
+
+        day_start = first_day * SECONDS_PER_DAY
+        time_of_day = check_in - day_start
+        multi_day = first_day != last_day
+
+        # ===== 첫째 날 =====
+        # 휴일: 출근 ~ (다음날 00:00 또는 퇴근) 전체, 9시간 이상이면 휴게 1시간 제외
+        holiday_seconds = np.where(
+            multi_day, SECONDS_PER_DAY - time_of_day, check_out - check_in
+        )
+        holiday_hours = holiday_seconds / SECONDS_PER_HOUR
+        holiday_hours = np.where(holiday_hours >= 9, holiday_hours - 1, holiday_hours)
+
+        # 평일: 09:00 이전 + 18:00 이후
+        early_mask = time_of_day < WORKDAY_START_SECONDS
+        early_hours = (WORKDAY_START_SECONDS - time_of_day) / SECONDS_PER_HOUR
+        late_mask = multi_day | (check_out > day_start + WORKDAY_END_SECONDS)
+        late_seconds = np.where(
+            multi_day,
+            SECONDS_PER_DAY - WORKDAY_END_SECONDS,
+            check_out - (day_start + WORKDAY_END_SECONDS),
+        )
+        late_hours = late_seconds / SECONDS_PER_HOUR
+
+        weekday_first = ~first_is_holiday
+        first_a = np.where(
+            first_is_holiday, holiday_hours, np.where(early_mask, early_hours, 0.0)
+        )
+        first_b = np.where(weekday_first & late_mask, late_hours, 0.0)
+        pieces[:, 0] = first_a * rates * 1.5
+        pieces[:, 1] = first_b * rates * 1.5
+        hours_total += first_a + first_b
+
+        # ===== 둘째 날부터 =====
+        for k in range(1, span):
+            active = extra_days >= k
+            current_day = first_day + k
+            current_start = current_day * SECONDS_PER_DAY
+            current_end = np.where(
+                current_day == last_day, check_out, current_start + SECONDS_PER_DAY
+            )
+            day_seconds = current_end - current_start
+
+            # 평일 연속 근무: 00:00~09:00, 18:00~퇴근
+            continuous = active & ~holiday_matrix[:, k] & ~first_is_holiday
+            early = np.minimum(WORKDAY_START_SECONDS, day_seconds) / SECONDS_PER_HOUR
+            late_mask = current_end > current_start + WORKDAY_END_SECONDS
+            late = (
+                current_end - (current_start + WORKDAY_END_SECONDS)
+            ) / SECONDS_PER_HOUR
+
+            # 휴일 또는 휴일 시작 근무: 하루 전체
+            all_day = active & ~continuous
+            day_hours = day_seconds / SECONDS_PER_HOUR
+            day_hours = np.where(day_hours >= 9, day_hours - 1, day_hours)
+
+            piece_a = np.where(continuous, early, np.where(all_day, day_hours, 0.0))
+            piece_b = np.where(continuous & late_mask, late, 0.0)
+            pieces[:, 2 * k] = piece_a * rates * 1.5
+            pieces[:, 2 * k + 1] = piece_b * rates * 1.5
+            hours_total += piece_a + piece_b
+
+        return pieces, hours_total
+
+    def _night_pieces(
+        self, check_in, check_out, first_day, extra_days, rates, max_extra
+    ):
+        """야간근로 조각 금액 (calculate_night_pay 와 같은 순서)"""
+        n = check_in.size
+        pieces = np.zeros((n, max_extra + 1), dtype=np.float64)
+        hours_total = np.zeros(n, dtype=np.float64)
+
+        for k in range(max_extra + 1):
+            active = extra_days >= k
+            day_start = (first_day + k) * SECONDS_PER_DAY
+            night_start = day_start + NIGHT_START_SECONDS
+            night_end = day_start + NIGHT_END_SECONDS
+
+            start = np.maximum(check_in, night_start)
+            end = np.minimum(check_out, night_end)
+            overlap = active & (end > start)
+            # 교집합이 없는 경우(퇴근 <= 22:00 또는 출근 >= 06:00)는 end <= start 로 걸러짐
+            night_hours = np.where(overlap, (end - start) / SECONDS_PER_HOUR, 0.0)
+            pieces[:, k] = night_hours * rates * 0.5
+            hours_total += night_hours
+
+        return pieces, hours_total
+
+    def _holiday_pieces(
+        self,
+        check_in,
+        check_out,
+        first_day,
+        last_day,
+        extra_days,
+        first_is_holiday,
+        holiday_matrix,
+        rates,
+    ):
+        """휴일근로 조각 금액 (calculate_holiday_pay 와 같은 순서)"""
+        n, span = holiday_matrix.shape
+        pieces = np.zeros((n, span * 2), dtype=np.float64)
+        hours_total = np.zeros(n, dtype=np.float64)
+
+        # 휴일근로 누적 시간 (8시간 기준 계산용)
+        accumulated = np.zeros(n, dtype=np.float64)
+
+        for k in range(span):
+            # 평일에 시작한 근로는 휴일근로수당 적용 안함
+            active = first_is_holiday & (extra_days >= k)
+            current_day = first_day + k
+            current_start = current_day * SECONDS_PER_DAY
+
+            day_start = check_in if k == 0 else current_start
+            # 마지막 날이 아니면 23:59:59 까지 (기존 로직과 동일)
+            day_end = np.where(
+                current_day == last_day, check_out, current_start + SECONDS_PER_DAY - 1
+            )
+            if k > 0:
+                # 휴일이 아닌 평일로 이어진 경우 09:00 까지만 휴일근로
+                weekday = ~holiday_matrix[:, k]
+                day_end = np.where(
+                    weekday,
+                    np.minimum(day_end, current_start + WORKDAY_START_SECONDS),
+                    day_end,
+                )
+
+            day_hours = (day_end - day_start) / SECONDS_PER_HOUR
+            day_hours = np.where(day_hours >= 9, day_hours - 1, day_hours)
+            day_hours = np.where(active, day_hours, 0.0)
+
+            below = accumulated < 8
+            fits = below & (accumulated + day_hours <= 8)
+            splits = below & ~fits
+            within_8 = 8 - accumulated
+            over_8 = day_hours - within_8
+
+            piece_a = np.where(
+                fits,
+                day_hours * rates * 1.5,
+                np.where(splits, within_8 * rates * 1.5, day_hours * rates * 2.0),
+            )
+            piece_b = np.where(splits, over_8 * rates * 2.0, 0.0)
+            pieces[:, 2 * k] = np.where(active, piece_a, 0.0)
+            pieces[:, 2 * k + 1] = np.where(active, piece_b, 0.0)
+
+            accumulated = np.where(active, accumulated + day_hours, accumulated)
+            hours_total += day_hours
+
+        return pieces, hours_total
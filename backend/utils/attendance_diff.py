@@ -0,0 +1,190 @@
+"""
+근태 기록 내용 해시 및 해시 기반 변경 감지 모듈
+
+근태 기록마다 내용 필드(check_in, check_out, attendance_type, remarks)의
+64비트 해시(attendance.row_hash)를 저장해 두고, CSV 변경 감지 시
+DB 에서는 (employee_id, date, row_hash) 투영만 키 순서로 스트리밍 조회합니다.
+CSV 도 같은 키 순서로 정렬해 병합 비교하므로 ORM 객체를 만들지 않으며,
+비교 중 추가로 보관하는 데이터는 신규/변경 행뿐입니다.
+"""
+
+import hashlib
+
+import pandas as pd
+
+# 해시 대상 필드 (순서 고정)
+ROW_HASH_FIELDS = ("check_in", "check_out", "attendance_type", "remarks")
+
+# SQLite 사용자 정의 함수 이름 (기존 기록 해시 채우기용)
+ROW_HASH_SQL_FUNCTION = "attendance_row_hash"
+
+# DB 투영 조회 스트리밍 단위
+STREAM_CHUNK_SIZE = 10000
+
+_SEPARATOR = "\x1f"
+_NULL = "\x00"  # NULL 과 빈 문자열 구분
+
+
+def attendance_row_hash(check_in, check_out, attendance_type, remarks):
+    """근태 내용 필드의 64비트 해시 (SQLite INTEGER 범위의 부호 있는 정수)"""
+    payload = _SEPARATOR.join(
+        _NULL if value is None else str(value)
+        for value in (check_in, check_out, attendance_type, remarks)
+    )
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def register_row_hash_function(connection):
+    """SQLAlchemy 연결의 SQLite 드라이버 연결에 해시 함수 등록"""
+    connection.connection.driver_connection.create_function(
+        ROW_HASH_SQL_FUNCTION, 4, attendance_row_hash, deterministic=True
+    )
+
+
+def backfill_row_hashes(session):
+    """
+    해시가 없는 근태 기록(컬럼 추가 이전 기록, Core INSERT 기록)의 해시 채우기
+
+    Returns:
+        int: 해시를 채운 기록 수
+    """
+    connection = session.connection()
+    register_row_hash_function(connection)
+    fields = ", ".join(ROW_HASH_FIELDS)
+    result = connection.exec_driver_sql(
+        f"UPDATE attendance SET row_hash = {ROW_HASH_SQL_FUNCTION}({fields}) "
+        "WHERE row_hash IS NULL"
+    )
+    return result.rowcount
+
+
+def clean_attendance_frame(df):
+    """
+    CSV 에서 읽은 근태 DataFrame 전처리 (빈 값 기본값 채우기, 공백 제거)
+
+    전체 파일과 추가분(tail) 읽기가 같은 규칙을 쓰도록 공통으로 사용합니다.
+    """
+    df["check_in"] = df["check_in"].fillna("").astype(str).str.strip()
+    df["check_out"] = df["check_out"].fillna("").astype(str).str.strip()
+    df["attendance_type"] = df["attendance_type"].fillna("정상").astype(str).str.strip()
+    df["date"] = df["date"].fillna("").astype(str).str.strip()
+    if "remarks" not in df.columns:
+        df["remarks"] = ""
+    else:
+        df["remarks"] = df["remarks"].fillna("").astype(str).str.strip()
+    return df
+
+
+def normalize_frame(df):
+    """
+    전처리된 근태 DataFrame 을 비교용 형태로 변환
+
+    - 날짜를 'YYYY-MM-DD' 문자열로 통일 (형식 오류 행 제외)
+    - (employee_id, date) 순서로 정렬, 중복 키는 마지막 행 사용
+
+    Returns:
+        tuple: (정규화된 DataFrame, 형식 오류로 제외한 행 수)
+    """
+    frame = pd.DataFrame(
+        {
+            "employee_id": df["employee_id"].fillna("").astype(str).str.strip(),
+            "date": pd.to_datetime(
+                df["date"], format="%Y-%m-%d", errors="coerce"
+            ).dt.strftime("%Y-%m-%d"),
+            "check_in": df["check_in"],
+            "check_out": df["check_out"],
+            "attendance_type": df["attendance_type"],
+            "remarks": df["remarks"] if "remarks" in df.columns else "",
+        }
+    )
+    valid = frame["date"].notna() & (frame["employee_id"] != "")
+    skipped = int((~valid).sum())
+    frame = (
+        frame[valid]
+        .sort_values(["employee_id", "date"], kind="mergesort")
+        .drop_duplicates(["employee_id", "date"], keep="last")
+        .reset_index(drop=True)
+    )
+    return frame, skipped
+
+
+def _stream_db_hashes(session, chunk_size):
+    """DB 근태 (employee_id, date, row_hash) 를 키 순서로 스트리밍 (고유 인덱스 순서)"""
+    connection = session.connection().execution_options(yield_per=chunk_size)
+    return connection.exec_driver_sql(
+        "SELECT employee_id, date, row_hash FROM attendance ORDER BY employee_id, date"
+    )
+
+
+def find_changed_rows(session, df, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    CSV 와 DB 의 내용 해시를 키 순서로 병합 비교하여 신규/변경 행만 반환
+
+    DB 에만 있는 기록은 변경으로 보지 않습니다 (CSV 에서 삭제된 기록은 유지).
+    해시가 없는 DB 기록이 있으면 먼저 backfill_row_hashes 를 호출해야 합니다.
+
+    Args:
+        session: SQLAlchemy 세션
+        df (pd.DataFrame): 전처리된 근태 CSV 데이터
+
+    Returns:
+        dict: rows(신규/변경 행 튜플 목록, upsert_attendance 입력 형식),
+              inserted, updated, unchanged, skipped 건수
+    """
+    frame, skipped = normalize_frame(df)
+    employee_ids = frame["employee_id"].tolist()
+    dates = frame["date"].tolist()
+    # 필드별 목록 (행 튜플을 만들지 않고 위치로 접근)
+    check_ins, check_outs, types, remarks = (
+        frame[field].tolist() for field in ROW_HASH_FIELDS
+    )
+
+    changed = []
+    inserted = updated = 0
+    position = 0
+    count = len(employee_ids)
+    for db_employee_id, db_date, db_hash in _stream_db_hashes(session, chunk_size):
+        # CSV 에만 있는 키 (신규)
+        while position < count and (employee_ids[position], dates[position]) < (
+            db_employee_id,
+            db_date,
+        ):
+            changed.append(position)
+            inserted += 1
+            position += 1
+        if position >= count:
+            break
+        if (employee_ids[position], dates[position]) == (db_employee_id, db_date):
+            row_hash = attendance_row_hash(
+                check_ins[position],
+                check_outs[position],
+                types[position],
+                remarks[position],
+            )
+            if row_hash != db_hash:
+                changed.append(position)
+                updated += 1
+            position += 1
+    # DB 키보다 뒤에 남은 CSV 행 (신규)
+    inserted += count - position
+    changed.extend(range(position, count))
+
+    rows = [
+        (
+            employee_ids[i],
+            dates[i],
+            check_ins[i],
+            check_outs[i],
+            types[i],
+            remarks[i],
+        )
+        for i in changed
+    ]
+    return {
+        "rows": rows,
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": count - inserted - updated,
+        "skipped": skipped,
+    }
@@ -0,0 +1,272 @@
+"""
+근태 DB → CSV 증분 내보내기 모듈
+
+근태 기록을 월별 조각 파일(partition)로 나누어 보관하고, 변경된 월의 조각만
+DB 에서 다시 조회해 씁니다. attendance.csv 는 헤더와 월별 조각을 월 순서로
+이어 붙여 만들며, 모든 파일은 설정한 인코딩 하나로 임시 파일에 쓴 뒤
+os.replace 로 교체하므로 읽는 쪽에서 쓰다 만 파일을 보지 않습니다.
+
+- 조각 파일: <데이터 디렉토리>/attendance_parts/attendance_YYYY-MM.csv (헤더 없음)
+- manifest.json: 인코딩, 월별 행 수, 마지막으로 만든 attendance.csv 의 stat
+- 백업: <데이터 디렉토리>/attendance_backups/ 에 gzip 압축, 최근 backup_keep 개만 유지
+  (증분 내보내기는 바뀌는 월 조각만, 전체 내보내기는 기존 attendance.csv 전체를 백업)
+
+attendance.csv 가 마지막 내보내기 이후 외부에서 바뀌었거나(stat 불일치) manifest 가
+없거나 인코딩이 바뀌었으면 전체 내보내기로 조각을 다시 만듭니다.
+"""
+
+import csv
+import glob
+import gzip
+import os
+import shutil
+from datetime import datetime
+
+from sqlalchemy import select
+
+from models.models import Attendance
+from utils.file_fingerprint import stat_key
+from utils.partition_files import (
+    atomic_write,
+    load_manifest,
+    month_key,
+    month_range,
+    save_manifest,
+)
+
+EXPORT_FIELDS = (
+    "employee_id",
+    "date",
+    "check_in",
+    "check_out",
+    "attendance_type",
+    "remarks",
+)
+DEFAULT_ENCODING = "utf-8"
+DEFAULT_BACKUP_KEEP = 20
+
+PARTITION_DIR_NAME = "attendance_parts"
+BACKUP_DIR_NAME = "attendance_backups"
+MANIFEST_NAME = "manifest.json"
+
+# 전체 내보내기 조회 단위
+EXPORT_CHUNK_SIZE = 10000
+
+
+def _partition_encoding(encoding):
+    """조각 파일 인코딩 (BOM 은 attendance.csv 헤더에만 기록)"""
+    return "utf-8" if encoding.lower().replace("_", "-") == "utf-8-sig" else encoding
+
+
+# 내보내기 조회 (날짜, 직원 순서: 새 날짜가 파일 끝에 추가되는 순서)
+# 날짜는 SQLite 에 저장된 'YYYY-MM-DD' 문자열을 그대로 사용 (date 변환 생략)
+_SELECT_SQL = (
+    "SELECT employee_id, date, COALESCE(check_in, ''), COALESCE(check_out, ''), "
+    "COALESCE(attendance_type, '정상'), COALESCE(remarks, '') FROM attendance"
+)
+_ORDER_SQL = " ORDER BY date, employee_id"
+
+
+class AttendanceCsvExporter:
+    """근태 CSV 월별 증분 내보내기"""
+
+    def __init__(
+        self,
+        csv_path,
+        encoding=DEFAULT_ENCODING,
+        backup_keep=DEFAULT_BACKUP_KEEP,
+        partition_dir=None,
+        backup_dir=None,
+    ):
+        data_dir = os.path.dirname(os.path.abspath(csv_path))
+        self.csv_path = csv_path
+        self.encoding = encoding
+        self.backup_keep = backup_keep
+        self.partition_dir = partition_dir or os.path.join(data_dir, PARTITION_DIR_NAME)
+        self.backup_dir = backup_dir or os.path.join(data_dir, BACKUP_DIR_NAME)
+        self.manifest_path = os.path.join(self.partition_dir, MANIFEST_NAME)
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+    def export(self, session, changed=None):
+        """
+        DB 근태 기록을 CSV 로 내보내기
+
+        Args:
+            session: SQLAlchemy 세션
+            changed (iterable): 변경된 날짜 또는 (employee_id, 날짜) 목록.
+                None 이면 전체 내보내기
+
+        Returns:
+            dict: mode(incremental | full | unchanged | empty), months(다시 쓴 월),
+                  rows(다시 쓴 행 수), total_rows, backups(만든 백업 파일)
+        """
+        os.makedirs(self.partition_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        months = None if changed is None else self._changed_months(changed)
+
+        if months is not None and self._can_increment(manifest):
+            if not months:
+                return self._result("unchanged", [], 0, manifest)
+            backups = self._backup_partitions(months, manifest)
+            rows = 0
+            for month in sorted(months):
+                count = self._write_month(session, month)
+                rows += count
+                if count:
+                    manifest["months"][month] = count
+                else:
+                    manifest["months"].pop(month, None)
+            mode = "incremental"
+        else:
+            # DB 가 비어 있으면 기존 CSV 를 빈 파일로 덮어쓰지 않음
+            if session.execute(select(Attendance.id).limit(1)).first() is None:
+                return self._result("empty", [], 0, {})
+            backups = self._backup_file(self.csv_path, "full")
+            months, rows = self._write_all(session, manifest)
+            mode = "full"
+
+        self._assemble(manifest)
+        manifest["encoding"] = self.encoding
+        manifest["csv_stat"] = list(stat_key(self.csv_path) or ())
+        manifest["exported_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._save_manifest(manifest)
+        self._rotate_backups()
+        return self._result(mode, sorted(months), rows, manifest, backups)
+
+    @staticmethod
+    def _result(mode, months, rows, manifest, backups=()):
+        return {
+            "mode": mode,
+            "months": months,
+            "rows": rows,
+            "total_rows": sum(manifest.get("months", {}).values()),
+            "backups": list(backups),
+        }
+
+    @staticmethod
+    def _changed_months(changed):
+        """변경 목록의 월 키 집합"""
+        months = set()
+        for item in changed:
+            day = item[1] if isinstance(item, (tuple, list)) else item
+            months.add(month_key(day))
+        return months
+
+    def _can_increment(self, manifest):
+        """기존 조각으로 증분 내보내기가 가능한지 (인코딩, attendance.csv stat, 조각 존재)"""
+        if manifest.get("encoding") != self.encoding:
+            return False
+        if list(stat_key(self.csv_path) or ()) != manifest.get("csv_stat"):
+            return False
+        return all(
+            os.path.exists(self._partition_path(month)) for month in manifest["months"]
+        )
+
+    def _partition_path(self, month):
+        return os.path.join(self.partition_dir, f"attendance_{month}.csv")
+
+    def _write_partition(self, month, rows):
+        """월 조각 파일 쓰기 (행 수 반환, 행이 없으면 조각 삭제)"""
+        path = self._partition_path(month)
+        if not rows:
+            if os.path.exists(path):
+                os.remove(path)
+            return 0
+
+        def write(f):
+            csv.writer(f).writerows(rows)
+
+        atomic_write(path, write, encoding=_partition_encoding(self.encoding))
+        return len(rows)
+
+    def _write_month(self, session, month):
+        """한 달치 근태를 조회해 조각 파일 쓰기 (날짜 인덱스 범위 조회)"""
+        start, end = month_range(month)
+        rows = (
+            session.connection()
+            .exec_driver_sql(
+                _SELECT_SQL + " WHERE date >= ? AND date < ?" + _ORDER_SQL,
+                (start.isoformat(), end.isoformat()),
+            )
+            .all()
+        )
+        return self._write_partition(month, rows)
+
+    def _write_all(self, session, manifest):
+        """전체 근태를 날짜 순서로 스트리밍하며 월별 조각 다시 쓰기"""
+        for path in glob.glob(os.path.join(self.partition_dir, "attendance_*.csv")):
+            os.remove(path)
+        manifest["months"] = {}
+        current, rows, total = None, [], 0
+        connection = session.connection().execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        for row in connection.exec_driver_sql(_SELECT_SQL + _ORDER_SQL):
+            month = row[1][:7]
+            if month != current:
+                if rows:
+                    manifest["months"][current] = self._write_partition(current, rows)
+                    total += len(rows)
+                current, rows = month, []
+            rows.append(row)
+        if rows:
+            manifest["months"][current] = self._write_partition(current, rows)
+            total += len(rows)
+        return set(manifest["months"]), total
+
+    def _assemble(self, manifest):
+        """헤더 + 월 조각을 이어 붙여 attendance.csv 교체 (조각은 바이트 복사)"""
+        header = (",".join(EXPORT_FIELDS) + "\r\n").encode(self.encoding)
+
+        def write(f):
+            f.write(header)
+            for month in sorted(manifest["months"]):
+                with open(self._partition_path(month), "rb") as part:
+                    shutil.copyfileobj(part, f)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.csv_path)), exist_ok=True)
+        atomic_write(self.csv_path, write, mode="wb")
+
+    # ------------------------------------------------------------------
+    # manifest
+    # ------------------------------------------------------------------
+    def _load_manifest(self):
+        return load_manifest(self.manifest_path, "months")
+
+    def _save_manifest(self, manifest):
+        save_manifest(self.manifest_path, manifest)
+
+    # ------------------------------------------------------------------
+    # 백업
+    # ------------------------------------------------------------------
+    def _backup_file(self, path, label):
+        """파일을 gzip 압축 백업 (만든 백업 경로 목록 반환)"""
+        if not os.path.exists(path):
+            return []
+        os.makedirs(self.backup_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        backup_path = os.path.join(
+            self.backup_dir, f"attendance_{label}_{stamp}.csv.gz"
+        )
+        with open(path, "rb") as source, gzip.open(
+            backup_path, "wb", compresslevel=6
+        ) as target:
+            shutil.copyfileobj(source, target)
+        return [backup_path]
+
+    def _backup_partitions(self, months, manifest):
+        """다시 쓸 월 조각의 이전 내용 백업"""
+        backups = []
+        for month in sorted(months):
+            if month in manifest["months"]:
+                backups += self._backup_file(self._partition_path(month), month)
+        return backups
+
+    def _rotate_backups(self):
+        """최근 backup_keep 개만 남기고 오래된 백업 삭제"""
+        backups = sorted(
+            glob.glob(os.path.join(self.backup_dir, "attendance_*.csv.gz")),
+            key=os.path.getmtime,
+        )
+        for path in backups[: max(len(backups) - self.backup_keep, 0)]:
+            os.remove(path)
@@ -0,0 +1,119 @@
+"""
+근태 CSV 추가분(tail) 읽기 모듈
+
+출퇴근 기록기가 만드는 근태 CSV 는 보통 새 날짜 행이 파일 끝에 추가되는 방식으로
+커집니다. 마지막으로 처리한 바이트 위치(offset)와 그 앞부분(prefix)의 해시를
+상태로 기억해 두고, 다음 변경 때 앞부분 해시가 같으면 추가된 부분만 파싱합니다.
+앞부분이 바뀌었거나(기존 행 수정/삭제) 파일이 줄었으면 None 을 반환하므로
+호출자는 전체 비교로 돌아가야 합니다.
+
+- 앞부분 검증은 청크 단위 비암호화 해시(utils.file_fingerprint)로 순차 읽기만 하며,
+  파싱과 UPSERT 비용은 추가된 행 수에 비례합니다.
+- 줄바꿈으로 끝나지 않은 마지막 행(기록 중인 행)은 처리하지 않고 다음 번에 읽습니다.
+- 상태의 prefix 해시는 처리한 바이트까지 이어서 갱신하므로 파일을 두 번 읽지 않습니다.
+"""
+
+import io
+import os
+
+import pandas as pd
+
+from utils.file_fingerprint import FINGERPRINT_CHUNK_SIZE, HASH_ALGORITHM, new_hasher
+
+CSV_ENCODING = "utf-8"
+
+
+def _hash_range(f, hasher, length, chunk_size):
+    """파일 현재 위치부터 length 바이트를 청크 단위로 해시 (읽은 바이트 수 반환)"""
+    remaining = length
+    while remaining > 0:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        hasher.update(chunk)
+        remaining -= len(chunk)
+    return length - remaining
+
+
+def capture_tail_state(path, chunk_size=FINGERPRINT_CHUNK_SIZE):
+    """
+    현재 파일의 마지막 완전한 행까지를 처리 완료 상태로 기록
+
+    전체 비교를 시작하기 전에 호출합니다. 비교 중 추가된 행은 다음 추가분 읽기에서
+    다시 읽히지만 UPSERT 는 변경 없는 행을 건너뛰므로 안전합니다.
+
+    Returns:
+        dict: offset, prefix_hash, header, algorithm (헤더 행이 없으면 None)
+    """
+    hasher = new_hasher()
+    offset = 0
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            return None
+        hasher.update(header)
+        offset = len(header)
+        carry = b""
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            data = carry + chunk
+            end = data.rfind(b"\n") + 1
+            if end:
+                hasher.update(data[:end])
+                offset += end
+            carry = data[end:]
+    return {
+        "offset": offset,
+        "prefix_hash": hasher.hexdigest(),
+        "header": header,
+        "algorithm": HASH_ALGORITHM,
+    }
+
+
+def read_appended_rows(
+    path, state, encoding=CSV_ENCODING, chunk_size=FINGERPRINT_CHUNK_SIZE
+):
+    """
+    이전 상태 이후 추가된 행만 DataFrame 으로 읽기
+
+    Args:
+        path (str): 근태 CSV 경로
+        state (dict): capture_tail_state 또는 이전 호출이 반환한 상태
+        encoding (str): CSV 인코딩
+
+    Returns:
+        dict: frame(추가된 행, 헤더 포함 파싱), state(새 상태), bytes(읽은 추가분 크기)
+        None: 상태가 없거나 앞부분이 바뀌어 전체 비교가 필요한 경우
+    """
+    if not state or state.get("algorithm") != HASH_ALGORITHM:
+        return None
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None
+    offset = state["offset"]
+    if size < offset:
+        return None
+
+    hasher = new_hasher()
+    with open(path, "rb") as f:
+        if _hash_range(f, hasher, offset, chunk_size) != offset:
+            return None
+        if hasher.hexdigest() != state["prefix_hash"]:
+            return None
+        tail = f.read()
+
+    # 줄바꿈으로 끝난 행까지만 처리
+    end = tail.rfind(b"\n") + 1
+    consumed = tail[:end]
+    hasher.update(consumed)
+    new_state = dict(state, offset=offset + end, prefix_hash=hasher.hexdigest())
+
+    if consumed.strip():
+        frame = pd.read_csv(
+            io.BytesIO(state["header"] + consumed),
+            encoding=encoding,
+            on_bad_lines="warn",
+        )
+    else:
+        frame = pd.read_csv(io.BytesIO(state["header"]), encoding=encoding)
+    return {"frame": frame, "state": new_state, "bytes": end}
@@ -0,0 +1,261 @@
+"""
+근태 기록 일괄 UPSERT 모듈
+
+CSV 근태 데이터를 임시 스테이징 테이블에 executemany 로 적재한 뒤,
+집합 연산(SQL)으로 변경 감지, 감사 이력 생성, UPSERT 를 처리합니다.
+
+- 스테이징과 근태 테이블을 한 번 조인해 내용 해시(row_hash)가 다른 신규/변경 행만
+  diff 임시 테이블에 기록
+- diff 행만 INSERT ... ON CONFLICT(employee_id, date) DO UPDATE 로 반영
+- 변경/생성/삭제 감사 이력(AttendanceAudit)을 같은 트랜잭션에서 INSERT ... SELECT 로 생성
+- 전체 삭제 후 재삽입하지 않으므로 동기화 중에도 다른 연결은 기존 근태를 조회할 수 있음
+
+(employee_id, date) 고유 인덱스(uq_attendance_employee_date)가 필요합니다. 인덱스가
+없으면(기존 DB 의 중복 기록 등) 실행 전에 RuntimeError 를 발생시킵니다.
+"""
+
+from datetime import date, datetime
+
+from config.database import ATTENDANCE_UNIQUE_INDEX
+from utils.attendance_diff import attendance_row_hash, backfill_row_hashes
+
+STAGING_TABLE = "attendance_staging"
+DIFF_TABLE = "attendance_diff"
+MISSING_TABLE = "attendance_missing"
+
+# 스테이징 적재 단위 (executemany 1회당 행 수)
+STAGING_CHUNK_SIZE = 50000
+
+# 비교/갱신 대상 필드 (감사 이력 field_name 과 동일)
+CONTENT_FIELDS = ("check_in", "check_out", "attendance_type", "remarks")
+
+# 감사 이력 변경자 (파일 동기화)
+SYNC_USER = "system_sync"
+
+_JOIN = "a.employee_id = s.employee_id AND a.date = s.date"
+_AUDIT_INSERT = (
+    "INSERT INTO attendance_audit (employee_id, date, field_name, old_value, "
+    "new_value, change_type, changed_by, changed_at) "
+)
+
+
+def _parse_date(value):
+    """날짜 값을 'YYYY-MM-DD' 문자열로 변환 (형식 오류 시 None)"""
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    value = str(value).strip()
+    try:
+        parsed = date.fromisoformat(value)
+        # 이미 'YYYY-MM-DD' 형식이면 그대로 사용 (문자열 재생성 생략)
+        return value if len(value) == 10 else parsed.isoformat()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        return None
+
+
+def records_to_rows(records):
+    """근태 딕셔너리 목록을 스테이징 행 튜플로 변환"""
+    for record in records:
+        yield (
+            record.get("employee_id"),
+            record.get("date"),
+            record.get("check_in", ""),
+            record.get("check_out", ""),
+            record.get("attendance_type", "정상"),
+            record.get("remarks", ""),
+        )
+
+
+def frame_to_rows(df):
+    """전처리된 근태 DataFrame 을 스테이징 행으로 변환 (행별 딕셔너리를 만들지 않음)"""
+    remarks = df["remarks"] if "remarks" in df.columns else [""] * len(df)
+    return zip(
+        df["employee_id"].fillna("").astype(str).str.strip(),
+        df["date"],
+        df["check_in"],
+        df["check_out"],
+        df["attendance_type"],
+        remarks,
+    )
+
+
+def _drop_temp_tables(connection):
+    """스테이징/diff 임시 테이블 삭제"""
+    for table in (STAGING_TABLE, DIFF_TABLE, MISSING_TABLE):
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS temp.{table}")
+
+
+def _require_unique_index(connection):
+    """ON CONFLICT (employee_id, date) 에 필요한 고유 인덱스 확인
+
+    Raises:
+        RuntimeError: 고유 인덱스가 없는 경우
+    """
+    indexes = connection.exec_driver_sql("PRAGMA index_list(attendance)").all()
+    if not any(
+        name == ATTENDANCE_UNIQUE_INDEX and unique for _, name, unique, *_ in indexes
+    ):
+        raise RuntimeError(
+            f"근태 고유 인덱스 {ATTENDANCE_UNIQUE_INDEX} 가 없어 근태를 반영할 수 "
+            "없습니다. (직원, 날짜) 중복 기록을 정리하세요: "
+            "python scripts/migrate_add_indexes.py --dedupe"
+        )
+
+
+def _stage(connection, rows, chunk_size):
+    """스테이징 테이블 생성 후 적재 (직원+날짜 중복 시 마지막 행 사용)
+
+    Returns:
+        tuple: (적재 행 수, 형식 오류로 제외한 행 수)
+    """
+    _drop_temp_tables(connection)
+    connection.exec_driver_sql(
+        f"CREATE TEMP TABLE {STAGING_TABLE} ("
+        "employee_id VARCHAR(10) NOT NULL, date DATE NOT NULL, "
+        "check_in VARCHAR(19), check_out VARCHAR(19), "
+        "attendance_type VARCHAR(20) NOT NULL, remarks TEXT, row_hash BIGINT, "
+        "PRIMARY KEY (employee_id, date)) WITHOUT ROWID"
+    )
+    sql = f"INSERT OR REPLACE INTO {STAGING_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+    staged = skipped = 0
+    chunk = []
+    for employee_id, day, check_in, check_out, attendance_type, remarks in rows:
+        day = _parse_date(day) if employee_id and day else None
+        if day is None:
+            skipped += 1
+            continue
+        chunk.append(
+            (
+                str(employee_id),
+                day,
+                check_in,
+                check_out,
+                attendance_type,
+                remarks,
+                attendance_row_hash(check_in, check_out, attendance_type, remarks),
+            )
+        )
+        if len(chunk) >= chunk_size:
+            connection.exec_driver_sql(sql, chunk)
+            staged += len(chunk)
+            chunk = []
+    if chunk:
+        connection.exec_driver_sql(sql, chunk)
+        staged += len(chunk)
+    return staged, skipped
+
+
+def upsert_attendance(
+    session,
+    rows,
+    delete_missing=False,
+    changed_by=SYNC_USER,
+    chunk_size=STAGING_CHUNK_SIZE,
+):
+    """
+    근태 기록 일괄 UPSERT (커밋은 호출자가 수행)
+
+    Args:
+        session: SQLAlchemy 세션
+        rows (iterable): (employee_id, date, check_in, check_out, attendance_type, remarks)
+            튜플. records_to_rows / frame_to_rows 로 만듭니다.
+        delete_missing (bool): 입력에 없는 DB 근태 기록 삭제 여부 (CSV 전체 동기화)
+        changed_by (str): 감사 이력 변경자
+        chunk_size (int): 스테이징 executemany 단위
+
+    Returns:
+        dict: staged, skipped, inserted, updated, deleted, unchanged 건수와
+              changes(변경된 (employee_id, date) 집합)
+    """
+    connection = session.connection()
+    _require_unique_index(connection)
+    changed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+    # 해시가 없는 기존 기록은 먼저 채워야 변경 없는 행이 변경으로 잡히지 않음
+    backfill_row_hashes(session)
+    staged, skipped = _stage(connection, rows, chunk_size)
+
+    # 신규/변경 행과 기존 값 (근태 테이블은 여기서 한 번만 조인)
+    old_columns = ", ".join(f"a.{field} AS old_{field}" for field in CONTENT_FIELDS)
+    connection.exec_driver_sql(
+        f"CREATE TEMP TABLE {DIFF_TABLE} AS SELECT s.*, a.id IS NULL AS is_new, "
+        f"{old_columns} FROM {STAGING_TABLE} s LEFT JOIN attendance a ON {_JOIN} "
+        "WHERE a.id IS NULL OR a.row_hash IS NOT s.row_hash"
+    )
+    changed_rows = connection.exec_driver_sql(
+        f"SELECT employee_id, date, is_new FROM {DIFF_TABLE}"
+    ).all()
+    inserted = sum(1 for _, _, is_new in changed_rows if is_new)
+    changes = {
+        (employee_id, date.fromisoformat(day)) for employee_id, day, _ in changed_rows
+    }
+
+    if changed_rows:
+        # 필드별 변경 이력과 생성 이력
+        for field in CONTENT_FIELDS:
+            connection.exec_driver_sql(
+                _AUDIT_INSERT
+                + f"SELECT employee_id, date, ?, old_{field}, {field}, 'update', ?, ? "
+                f"FROM {DIFF_TABLE} WHERE NOT is_new AND old_{field} IS NOT {field}",
+                (field, changed_by, changed_at),
+            )
+        connection.exec_driver_sql(
+            _AUDIT_INSERT
+            + "SELECT employee_id, date, '*', '', '새 근태 기록 생성', 'create', ?, ? "
+            f"FROM {DIFF_TABLE} WHERE is_new",
+            (changed_by, changed_at),
+        )
+
+        # 신규/변경 행만 반영
+        connection.exec_driver_sql(
+            "INSERT INTO attendance (employee_id, date, check_in, check_out, "
+            "attendance_type, remarks, row_hash, created_at, updated_at) "
+            "SELECT employee_id, date, check_in, check_out, attendance_type, remarks, "
+            f"row_hash, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP FROM {DIFF_TABLE} "
+            "WHERE true ON CONFLICT (employee_id, date) DO UPDATE SET "
+            + ", ".join(f"{field} = excluded.{field}" for field in CONTENT_FIELDS)
+            + ", row_hash = excluded.row_hash, updated_at = excluded.updated_at"
+        )
+
+    # 입력에 없는 기록 삭제 (입력이 비어 있으면 전체 삭제를 막기 위해 건너뜀)
+    deleted = 0
+    if delete_missing and staged:
+        connection.exec_driver_sql(
+            f"CREATE TEMP TABLE {MISSING_TABLE} AS "
+            "SELECT a.id, a.employee_id, a.date FROM attendance a WHERE NOT EXISTS "
+            f"(SELECT 1 FROM {STAGING_TABLE} s WHERE {_JOIN})"
+        )
+        deleted_rows = connection.exec_driver_sql(
+            f"SELECT employee_id, date FROM {MISSING_TABLE}"
+        ).all()
+        if deleted_rows:
+            connection.exec_driver_sql(
+                _AUDIT_INSERT
+                + "SELECT employee_id, date, '*', '', '근태 기록 삭제', 'delete', ?, ? "
+                f"FROM {MISSING_TABLE}",
+                (changed_by, changed_at),
+            )
+            connection.exec_driver_sql(
+                f"DELETE FROM attendance WHERE id IN (SELECT id FROM {MISSING_TABLE})"
+            )
+            deleted = len(deleted_rows)
+            changes.update(
+                (employee_id, date.fromisoformat(str(day)))
+                for employee_id, day in deleted_rows
+            )
+
+    # 임시 테이블 정리 (오류 시에는 호출자의 롤백으로 함께 취소됨)
+    _drop_temp_tables(connection)
+
+    return {
+        "staged": staged,
+        "skipped": skipped,
+        "inserted": inserted,
+        "updated": len(changed_rows) - inserted,
+        "deleted": deleted,
+        "unchanged": staged - len(changed_rows),
+        "changes": changes,
+    }
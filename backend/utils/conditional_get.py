@@ -0,0 +1,117 @@
+"""
+조건부 GET 모듈 (ETag / Last-Modified, 304 Not Modified)
+
+프론트엔드가 주기적으로 호출하는 조회 API 에 데코레이터로 적용합니다.
+
+    @app.route("/api/attendance", methods=["GET"])
+    @conditional_get("attendance", files=(ATTENDANCE_CSV,))
+    def get_attendance(): ...
+
+- ETag: 응답이 의존하는 테이블의 데이터 버전(utils/data_versions.py)과 폴백 파일의
+  stat 으로 만든 약한 ETag. 행을 조회하지 않고 계산합니다. 데이터 버전에는 다른
+  프로세스의 DB 쓰기(DB 파일 stat 변경)도 포함되므로, 스크립트나 다른 서버 작업자가
+  바꾼 데이터에 304 를 돌려주지 않습니다.
+- 요청 경로+쿼리 문자열(request.full_path)과 variant(요청 헤더로 고른 응답 형식)도
+  ETag 에 넣으므로, 조회 조건이나 형식이 다른 응답은 ETag 가 다릅니다. vary 에 지정한
+  요청 헤더는 Vary 응답 헤더로 알립니다.
+- If-None-Match 가 일치하면 뷰를 실행하지 않고 304 를 반환합니다.
+  If-None-Match 가 없을 때만 If-Modified-Since 를 사용합니다.
+- ETag 는 뷰 실행(조회) 전에 계산하므로, 조회 중에 바뀐 데이터는 다음 요청에서
+  다른 ETag 가 됩니다.
+- Last-Modified 는 초 단위라 같은 초 안의 두 변경을 구분하지 못하므로, 마지막 변경
+  후 1초가 지난 경우에만 보냅니다.
+- Cache-Control: no-cache 로 브라우저가 매번 다시 검증하게 합니다.
+- 200 이외의 응답(오류)과 GET/HEAD 이외의 요청에는 적용하지 않습니다.
+"""
+
+import time
+import zlib
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, request
+
+from utils.data_versions import data_versions
+from utils.file_fingerprint import stat_key
+
+# Last-Modified 를 보내기 위한 마지막 변경 후 최소 경과 시간 (초)
+LAST_MODIFIED_SETTLE_SECONDS = 1
+
+
+def validators(tables, files=()):
+    """
+    테이블/파일 상태로 (ETag 값, 마지막 변경 시각) 계산
+
+    Returns:
+        tuple: (ETag 문자열(따옴표 제외), 마지막 변경 epoch 초)
+    """
+    tag = data_versions.token(*tables)
+    changed_at = data_versions.changed_at(*tables)
+    if files:
+        keys = [stat_key(path) for path in files]
+        tag = f"{tag}-{zlib.crc32(repr(keys).encode()):08x}"
+        changed_at = max(
+            [changed_at] + [key[1] / 1e9 for key in keys if key is not None]
+        )
+    return tag, changed_at
+
+
+def request_tag(variant=None):
+    """요청 경로+쿼리 문자열과 응답 형식으로 만든 ETag 구분값"""
+    key = request.full_path
+    if variant is not None:
+        key = f"{key}|{variant()}"
+    return f"{zlib.crc32(key.encode()):08x}"
+
+
+def conditional_get(*tables, files=(), variant=None, vary=()):
+    """
+    조회 뷰에 ETag / Last-Modified 검증을 적용하는 데코레이터
+
+    Args:
+        tables: 응답이 의존하는 테이블 이름
+        files (tuple): 응답이 의존하는 파일 경로 (CSV 폴백 등)
+        variant (callable): 현재 요청이 고른 응답 형식을 반환하는 함수 (ETag 에 포함)
+        vary (tuple): 응답 형식을 고르는 요청 헤더 이름 (Vary 응답 헤더)
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(*args, **kwargs)
+
+            tag, changed_at = validators(tables, files)
+            tag = f"{tag}-{request_tag(variant)}"
+            last_modified = None
+            if time.time() - changed_at >= LAST_MODIFIED_SETTLE_SECONDS:
+                last_modified = datetime.fromtimestamp(int(changed_at), timezone.utc)
+
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(tag)
+            else:
+                since = request.if_modified_since
+                not_modified = (
+                    since is not None
+                    and last_modified is not None
+                    and last_modified <= since
+                )
+
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(tag, weak=True)
+            for header in vary:
+                response.vary.add(header)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,173 @@
+"""
+테이블별 데이터 버전 카운터 모듈
+
+테이블에 쓰기가 있을 때마다 버전을 올려, 응답 캐시 검증(ETag)이나 메모리 캐시 무효화가
+행을 다시 읽지 않고 "마지막으로 본 뒤 바뀌었는지" 판단할 수 있게 합니다.
+
+- 엔진의 after_cursor_execute 이벤트에서 실행된 SQL 이 INSERT / UPDATE / DELETE /
+  REPLACE 인지 보고 대상 테이블의 버전을 올립니다. ORM flush, Core 문, exec_driver_sql
+  로 실행한 원시 SQL(근태 upsert 등)이 모두 같은 경로로 감지됩니다. 바뀐 행이 없는
+  쓰기는 버전을 올리지 않습니다.
+- 쓰기 직후와 연결이 풀로 반환될 때(커밋/롤백 이후) 두 번 올립니다. 커밋 전에 다른
+  스레드가 읽은 값으로 만든 버전은 커밋 후의 버전과 항상 다릅니다.
+- 버전은 프로세스 안에서만 유지됩니다. 프로세스마다 다른 BOOT_ID 를 함께 쓰면
+  서버를 다시 시작한 뒤 같은 번호가 다른 데이터를 가리키지 않습니다.
+- 다른 프로세스(마이그레이션 스크립트, 다른 서버 작업자 등)의 쓰기는 이 프로세스가
+  연결한 SQLite 파일과 -wal 파일의 stat 으로 감지합니다. 자기 쓰기가 끝난 뒤의 stat 을
+  기준으로 기록해 두고, 조회 시 stat 이 기준과 다르면 외부 버전(external)을 올립니다.
+  외부 쓰기는 어느 테이블인지 알 수 없으므로 모든 테이블의 버전 문자열이 바뀝니다.
+  자기 트랜잭션의 커밋과 연결 반환 사이(수 μs)에 끝난 다른 프로세스의 커밋만은
+  자기 쓰기와 구분하지 못하며, 다른 프로세스의 다음 쓰기 때 함께 반영됩니다.
+"""
+
+import re
+import threading
+import time
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+from utils.file_fingerprint import stat_key
+
+# 프로세스 식별자 (버전 번호와 함께 사용)
+BOOT_ID = uuid.uuid4().hex[:8]
+
+# 쓰기 SQL 의 대상 테이블 (스키마 접두어와 따옴표 제외)
+_WRITE_SQL = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?"
+    r"|DELETE\s+FROM)\s+(?:[\"`\[]?\w+[\"`\]]?\.)?[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+
+_RETURNING = re.compile(r"\bRETURNING\b", re.IGNORECASE)
+
+# 연결에 기록해 두는 쓰기 테이블 (풀 반환 시 버전 증가)
+_PENDING_KEY = "data_versions_pending"
+
+
+def written_table(statement):
+    """SQL 문이 쓰기이면 대상 테이블 이름, 아니면 None"""
+    match = _WRITE_SQL.match(statement)
+    return match.group(1).lower() if match else None
+
+
+class DataVersions:
+    """테이블별 버전 카운터와 마지막 변경 시각"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._changed_at = {}
+        self.started_at = time.time()
+        # 감시 중인 SQLite 파일과 마지막으로 확인한 stat, 외부 쓰기 감지 횟수
+        self._databases = ()
+        self._seen = ()
+        self._external = 0
+        self._external_changed_at = self.started_at
+
+    def watch_database(self, path):
+        """다른 프로세스의 쓰기를 감지할 SQLite 파일 등록 (현재 상태를 기준으로 함)"""
+        if path in self._databases:
+            return
+        with self._lock:
+            if path not in self._databases:
+                self._databases = tuple(sorted(self._databases + (path,)))
+                self._seen = self._database_key()
+
+    def _database_key(self):
+        """감시 중인 DB 파일과 -wal 파일의 stat"""
+        return tuple(
+            stat_key(path)
+            for database in self._databases
+            for path in (database, f"{database}-wal")
+        )
+
+    def external(self):
+        """
+        외부 쓰기 버전 (다른 프로세스의 쓰기가 감지될 때마다 증가)
+
+        DB 파일 stat 이 마지막 자기 쓰기(또는 마지막 확인) 이후 바뀌었으면 증가합니다.
+        자기 쓰기가 진행 중일 때 호출되면 그 쓰기도 외부 쓰기로 셀 수 있습니다
+        (필요 이상으로 무효화될 뿐 오래된 데이터를 돌려주지는 않음).
+        """
+        key = self._database_key()
+        if key != self._seen:
+            with self._lock:
+                if key != self._seen:
+                    self._seen = key
+                    self._external += 1
+                    self._external_changed_at = time.time()
+        return self._external
+
+    def own_write_done(self):
+        """자기 쓰기 완료 후 DB 파일 stat 을 새 기준으로 기록 (외부 쓰기로 세지 않음)"""
+        key = self._database_key()
+        with self._lock:
+            self._seen = key
+
+    def get(self, table):
+        """테이블 버전 (프로세스 시작 후 변경이 없으면 0)"""
+        return self._versions.get(table, 0)
+
+    def changed_at(self, *tables):
+        """테이블들의 마지막 변경 시각 (외부 쓰기 포함, 변경이 없으면 프로세스 시작 시각)"""
+        return max(
+            [self._external_changed_at]
+            + [self._changed_at.get(table, self.started_at) for table in tables]
+        )
+
+    def bump(self, *tables):
+        """테이블 버전 증가"""
+        now = time.time()
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                self._changed_at[table] = now
+
+    def token(self, *tables):
+        """BOOT_ID, 외부 쓰기 버전, 테이블 버전을 이은 문자열 (예: 1a2b3c4d-0-12.3)"""
+        external = self.external()
+        versions = ".".join(str(self.get(table)) for table in tables)
+        return f"{BOOT_ID}-{external}-{versions}"
+
+
+# 프로세스 전체에서 공유하는 버전 카운터
+data_versions = DataVersions()
+
+
+@event.listens_for(Engine, "engine_connect")
+def _on_engine_connect(conn):
+    # 파일 기반 SQLite 만 감시 (메모리 DB 는 다른 프로세스와 공유되지 않음)
+    url = conn.engine.url
+    if url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    ):
+        data_versions.watch_database(url.database)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _on_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    table = written_table(statement)
+    # 바뀐 행이 없는 쓰기(변경 없는 동기화 등)는 무시, 알 수 없으면(-1) 변경으로 봄.
+    # RETURNING 문은 결과를 읽기 전까지 rowcount 가 0 이므로 변경으로 봄
+    if table and (cursor.rowcount != 0 or _RETURNING.search(statement)):
+        pending = conn.info.setdefault(_PENDING_KEY, set())
+        if not pending:
+            # 이 트랜잭션이 쓰기 잠금을 잡은 뒤이므로, 그 전의 다른 프로세스 쓰기는
+            # 지금 확인해 두어야 자기 쓰기 완료 시점의 기준에 묻히지 않음
+            data_versions.external()
+        data_versions.bump(table)
+        pending.add(table)
+
+
+@event.listens_for(Pool, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    # 커밋(또는 롤백)이 끝난 뒤 한 번 더 올리고, DB 파일 stat 기준 갱신
+    tables = connection_record.info.pop(_PENDING_KEY, None)
+    if tables:
+        data_versions.bump(*tables)
+        data_versions.own_write_done()
@@ -0,0 +1,218 @@
+"""
+직원 기준 정보 캐시 모듈
+
+직원 목록(/api/employees), 급여 계산, 인사 조회가 요청마다 employees 테이블이나
+employees.csv 를 다시 읽지 않도록, 한 번 읽은 직원 정보를 변경 불가능한 스냅샷으로
+보관하고 모든 조회가 같은 스냅샷을 공유합니다.
+
+- EmployeeSnapshot: 직원 레코드(EmployeeRecord) 튜플과 employee_id / 부서 / 직급 색인
+- EmployeeCache: employees 테이블 데이터 버전(utils/data_versions.py)으로 스냅샷을
+  무효화하는 캐시
+  - employees 테이블 쓰기: ORM/Core/원시 SQL 모두 데이터 버전 증가로 감지
+  - 다른 프로세스(migrate_csv_to_db.py, db_update.py, 다른 서버 작업자 등)의 쓰기:
+    DB 파일 stat 변경(외부 쓰기 버전)으로 감지
+  - employees.csv: 파일 stat 이 바뀌면 버전 증가
+- 스냅샷을 읽기 시작할 때의 버전을 기록하므로, 읽는 도중 쓰기가 있었으면 다음
+  조회 때 다시 읽습니다.
+"""
+
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+import pandas as pd
+from sqlalchemy import select
+
+from models.models import Employee
+from utils.data_versions import data_versions
+from utils.file_fingerprint import stat_key
+
+EMPLOYEE_TABLE = Employee.__table__
+
+# employees 테이블 컬럼 순서의 직원 레코드 (Employee 모델과 같은 속성 이름)
+EMPLOYEE_FIELDS = tuple(column.name for column in EMPLOYEE_TABLE.columns)
+EmployeeRecord = namedtuple("EmployeeRecord", EMPLOYEE_FIELDS)
+
+# employees.csv 에서 날짜로 변환하는 컬럼
+CSV_DATE_COLUMNS = ("join_date", "birth", "resignation_date")
+
+
+def _csv_value(value):
+    """데이터프레임 값 → 레코드 값 (NaN/NaT 는 None, Timestamp 는 date)"""
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    return value.item() if hasattr(value, "item") else value
+
+
+class EmployeeSnapshot:
+    """직원 정보 스냅샷 (변경 불가)"""
+
+    def __init__(self, version, records, frame=None, source_key=None):
+        """
+        Args:
+            version (tuple): 스냅샷을 읽기 시작할 때의 캐시 버전
+            records (iterable): EmployeeRecord 목록 (원본 순서)
+            frame (DataFrame): CSV 스냅샷의 원본 데이터프레임
+            source_key (tuple): CSV 파일 stat (변경 확인용)
+        """
+        self.version = version
+        self.source_key = source_key
+        self.records = tuple(records)
+        self._frame = frame
+
+        by_id, by_department, by_position = {}, {}, {}
+        for index, record in enumerate(self.records):
+            # 같은 ID 가 여러 번 있으면 처음 행 (CSV 조회와 같은 결과)
+            by_id.setdefault(record.employee_id, index)
+            by_department.setdefault(record.department, []).append(index)
+            by_position.setdefault(record.position, []).append(index)
+        self._by_id = MappingProxyType(by_id)
+        self._by_department = MappingProxyType(
+            {key: tuple(value) for key, value in by_department.items()}
+        )
+        self._by_position = MappingProxyType(
+            {key: tuple(value) for key, value in by_position.items()}
+        )
+
+    def __len__(self):
+        return len(self.records)
+
+    def index_of(self, employee_id):
+        """employee_id 의 레코드 위치 (없으면 None)"""
+        return self._by_id.get(employee_id)
+
+    def get(self, employee_id):
+        """employee_id 의 직원 레코드 (없으면 None)"""
+        index = self._by_id.get(employee_id)
+        return None if index is None else self.records[index]
+
+    def positions(self, department=None, position=None):
+        """
+        부서/직급 조건에 맞는 레코드 위치 (원본 순서)
+
+        조건이 없으면 전체 위치를 돌려줍니다.
+        """
+        selected = None
+        for index, key in (
+            (self._by_department, department),
+            (self._by_position, position),
+        ):
+            if key is None:
+                continue
+            matches = index.get(key, ())
+            if selected is None:
+                selected = matches
+            else:
+                matched = set(matches)
+                selected = tuple(i for i in selected if i in matched)
+        return tuple(range(len(self.records))) if selected is None else selected
+
+    def filter(self, department=None, position=None, status=None):
+        """부서/직급/상태 조건에 맞는 직원 레코드 목록"""
+        return [
+            self.records[i]
+            for i in self.positions(department, position)
+            if status is None or self.records[i].status == status
+        ]
+
+    def frame(self, positions=None):
+        """
+        데이터프레임 사본 (호출자가 수정해도 스냅샷은 그대로)
+
+        Args:
+            positions (tuple): 지정하면 해당 위치의 행만
+        """
+        if self._frame is None:
+            frame = pd.DataFrame(self.records, columns=list(EMPLOYEE_FIELDS))
+        else:
+            frame = self._frame
+        if positions is not None:
+            return frame.iloc[list(positions)].copy()
+        return frame.copy()
+
+
+class EmployeeCache:
+    """employees 데이터 버전으로 무효화하는 직원 정보 캐시"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._database = None
+        self._csv = {}
+
+    @property
+    def version(self):
+        """현재 캐시 버전 (외부 쓰기 버전, employees 테이블 버전)"""
+        return (data_versions.external(), data_versions.get(EMPLOYEE_TABLE.name))
+
+    def invalidate(self):
+        """버전을 올려 모든 스냅샷을 무효화"""
+        data_versions.bump(EMPLOYEE_TABLE.name)
+
+    def database(self, session):
+        """
+        employees 테이블 스냅샷
+
+        Args:
+            session: 조회에 사용할 세션 (캐시가 유효하면 조회하지 않음)
+        """
+        snapshot = self._database
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+
+        version = self.version
+        rows = session.execute(select(*EMPLOYEE_TABLE.columns)).all()
+        snapshot = EmployeeSnapshot(version, (EmployeeRecord._make(r) for r in rows))
+        with self._lock:
+            if self.version == version:
+                self._database = snapshot
+        return snapshot
+
+    def csv(self, path):
+        """
+        employees.csv 스냅샷
+
+        파일 stat 이 마지막으로 읽었을 때와 다르면 버전을 올리고 다시 읽습니다.
+        날짜 컬럼(입사일/생년월일/퇴사일)은 datetime 으로 변환해 둡니다.
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        key = stat_key(path)
+        if key is None:
+            raise FileNotFoundError(path)
+        snapshot = self._csv.get(path)
+        if snapshot is not None and snapshot.source_key != key:
+            self.invalidate()
+        if (
+            snapshot is not None
+            and snapshot.version == self.version
+            and snapshot.source_key == key
+        ):
+            return snapshot
+
+        version = self.version
+        frame = pd.read_csv(path, dtype={"employee_id": str}, on_bad_lines="warn")
+        for column in CSV_DATE_COLUMNS:
+            if column in frame.columns:
+                frame[column] = pd.to_datetime(frame[column])
+        records = (
+            EmployeeRecord._make(
+                _csv_value(row.get(column)) for column in EMPLOYEE_FIELDS
+            )
+            for row in frame.to_dict("records")
+        )
+        # 읽는 동안 파일이 바뀌었으면 다음 조회 때 다시 읽음
+        after = stat_key(path)
+        snapshot = EmployeeSnapshot(
+            version, records, frame, key if after == key else None
+        )
+        with self._lock:
+            if self.version == version:
+                self._csv[path] = snapshot
+        return snapshot
+
+
+# 프로세스 전체에서 공유하는 캐시
+employee_cache = EmployeeCache()
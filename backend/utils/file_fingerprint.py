@@ -0,0 +1,140 @@
+"""
+파일 지문(fingerprint) 모듈
+
+근태 CSV 변경 여부를 자주 확인하므로, 매번 파일 전체를 읽어 해시하지 않도록
+1. stat 정보(크기, mtime_ns, inode)가 이전과 같으면 캐시된 지문을 그대로 반환하고
+2. stat 정보가 바뀐 경우에만 고정 크기 청크로 읽으며 비암호화 해시를 계산합니다.
+
+xxhash 패키지가 설치되어 있으면 xxh3_64 를, 없으면 표준 라이브러리 zlib.crc32 를
+사용합니다. 지문에는 파일 크기가 함께 포함되므로 변경 감지 용도로 충분합니다.
+
+mtime 해상도가 낮은 파일 시스템에서는 해시 직후 같은 시각에 다시 쓰인 파일의
+stat 이 바뀌지 않을 수 있으므로, 해시 시점과 mtime 이 가까운 결과(racy)는
+캐시를 신뢰하지 않고 다음 확인 때 다시 해시합니다.
+"""
+
+import os
+import threading
+import time
+import zlib
+
+try:
+    import xxhash
+except ImportError:  # 선택 의존성
+    xxhash = None
+
+# 해시 읽기 단위 (1MB)
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+
+# 해시 시점과 mtime 차이가 이 값 이하이면 캐시를 신뢰하지 않음 (나노초)
+RACY_WINDOW_NS = 2_000_000_000
+
+HASH_ALGORITHM = "xxh3_64" if xxhash is not None else "crc32"
+
+
+def stat_key(path):
+    """파일 stat 기반 빠른 비교 키 (size, mtime_ns, inode), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class _Crc32Hasher:
+    """zlib.crc32 를 hashlib 과 같은 update/hexdigest 인터페이스로 감싼 해시 객체"""
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        self._crc = zlib.crc32(data, self._crc)
+
+    def hexdigest(self):
+        return f"{self._crc:08x}"
+
+
+def new_hasher():
+    """점진적 해시 객체 생성 (xxh3_64, 없으면 crc32)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return _Crc32Hasher()
+
+
+def hash_file(path, chunk_size=FINGERPRINT_CHUNK_SIZE):
+    """파일 내용을 청크 단위로 읽어 16진수 해시 문자열 반환"""
+    hasher = new_hasher()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class FileFingerprinter:
+    """파일 지문 계산기 (stat 빠른 경로 + 청크 해시 + 결과 캐시, 스레드 안전)"""
+
+    def __init__(self, path, chunk_size=FINGERPRINT_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._key = None
+        self._racy = True
+        self._fingerprint = None
+        self.stats = {"stat_hits": 0, "hashes": 0, "bytes_hashed": 0}
+
+    def fingerprint(self):
+        """
+        현재 파일 지문 반환 (stat 이 바뀌지 않았으면 파일을 읽지 않음)
+
+        Returns:
+            dict: exists, size, mtime_ns, inode, digest(파일이 없으면 ''), algorithm
+        """
+        with self._lock:
+            key = stat_key(self.path)
+            if self._fingerprint is not None and key == self._key and not self._racy:
+                self.stats["stat_hits"] += 1
+                return self._fingerprint
+
+            if key is None:
+                fingerprint = self._build(None, "")
+            else:
+                try:
+                    digest = hash_file(self.path, self.chunk_size)
+                except FileNotFoundError:
+                    key, digest = None, ""
+                self.stats["hashes"] += 1
+                # 읽는 동안 파일이 바뀌었으면 다음 확인 때 다시 해시
+                after = stat_key(self.path)
+                if key is not None:
+                    self.stats["bytes_hashed"] += key[0]
+                fingerprint = self._build(key, digest)
+                if after != key:
+                    key = None
+
+            self._key = key
+            self._racy = key is None or time.time_ns() - key[1] <= RACY_WINDOW_NS
+            self._fingerprint = fingerprint
+            return fingerprint
+
+    def digest(self):
+        """현재 파일 내용 해시 (파일이 없으면 빈 문자열)"""
+        return self.fingerprint()["digest"]
+
+    def invalidate(self):
+        """캐시된 지문 폐기 (다음 확인 때 다시 해시)"""
+        with self._lock:
+            self._key = None
+            self._fingerprint = None
+
+    @staticmethod
+    def _build(key, digest):
+        """지문 딕셔너리 생성"""
+        size, mtime_ns, inode = key if key is not None else (0, 0, 0)
+        return {
+            "exists": key is not None,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "inode": inode,
+            "digest": digest,
+            "algorithm": HASH_ALGORITHM,
+        }
@@ -0,0 +1,109 @@
+"""
+휴일 달력 모듈
+
+공휴일(holidays.KR), 주말, 회사 지정 휴무일을 하나의 비트 배열로 미리 계산해 두고
+날짜 서수(date.toordinal()) 기준으로 휴일 여부를 O(1)에 조회합니다.
+NumPy 배열을 이용한 일괄 조회도 지원하며, 프로세스 전체에서 하나의 달력을 공유합니다.
+"""
+
+import threading
+from datetime import date
+
+import holidays
+import numpy as np
+
+from config import Config
+
+
+class HolidayCalendar:
+    """공휴일 + 주말 + 회사 지정 휴무일 비트 배열 달력"""
+
+    def __init__(self, start_year, end_year, closure_days=()):
+        """
+        Args:
+            start_year (int): 달력 시작 연도
+            end_year (int): 달력 종료 연도 (포함)
+            closure_days (iterable): 회사 지정 휴무일 (date 또는 'YYYY-MM-DD')
+        """
+        self.closure_days = frozenset(
+            day if isinstance(day, date) else date.fromisoformat(day)
+            for day in closure_days
+        )
+        self._lock = threading.Lock()
+        self._build(start_year, end_year)
+
+    def _build(self, start_year, end_year):
+        """연도 범위의 비트 배열 생성"""
+        first = date(start_year, 1, 1).toordinal()
+        last = date(end_year, 12, 31).toordinal()
+        ordinals = np.arange(first, last + 1, dtype=np.int64)
+
+        # date.weekday(): 서수 1(0001-01-01)이 월요일
+        mask = (ordinals - 1) % 7 >= 5
+        for day in holidays.KR(years=range(start_year, end_year + 1)):
+            mask[day.toordinal() - first] = True
+        for day in self.closure_days:
+            if first <= day.toordinal() <= last:
+                mask[day.toordinal() - first] = True
+
+        packed = np.packbits(mask)
+        # 조회 중인 스레드가 항상 일관된 상태를 보도록 한 번에 교체
+        self._state = (first, last, packed.tobytes(), packed)
+        self.start_year = start_year
+        self.end_year = end_year
+
+    def _ensure_range(self, min_ordinal, max_ordinal):
+        """조회 범위가 달력 밖이면 연도 범위를 넓혀 다시 생성"""
+        first, last, _, _ = self._state
+        if first <= min_ordinal and max_ordinal <= last:
+            return
+        with self._lock:
+            first, last, _, _ = self._state
+            if first <= min_ordinal and max_ordinal <= last:
+                return
+            self._build(
+                min(self.start_year, date.fromordinal(min_ordinal).year),
+                max(self.end_year, date.fromordinal(max_ordinal).year),
+            )
+
+    def is_holiday(self, ordinal):
+        """날짜 서수의 휴일(공휴일/주말/휴무일) 여부"""
+        first, last, bits, _ = self._state
+        if not first <= ordinal <= last:
+            self._ensure_range(ordinal, ordinal)
+            first, last, bits, _ = self._state
+        index = ordinal - first
+        return bool(bits[index >> 3] & (0x80 >> (index & 7)))
+
+    def is_holiday_date(self, date_obj):
+        """date 객체의 휴일 여부"""
+        return self.is_holiday(date_obj.toordinal())
+
+    def holiday_mask(self, ordinals):
+        """날짜 서수 배열의 휴일 여부 (bool 배열, 입력과 같은 모양)"""
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        if ordinals.size == 0:
+            return np.zeros(ordinals.shape, dtype=bool)
+
+        self._ensure_range(int(ordinals.min()), int(ordinals.max()))
+        first, _, _, packed = self._state
+        index = ordinals - first
+        return (packed[index >> 3] & (0x80 >> (index & 7))).astype(bool)
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar():
+    """프로세스 공용 휴일 달력 반환 (최초 호출 시 Config 설정으로 생성)"""
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = HolidayCalendar(
+                    Config.HOLIDAY_CALENDAR_START_YEAR,
+                    Config.HOLIDAY_CALENDAR_END_YEAR,
+                    Config.COMPANY_CLOSURE_DAYS,
+                )
+    return _calendar
@@ -1,29 +1,59 @@
-import json
-import os
+import numpy as np
 
-# tax_table_2024.json 파일 읽기
-with open(
-    os.path.join(os.path.dirname(__file__), "../data/tax_table_2024.json"),
-    "r",
-    encoding="utf-8",
-) as f:
-    tax_data = json.load(f)
-    tax_brackets = tax_data["tax_brackets"]
-    high_income_brackets = tax_data.get("high_income_brackets", {})
+from utils.tax_table import get_tax_table
+
+# 식대 비과세 한도
+TAX_FREE_MEAL_ALLOWANCE = 200000
+
+# 공제 항목 (Payroll 컬럼명 기준)
+DEDUCTION_COLUMNS = (
+    "national_pension",
+    "health_insurance",
+    "long_term_care",
+    "employment_insurance",
+    "income_tax",
+    "residence_tax",
+    "total_deductions",
+    "net_pay",
+)
+
+
+def _as_amount_array(values):
+    """금액 배열 변환 (정수는 int64, 그 외는 float64 로 유지)"""
+    values = np.asarray(values)
+    if values.dtype.kind in "iub":
+        return values.astype(np.int64, copy=False)
+    return values.astype(np.float64, copy=False)
+
+
+def _truncate(values):
+    """int() 와 같은 0 방향 버림 후 int64 변환"""
+    return np.trunc(values).astype(np.int64)
 
 
 class InsuranceCalculator:
-    def __init__(self):
+    def __init__(self, rates=None, pension_limits=None):
+        """
+        Args:
+            rates (dict): 기본 보험 요율 대신 사용할 요율 (키는 RATES 와 동일)
+            pension_limits (dict): 기본 국민연금 상한/하한 대신 사용할 값 (MIN, MAX)
+        """
+        # 간이세액표 (프로세스 공용, 최초 1회만 로드)
+        self.tax_table = get_tax_table()
         self.RATES = {
             "NATIONAL_PENSION": 0.045,  # 국민연금: 4.5%
             "HEALTH_INSURANCE": 0.03545,  # 건강보험: 3.545%
             "LONG_TERM_CARE": 0.1295,  # 장기요양: 건강보험의 12.95%
             "EMPLOYMENT_INSURANCE": 0.009,  # 고용보험: 0.9%
         }
+        if rates:
+            self.RATES.update(rates)
         self.NATIONAL_PENSION_LIMITS = {
             "MIN": 390000,
             "MAX": 6170000,
         }  # 국민연금 상한/하한
+        if pension_limits:
+            self.NATIONAL_PENSION_LIMITS.update(pension_limits)
 
     def calculate_insurances(self, gross_salary):
         """4대 보험 공제 계산"""
@@ -45,6 +75,119 @@ class InsuranceCalculator:
         local_income_tax = income_tax // 10  # 지방소득세는 소득세의 10%
         return {"incomeTax": income_tax, "localIncomeTax": local_income_tax}
 
+    def calculate_deductions(self, gross_salary, dependents):
+        """
+        공제 항목 전체 계산 (4대 보험은 한 번만 계산하여 과세 소득에 재사용)
+
+        Returns:
+            dict: DEDUCTION_COLUMNS 항목별 금액
+        """
+        national_pension = self.calculate_national_pension(gross_salary)
+        health_insurance = self.calculate_health_insurance(gross_salary)
+        long_term_care = self.calculate_long_term_care(health_insurance)
+        employment_insurance = self.calculate_employment_insurance(gross_salary)
+
+        taxable_income = max(
+            0,
+            gross_salary
+            - TAX_FREE_MEAL_ALLOWANCE
+            - (national_pension + health_insurance + employment_insurance),
+        )
+        income_tax = self._lookup_tax_table(taxable_income, dependents)
+        residence_tax = income_tax // 10  # 지방소득세는 소득세의 10%
+
+        total_deductions = (
+            income_tax
+            + residence_tax
+            + national_pension
+            + health_insurance
+            + long_term_care
+            + employment_insurance
+        )
+        return {
+            "national_pension": national_pension,
+            "health_insurance": health_insurance,
+            "long_term_care": long_term_care,
+            "employment_insurance": employment_insurance,
+            "income_tax": income_tax,
+            "residence_tax": residence_tax,
+            "total_deductions": total_deductions,
+            "net_pay": int(gross_salary - total_deductions),
+        }
+
+    def calculate_insurances_batch(self, gross_salaries):
+        """
+        4대 보험 공제 일괄 계산 (calculate_insurances 와 동일한 결과)
+
+        Args:
+            gross_salaries (array-like): 지급총액
+
+        Returns:
+            dict: national_pension, health_insurance, long_term_care,
+                  employment_insurance (int64 배열)
+        """
+        gross = _as_amount_array(gross_salaries)
+        base_income = np.maximum(
+            np.minimum(gross, self.NATIONAL_PENSION_LIMITS["MAX"]),
+            self.NATIONAL_PENSION_LIMITS["MIN"],
+        )
+        health_insurance = _truncate(gross * self.RATES["HEALTH_INSURANCE"])
+        return {
+            "national_pension": _truncate(base_income * self.RATES["NATIONAL_PENSION"]),
+            "health_insurance": health_insurance,
+            "long_term_care": _truncate(
+                health_insurance * self.RATES["LONG_TERM_CARE"] * 0.5
+            ),  # 직원 부담 50%
+            "employment_insurance": _truncate(
+                gross * self.RATES["EMPLOYMENT_INSURANCE"]
+            ),
+        }
+
+    def calculate_deductions_batch(self, gross_salaries, dependents):
+        """
+        공제 항목 전체 일괄 계산 (calculate_deductions 와 동일한 결과)
+
+        4대 보험(국민연금 상한/하한, 장기요양 포함), 식대 비과세를 반영한 과세 소득,
+        간이세액표/고소득 구간 소득세, 지방소득세, 총 공제액, 실수령액을
+        중간 결과를 다시 계산하지 않고 배열 연산으로 구합니다.
+
+        Args:
+            gross_salaries (array-like): 지급총액
+            dependents (array-like): 부양가족 수 (gross_salaries 와 같은 길이)
+
+        Returns:
+            dict: DEDUCTION_COLUMNS 항목별 int64 배열
+        """
+        gross = _as_amount_array(gross_salaries)
+        deductions = self.calculate_insurances_batch(gross)
+
+        taxable_income = np.maximum(
+            0,
+            gross
+            - TAX_FREE_MEAL_ALLOWANCE
+            - (
+                deductions["national_pension"]
+                + deductions["health_insurance"]
+                + deductions["employment_insurance"]
+            ),
+        )
+        income_tax = self.tax_table.monthly_tax_batch(taxable_income, dependents)
+        residence_tax = income_tax // 10  # 지방소득세는 소득세의 10%
+
+        total_deductions = (
+            income_tax
+            + residence_tax
+            + deductions["national_pension"]
+            + deductions["health_insurance"]
+            + deductions["long_term_care"]
+            + deductions["employment_insurance"]
+        )
+        deductions["income_tax"] = income_tax
+        deductions["residence_tax"] = residence_tax
+        deductions["total_deductions"] = total_deductions
+        deductions["net_pay"] = _truncate(gross - total_deductions)
+        return deductions
+
     def get_net_pay(self, gross_salary, dependents):
         """실수령액 계산"""
         insurances = self.calculate_insurances(gross_salary)
@@ -83,36 +226,17 @@ class InsuranceCalculator:
 
     def calculate_taxable_income(self, salary):
         """과세 소득 계산"""
-        tax_free_allowance = 200000  # 식대 비과세 한도
         total_insurances = (
             self.calculate_national_pension(salary)
             + self.calculate_health_insurance(salary)
             + self.calculate_employment_insurance(salary)
         )
-        taxable = max(0, salary - tax_free_allowance - total_insurances)
+        taxable = max(0, salary - TAX_FREE_MEAL_ALLOWANCE - total_insurances)
         return taxable
 
     def _lookup_tax_table(self, income, dependents):
         """세율 테이블 조회"""
-        if income >= 10000000:
-            for bracket, info in high_income_brackets.items():
-                min_val, max_val = map(int, bracket.split("-"))
-                if min_val <= income < max_val:
-                    base_tax = info["base_tax"].get(str(dependents), 0)
-                    rate = info["rate"]
-                    addition = info["addition"]
-                    excess_amount = income - 10000000
-                    tax = int(
-                        base_tax + (excess_amount * 0.98 * rate) + addition
-                    )  # 2% 세액공제 적용
-                    return tax
-
-        for bracket, rates in tax_brackets.items():
-            min_val, max_val = map(int, bracket.split("-"))
-            if min_val <= income < max_val:
-                tax = rates.get(str(dependents), 0)
-                return tax
-        return 0
+        return self.tax_table.monthly_tax(income, dependents)
 
 
 # 마지막 줄 제거: InsuranceCalculator = InsuranceCalculator()
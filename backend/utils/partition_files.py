@@ -0,0 +1,89 @@
+"""
+월별 조각(partition) 파일 공용 모듈
+
+근태 CSV 증분 내보내기(utils/attendance_export.py), 급여 이력 아카이브
+(utils/payroll_archive.py), 월별 급여 요약(utils/payroll_summary.py)이 함께 쓰는
+월 키 계산, 원자적 파일 교체, manifest.json 읽기/쓰기 도우미입니다.
+
+- month_key / month_range: 날짜 ↔ 월 키 'YYYY-MM'
+- atomic_write: 같은 디렉토리 임시 파일에 쓴 뒤 os.replace 로 교체하므로 읽는 쪽에서
+  쓰다 만 파일을 보지 않습니다.
+- load_manifest / save_manifest: 조각별 정보를 기록하는 JSON 파일 (없거나 손상되면
+  빈 manifest 로 시작)
+"""
+
+import json
+import os
+import tempfile
+from datetime import date, datetime
+
+
+def month_key(value):
+    """날짜(date 또는 'YYYY-MM-DD' 문자열)의 월 키 'YYYY-MM'"""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m")
+    return str(value)[:7]
+
+
+def month_range(month):
+    """월 키의 [월 첫날, 다음 달 1일) 범위"""
+    year, month_number = (int(part) for part in month.split("-"))
+    return (
+        date(year, month_number, 1),
+        date(year + month_number // 12, month_number % 12 + 1, 1),
+    )
+
+
+def atomic_write(path, write, mode="w", encoding=None):
+    """
+    같은 디렉토리 임시 파일에 write(파일 객체) 한 뒤 os.replace 로 교체
+
+    디렉토리가 없으면 만들고, 실패하면 임시 파일을 지웁니다. 텍스트 모드는
+    newline="" 로 엽니다 (csv 모듈과 같은 줄바꿈 처리).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        kwargs = {"newline": "", "encoding": encoding} if "b" not in mode else {}
+        with os.fdopen(fd, mode, **kwargs) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def load_manifest(path, *sections):
+    """
+    manifest.json 읽기
+
+    Args:
+        path (str): manifest 파일 경로
+        sections: 없으면 빈 dict 로 채울 최상위 키
+
+    Returns:
+        dict: manifest (파일이 없거나 읽을 수 없으면 빈 manifest)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    for section in sections:
+        manifest.setdefault(section, {})
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """manifest.json 을 원자적으로 교체"""
+    atomic_write(
+        path,
+        lambda f: json.dump(manifest, f, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
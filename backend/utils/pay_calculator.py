@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime, time, timedelta
 import pandas as pd
-import holidays
+
+from utils.holiday_calendar import get_calendar
 
 # 급여 지급일 설정 (매월 1일 또는 25일 등으로 설정 가능)
 PAYROLL_DAY = 1  # *** 급여 지급일 설정 (변경 시 이 값을 수정하세요) ***
@@ -45,6 +47,329 @@ def process_time_string(time_str):
     return time_str
 
 
+# 근무 구간 종류
+SEGMENT_REGULAR = "regular"  # 소정근로시간(09:00~18:00) 내 근무
+SEGMENT_EARLY_OVERTIME = "early_overtime"  # 09:00 이전 연장근로
+SEGMENT_LATE_OVERTIME = "late_overtime"  # 18:00 이후 연장근로
+SEGMENT_HOLIDAY_OVERTIME = "holiday_overtime"  # 휴일 근무일의 전체 시간 연장근로
+SEGMENT_NIGHT = "night"  # 야간근로 (22:00~06:00)
+SEGMENT_HOLIDAY_WITHIN_8H = "holiday_within_8h"  # 휴일근로 8시간 이내
+SEGMENT_HOLIDAY_OVER_8H = "holiday_over_8h"  # 휴일근로 8시간 초과
+
+OVERTIME_SEGMENT_KINDS = frozenset(
+    (SEGMENT_EARLY_OVERTIME, SEGMENT_LATE_OVERTIME, SEGMENT_HOLIDAY_OVERTIME)
+)
+
+
+@dataclass(frozen=True)
+class ShiftSegment:
+    """근무 1건을 구성하는 구간 (불변)"""
+
+    kind: str
+    start: datetime
+    end: datetime
+    hours: float  # 휴게시간 차감 등이 반영된 수당 계산용 시간
+
+
+@dataclass(frozen=True)
+class SegmentedShift:
+    """한 번 파싱되어 구간으로 나뉜 근무 1건 (불변)"""
+
+    date: str
+    check_in: datetime
+    check_out: datetime
+    attendance_type: str
+    is_holiday_work: bool  # 휴일에 시작한 근무 여부
+    segments: tuple
+
+    def hours_of(self, *kinds):
+        """지정한 종류의 구간 시간 합계"""
+        return sum(segment.hours for segment in self.segments if segment.kind in kinds)
+
+
+class SegmentedShifts(tuple):
+    """ShiftSegmenter.segment_all 의 결과 (SegmentedShift 튜플)"""
+
+
+def _segment(kind, start, end):
+    return ShiftSegment(kind, start, end, (end - start).total_seconds() / 3600)
+
+
+def _holiday_overtime_segment(start, end):
+    hours = (end - start).total_seconds() / 3600
+
+    # 9시간 이상 근무 시 휴게시간 1시간 제외
+    if hours >= 9:
+        hours -= 1
+    return ShiftSegment(SEGMENT_HOLIDAY_OVERTIME, start, end, hours)
+
+
+class ShiftSegmenter:
+    """
+    근태 기록을 한 번만 파싱하여 연장/야간/휴일근로 구간으로 나누는 클래스
+
+    연장/야간/휴일근로수당 계산은 모두 이 결과를 읽기만 하므로
+    기록을 세 번 파싱하지 않으며, 호출자의 근태 데이터도 변경하지 않습니다.
+    각 수당의 구간은 기존 계산과 같은 순서·같은 시간 값으로 생성되어
+    합산 결과가 기존과 동일합니다.
+    """
+
+    def __init__(self, is_holiday):
+        # is_holiday: date 객체를 받아 공휴일/주말 여부를 반환하는 함수
+        self.is_holiday = is_holiday
+
+    def segment_all(self, attendance_data):
+        """근태 기록 목록을 SegmentedShifts 로 변환 (출퇴근 시간이 없는 기록은 제외)"""
+        shifts = []
+        for record in attendance_data:
+            shift = self.segment(record)
+            if shift is not None:
+                shifts.append(shift)
+        return SegmentedShifts(shifts)
+
+    def segment(self, record):
+        """근태 기록 1건을 SegmentedShift 로 변환 (출퇴근 시간이 없으면 None)"""
+        if not record.get("check_in") or not record.get("check_out"):
+            return None
+
+        check_in_dt = datetime.strptime(record["check_in"], "%Y-%m-%d %H:%M:%S")
+        check_out_dt = datetime.strptime(
+            process_time_string(record["check_out"]), "%Y-%m-%d %H:%M:%S"
+        )
+        attendance_type = record.get("attendance_type")
+
+        # 근무 기간 내 날짜별 휴일 여부는 한 번만 조회
+        holiday_cache = {}
+
+        def is_holiday(day):
+            if day not in holiday_cache:
+                holiday_cache[day] = self.is_holiday(day)
+            return holiday_cache[day]
+
+        # 출근일이 휴일인지 확인
+        is_holiday_work = attendance_type == "휴일" or is_holiday(check_in_dt.date())
+
+        segments = []
+        self._overtime_segments(
+            check_in_dt, check_out_dt, is_holiday_work, is_holiday, segments
+        )
+        self._night_segments(check_in_dt, check_out_dt, segments)
+        if is_holiday_work:
+            self._holiday_segments(check_in_dt, check_out_dt, is_holiday, segments)
+
+        return SegmentedShift(
+            date=record.get("date"),
+            check_in=check_in_dt,
+            check_out=check_out_dt,
+            attendance_type=attendance_type,
+            is_holiday_work=is_holiday_work,
+            segments=tuple(segments),
+        )
+
+    def _overtime_segments(
+        self, check_in_dt, check_out_dt, first_day_is_holiday, is_holiday, segments
+    ):
+        """
+        소정근로/연장근로 구간
+
+        - 소정근로시간(9시~18시) 이외의 시간에 대해 연장근로 계산
+        - 연속 근무 시 다음날이 근로일인 경우 해당일 09:00~18:00은 소정근로시간
+        - 휴일 근무의 경우 모든 시간을 연장근로로, 평일 근무는 소정근로시간 외 시간만 연장근로로 계산
+        """
+        first_date = check_in_dt.date()
+        workday_start = datetime.combine(first_date, time(REGULAR_WORKDAY_START, 0, 0))
+        workday_end = datetime.combine(first_date, time(REGULAR_WORKDAY_END, 0, 0))
+
+        if first_date == check_out_dt.date():
+            # ===== 같은 날 출퇴근인 경우 =====
+            if first_day_is_holiday:
+                # 휴일인 경우 모든 시간이 연장근로
+                segments.append(_holiday_overtime_segment(check_in_dt, check_out_dt))
+                return
+
+            # 평일인 경우 소정근로시간(9:00~18:00) 외 시간만 연장근로
+            if check_in_dt < workday_start:
+                segments.append(
+                    _segment(SEGMENT_EARLY_OVERTIME, check_in_dt, workday_start)
+                )
+            regular_start = max(check_in_dt, workday_start)
+            regular_end = min(check_out_dt, workday_end)
+            if regular_end > regular_start:
+                segments.append(_segment(SEGMENT_REGULAR, regular_start, regular_end))
+            if check_out_dt > workday_end:
+                segments.append(
+                    _segment(SEGMENT_LATE_OVERTIME, workday_end, check_out_dt)
+                )
+            return
+
+        # ===== 첫째 날 처리 =====
+        # 23:59:59 대신 다음날 00:00:00을 사용하여 정확한 계산
+        next_day_start = datetime.combine(first_date + timedelta(days=1), time(0, 0, 0))
+        if first_day_is_holiday:
+            segments.append(_holiday_overtime_segment(check_in_dt, next_day_start))
+        else:
+            if check_in_dt < workday_start:
+                segments.append(
+                    _segment(SEGMENT_EARLY_OVERTIME, check_in_dt, workday_start)
+                )
+            if check_in_dt < workday_end:
+                segments.append(
+                    _segment(
+                        SEGMENT_REGULAR, max(check_in_dt, workday_start), workday_end
+                    )
+                )
+            # 기존 계산과 동일하게 첫날 18:00~24:00 전체를 연장근로로 봄
+            segments.append(
+                _segment(SEGMENT_LATE_OVERTIME, workday_end, next_day_start)
+            )
+
+        # ===== 둘째 날부터 처리 =====
+        current_date = first_date + timedelta(days=1)
+        while current_date <= check_out_dt.date():
+            if current_date == check_out_dt.date():
+                # 마지막 날
+                day_end = check_out_dt
+            else:
+                # 중간 날짜 - 다음날 00:00:00 사용
+                day_end = datetime.combine(
+                    current_date + timedelta(days=1), time(0, 0, 0)
+                )
+            day_start = datetime.combine(current_date, time(0, 0, 0))
+
+            # 현재 날짜가 평일이고, 첫날이 평일인 경우 (연속 근무)
+            if not first_day_is_holiday and not is_holiday(current_date):
+                workday_start = datetime.combine(
+                    current_date, time(REGULAR_WORKDAY_START, 0, 0)
+                )
+                workday_end = datetime.combine(
+                    current_date, time(REGULAR_WORKDAY_END, 0, 0)
+                )
+
+                # 00:00부터 09:00까지 연장근로
+                if day_start < workday_start:
+                    early_end = min(workday_start, day_end)
+                    early_hours = min(
+                        (workday_start - day_start).total_seconds() / 3600,
+                        (early_end - day_start).total_seconds() / 3600,
+                    )
+                    segments.append(
+                        ShiftSegment(
+                            SEGMENT_EARLY_OVERTIME, day_start, early_end, early_hours
+                        )
+                    )
+
+                if day_end > workday_start:
+                    segments.append(
+                        _segment(
+                            SEGMENT_REGULAR, workday_start, min(day_end, workday_end)
+                        )
+                    )
+
+                # 18:00부터 퇴근시간까지 연장근로
+                if day_end > workday_end:
+                    segments.append(
+                        _segment(
+                            SEGMENT_LATE_OVERTIME,
+                            max(workday_end, day_start),
+                            day_end,
+                        )
+                    )
+            else:
+                # 현재 날짜가 휴일이거나, 첫날이 휴일인 경우 모든 시간을 연장근로로 계산
+                segments.append(_holiday_overtime_segment(day_start, day_end))
+
+            current_date += timedelta(days=1)
+
+    def _night_segments(self, check_in_dt, check_out_dt, segments):
+        """
+        야간근로 구간
+
+        - 철야 근무의 경우 모든 날짜의 야간 시간(22시-06시)을 정확히 계산
+        - 야간근로는 근무일 여부와 상관없이 22:00~06:00 시간대 근무 시 적용
+        """
+        current_date = check_in_dt.date()
+        while current_date <= check_out_dt.date():
+            night_start = datetime.combine(current_date, time(22, 0))
+            night_end = datetime.combine(current_date, time(6, 0)) + timedelta(days=1)
+
+            # 실제 근무 시간과 야간 시간대의 교집합
+            if not (check_out_dt <= night_start or check_in_dt >= night_end):
+                start = max(check_in_dt, night_start)
+                end = min(check_out_dt, night_end)
+                if end > start:
+                    segments.append(_segment(SEGMENT_NIGHT, start, end))
+
+            current_date += timedelta(days=1)
+
+    def _holiday_segments(self, check_in_dt, check_out_dt, is_holiday, segments):
+        """
+        휴일근로 구간 (휴일에 시작한 근무만 호출)
+
+        - 휴일 8시간 이내 / 8시간 초과 구간으로 나눔
+        - 휴일에 시작한 근로가 평일로 이어지는 경우, 평일 09:00까지만 휴일근로
+        """
+        total_holiday_hours = 0  # 휴일근로 누적 시간 (8시간 기준 계산용)
+        current_date = check_in_dt.date()
+
+        while current_date <= check_out_dt.date():
+            if current_date == check_in_dt.date():
+                day_start = check_in_dt
+            else:
+                day_start = datetime.combine(current_date, time(0, 0, 0))
+
+            if current_date == check_out_dt.date():
+                day_end = check_out_dt
+            else:
+                day_end = datetime.combine(current_date, time(23, 59, 59))
+
+            # 현재 날짜가 휴일이 아니고 평일인 경우, 09:00까지만 계산
+            if current_date != check_in_dt.date() and not is_holiday(current_date):
+                workday_start = datetime.combine(
+                    current_date, time(REGULAR_WORKDAY_START, 0, 0)
+                )
+                if day_start < workday_start:
+                    day_end = min(day_end, workday_start)
+                else:
+                    # 이미 평일 09:00 이후라면 휴일근로 계산 종료
+                    break
+
+            day_hours = (day_end - day_start).total_seconds() / 3600
+
+            # 휴게시간 적용 (9시간 이상 근무 시)
+            if day_hours >= 9:
+                day_hours -= 1
+
+            if total_holiday_hours >= 8:
+                # 이미 8시간 초과한 경우
+                segments.append(
+                    ShiftSegment(SEGMENT_HOLIDAY_OVER_8H, day_start, day_end, day_hours)
+                )
+            elif total_holiday_hours + day_hours <= 8:
+                segments.append(
+                    ShiftSegment(
+                        SEGMENT_HOLIDAY_WITHIN_8H, day_start, day_end, day_hours
+                    )
+                )
+            else:
+                # 8시간 경계에서 나눔
+                hours_within_8 = 8 - total_holiday_hours
+                hours_over_8 = day_hours - hours_within_8
+                boundary = min(day_start + timedelta(hours=hours_within_8), day_end)
+                segments.append(
+                    ShiftSegment(
+                        SEGMENT_HOLIDAY_WITHIN_8H, day_start, boundary, hours_within_8
+                    )
+                )
+                segments.append(
+                    ShiftSegment(
+                        SEGMENT_HOLIDAY_OVER_8H, boundary, day_end, hours_over_8
+                    )
+                )
+            total_holiday_hours += day_hours
+
+            current_date += timedelta(days=1)
+
+
 class PayCalculator:
     def __init__(
         self,
@@ -55,7 +380,7 @@ class PayCalculator:
     ):
         # 월 소정 근로시간: 8시간 × 6일 × 365일 ÷ 12개월 ÷ 7일 = 약 209시간
         self.WORK_HOURS_PER_MONTH = 209
-        self.kr_holidays = holidays.KR()
+        self.calendar = get_calendar()
         self.employee = employee
         self.attendance_records = attendance_records
         self.period_start_date = period_start_date
@@ -196,6 +521,17 @@ class PayCalculator:
         # 결과값 정수로 반환
         return int(base_pay)
 
+    def segment_shifts(self, attendance_data):
+        """
+        근태 기록을 한 번 파싱하여 구간으로 나눈 결과 반환
+
+        연장/야간/휴일근로수당을 함께 계산할 때 이 결과를 세 메서드에 그대로 넘기면
+        기록별 파싱·구간 분할이 한 번만 수행됩니다.
+        """
+        if isinstance(attendance_data, SegmentedShifts):
+            return attendance_data
+        return ShiftSegmenter(self._is_holiday_date).segment_all(attendance_data)
+
     def calculate_overtime_pay(self, attendance_data, hourly_rate):
         """
         연장근로수당 계산 함수 (개선됨)
@@ -203,158 +539,15 @@ class PayCalculator:
         - 소정근로시간(9시~18시) 이외의 시간에 대해 연장근로 계산
         - 연속 근무 시 다음날이 근로일인 경우 해당일 09:00~18:00은 소정근로시간
         - 휴일 근무의 경우 모든 시간을 연장근로로, 평일 근무는 소정근로시간 외 시간만 연장근로로 계산
+
+        attendance_data 는 근태 기록 목록 또는 segment_shifts 결과입니다.
         """
         total_overtime_pay = 0
 
-        for record in attendance_data:
-            # 출퇴근 시간이 없으면 건너뛰기
-            if not record["check_in"] or not record["check_out"]:
-                continue
-
-            # 24:00:00 형식 처리
-            record["check_out"] = process_time_string(record["check_out"])
-
-            check_in_dt = datetime.strptime(record["check_in"], "%Y-%m-%d %H:%M:%S")
-            check_out_dt = datetime.strptime(record["check_out"], "%Y-%m-%d %H:%M:%S")
-
-            # 출근일이 휴일인지 확인
-            first_day_is_holiday = record[
-                "attendance_type"
-            ] == "휴일" or self._is_holiday(check_in_dt.strftime("%Y-%m-%d"))
-
-            # 날짜가 바뀌는지 확인
-            if check_in_dt.date() != check_out_dt.date():
-                # ===== 첫째 날 처리 =====
-                if first_day_is_holiday:
-                    # 휴일인 경우 모든 시간이 연장근로
-                    # 23:59:59 대신 다음날 00:00:00을 사용하여 정확한 계산
-                    next_day_start = datetime.combine(
-                        check_in_dt.date() + timedelta(days=1), time(0, 0, 0)
-                    )
-                    first_day_hours = (
-                        next_day_start - check_in_dt
-                    ).total_seconds() / 3600
-
-                    # 9시간 이상 근무 시 휴게시간 1시간 제외
-                    if first_day_hours >= 9:
-                        first_day_hours -= 1
-
-                    total_overtime_pay += first_day_hours * hourly_rate * 1.5
-                else:
-                    # 평일인 경우 소정근로시간(9:00~18:00) 외 시간만 연장근로
-                    # 23:59:59 대신 다음날 00:00:00을 사용하여 정확한 계산
-                    next_day_start = datetime.combine(
-                        check_in_dt.date() + timedelta(days=1), time(0, 0, 0)
-                    )
-                    workday_start = datetime.combine(
-                        check_in_dt.date(), time(REGULAR_WORKDAY_START, 0, 0)
-                    )
-                    workday_end = datetime.combine(
-                        check_in_dt.date(), time(REGULAR_WORKDAY_END, 0, 0)
-                    )
-
-                    # 09:00 이전 근무 시간 (연장근로)
-                    if check_in_dt < workday_start:
-                        early_hours = (
-                            workday_start - check_in_dt
-                        ).total_seconds() / 3600
-                        total_overtime_pay += early_hours * hourly_rate * 1.5
-
-                    # 18:00 이후 근무 시간 (연장근로)
-                    late_hours = (next_day_start - workday_end).total_seconds() / 3600
-                    total_overtime_pay += late_hours * hourly_rate * 1.5
-
-                # ===== 둘째 날부터 처리 =====
-                current_date = check_in_dt.date() + timedelta(days=1)
-
-                while current_date <= check_out_dt.date():
-                    # 현재 날짜가 휴일인지 확인
-                    current_day_is_holiday = self._is_holiday(
-                        current_date.strftime("%Y-%m-%d")
-                    )
-
-                    # 해당 날짜의 시작과 종료 시간 설정
-                    if current_date == check_out_dt.date():
-                        # 마지막 날
-                        day_end = check_out_dt
-                    else:
-                        # 중간 날짜 - 23:59:59 대신 다음날 00:00:00 사용
-                        next_day = current_date + timedelta(days=1)
-                        day_end = datetime.combine(next_day, time(0, 0, 0))
-
-                    day_start = datetime.combine(current_date, time(0, 0, 0))
-
-                    # 현재 날짜가 평일이고, 첫날이 평일인 경우 (연속 근무)
-                    if not current_day_is_holiday and not first_day_is_holiday:
-                        # 소정근로시간(09:00~18:00) 설정
-                        workday_start = datetime.combine(
-                            current_date, time(REGULAR_WORKDAY_START, 0, 0)
-                        )
-                        workday_end = datetime.combine(
-                            current_date, time(REGULAR_WORKDAY_END, 0, 0)
-                        )
-
-                        # 00:00부터 09:00까지 연장근로
-                        if day_start < workday_start:
-                            early_hours = min(
-                                (workday_start - day_start).total_seconds() / 3600,
-                                (
-                                    min(workday_start, day_end) - day_start
-                                ).total_seconds()
-                                / 3600,
-                            )
-                            total_overtime_pay += early_hours * hourly_rate * 1.5
-
-                        # 18:00부터 퇴근시간까지 연장근로
-                        if day_end > workday_end:
-                            late_hours = (
-                                day_end - max(workday_end, day_start)
-                            ).total_seconds() / 3600
-                            total_overtime_pay += late_hours * hourly_rate * 1.5
-                    else:
-                        # 현재 날짜가 휴일이거나, 첫날이 휴일인 경우
-                        # 모든 시간을 연장근로로 계산
-                        day_hours = (day_end - day_start).total_seconds() / 3600
-
-                        # 9시간 이상 근무 시 휴게시간 1시간 제외
-                        if day_hours >= 9:
-                            day_hours -= 1
-
-                        total_overtime_pay += day_hours * hourly_rate * 1.5
-
-                    # 다음 날로 이동
-                    current_date += timedelta(days=1)
-            else:
-                # ===== 같은 날 출퇴근인 경우 =====
-                if first_day_is_holiday:
-                    # 휴일인 경우 모든 시간이 연장근로
-                    total_hours = (check_out_dt - check_in_dt).total_seconds() / 3600
-
-                    # 9시간 이상 근무 시 휴게시간 1시간 제외
-                    if total_hours >= 9:
-                        total_hours -= 1
-
-                    total_overtime_pay += total_hours * hourly_rate * 1.5
-                else:
-                    # 평일인 경우 소정근로시간(9:00~18:00) 외 시간만 연장근로
-                    workday_start = datetime.combine(
-                        check_in_dt.date(), time(REGULAR_WORKDAY_START, 0, 0)
-                    )
-                    workday_end = datetime.combine(
-                        check_in_dt.date(), time(REGULAR_WORKDAY_END, 0, 0)
-                    )
-
-                    # 09:00 이전 근무 시간 (연장근로)
-                    if check_in_dt < workday_start:
-                        early_hours = (
-                            workday_start - check_in_dt
-                        ).total_seconds() / 3600
-                        total_overtime_pay += early_hours * hourly_rate * 1.5
-
-                    # 18:00 이후 근무 시간 (연장근로)
-                    if check_out_dt > workday_end:
-                        late_hours = (check_out_dt - workday_end).total_seconds() / 3600
-                        total_overtime_pay += late_hours * hourly_rate * 1.5
+        for shift in self.segment_shifts(attendance_data):
+            for segment in shift.segments:
+                if segment.kind in OVERTIME_SEGMENT_KINDS:
+                    total_overtime_pay += segment.hours * hourly_rate * 1.5
 
         return int(total_overtime_pay)
 
@@ -385,44 +578,15 @@ class PayCalculator:
 
         - 철야 근무의 경우 모든 날짜의 야간 시간(22시-06시)을 정확히 계산
         - 야간근로는 근무일 여부와 상관없이 22:00~06:00 시간대 근무 시 적용
+
+        attendance_data 는 근태 기록 목록 또는 segment_shifts 결과입니다.
         """
         total_night_pay = 0
-        for record in attendance_data:
-            # 출퇴근 시간이 없으면 건너뛰기
-            if not record["check_in"] or not record["check_out"]:
-                continue
-
-            # 24:00:00 형식 처리
-            record["check_out"] = process_time_string(record["check_out"])
-
-            check_in_dt = datetime.strptime(record["check_in"], "%Y-%m-%d %H:%M:%S")
-            check_out_dt = datetime.strptime(record["check_out"], "%Y-%m-%d %H:%M:%S")
-
-            # 모든 날짜에 대한 야간 근무 계산
-            current_date = check_in_dt.date()
-
-            while current_date <= check_out_dt.date():
-                # 현재 날짜의 야간 시간대 설정
-                night_start = datetime.combine(current_date, time(22, 0))
-                night_end = datetime.combine(current_date, time(6, 0)) + timedelta(
-                    days=1
-                )
-
-                # 실제 근무 시간과 야간 시간대의 교집합 계산
-                if check_out_dt <= night_start or check_in_dt >= night_end:
-                    # 야간 시간대와 겹치지 않음
-                    pass
-                else:
-                    # 야간 시간대와 겹치는 시간 계산
-                    start = max(check_in_dt, night_start)
-                    end = min(check_out_dt, night_end)
 
-                    if end > start:  # 유효한 겹침이 있는지 확인
-                        night_hours = (end - start).total_seconds() / 3600
-                        total_night_pay += night_hours * hourly_rate * 0.5
-
-                # 다음 날로 이동
-                current_date += timedelta(days=1)
+        for shift in self.segment_shifts(attendance_data):
+            for segment in shift.segments:
+                if segment.kind == SEGMENT_NIGHT:
+                    total_night_pay += segment.hours * hourly_rate * 0.5
 
         return int(total_night_pay)
 
@@ -455,8 +619,15 @@ class PayCalculator:
         """
         공휴일 또는 주말 여부 확인 함수
         """
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        return date_obj in self.kr_holidays or date_obj.weekday() >= 5
+        return self.calendar.is_holiday(
+            datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+        )
+
+    def _is_holiday_date(self, date_obj):
+        """
+        공휴일 또는 주말 여부 확인 함수 (date 객체)
+        """
+        return self.calendar.is_holiday(date_obj.toordinal())
 
     def calculate_holiday_pay(self, attendance_data, hourly_rate):
         """
@@ -467,97 +638,17 @@ class PayCalculator:
         - 휴일 8시간 초과: 초과분에 대해 시간당 임금의 2.0배
         - 평일에 시작한 근로가 휴일로 이어지는 경우는 휴일근로수당 미적용
         - 휴일에 시작한 근로가 평일로 이어지는 경우, 평일 09:00까지만 휴일근로수당 적용
+
+        attendance_data 는 근태 기록 목록 또는 segment_shifts 결과입니다.
         """
         total_holiday_pay = 0
 
-        for record in attendance_data:
-            # 휴일 근무가 아니거나 출퇴근 시간이 없으면 건너뛰기
-            if not (
-                record["attendance_type"] == "휴일"
-                or self._is_holiday(record["check_in"].split(" ")[0])
-            ):
-                continue
-            if not record["check_in"] or not record["check_out"]:
-                continue
-
-            # 24:00:00 형식 처리
-            record["check_out"] = process_time_string(record["check_out"])
-
-            check_in_dt = datetime.strptime(record["check_in"], "%Y-%m-%d %H:%M:%S")
-            check_out_dt = datetime.strptime(record["check_out"], "%Y-%m-%d %H:%M:%S")
-
-            # 출근일이 휴일인지 확인
-            is_holiday_work = record["attendance_type"] == "휴일" or self._is_holiday(
-                check_in_dt.strftime("%Y-%m-%d")
-            )
-
-            # 평일에 시작한 근로는 휴일근로수당 적용 안함
-            if not is_holiday_work:
-                continue
-
-            # 이제부터 휴일에 시작한 근로만 처리
-            total_holiday_hours = 0  # 휴일근로 누적 시간 (8시간 기준 계산용)
-            current_date = check_in_dt.date()
-
-            while current_date <= check_out_dt.date():
-                # 현재 날짜의 시작과 종료 시간 설정
-                if current_date == check_in_dt.date():
-                    # 첫째 날
-                    day_start = check_in_dt
-                else:
-                    # 그 외 날짜
-                    day_start = datetime.combine(current_date, time(0, 0, 0))
-
-                if current_date == check_out_dt.date():
-                    # 마지막 날
-                    day_end = check_out_dt
-                else:
-                    # 그 외 날짜
-                    day_end = datetime.combine(current_date, time(23, 59, 59))
-
-                # 현재 날짜가 휴일이 아니고 평일인 경우, 09:00까지만 계산
-                if current_date != check_in_dt.date() and not self._is_holiday(
-                    current_date.strftime("%Y-%m-%d")
-                ):
-                    workday_start = datetime.combine(
-                        current_date, time(REGULAR_WORKDAY_START, 0, 0)
-                    )
-                    if day_start < workday_start:
-                        # 00:00부터 09:00까지만 휴일근로로 계산
-                        day_end = min(day_end, workday_start)
-                    else:
-                        # 이미 평일 09:00 이후라면 휴일근로 계산 종료
-                        break
-
-                # 해당 날짜의 근무 시간 계산
-                day_hours = (day_end - day_start).total_seconds() / 3600
-
-                # 휴게시간 적용 (9시간 이상 근무 시)
-                if day_hours >= 9:
-                    day_hours -= 1
-
-                # 휴일근로 누적 및 계산 (8시간 기준)
-                if total_holiday_hours < 8:
-                    # 8시간 이내 부분
-                    if total_holiday_hours + day_hours <= 8:
-                        # 모두 1.5배 적용
-                        total_holiday_pay += day_hours * hourly_rate * 1.5
-                        total_holiday_hours += day_hours
-                    else:
-                        # 일부는 1.5배, 일부는 2.0배 적용
-                        hours_within_8 = 8 - total_holiday_hours
-                        hours_over_8 = day_hours - hours_within_8
-
-                        total_holiday_pay += hours_within_8 * hourly_rate * 1.5
-                        total_holiday_pay += hours_over_8 * hourly_rate * 2.0
-                        total_holiday_hours += day_hours
-                else:
-                    # 이미 8시간 초과한 경우, 모두 2.0배 적용
-                    total_holiday_pay += day_hours * hourly_rate * 2.0
-                    total_holiday_hours += day_hours
-
-                # 다음 날로 이동
-                current_date += timedelta(days=1)
+        for shift in self.segment_shifts(attendance_data):
+            for segment in shift.segments:
+                if segment.kind == SEGMENT_HOLIDAY_WITHIN_8H:
+                    total_holiday_pay += segment.hours * hourly_rate * 1.5
+                elif segment.kind == SEGMENT_HOLIDAY_OVER_8H:
+                    total_holiday_pay += segment.hours * hourly_rate * 2.0
 
         return int(total_holiday_pay)
 
@@ -597,14 +688,11 @@ class PayCalculator:
                 ),
             )
 
-            # 추가 수당 계산
-            overtime_pay = self.calculate_overtime_pay(
-                self.attendance_records, hourly_rate
-            )
-            night_pay = self.calculate_night_pay(self.attendance_records, hourly_rate)
-            holiday_pay = self.calculate_holiday_pay(
-                self.attendance_records, hourly_rate
-            )
+            # 추가 수당 계산 (근태 기록은 한 번만 구간 분할)
+            shifts = self.segment_shifts(self.attendance_records)
+            overtime_pay = self.calculate_overtime_pay(shifts, hourly_rate)
+            night_pay = self.calculate_night_pay(shifts, hourly_rate)
+            holiday_pay = self.calculate_holiday_pay(shifts, hourly_rate)
 
             # 직급 수당 계산 (직급에 따라 다른 수당 적용)
             position_allowance = 0
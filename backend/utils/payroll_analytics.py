@@ -0,0 +1,264 @@
+"""
+급여 분석 집계 모듈 (/api/payroll/analysis)
+
+확정/지급된 급여를 SQL 의 GROUP BY 로 집계합니다. 급여 행은 (기간, 그룹) 단위 CTE 에서
+한 번만 읽고, 기간별/그룹별/전체 합계는 그 결과를 UNION ALL 로 이어 같은 쿼리에서
+함께 가져옵니다 (SQLite 에는 GROUPING SETS 가 없음). Python 으로 넘어오는 행 수는
+급여 행 수가 아니라 그룹 수에 비례합니다.
+
+시작일이 월 첫날이면 급여 테이블 대신 월별 요약(payroll_monthly_summary,
+utils.payroll_summary)에서 집계합니다. 요약의 급여월 중 종료일 이후에 끝나는 급여가
+있어 기간을 요약 단위로 맞출 수 없으면 급여 테이블에서 다시 집계합니다.
+
+집계 수준(level)
+- detail: 기간 + 그룹
+- period: 기간별 전체
+- group: 전체 기간의 그룹별
+- total: 전체
+
+평균은 SQL 의 SUM/COUNT 로 Python 에서 계산합니다 (이전 응답과 같은 반올림).
+"""
+
+from sqlalchemy import Integer, String, cast, func, literal, union_all, select
+
+from models.models import Employee, Payroll, PayrollMonthlySummary
+from utils.partition_files import month_key
+from utils.payroll_summary import SUMMARY_STATUSES
+
+TOTAL_LABEL = "전체"
+
+# 집계에 포함하는 급여 상태 (월별 요약과 같음)
+ANALYSIS_STATUSES = SUMMARY_STATUSES
+
+# 집계 기준 (시간 기준은 급여기간 시작일 기준)
+GROUP_BY_OPTIONS = ("department", "position", "month", "quarter", "year")
+
+# 기간 유형 → 기간 컬럼의 집계 기준 (all 은 기간 구분 없음)
+PERIOD_TYPES = {
+    "monthly": "month",
+    "quarterly": "quarter",
+    "yearly": "year",
+    "all": None,
+}
+
+_LEVEL_ORDER = {"detail": 0, "period": 1, "group": 2, "total": 3}
+
+_MEASURES = (
+    "row_count",
+    "total_base_pay",
+    "total_allowances",
+    "total_gross_pay",
+    "total_net_pay",
+)
+
+
+def _dimensions(period_start, department, position):
+    """집계 기준 이름 → 컬럼"""
+    quarter = (cast(func.strftime("%m", period_start), Integer) + 2) // 3
+    return {
+        "department": department,
+        "position": position,
+        "month": func.strftime("%Y-%m", period_start),
+        "quarter": func.strftime("%Y", period_start)
+        .concat("-Q")
+        .concat(cast(quarter, String)),
+        "year": func.strftime("%Y", period_start),
+    }
+
+
+def _keys(dimensions, group_by, period):
+    period_column = dimensions[period] if period else literal(TOTAL_LABEL)
+    return period_column, dimensions[group_by]
+
+
+def _payroll_detail(start_date, end_date, group_by, period):
+    """급여 행을 (기간, 그룹) 단위로 한 번만 집계하는 CTE"""
+    period_column, group_column = _keys(
+        _dimensions(
+            Payroll.payment_period_start,
+            # 요약 테이블과 같은 그룹이 되도록 NULL 은 빈 문자열로
+            func.coalesce(Employee.department, ""),
+            func.coalesce(Employee.position, ""),
+        ),
+        group_by,
+        period,
+    )
+    allowances = Payroll.overtime_pay + Payroll.night_shift_pay + Payroll.holiday_pay
+    return (
+        select(
+            period_column.label("period"),
+            group_column.label("group_value"),
+            func.count().label("row_count"),
+            func.sum(Payroll.base_pay).label("total_base_pay"),
+            func.sum(allowances).label("total_allowances"),
+            func.sum(Payroll.gross_pay).label("total_gross_pay"),
+            func.sum(Payroll.net_pay).label("total_net_pay"),
+            func.max(Payroll.payment_period_end).label("max_period_end"),
+        )
+        .select_from(Payroll)
+        .join(Employee, Payroll.employee_id == Employee.employee_id)
+        .where(
+            Payroll.payment_period_start >= start_date,
+            Payroll.payment_period_end <= end_date,
+            Payroll.status.in_(ANALYSIS_STATUSES),
+        )
+        .group_by(period_column, group_column)
+        .cte("payroll_detail")
+    )
+
+
+def _summary_detail(start_date, end_date, group_by, period):
+    """월별 요약 행을 (기간, 그룹) 단위로 합산하는 CTE"""
+    summary = PayrollMonthlySummary
+    period_column, group_column = _keys(
+        _dimensions(summary.month.concat("-01"), summary.department, summary.position),
+        group_by,
+        period,
+    )
+    allowances = (
+        summary.sum_overtime_pay + summary.sum_night_shift_pay + summary.sum_holiday_pay
+    )
+    return (
+        select(
+            period_column.label("period"),
+            group_column.label("group_value"),
+            func.sum(summary.payroll_count).label("row_count"),
+            func.sum(summary.sum_base_pay).label("total_base_pay"),
+            func.sum(allowances).label("total_allowances"),
+            func.sum(summary.sum_gross_pay).label("total_gross_pay"),
+            func.sum(summary.sum_net_pay).label("total_net_pay"),
+            func.max(summary.max_period_end).label("max_period_end"),
+        )
+        .where(
+            summary.month >= month_key(start_date),
+            summary.month <= month_key(end_date),
+        )
+        .group_by(period_column, group_column)
+        .cte("payroll_detail")
+    )
+
+
+def build_analysis_query(
+    start_date,
+    end_date,
+    group_by="department",
+    period_type="all",
+    use_summary=False,
+):
+    """
+    집계 수준별 조회문을 UNION ALL 로 이은 한 문장
+
+    급여 행(또는 월별 요약 행)은 payroll_detail CTE 에서 (기간, 그룹) 단위로 한 번만
+    읽고, 기간별/그룹별/전체 행은 그룹 수만큼인 CTE 결과를 다시 합산합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 group_by / period_type
+    """
+    if group_by not in GROUP_BY_OPTIONS:
+        raise ValueError(
+            f"지원하지 않는 group_by 입니다: {group_by} ({', '.join(GROUP_BY_OPTIONS)})"
+        )
+    if period_type not in PERIOD_TYPES:
+        raise ValueError(
+            f"지원하지 않는 period_type 입니다: {period_type} ({', '.join(PERIOD_TYPES)})"
+        )
+
+    period = PERIOD_TYPES[period_type]
+    detail_cte = _summary_detail if use_summary else _payroll_detail
+    detail = detail_cte(start_date, end_date, group_by, period)
+    levels = [("group", False, True), ("total", False, False)]
+    if period:
+        levels = [("detail", True, True), ("period", True, False)] + levels
+
+    selects = []
+    for level, by_period, by_group in levels:
+        period_column = detail.c.period if by_period else literal(TOTAL_LABEL)
+        group = detail.c.group_value if by_group else literal(TOTAL_LABEL)
+        statement = select(
+            literal(level).label("level"),
+            period_column.label("period"),
+            group.label("group_value"),
+            *(func.sum(detail.c[name]).label(name) for name in _MEASURES),
+            func.max(detail.c.max_period_end).label("max_period_end"),
+        )
+        keys = [
+            column
+            for column, used in ((period_column, by_period), (group, by_group))
+            if used
+        ]
+        if keys:
+            statement = statement.group_by(*keys)
+        selects.append(statement)
+    return union_all(*selects)
+
+
+def _fetch_rows(session, query):
+    return [row for row in session.execute(query) if row.row_count]
+
+
+def analyze_payrolls(
+    session,
+    start_date,
+    end_date,
+    group_by="department",
+    period_type="all",
+    use_summary=True,
+):
+    """
+    급여 분석 집계
+
+    Args:
+        session: SQLAlchemy 세션
+        start_date (date): 급여기간 시작일 하한
+        end_date (date): 급여기간 종료일 상한
+        group_by (str): department | position | month | quarter | year
+        period_type (str): monthly | quarterly | yearly | all
+        use_summary (bool): 월 단위로 맞는 기간이면 월별 요약에서 집계
+
+    Returns:
+        list: 집계 행 (level, period, group, employee_count, 합계, 평균).
+              데이터가 없으면 빈 목록
+    """
+    rows = None
+    if use_summary and start_date.day == 1:
+        rows = _fetch_rows(
+            session,
+            build_analysis_query(start_date, end_date, group_by, period_type, True),
+        )
+        # 종료일 이후에 끝나는 급여가 요약에 섞여 있으면 급여 테이블에서 집계
+        if any(row.max_period_end > end_date for row in rows):
+            rows = None
+    if rows is None:
+        rows = _fetch_rows(
+            session, build_analysis_query(start_date, end_date, group_by, period_type)
+        )
+
+    rows.sort(
+        key=lambda row: (
+            row.period == TOTAL_LABEL,
+            row.period,
+            _LEVEL_ORDER[row.level],
+            str(row.group_value),
+        )
+    )
+
+    results = []
+    for row in rows:
+        count = row.row_count
+        results.append(
+            {
+                "level": row.level,
+                "period": row.period,
+                "group": row.group_value,
+                "employee_count": count,
+                "total_base_pay": row.total_base_pay,
+                "total_allowances": row.total_allowances,
+                "total_gross_pay": row.total_gross_pay,
+                "total_net_pay": row.total_net_pay,
+                "avg_base_pay": round(row.total_base_pay / count),
+                "avg_allowances": round(row.total_allowances / count),
+                "avg_gross_pay": round(row.total_gross_pay / count),
+                "avg_net_pay": round(row.total_net_pay / count),
+            }
+        )
+    return results
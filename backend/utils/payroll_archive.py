@@ -0,0 +1,412 @@
+"""
+급여 이력 컬럼 저장소 모듈 (연/월 분할 아카이브)
+
+급여 이력(payroll.csv 형식)을 지급일 기준 연/월 조각(partition)으로 나누어 보관하고,
+조회 시 필요한 월의 조각에서 필요한 컬럼만 읽습니다. manifest.json 에 조각별 행 수와
+컬럼별 최소/최대 통계를 기록해 두므로, 조건에 맞지 않는 조각은 파일을 열지 않고
+건너뜁니다.
+
+- 조각 파일: <아카이브>/year=YYYY/month=MM/source=<원본>/payroll.parquet
+  pyarrow 가 설치되어 있지 않으면 payroll.csv.gz (gzip CSV) 로 저장합니다.
+  형식은 아카이브를 처음 만들 때 정해 manifest 에 기록합니다.
+- 원본: payroll.csv (stat 이 바뀐 경우에만 다시 가져옴), SQLite payroll 테이블
+  (확정/지급 급여)
+- 원본마다 따로 조각을 두고, 가져올 때마다 그 원본의 조각 전체를 원본 내용으로
+  바꿉니다. 원본에서 수정/삭제된 행은 아카이브에서도 수정/삭제되고, 원본에 더 이상
+  없는 달의 조각은 지웁니다. 다른 원본의 조각은 건드리지 않습니다.
+- 같은 달의 여러 원본 조각은 조회 시 함께 읽습니다.
+
+모든 파일은 임시 파일에 쓴 뒤 os.replace 로 교체하므로 읽는 쪽에서 쓰다 만 파일을
+보지 않습니다.
+"""
+
+import hashlib
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import func, select
+
+from models.models import Payroll
+from utils.file_fingerprint import stat_key
+from utils.partition_files import atomic_write, load_manifest, save_manifest
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = pq = None
+
+# payroll.csv 컬럼 순서
+ARCHIVE_COLUMNS = (
+    "payment_id",
+    "employee_id",
+    "payment_date",
+    "base_salary",
+    "position_allowance",
+    "overtime_pay",
+    "night_shift_pay",
+    "holiday_pay",
+    "meal_allowance",
+    "transportation_allowance",
+    "bonus",
+    "gross_salary",
+    "national_pension",
+    "health_insurance",
+    "long_term_care",
+    "employment_insurance",
+    "income_tax",
+    "local_income_tax",
+    "net_salary",
+)
+KEY_COLUMN = "payment_id"
+TEXT_COLUMNS = ("payment_id", "employee_id", "payment_date")
+AMOUNT_COLUMNS = tuple(c for c in ARCHIVE_COLUMNS if c not in TEXT_COLUMNS)
+
+# 조각별 최소/최대 통계를 기록하는 컬럼
+STATS_COLUMNS = ("payment_date",) + AMOUNT_COLUMNS
+
+DEFAULT_FORMAT = "parquet" if pq is not None else "csv"
+PARTITION_FILES = {"parquet": "payroll.parquet", "csv": "payroll.csv.gz"}
+MANIFEST_NAME = "manifest.json"
+
+# SQLite payroll 테이블에서 가져오는 급여 상태
+IMPORT_STATUSES = ("confirmed", "paid")
+
+# 같은 프로세스 안의 여러 서비스 인스턴스가 동시에 쓰지 않도록 보호
+_write_lock = threading.Lock()
+
+
+def _python_value(value):
+    """numpy 값 → JSON 저장용 파이썬 값"""
+    return value.item() if hasattr(value, "item") else value
+
+
+def _source_directory(name):
+    """원본 이름(예: csv:/경로/payroll.csv) → 조각 디렉토리 이름"""
+    kind = name.split(":", 1)[0]
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:12]
+    return f"source={kind}-{digest}"
+
+
+def _partition_stats(frame):
+    """조각의 행 수와 컬럼별 [최소, 최대]"""
+    return {
+        "rows": len(frame),
+        "stats": {
+            column: [
+                _python_value(frame[column].min()),
+                _python_value(frame[column].max()),
+            ]
+            for column in STATS_COLUMNS
+        },
+    }
+
+
+def _may_match(stats, where):
+    """최소/최대 통계상 where 조건을 만족하는 행이 있을 수 있는지"""
+    return not any(
+        column in stats
+        and (
+            (high is not None and stats[column][0] > high)
+            or (low is not None and stats[column][1] < low)
+        )
+        for column, (low, high) in (where or {}).items()
+    )
+
+
+def normalize_frame(frame):
+    """
+    급여 이력 데이터프레임을 아카이브 컬럼/형식으로 맞춤
+
+    없는 금액 컬럼은 0, 지급일은 'YYYY-MM-DD' 문자열, 금액은 int64 로 바꿉니다.
+    """
+    frame = frame.copy()
+    for column in AMOUNT_COLUMNS:
+        if column not in frame:
+            frame[column] = 0
+    frame[list(AMOUNT_COLUMNS)] = (
+        frame[list(AMOUNT_COLUMNS)].fillna(0).astype("int64", copy=False)
+    )
+    frame["payment_date"] = pd.to_datetime(frame["payment_date"]).dt.strftime(
+        "%Y-%m-%d"
+    )
+    frame["payment_id"] = frame["payment_id"].astype(str)
+    frame["employee_id"] = frame["employee_id"].astype(str)
+    return frame[list(ARCHIVE_COLUMNS)]
+
+
+class PayrollArchive:
+    """급여 이력 연/월 분할 아카이브"""
+
+    def __init__(self, root, file_format=None):
+        """
+        Args:
+            root (str): 아카이브 디렉토리
+            file_format (str): 새 아카이브 형식 (parquet | csv). 기존 아카이브는
+                manifest 에 기록된 형식을 사용합니다.
+        """
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST_NAME)
+        manifest = self._load_manifest()
+        self.file_format = manifest.get("format") or file_format or DEFAULT_FORMAT
+        if self.file_format == "parquet" and pq is None:
+            raise ImportError(
+                f"parquet 형식 급여 아카이브를 읽으려면 pyarrow 가 필요합니다: {root}"
+            )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def months(self):
+        """보관 중인 급여월 목록 (YYYY-MM, 오름차순)"""
+        return sorted(self._load_manifest()["partitions"])
+
+    def latest_month(self):
+        """가장 최근 급여월 (없으면 None)"""
+        months = self.months()
+        return months[-1] if months else None
+
+    def select_partitions(self, start_month=None, end_month=None, where=None):
+        """
+        조회 조건에 맞는 조각의 급여월 목록
+
+        월 범위 밖이거나 manifest 의 최소/최대 통계상 where 조건을 만족하는 행이
+        있을 수 없는 조각은 제외합니다.
+        """
+        partitions = self._load_manifest()["partitions"]
+        selected = []
+        for month in sorted(partitions):
+            if start_month and month < start_month:
+                continue
+            if end_month and month > end_month:
+                continue
+            if _may_match(partitions[month]["stats"], where):
+                selected.append(month)
+        return selected
+
+    def read(self, columns=None, start_month=None, end_month=None, where=None):
+        """
+        급여 이력 조회
+
+        Args:
+            columns (list): 읽을 컬럼 (None 이면 전체)
+            start_month (str): 시작 급여월 YYYY-MM (포함)
+            end_month (str): 종료 급여월 YYYY-MM (포함)
+            where (dict): {컬럼: (최소, 최대)} 포함 범위 조건, 한쪽은 None 가능
+
+        Returns:
+            DataFrame: 급여월, 지급일, payment_id 순서의 조회 결과
+        """
+        columns = list(columns or ARCHIVE_COLUMNS)
+        where = where or {}
+        read_columns = list(
+            dict.fromkeys(columns + list(where) + ["payment_date", KEY_COLUMN])
+        )
+        partitions = self._load_manifest()["partitions"]
+        frames = [
+            self._read_partition(month, name, read_columns, where)
+            for month in self.select_partitions(start_month, end_month, where)
+            for name, entry in sorted(partitions[month]["sources"].items())
+            if _may_match(entry["stats"], where)
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        frame = pd.concat(frames, ignore_index=True)
+        for column, (low, high) in where.items():
+            if low is not None:
+                frame = frame[frame[column] >= low]
+            if high is not None:
+                frame = frame[frame[column] <= high]
+        # 같은 달의 여러 원본 조각을 지급일, payment_id 순서로 합침
+        frame = frame.sort_values(["payment_date", KEY_COLUMN], kind="stable")
+        return frame[columns].reset_index(drop=True)
+
+    def _partition_path(self, month, name):
+        year, month_number = month.split("-")
+        return os.path.join(
+            self.root,
+            f"year={year}",
+            f"month={month_number}",
+            _source_directory(name),
+            PARTITION_FILES[self.file_format],
+        )
+
+    def _read_partition(self, month, name, columns=None, where=None):
+        path = self._partition_path(month, name)
+        if self.file_format == "parquet":
+            filters = []
+            for column, (low, high) in (where or {}).items():
+                if low is not None:
+                    filters.append((column, ">=", low))
+                if high is not None:
+                    filters.append((column, "<=", high))
+            return pq.read_table(
+                path, columns=columns, filters=filters or None
+            ).to_pandas()
+        return pd.read_csv(
+            path,
+            usecols=columns,
+            dtype={column: str for column in TEXT_COLUMNS},
+            compression="gzip",
+        )
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def replace_source(self, name, frame, info=None):
+        """
+        원본 하나의 급여 이력 전체를 원본 내용으로 교체
+
+        frame 에 있는 급여월의 조각은 frame 의 행으로 다시 쓰고(같은 payment_id 는
+        마지막 행), 이 원본의 조각 중 frame 에 없는 급여월은 지웁니다. 다른 원본의
+        조각은 그대로 둡니다.
+
+        Args:
+            name (str): 원본 이름 (예: csv:<절대 경로>, db:payroll)
+            frame (DataFrame): 원본의 전체 급여 이력 (payroll.csv 형식)
+            info: manifest 에 기록할 원본 정보 (다시 가져올지 판단용)
+
+        Returns:
+            dict: 쓴 급여월, 지운 급여월 목록과 가져온 행 수
+        """
+        frame = normalize_frame(frame)
+        with _write_lock:
+            manifest = self._load_manifest()
+            partitions = manifest["partitions"]
+            written = []
+            for month, part in frame.groupby(frame["payment_date"].str[:7], sort=True):
+                part = (
+                    part.drop_duplicates(KEY_COLUMN, keep="last")
+                    .sort_values(["payment_date", KEY_COLUMN])
+                    .reset_index(drop=True)
+                )
+                self._write_partition(month, name, part)
+                partitions.setdefault(month, {"sources": {}})["sources"][name] = (
+                    _partition_stats(part)
+                )
+                written.append(month)
+
+            removed = [
+                month
+                for month in sorted(partitions)
+                if month not in written and name in partitions[month]["sources"]
+            ]
+            for month in removed:
+                del partitions[month]["sources"][name]
+            for month in set(written + removed):
+                self._update_month(partitions, month)
+            manifest["sources"][name] = info
+            self._save_manifest(manifest)
+
+            # manifest 에서 빠진 뒤에 지워야 읽는 쪽이 없는 파일을 찾지 않음
+            for month in removed:
+                path = self._partition_path(month, name)
+                if os.path.exists(path):
+                    os.unlink(path)
+                try:
+                    os.removedirs(os.path.dirname(path))
+                except OSError:
+                    pass
+        return {"months": written, "removed": removed, "rows": len(frame)}
+
+    @staticmethod
+    def _update_month(partitions, month):
+        """급여월의 원본별 통계를 합쳐 월 통계 갱신 (원본이 없으면 월 삭제)"""
+        sources = list(partitions[month]["sources"].values())
+        if not sources:
+            del partitions[month]
+            return
+        partitions[month]["rows"] = sum(entry["rows"] for entry in sources)
+        partitions[month]["stats"] = {
+            column: [
+                min(entry["stats"][column][0] for entry in sources),
+                max(entry["stats"][column][1] for entry in sources),
+            ]
+            for column in STATS_COLUMNS
+        }
+
+    def _write_partition(self, month, name, frame):
+        path = self._partition_path(month, name)
+        if self.file_format == "parquet":
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            atomic_write(path, lambda f: pq.write_table(table, f), mode="wb")
+        else:
+            atomic_write(
+                path,
+                lambda f: frame.to_csv(f, index=False, compression="gzip"),
+                mode="wb",
+            )
+
+    # ------------------------------------------------------------------
+    # 가져오기
+    # ------------------------------------------------------------------
+    def import_csv(self, path, force=False):
+        """
+        payroll.csv 가져오기
+
+        마지막으로 가져온 뒤 파일 stat 이 바뀌지 않았으면 읽지 않습니다. 가져오면
+        이 파일에서 온 급여월 조각을 파일 내용으로 교체합니다.
+
+        Returns:
+            dict: replace_source() 결과 (가져오지 않았으면 None)
+        """
+        name = f"csv:{os.path.abspath(path)}"
+        key = list(stat_key(path) or ())
+        if not key:
+            raise FileNotFoundError(path)
+        if not force and self._load_manifest()["sources"].get(name) == key:
+            return None
+        frame = pd.read_csv(path, dtype={column: str for column in TEXT_COLUMNS})
+        return self.replace_source(name, frame, key)
+
+    def import_payroll_table(self, session, statuses=IMPORT_STATUSES):
+        """
+        SQLite payroll 테이블의 확정/지급 급여 가져오기
+
+        지급일이 없는 확정 급여는 급여기간 종료일을 지급일로 사용합니다.
+        payroll.csv 에만 있는 수당 컬럼(직책/식대/교통비/상여)은 0 으로 채웁니다.
+        payroll.csv 에서 가져온 조각과는 따로 보관하며, 가져올 때마다 테이블에서 온
+        조각 전체를 현재 테이블 내용으로 교체합니다.
+
+        Returns:
+            dict: replace_source() 결과
+        """
+        result = session.execute(
+            select(
+                Payroll.payroll_code.label("payment_id"),
+                Payroll.employee_id,
+                func.coalesce(Payroll.payment_date, Payroll.payment_period_end).label(
+                    "payment_date"
+                ),
+                Payroll.base_pay.label("base_salary"),
+                Payroll.overtime_pay,
+                Payroll.night_shift_pay,
+                Payroll.holiday_pay,
+                Payroll.gross_pay.label("gross_salary"),
+                Payroll.national_pension,
+                Payroll.health_insurance,
+                Payroll.long_term_care,
+                Payroll.employment_insurance,
+                Payroll.income_tax,
+                Payroll.residence_tax.label("local_income_tax"),
+                Payroll.net_pay.label("net_salary"),
+            ).where(Payroll.status.in_(statuses))
+        )
+        frame = pd.DataFrame(result.all(), columns=list(result.keys()))
+        return self.replace_source(
+            "db:payroll",
+            frame,
+            {"rows": len(frame), "imported_at": datetime.now().isoformat()},
+        )
+
+    # ------------------------------------------------------------------
+    # manifest
+    # ------------------------------------------------------------------
+    def _load_manifest(self):
+        return load_manifest(self.manifest_path, "partitions", "sources")
+
+    def _save_manifest(self, manifest):
+        manifest["format"] = self.file_format
+        save_manifest(self.manifest_path, manifest)
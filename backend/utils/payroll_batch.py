@@ -0,0 +1,418 @@
+"""
+급여 일괄 계산 모듈
+
+여러 직원의 급여 항목(기본급, 수당, 4대 보험, 세금)을 계산합니다.
+공제 항목은 묶음 단위로 InsuranceCalculator.calculate_deductions_batch 에서 한 번에 계산합니다.
+근태 기록이 로드된 뒤의 계산은 순수 CPU 작업이므로, 작업자 수를 지정하면
+직원을 근태 기록 수 기준으로 균형 있게 나누어 ProcessPoolExecutor 로 병렬 계산합니다.
+각 작업자에는 직원 스칼라 값과 근무 시각 배열(에포크 초)만 전달하며,
+결과는 입력 순서대로 합쳐지므로 작업자 수와 관계없이 동일합니다.
+iter_batch_values 는 묶음(최대 SHARD_SIZE 명) 계산이 끝날 때마다 결과를 전달하므로
+호출자가 묶음 단위로 저장하고 진행 상황을 알릴 수 있습니다.
+
+작업자 수는 [1, CPU 수] 로 제한하고, 작업자 풀은 프로세스 전체에서 하나를 재사용합니다.
+서버 프로세스에는 파일 감시/스케줄러 스레드가 있으므로 fork 대신 spawn 으로
+작업자를 시작합니다.
+
+Flask 앱이나 DB 세션에 의존하지 않으므로 작업자 프로세스에서 그대로 import 됩니다.
+"""
+
+import heapq
+import multiprocessing
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from utils.allowance_engine import AllowanceEngine, records_to_shift_arrays
+from utils.insurance_calculator import DEDUCTION_COLUMNS, InsuranceCalculator
+from utils.pay_calculator import PayCalculator
+
+# 급여 계산에 필요한 직원 정보 (Employee 모델 대신 프로세스 간 전달용)
+EmployeeScalars = namedtuple(
+    "EmployeeScalars",
+    ["employee_id", "base_salary", "join_date", "resignation_date", "family_count"],
+)
+
+
+def employee_scalars(employee):
+    """Employee 모델에서 계산용 스칼라 값 추출"""
+    return EmployeeScalars(
+        employee.employee_id,
+        employee.base_salary,
+        employee.join_date,
+        employee.resignation_date,
+        employee.family_count,
+    )
+
+
+def calculate_earnings(
+    employee, attendance_data, start_date, end_date, calculator, allowances=None
+):
+    """
+    직원 1명의 기본급·수당·지급총액 계산
+
+    Args:
+        employee: Employee 모델 또는 EmployeeScalars
+        attendance_data (list): 근태 기록 (allowances 가 없을 때 수당 계산에 사용)
+        allowances (dict): 미리 계산된 overtime_pay, night_pay, holiday_pay.
+            None 이면 PayCalculator로 근태 기록에서 계산합니다.
+
+    Returns:
+        tuple: (급여 항목 dict, 공제 계산 기준 지급총액(정수 변환 전))
+    """
+    base_salary = employee.base_salary
+    join_date = employee.join_date.strftime("%Y-%m-%d") if employee.join_date else None
+    resignation_date = (
+        employee.resignation_date.strftime("%Y-%m-%d")
+        if employee.resignation_date
+        else None
+    )
+
+    # 시간당 임금 계산
+    hourly_rate = (base_salary / 12) / calculator.WORK_HOURS_PER_MONTH
+
+    base_pay = calculator.calculate_base_pay(
+        base_salary,
+        start_date.strftime("%Y-%m-%d"),
+        end_date.strftime("%Y-%m-%d"),
+        attendance_data,
+        join_date,
+        resignation_date,
+    )
+
+    if allowances is None:
+        # 근태 기록은 한 번만 파싱·구간 분할하여 세 수당 계산에 공유
+        shifts = calculator.segment_shifts(attendance_data)
+        overtime_pay = calculator.calculate_overtime_pay(shifts, hourly_rate)
+        night_shift_pay = calculator.calculate_night_pay(shifts, hourly_rate)
+        holiday_pay = calculator.calculate_holiday_pay(shifts, hourly_rate)
+    else:
+        overtime_pay = allowances["overtime_pay"]
+        night_shift_pay = allowances["night_pay"]
+        holiday_pay = allowances["holiday_pay"]
+
+    total_allowances = overtime_pay + night_shift_pay + holiday_pay
+    gross_pay = base_pay + total_allowances
+
+    # 부양가족 수 가져오기 (가족 수와 자녀 수를 합산)
+    dependents = employee.family_count or 1  # 기본값 1 (본인)
+
+    values = {
+        "base_salary": base_salary,
+        "join_date": join_date,
+        "resignation_date": resignation_date,
+        "hourly_rate": hourly_rate,
+        "base_pay": int(base_pay),
+        "overtime_pay": int(overtime_pay),
+        "night_shift_pay": int(night_shift_pay),
+        "holiday_pay": int(holiday_pay),
+        "total_allowances": int(total_allowances),
+        "gross_pay": int(gross_pay),
+        "dependents": dependents,
+    }
+    return values, gross_pay
+
+
+def calculate_payroll_values(
+    employee,
+    attendance_data,
+    start_date,
+    end_date,
+    calculator,
+    insurance_calc,
+    allowances=None,
+):
+    """
+    직원 1명의 급여 항목 계산
+
+    Args:
+        employee: Employee 모델 또는 EmployeeScalars
+        attendance_data (list): 근태 기록 (allowances 가 없을 때 수당 계산에 사용)
+        allowances (dict): 미리 계산된 overtime_pay, night_pay, holiday_pay.
+            None 이면 PayCalculator로 근태 기록에서 계산합니다.
+
+    Returns:
+        dict: 급여 항목별 계산 결과
+    """
+    values, gross_pay = calculate_earnings(
+        employee, attendance_data, start_date, end_date, calculator, allowances
+    )
+
+    # 4대 보험, 세금, 총 공제액, 실수령액 계산
+    values.update(insurance_calc.calculate_deductions(gross_pay, values["dependents"]))
+    return values
+
+
+def shard_by_weight(weights, shard_count):
+    """
+    가중치(근태 기록 수) 기준으로 인덱스를 shard_count 개 묶음으로 분배
+
+    가중치가 큰 순서대로 현재 합계가 가장 작은 묶음에 배정합니다(LPT).
+    동률은 원래 인덱스와 묶음 번호 순서로 처리하므로 결과가 항상 같습니다.
+
+    Returns:
+        list: 묶음별 인덱스 리스트 (각 묶음 안은 오름차순)
+    """
+    shard_count = max(1, min(shard_count, len(weights)))
+    order = sorted(range(len(weights)), key=lambda i: (-weights[i], i))
+    heap = [(0, shard) for shard in range(shard_count)]
+    shards = [[] for _ in range(shard_count)]
+    for index in order:
+        load, shard = heapq.heappop(heap)
+        shards[shard].append(index)
+        heapq.heappush(heap, (load + weights[index], shard))
+    return [sorted(shard) for shard in shards if shard]
+
+
+def build_shift_inputs(attendance_groups):
+    """
+    직원별 근태 기록을 작업자 전달용 배열로 변환
+
+    Returns:
+        dict: check_in, check_out (int64), holiday_type (bool) 연결 배열과
+              직원별 근무 건수 counts, 시작 위치 offsets
+    """
+    arrays = [records_to_shift_arrays(records) for records in attendance_groups]
+    counts = np.array([a["check_in"].size for a in arrays], dtype=np.int64)
+    offsets = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    def concat(key, dtype):
+        if not arrays:
+            return np.zeros(0, dtype=dtype)
+        return np.concatenate([a[key] for a in arrays]).astype(dtype, copy=False)
+
+    return {
+        "check_in": concat("check_in", np.int64),
+        "check_out": concat("check_out", np.int64),
+        "holiday_type": concat("holiday_type", bool),
+        "counts": counts,
+        "offsets": offsets,
+    }
+
+
+# 묶음 하나에 넣는 최대 직원 수 (진행 상황/저장 단위)
+SHARD_SIZE = 500
+
+_worker_state = {}
+
+# 프로세스 공용 작업자 풀 (처음 병렬 계산할 때 생성)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def max_workers():
+    """작업자 프로세스 수 상한 (CPU 수)"""
+    return os.cpu_count() or 1
+
+
+def clamp_workers(workers):
+    """
+    작업자 수를 [1, CPU 수] 범위의 정수로 변환
+
+    Raises:
+        ValueError: 정수로 변환할 수 없는 값인 경우
+    """
+    if isinstance(workers, bool):
+        raise ValueError(f"작업자 수는 정수여야 합니다: {workers!r}")
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        raise ValueError(f"작업자 수는 정수여야 합니다: {workers!r}") from None
+    return max(1, min(workers, max_workers()))
+
+
+def _get_pool():
+    """공용 작업자 풀 (CPU 수만큼, 작업자는 필요할 때 spawn 으로 시작)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_pool():
+    """공용 작업자 풀 종료 (다음 병렬 계산 때 다시 생성)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _worker_calculators():
+    """프로세스별 계산기 (작업자마다 한 번만 생성)"""
+    if not _worker_state:
+        _worker_state["calculator"] = PayCalculator()
+        _worker_state["insurance_calc"] = InsuranceCalculator()
+        _worker_state["engine"] = AllowanceEngine()
+    return (
+        _worker_state["calculator"],
+        _worker_state["insurance_calc"],
+        _worker_state["engine"],
+    )
+
+
+def calculate_shard(payload):
+    """
+    묶음 1개 계산 (작업자 프로세스에서 실행)
+
+    Args:
+        payload (tuple): (start_date, end_date, 직원 EmployeeScalars 리스트,
+                          check_in, check_out, holiday_type, counts)
+
+    Returns:
+        list: 직원 순서대로 급여 항목 dict (오류 시 {"error": 메시지})
+    """
+    start_date, end_date, employees, check_in, check_out, holiday_type, counts = payload
+    calculator, insurance_calc, engine = _worker_calculators()
+
+    hourly_rates = np.array(
+        [
+            (employee.base_salary / 12) / calculator.WORK_HOURS_PER_MONTH
+            for employee in employees
+        ],
+        dtype=np.float64,
+    )
+    groups = np.repeat(np.arange(len(employees), dtype=np.int64), counts)
+    allowances = engine.calculate(
+        check_in, check_out, holiday_type, hourly_rates, groups
+    )
+
+    # 직원별 기본급·수당 계산
+    results = [None] * len(employees)
+    earnings = []
+    for i, employee in enumerate(employees):
+        try:
+            values, gross_pay = calculate_earnings(
+                employee,
+                [],
+                start_date,
+                end_date,
+                calculator,
+                allowances={
+                    "overtime_pay": int(allowances["overtime_pay"][i]),
+                    "night_pay": int(allowances["night_pay"][i]),
+                    "holiday_pay": int(allowances["holiday_pay"][i]),
+                },
+            )
+            earnings.append((i, values, gross_pay))
+        except Exception as e:
+            results[i] = {"error": str(e)}
+
+    # 4대 보험, 세금, 총 공제액, 실수령액 일괄 계산
+    try:
+        deductions = insurance_calc.calculate_deductions_batch(
+            [gross_pay for _, _, gross_pay in earnings],
+            np.array(
+                [values["dependents"] for _, values, _ in earnings], dtype=np.int64
+            ),
+        )
+    except Exception as e:
+        for i, _, _ in earnings:
+            results[i] = {"error": str(e)}
+        return results
+
+    columns = {column: deductions[column].tolist() for column in DEDUCTION_COLUMNS}
+    for position, (i, values, _) in enumerate(earnings):
+        for column in DEDUCTION_COLUMNS:
+            values[column] = columns[column][position]
+        results[i] = values
+    return results
+
+
+def iter_batch_values(employees, attendance_groups, start_date, end_date, workers=1):
+    """
+    여러 직원의 급여 항목을 묶음 단위로 계산하며, 묶음이 끝날 때마다 결과 전달
+
+    작업자 수가 1 이하이면 입력 순서대로 SHARD_SIZE 명씩 현재 프로세스에서
+    계산하고, 2 이상이면 근태 기록 수(+1) 기준으로 균형 있게 나눈 묶음을 작업자
+    풀에서 계산해 끝난 순서대로 전달합니다. 제너레이터를 끝까지 소비하지 않으면
+    아직 시작하지 않은 묶음은 취소합니다.
+
+    Args:
+        employees (list): 직원별 EmployeeScalars
+        attendance_groups (list): 직원별 근태 기록 리스트 (employees 와 같은 순서)
+        start_date (date): 급여 기간 시작일
+        end_date (date): 급여 기간 종료일
+        workers (int): 작업자 프로세스 수 (CPU 수를 넘으면 CPU 수)
+
+    Yields:
+        tuple: (employees 인덱스 리스트, 같은 순서의 급여 항목 dict 리스트
+                (오류 시 {"error": 메시지}))
+    """
+    if not employees:
+        return
+    inputs = build_shift_inputs(attendance_groups)
+    offsets = inputs["offsets"]
+
+    def payload(indices):
+        positions = np.concatenate(
+            [np.arange(offsets[i], offsets[i + 1], dtype=np.int64) for i in indices]
+        )
+        return (
+            start_date,
+            end_date,
+            [employees[i] for i in indices],
+            inputs["check_in"][positions],
+            inputs["check_out"][positions],
+            inputs["holiday_type"][positions],
+            inputs["counts"][indices],
+        )
+
+    workers = clamp_workers(workers)
+    if workers <= 1 or len(employees) <= 1:
+        for first in range(0, len(employees), SHARD_SIZE):
+            indices = list(range(first, min(first + SHARD_SIZE, len(employees))))
+            yield indices, calculate_shard(payload(indices))
+        return
+
+    shard_count = max(workers, -(-len(employees) // SHARD_SIZE))
+    shards = shard_by_weight((inputs["counts"] + 1).tolist(), shard_count)
+    pool = _get_pool()
+    futures = {
+        pool.submit(calculate_shard, payload(indices)): indices for indices in shards
+    }
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    except BrokenProcessPool:
+        # 작업자가 비정상 종료된 풀은 다시 쓸 수 없으므로 다음 계산 때 새로 생성
+        shutdown_pool()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def calculate_batch_values(
+    employees, attendance_groups, start_date, end_date, workers=1
+):
+    """
+    여러 직원의 급여 항목을 일괄 계산
+
+    Args:
+        employees (list): 직원별 EmployeeScalars
+        attendance_groups (list): 직원별 근태 기록 리스트 (employees 와 같은 순서)
+        start_date (date): 급여 기간 시작일
+        end_date (date): 급여 기간 종료일
+        workers (int): 작업자 프로세스 수 (1 이하이면 현재 프로세스에서 계산,
+            CPU 수를 넘으면 CPU 수)
+
+    Returns:
+        list: employees 순서의 급여 항목 dict (오류 시 {"error": 메시지})
+    """
+    results = [None] * len(employees)
+    for indices, shard_results in iter_batch_values(
+        employees, attendance_groups, start_date, end_date, workers
+    ):
+        for index, values in zip(indices, shard_results):
+            results[index] = values
+    return results
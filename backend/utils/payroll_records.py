@@ -0,0 +1,140 @@
+"""
+급여 기록 조회 모듈 (/api/payroll/records)
+
+급여 기록을 (payment_period_start, id) 순서로 조회하며, 전체 조회(fetch_records,
+기본 JSON 배열 응답) 외에 두 가지 방식을 제공합니다.
+- 키셋(커서) 페이지: 마지막 행의 (급여기간 시작일, id)를 커서로 넘겨 다음 페이지를
+  인덱스 범위 조회로 가져옵니다. OFFSET 과 달리 뒤 페이지도 조회 비용이 같습니다.
+- 스트리밍(NDJSON): 서버 측 커서에서 STREAM_CHUNK_SIZE 행씩 가져와 한 행씩 내보내므로
+  결과 크기와 관계없이 메모리 사용량이 일정합니다.
+
+조회 컬럼과 응답 변환은 utils.read_layer.PAYROLL_RECORDS 를 사용하며, 직원 이름/부서/
+직급은 별도 IN 조회 대신 같은 쿼리의 외부 조인으로 가져옵니다.
+"""
+
+import base64
+import json
+from datetime import date
+
+from sqlalchemy import tuple_
+
+from models.models import Employee, Payroll
+from utils.read_layer import PAYROLL_RECORDS, STREAM_CHUNK_SIZE, execute_rows, iso_str
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def negotiated_format(request):
+    """요청한 응답 형식 (format=ndjson 또는 Accept: application/x-ndjson 이면 ndjson)"""
+    output_format = request.args.get("format")
+    if not output_format and request.accept_mimetypes.best == NDJSON_MIMETYPE:
+        output_format = "ndjson"
+    return output_format
+
+
+def encode_cursor(period_start, payroll_id):
+    """(급여기간 시작일, id)를 URL 에 넣을 수 있는 커서 문자열로 변환"""
+    raw = json.dumps([iso_str(period_start), payroll_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    커서 문자열을 (급여기간 시작일, id)로 변환
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        period_start, payroll_id = json.loads(raw)
+        return date.fromisoformat(period_start), int(payroll_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def parse_page_size(value):
+    """
+    limit 파라미터를 페이지 크기로 변환 (없으면 기본값, 최대 MAX_PAGE_SIZE)
+
+    Raises:
+        ValueError: 양의 정수가 아닌 경우
+    """
+    if value in (None, ""):
+        return DEFAULT_PAGE_SIZE
+    size = int(value)
+    if size < 1:
+        raise ValueError(f"limit 은 1 이상이어야 합니다: {value}")
+    return min(size, MAX_PAGE_SIZE)
+
+
+def build_records_query(employee_id=None, start_date=None, end_date=None, status=None):
+    """
+    필터를 적용한 급여 기록 조회문 ((급여기간 시작일, id) 순서)
+
+    Args:
+        employee_id (str): 직원 ID
+        start_date (date): 급여기간 시작일 하한
+        end_date (date): 급여기간 종료일 상한
+        status (list): 상태 목록 (draft, confirmed, paid 등)
+    """
+    query = PAYROLL_RECORDS.select().outerjoin(
+        Employee, Employee.employee_id == Payroll.employee_id
+    )
+    if employee_id:
+        query = query.where(Payroll.employee_id == employee_id)
+    if start_date:
+        query = query.where(Payroll.payment_period_start >= start_date)
+    if end_date:
+        query = query.where(Payroll.payment_period_end <= end_date)
+    if status:
+        query = query.where(Payroll.status.in_(status))
+    return query.order_by(Payroll.payment_period_start, Payroll.id)
+
+
+def fetch_page(session, query, page_size=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    키셋 페이지 조회
+
+    Args:
+        session: SQLAlchemy 세션
+        query: build_records_query 결과
+        page_size (int): 페이지 크기
+        cursor (str): 이전 페이지의 next_cursor (없으면 첫 페이지)
+
+    Returns:
+        dict: records, next_cursor(다음 페이지가 없으면 None), has_more, limit
+    """
+    if cursor:
+        period_start, payroll_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Payroll.payment_period_start, Payroll.id)
+            > tuple_(period_start, payroll_id)
+        )
+    # 한 행 더 조회해 다음 페이지 존재 여부 확인
+    rows = execute_rows(session, query.limit(page_size + 1)).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.payment_period_start, last.payroll_id)
+    return {
+        "records": [PAYROLL_RECORDS.to_dict(row) for row in rows],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "limit": page_size,
+    }
+
+
+def fetch_records(session, query):
+    """조회 결과 전체를 응답 딕셔너리 리스트로 반환"""
+    return PAYROLL_RECORDS.all(session, query)
+
+
+def iter_records(session, query, chunk_size=STREAM_CHUNK_SIZE):
+    """서버 측 커서에서 chunk_size 행씩 가져오며 응답 딕셔너리를 하나씩 생성"""
+    return PAYROLL_RECORDS.iter(session, query, chunk_size)
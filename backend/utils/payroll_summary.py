@@ -0,0 +1,146 @@
+"""
+월별 급여 요약 테이블 관리 모듈 (payroll_monthly_summary)
+
+확정/지급된 급여를 (급여월, 부서, 직급, 급여유형) 단위로 건수, 지급 건수,
+급여 항목별 합계/최소/최대로 미리 집계해 둡니다. 급여월은 급여기간 시작일 기준입니다.
+
+요약은 증분 계산 대신 영향받은 월 전체를 다시 집계합니다 (DELETE 후
+INSERT ... SELECT GROUP BY). 합계와 달리 최소/최대는 빼서 되돌릴 수 없고, 다시
+집계하면 요약이 항상 급여 테이블과 같아지기 때문입니다. 한 월의 급여 행만 읽으므로
+급여 확정/지급 트랜잭션 안에서 호출해도 비용은 해당 월의 급여 건수 정도입니다.
+
+- refresh_payroll_summary: 지정한 월 다시 집계 (호출자 트랜잭션 안에서, 커밋 안 함)
+- rebuild_payroll_summary: 전체 다시 집계 (백필, scripts/rebuild_payroll_summary.py)
+- ensure_payroll_summary: 요약이 비어 있는데 급여가 있으면 전체 다시 집계 (서버 시작 시)
+
+부서/직급은 집계 시점의 직원 정보이므로, 직원의 부서/직급을 바꾼 뒤 과거 월에도
+반영하려면 전체 다시 집계를 실행합니다.
+"""
+
+from sqlalchemy import and_, case, delete, exists, func, insert, or_, select
+
+from models.models import Employee, Payroll, PayrollMonthlySummary
+from utils.partition_files import month_range
+
+# 요약에 포함하는 급여 상태
+SUMMARY_STATUSES = ("confirmed", "paid")
+
+# 합계/최소/최대를 저장하는 급여 항목
+SUMMARY_PAY_COLUMNS = (
+    "base_pay",
+    "overtime_pay",
+    "night_shift_pay",
+    "holiday_pay",
+    "gross_pay",
+    "total_deductions",
+    "net_pay",
+)
+
+
+def build_summary_query(months=None):
+    """급여 테이블을 요약 단위로 집계하는 (컬럼 이름 목록, 조회문)"""
+    month = func.strftime("%Y-%m", Payroll.payment_period_start)
+    # 부서/직급은 요약 테이블의 기본 키이므로 NULL 은 빈 문자열로 저장
+    department = func.coalesce(Employee.department, "")
+    position = func.coalesce(Employee.position, "")
+    names = [
+        "month",
+        "department",
+        "position",
+        "payroll_type",
+        "payroll_count",
+        "paid_count",
+        "max_period_end",
+    ]
+    columns = [
+        month,
+        department,
+        position,
+        Payroll.payroll_type,
+        func.count(),
+        func.sum(case((Payroll.status == "paid", 1), else_=0)),
+        func.max(Payroll.payment_period_end),
+    ]
+    for name in SUMMARY_PAY_COLUMNS:
+        column = getattr(Payroll, name)
+        names += [f"sum_{name}", f"min_{name}", f"max_{name}"]
+        columns += [func.sum(column), func.min(column), func.max(column)]
+
+    statement = (
+        select(*columns)
+        .select_from(Payroll)
+        .join(Employee, Payroll.employee_id == Employee.employee_id)
+        .where(Payroll.status.in_(SUMMARY_STATUSES))
+    )
+    if months is not None:
+        # 월별 기간 조건으로 (기간 시작일) 인덱스 사용
+        statement = statement.where(
+            or_(
+                *(
+                    and_(
+                        Payroll.payment_period_start >= first_day,
+                        Payroll.payment_period_start < next_first_day,
+                    )
+                    for first_day, next_first_day in map(month_range, sorted(months))
+                )
+            )
+        )
+    statement = statement.group_by(month, department, position, Payroll.payroll_type)
+    return names, statement
+
+
+def refresh_payroll_summary(session, months=None):
+    """
+    지정한 급여월의 요약을 급여 테이블에서 다시 집계
+
+    세션의 미반영 변경을 먼저 flush 하고 같은 트랜잭션에서 DELETE/INSERT 하므로,
+    호출자가 커밋하면 급여 변경과 요약이 함께 반영되고 롤백하면 함께 취소됩니다.
+
+    Args:
+        session: SQLAlchemy 세션
+        months (iterable): 급여월 키(YYYY-MM) 목록. None 이면 전체
+
+    Returns:
+        int: 새로 기록된 요약 행 수
+    """
+    if months is not None:
+        months = set(months)
+        if not months:
+            return 0
+
+    session.flush()
+    clear = delete(PayrollMonthlySummary)
+    if months is not None:
+        clear = clear.where(PayrollMonthlySummary.month.in_(months))
+    session.execute(clear)
+
+    names, statement = build_summary_query(months)
+    result = session.execute(
+        insert(PayrollMonthlySummary).from_select(names, statement)
+    )
+    return result.rowcount
+
+
+def rebuild_payroll_summary(session):
+    """요약 전체 다시 집계 후 커밋 (백필)"""
+    count = refresh_payroll_summary(session)
+    session.commit()
+    return count
+
+
+def ensure_payroll_summary(session):
+    """
+    요약이 비어 있는데 요약 대상 급여가 있으면 전체 다시 집계
+
+    요약 테이블을 처음 만든 기존 데이터베이스를 서버 시작 시 채우는 용도입니다.
+
+    Returns:
+        int: 새로 기록된 요약 행 수 (다시 집계하지 않았으면 0)
+    """
+    summary_exists = session.scalar(select(exists().select_from(PayrollMonthlySummary)))
+    payroll_exists = session.scalar(
+        select(exists().where(Payroll.status.in_(SUMMARY_STATUSES)))
+    )
+    if summary_exists or not payroll_exists:
+        return 0
+    return rebuild_payroll_summary(session)
@@ -0,0 +1,233 @@
+"""
+급여 계산 내역(trace) 모듈
+
+급여 계산 결과를 구조화된 계산 내역으로 만들고, 저장용으로 압축/복원합니다.
+계산 내역은 요청 시에만 생성합니다 (trace 수준: none | summary | full).
+
+- none: 계산 내역을 만들지 않음 (기본값)
+- summary: 주요 합계 금액만 결과에 포함
+- full: 전체 계산 단계를 zlib 압축 JSON 으로 저장하고 payroll_code 로 조회
+
+사람이 읽는 문자열 형식은 조회 시점에 render_trace_lines 로 생성합니다.
+"""
+
+import json
+import zlib
+
+TRACE_NONE = "none"
+TRACE_SUMMARY = "summary"
+TRACE_FULL = "full"
+TRACE_LEVELS = (TRACE_NONE, TRACE_SUMMARY, TRACE_FULL)
+
+# 저장 형식 (payroll_calculation_traces.encoding)
+TRACE_ENCODING = "json+zlib"
+TRACE_VERSION = 1
+
+# summary 수준에 포함되는 금액 항목
+SUMMARY_FIELDS = (
+    "base_pay",
+    "total_allowances",
+    "gross_pay",
+    "total_deductions",
+    "net_pay",
+)
+
+
+def normalize_trace_level(level):
+    """
+    요청의 trace 값을 검증하여 반환
+
+    Raises:
+        ValueError: 지원하지 않는 trace 값인 경우
+    """
+    if level is None or level == "":
+        return TRACE_NONE
+    level = str(level).lower()
+    if level not in TRACE_LEVELS:
+        raise ValueError(
+            f"지원하지 않는 trace 값입니다: {level} ({', '.join(TRACE_LEVELS)})"
+        )
+    return level
+
+
+def build_summary(values):
+    """summary 수준 계산 내역 (주요 합계 금액)"""
+    return {field: values[field] for field in SUMMARY_FIELDS}
+
+
+def build_trace(employee, start_date, end_date, values, calculator, insurance_calc):
+    """
+    full 수준 계산 내역 생성
+
+    Args:
+        employee: Employee 모델 또는 employee_id/name 속성을 가진 객체
+        values (dict): calculate_payroll_values 의 계산 결과
+        calculator (PayCalculator): 월 소정근로시간 조회용
+        insurance_calc (InsuranceCalculator): 보험 요율 조회용
+
+    Returns:
+        dict: 계산 입력 값(연봉, 시간당 임금, 부양가족 수, 보험 요율 등)과
+              항목별 계산 결과. 계산식 문자열은 render_trace_lines 에서 만듭니다.
+    """
+    rates = insurance_calc.RATES
+    return {
+        "version": TRACE_VERSION,
+        "employee": {
+            "employee_id": employee.employee_id,
+            "name": getattr(employee, "name", None),
+        },
+        "period": {
+            "start": start_date.strftime("%Y-%m-%d"),
+            "end": end_date.strftime("%Y-%m-%d"),
+        },
+        "inputs": {
+            "base_salary": values["base_salary"],
+            "join_date": values["join_date"],
+            "resignation_date": values["resignation_date"],
+            "hourly_rate": values["hourly_rate"],
+            "work_hours_per_month": calculator.WORK_HOURS_PER_MONTH,
+            "dependents": values["dependents"],
+            "rates": {
+                "national_pension": rates["NATIONAL_PENSION"],
+                "health_insurance": rates["HEALTH_INSURANCE"],
+                "long_term_care": rates["LONG_TERM_CARE"],
+                "employment_insurance": rates["EMPLOYMENT_INSURANCE"],
+            },
+        },
+        "results": {
+            field: values[field]
+            for field in (
+                "base_pay",
+                "overtime_pay",
+                "night_shift_pay",
+                "holiday_pay",
+                "total_allowances",
+                "gross_pay",
+                "national_pension",
+                "health_insurance",
+                "long_term_care",
+                "employment_insurance",
+                "income_tax",
+                "residence_tax",
+                "total_deductions",
+                "net_pay",
+            )
+        },
+    }
+
+
+def encode_trace(trace):
+    """계산 내역을 저장용 바이트로 압축"""
+    payload = json.dumps(trace, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"))
+
+
+def decode_trace(data):
+    """저장된 바이트를 계산 내역으로 복원"""
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def render_trace_lines(trace):
+    """계산 내역을 사람이 읽는 문자열 목록으로 변환 (조회 시점에 생성)"""
+    employee = trace["employee"]
+    inputs = trace["inputs"]
+    rates = inputs["rates"]
+    r = trace["results"]
+    gross_pay = r["gross_pay"]
+    dependents = inputs["dependents"]
+
+    lines = ["=" * 80]
+    lines.append(
+        f"급여 계산 시작: 직원 ID {employee['employee_id']}, 이름: {employee['name']}"
+    )
+    lines.append(f"계산 기간: {trace['period']['start']} ~ {trace['period']['end']}")
+    lines.append("=" * 80)
+
+    def section(title, width=80):
+        lines.append("\n" + "-" * width)
+        lines.append(title)
+        lines.append("-" * width)
+
+    section("1. 기본 정보")
+    lines.append(f"연봉: {inputs['base_salary']:,}원")
+    lines.append(f"입사일: {inputs['join_date'] or '정보 없음'}")
+    lines.append(f"퇴사일: {inputs['resignation_date'] or '재직중'}")
+    lines.append(
+        f"시간당 임금: {inputs['hourly_rate']:,.2f}원 (연봉 ÷ 12개월 ÷ {inputs['work_hours_per_month']}시간)"
+    )
+
+    section("2. 기본급 계산")
+    lines.append("계산식: 월 기본급 × 근무일수 비율")
+    lines.append(f"계산결과: {r['base_pay']:,}원")
+
+    section("3. 연장근로수당 계산")
+    lines.append("계산식: 연장근로시간 × 시간당 임금 × 1.5")
+    lines.append(f"계산결과: {r['overtime_pay']:,}원")
+
+    section("4. 야간근로수당 계산")
+    lines.append("계산식: 야간근로시간(22:00~06:00) × 시간당 임금 × 0.5")
+    lines.append(f"계산결과: {r['night_shift_pay']:,}원")
+
+    section("5. 휴일근로수당 계산")
+    lines.append("계산식: 휴일근로시간 × 시간당 임금 × 1.5")
+    lines.append(f"계산결과: {r['holiday_pay']:,}원")
+
+    section("6. 총 수당 합계")
+    lines.append(
+        f"연장근로수당 + 야간근로수당 + 휴일근로수당 = {r['overtime_pay']:,} + {r['night_shift_pay']:,} + {r['holiday_pay']:,}"
+    )
+    lines.append(f"계산결과: {r['total_allowances']:,}원")
+
+    section("7. 총 지급액 계산")
+    lines.append(f"기본급 + 총 수당 = {r['base_pay']:,} + {r['total_allowances']:,}")
+    lines.append(f"계산결과: {gross_pay:,}원")
+
+    section("8. 4대 보험 및 세금 계산")
+    lines.append(f"총 지급액: {gross_pay:,}원")
+    lines.append(f"부양가족 수: {dependents}명")
+
+    section("8.1 국민연금", 40)
+    lines.append(f"계산식: {gross_pay:,} × {rates['national_pension']:.3f}")
+    lines.append(f"계산결과: {r['national_pension']:,}원")
+
+    section("8.2 건강보험", 40)
+    lines.append(f"계산식: {gross_pay:,} × {rates['health_insurance']:.5f}")
+    lines.append(f"계산결과: {r['health_insurance']:,}원")
+
+    section("8.3 장기요양보험", 40)
+    lines.append(
+        f"계산식: {r['health_insurance']:,} × {rates['long_term_care']:.4f} × 0.5(직원부담분)"
+    )
+    lines.append(f"계산결과: {r['long_term_care']:,}원")
+
+    section("8.4 고용보험", 40)
+    lines.append(f"계산식: {gross_pay:,} × {rates['employment_insurance']:.4f}")
+    lines.append(f"계산결과: {r['employment_insurance']:,}원")
+
+    section("8.5 소득세", 40)
+    lines.append("계산식: 세액표 기준 계산")
+    lines.append(f"월 급여: {gross_pay:,}원, 부양가족: {dependents}명")
+    lines.append(f"계산결과: {r['income_tax']:,}원")
+
+    section("8.6 지방소득세", 40)
+    lines.append(f"계산식: 소득세({r['income_tax']:,}) × 0.1")
+    lines.append(f"계산결과: {r['residence_tax']:,}원")
+
+    section("9. 총 공제액 계산")
+    lines.append("소득세 + 지방소득세 + 국민연금 + 건강보험 + 장기요양보험 + 고용보험")
+    lines.append(
+        f"{r['income_tax']:,} + {r['residence_tax']:,} + {r['national_pension']:,} + {r['health_insurance']:,} + {r['long_term_care']:,} + {r['employment_insurance']:,}"
+    )
+    lines.append(f"계산결과: {r['total_deductions']:,}원")
+
+    section("10. 실수령액 계산")
+    lines.append(f"총 지급액 - 총 공제액 = {gross_pay:,} - {r['total_deductions']:,}")
+    lines.append(f"계산결과: {r['net_pay']:,}원")
+
+    lines.append("\n" + "=" * 80)
+    lines.append(
+        f"급여 계산 완료: 직원 ID {employee['employee_id']}, 이름: {employee['name']}"
+    )
+    lines.append(f"실수령액: {r['net_pay']:,}원")
+    lines.append("=" * 80 + "\n")
+    return lines
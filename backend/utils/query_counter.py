@@ -0,0 +1,64 @@
+"""
+SQL 실행 횟수 측정 모듈
+
+엔진의 before_cursor_execute 이벤트로 실제 DB 에 보낸 문장 수를 셉니다.
+executemany 한 번(ORM 일괄 INSERT 등)은 한 문장으로 셉니다.
+목록 크기에 따라 쿼리 수가 늘어나는 N+1 회귀를 확인할 때 사용합니다.
+
+    with QueryCounter(engine) as counter:
+        ...
+    print(counter.count, counter.statements)
+
+    with assert_max_queries(engine, 3):
+        ...  # 3 문장을 넘으면 AssertionError (실행된 문장 목록 포함)
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+# 세션/트랜잭션 관리용 문장은 세지 않음
+_IGNORED_PREFIXES = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+class QueryCounter:
+    """with 블록 안에서 엔진이 실행한 SQL 문장 수 측정"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        return False
+
+
+@contextmanager
+def assert_max_queries(engine, limit):
+    """
+    with 블록의 SQL 문장 수가 limit 이하인지 확인
+
+    Raises:
+        AssertionError: limit 을 넘은 경우 (실행된 문장 목록 포함)
+    """
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        listing = "\n".join(
+            f"  {i}. {' '.join(statement.split())[:200]}"
+            for i, statement in enumerate(counter.statements, 1)
+        )
+        raise AssertionError(f"SQL {counter.count}건 실행 (최대 {limit}건)\n{listing}")
@@ -0,0 +1,174 @@
+"""
+목록 조회용 경량 읽기 계층
+
+목록 API 는 응답에 필요한 컬럼만 select() 로 조회하고, 결과 Row 를 응답 딕셔너리로
+바로 변환합니다. ORM 엔티티를 만들지 않으므로 identity map 등록, 속성 계측,
+관계/타임스탬프 등 쓰지 않는 컬럼 로드 비용이 없습니다.
+
+- ReadView: 응답 한 종류의 조회 컬럼(응답 필드명으로 label)과 Row 변환 함수
+- 변환은 Row._asdict() 뿐이며, 기본값(COALESCE)과 필드명 변경(label)은 SQL 에서 처리
+- Date 컬럼은 text_date() 로 저장된 'YYYY-MM-DD' 문자열을 그대로 읽어 date 변환과
+  strftime 을 생략합니다 (문자열이 아닌 값을 돌려주는 DB 에서는 iso_str 이 변환)
+- 쿼리는 세션의 Connection 에서 Core 로 실행합니다 (세션 트랜잭션은 그대로 사용)
+"""
+
+from sqlalchemy import String, func, select, type_coerce
+
+from models.models import Attendance, AttendanceAudit, Employee, Payroll
+
+# 스트리밍 조회 시 서버 측 커서에서 한 번에 가져오는 행 수
+STREAM_CHUNK_SIZE = 500
+
+UNKNOWN = "Unknown"
+
+
+def text_date(column, name=None):
+    """Date 컬럼을 저장된 문자열 그대로 조회 (응답 필드명 label)"""
+    return type_coerce(column, String).label(name or column.key)
+
+
+def coalesce(column, default, name=None):
+    """NULL 을 기본값으로 바꿔 조회"""
+    return func.coalesce(column, default).label(name or column.key)
+
+
+def iso_str(value):
+    """날짜/일시 값을 ISO 형식 문자열로 (문자열과 None 은 그대로)"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def execute_rows(session, statement, chunk_size=None):
+    """
+    세션의 Connection 에서 조회문을 Core 로 실행
+
+    Args:
+        chunk_size (int): 지정하면 서버 측 커서에서 이 행 수씩 가져옴 (스트리밍)
+    """
+    connection = session.connection()
+    if chunk_size:
+        connection = connection.execution_options(yield_per=chunk_size)
+    return connection.execute(statement)
+
+
+class ReadView:
+    """목록 응답 한 종류의 조회 컬럼과 Row → 응답 딕셔너리 변환"""
+
+    def __init__(self, *columns, iso_fields=()):
+        """
+        Args:
+            columns: 조회 컬럼 (label 이 곧 응답 필드명)
+            iso_fields (tuple): ISO 문자열로 바꿀 날짜/일시 필드명
+        """
+        self.columns = columns
+        self.iso_fields = tuple(iso_fields)
+
+    def to_dict(self, row):
+        """Row 를 응답 딕셔너리로 변환"""
+        data = row._asdict()
+        for name in self.iso_fields:
+            data[name] = iso_str(data[name])
+        return data
+
+    def select(self):
+        """이 뷰의 컬럼만 조회하는 select() (where/order_by 는 호출자가 추가)"""
+        return select(*self.columns)
+
+    def all(self, session, statement):
+        """조회 결과 전체를 응답 딕셔너리 목록으로"""
+        to_dict = self.to_dict
+        return [to_dict(row) for row in execute_rows(session, statement)]
+
+    def iter(self, session, statement, chunk_size=STREAM_CHUNK_SIZE):
+        """서버 측 커서에서 chunk_size 행씩 가져오며 응답 딕셔너리를 하나씩 생성"""
+        to_dict = self.to_dict
+        for row in execute_rows(session, statement, chunk_size):
+            yield to_dict(row)
+
+
+# /api/employees
+EMPLOYEE_LIST = ReadView(
+    Employee.employee_id,
+    Employee.name,
+    Employee.department,
+    Employee.position,
+    Employee.base_salary,
+    Employee.family_count,
+    Employee.status,
+)
+
+# /api/attendance (CSV 와 같은 기본값)
+ATTENDANCE_LIST = ReadView(
+    Attendance.employee_id,
+    text_date(Attendance.date),
+    coalesce(Attendance.check_in, ""),
+    coalesce(Attendance.check_out, ""),
+    coalesce(Attendance.attendance_type, "정상"),
+    coalesce(Attendance.remarks, ""),
+    iso_fields=("date",),
+)
+
+# /api/attendance/records
+ATTENDANCE_RECORDS = ReadView(
+    Attendance.id,
+    Attendance.employee_id,
+    text_date(Attendance.date),
+    Attendance.check_in,
+    Attendance.check_out,
+    Attendance.attendance_type,
+    Attendance.remarks,
+    iso_fields=("date",),
+)
+
+# /api/attendance/audit
+ATTENDANCE_AUDIT = ReadView(
+    AttendanceAudit.id,
+    AttendanceAudit.employee_id,
+    text_date(AttendanceAudit.date),
+    AttendanceAudit.field_name,
+    AttendanceAudit.old_value,
+    AttendanceAudit.new_value,
+    AttendanceAudit.change_type,
+    AttendanceAudit.changed_by,
+    AttendanceAudit.changed_at,
+    AttendanceAudit.ip_address,
+    iso_fields=("date", "changed_at"),
+)
+
+# /api/payroll/records (직원 정보는 외부 조인, 기존 응답 필드명 유지)
+PAYROLL_RECORDS = ReadView(
+    Payroll.id.label("payroll_id"),
+    Payroll.payroll_code,
+    Payroll.employee_id,
+    coalesce(Employee.name, UNKNOWN, "employee_name"),
+    coalesce(Employee.department, UNKNOWN),
+    coalesce(Employee.position, UNKNOWN),
+    text_date(Payroll.payment_period_start),
+    text_date(Payroll.payment_period_end),
+    text_date(Payroll.payment_date),
+    Payroll.base_pay.label("basePay"),
+    Payroll.overtime_pay.label("overtimePay"),
+    Payroll.night_shift_pay.label("nightPay"),
+    Payroll.holiday_pay.label("holidayPay"),
+    Payroll.total_allowances.label("totalAllowances"),
+    Payroll.gross_pay.label("totalPay"),
+    Payroll.income_tax,
+    Payroll.residence_tax,
+    Payroll.national_pension,
+    Payroll.health_insurance,
+    Payroll.employment_insurance,
+    Payroll.total_deductions,
+    Payroll.net_pay.label("netPay"),
+    Payroll.status,
+    Payroll.confirmed_at,
+    Payroll.confirmed_by,
+    Payroll.payment_method,
+    Payroll.remarks,
+    iso_fields=(
+        "payment_period_start",
+        "payment_period_end",
+        "payment_date",
+        "confirmed_at",
+    ),
+)
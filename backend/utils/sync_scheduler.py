@@ -0,0 +1,286 @@
+"""
+근태 파일 동기화 스케줄러 (debounce + 병합 + 자체 쓰기 무시)
+
+watchdog 이벤트마다 바로 동기화하지 않고,
+- 마지막 이벤트 후 조용한 구간(quiet window)이 지나면 한 번만 동기화하고
+  (계속 이벤트가 와도 첫 이벤트 후 max_wait 가 지나면 실행)
+- 이미 대기 중인 동기화가 있으면 새 요청을 합치며
+- 서버가 직접 쓴 파일(쓰기 세대 토큰으로 기록한 stat)은 동기화하지 않고
+- 동기화는 전용 작업 스레드 하나가 크기 제한 큐에서 꺼내 순서대로 실행합니다.
+
+동기화 시간, 큐 길이, 이벤트/병합/무시 건수는 metrics() 로 확인합니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+
+from utils.file_fingerprint import stat_key
+
+# 기본 설정 (초)
+DEFAULT_QUIET_SECONDS = 0.5
+DEFAULT_MAX_WAIT_SECONDS = 5.0
+DEFAULT_QUEUE_SIZE = 4
+
+_STOP = object()
+
+
+class SyncScheduler:
+    """파일 변경 이벤트를 모아 전용 작업 스레드에서 동기화를 실행하는 스케줄러"""
+
+    def __init__(
+        self,
+        path,
+        sync_func,
+        on_synced=None,
+        quiet_seconds=DEFAULT_QUIET_SECONDS,
+        max_wait_seconds=DEFAULT_MAX_WAIT_SECONDS,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        logger=None,
+    ):
+        """
+        Args:
+            path (str): 감시 파일 경로 (자체 쓰기 판별용)
+            sync_func (callable): 동기화 함수 (변경이 반영되었으면 True 반환)
+            on_synced (callable): 동기화로 변경이 반영된 뒤 호출할 함수
+            quiet_seconds (float): 마지막 이벤트 후 기다릴 조용한 구간
+            max_wait_seconds (float): 이벤트가 계속 와도 첫 이벤트 후 최대 대기 시간
+            queue_size (int): 작업 큐 최대 길이
+        """
+        self.path = path
+        self.sync_func = sync_func
+        self.on_synced = on_synced
+        self.quiet_seconds = quiet_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._condition = threading.Condition()
+        self._first_event_at = None
+        self._last_event_at = None
+        self._pending = False  # 큐에 아직 시작되지 않은 동기화가 있는지
+        self._running = False
+        self._threads = []
+
+        # 자체 쓰기 (쓰기 세대 토큰)
+        self._generation = 0
+        self._active_writes = set()
+        self._self_written = None  # (토큰, 쓰기 직후 stat 키)
+
+        self._stats = {
+            "events_received": 0,
+            "events_coalesced": 0,
+            "self_writes_ignored": 0,
+            "syncs_queued": 0,
+            "syncs_dropped": 0,
+            "syncs_run": 0,
+            "syncs_changed": 0,
+            "sync_errors": 0,
+            "last_sync_seconds": None,
+            "max_sync_seconds": None,
+            "total_sync_seconds": 0.0,
+            "last_sync_at": None,
+            "last_error": None,
+            "max_queue_depth": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 시작/중지
+    # ------------------------------------------------------------------
+    def start(self):
+        """debounce 스레드와 동기화 작업 스레드 시작"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._threads = [
+            threading.Thread(
+                target=self._debounce_loop, daemon=True, name="AttendanceSyncDebounce"
+            ),
+            threading.Thread(
+                target=self._worker_loop, daemon=True, name="AttendanceSyncWorker"
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=3.0):
+        """스레드 중지 (대기 중인 이벤트는 버림)"""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._first_event_at = self._last_event_at = None
+            self._condition.notify_all()
+        # 큐가 가득 차 있으면 대기 작업 하나를 버리고 중지 신호를 넣음
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(_STOP)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    @property
+    def running(self):
+        return self._running
+
+    # ------------------------------------------------------------------
+    # 이벤트 / 요청
+    # ------------------------------------------------------------------
+    def notify(self):
+        """파일 변경 이벤트 기록 (quiet window 동안 추가 이벤트는 한 번으로 합침)"""
+        now = time.monotonic()
+        with self._condition:
+            self._stats["events_received"] += 1
+            if self._first_event_at is None:
+                self._first_event_at = now
+            else:
+                self._stats["events_coalesced"] += 1
+            self._last_event_at = now
+            self._condition.notify_all()
+
+    def request_sync(self):
+        """debounce 없이 동기화 요청 (대기 중인 동기화가 있으면 합침)
+
+        Returns:
+            bool: 새로 큐에 넣었으면 True
+        """
+        return self._enqueue()
+
+    def _enqueue(self):
+        """동기화 작업을 큐에 넣기 (대기 중인 작업이 있으면 합침)"""
+        with self._condition:
+            if self._pending:
+                self._stats["events_coalesced"] += 1
+                return False
+            try:
+                self._queue.put_nowait(time.monotonic())
+            except queue.Full:
+                self._stats["syncs_dropped"] += 1
+                return False
+            self._pending = True
+            self._stats["syncs_queued"] += 1
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self._queue.qsize()
+            )
+            return True
+
+    # ------------------------------------------------------------------
+    # 자체 쓰기
+    # ------------------------------------------------------------------
+    def begin_self_write(self):
+        """서버가 감시 파일을 쓰기 시작함을 기록 (쓰기 세대 토큰 반환)"""
+        with self._condition:
+            self._generation += 1
+            token = self._generation
+            self._active_writes.add(token)
+            return token
+
+    def end_self_write(self, token):
+        """서버 쓰기 완료 기록 (현재 stat 을 토큰과 함께 저장)"""
+        key = stat_key(self.path)
+        with self._condition:
+            self._active_writes.discard(token)
+            self._self_written = (token, key)
+            self._condition.notify_all()
+
+    def _is_self_written(self):
+        """현재 파일이 마지막 자체 쓰기 결과 그대로인지 (호출자가 잠금 보유)"""
+        if self._self_written is None:
+            return False
+        return stat_key(self.path) == self._self_written[1]
+
+    # ------------------------------------------------------------------
+    # 스레드
+    # ------------------------------------------------------------------
+    def _debounce_loop(self):
+        """조용한 구간이 지나면 동기화 작업을 큐에 넣음"""
+        while True:
+            with self._condition:
+                while self._running and self._last_event_at is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                deadline = min(
+                    self._last_event_at + self.quiet_seconds,
+                    self._first_event_at + self.max_wait_seconds,
+                )
+                remaining = deadline - time.monotonic()
+                # 서버가 쓰는 중이면 쓰기가 끝날 때까지 대기
+                if remaining > 0 or self._active_writes:
+                    self._condition.wait(timeout=max(remaining, 0.05))
+                    continue
+                self._first_event_at = self._last_event_at = None
+                if self._is_self_written():
+                    self._stats["self_writes_ignored"] += 1
+                    self.logger.info("서버가 쓴 근태 파일 변경은 동기화하지 않습니다.")
+                    continue
+            self._enqueue()
+
+    def _worker_loop(self):
+        """큐에서 작업을 꺼내 동기화 실행 (한 번에 하나)"""
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            with self._condition:
+                self._pending = False
+            self._run_sync()
+
+    def _run_sync(self):
+        """동기화 실행 및 지표 기록"""
+        started = time.perf_counter()
+        changed = False
+        error = None
+        try:
+            changed = bool(self.sync_func())
+            if changed and self.on_synced is not None:
+                self.on_synced()
+        except Exception as e:
+            error = str(e)
+            self.logger.error(f"근태 파일 동기화 작업 오류: {error}")
+        elapsed = time.perf_counter() - started
+
+        with self._condition:
+            stats = self._stats
+            stats["syncs_run"] += 1
+            stats["syncs_changed"] += int(changed)
+            stats["last_sync_seconds"] = elapsed
+            stats["max_sync_seconds"] = max(stats["max_sync_seconds"] or 0, elapsed)
+            stats["total_sync_seconds"] += elapsed
+            stats["last_sync_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if error is not None:
+                stats["sync_errors"] += 1
+                stats["last_error"] = error
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    def metrics(self):
+        """
+        스케줄러 지표
+
+        Returns:
+            dict: 이벤트/동기화 건수, 동기화 시간(초), 현재 큐 길이 등
+        """
+        with self._condition:
+            metrics = dict(self._stats)
+            metrics["queue_depth"] = self._queue.qsize()
+            metrics["queue_size"] = self._queue.maxsize
+            metrics["sync_pending"] = self._pending
+            metrics["event_waiting"] = self._last_event_at is not None
+            metrics["quiet_seconds"] = self.quiet_seconds
+            metrics["max_wait_seconds"] = self.max_wait_seconds
+            metrics["running"] = self._running
+        runs = metrics["syncs_run"]
+        metrics["avg_sync_seconds"] = (
+            metrics["total_sync_seconds"] / runs if runs else None
+        )
+        return metrics
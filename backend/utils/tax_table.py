@@ -0,0 +1,298 @@
+"""
+근로소득 간이세액표 모듈
+
+tax_table_2024.json 을 한 번만 읽어 구간 하한/상한 정렬 배열과
+부양가족 수 × 구간 세액 행렬(NumPy)로 변환해 둡니다.
+단건 조회는 bisect, 일괄 조회는 np.searchsorted 로 처리하며
+프로세스 전체에서 파일 경로별로 하나의 세액표를 공유합니다.
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+DEFAULT_TAX_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "tax_table_2024.json"
+)
+
+# 1천만원 초과 구간 계산 기준 금액
+HIGH_INCOME_THRESHOLD = 10_000_000
+
+
+def _parse_brackets(brackets):
+    """'하한-상한' 키를 (하한, 상한, 값) 목록으로 변환하고 정렬·연속 여부 검증"""
+    parsed = []
+    for bracket, value in brackets.items():
+        start, end = map(int, bracket.split("-"))
+        parsed.append((start, end, value))
+    parsed.sort(key=lambda item: item[0])
+    for (_, prev_end, _), (start, _, _) in zip(parsed, parsed[1:]):
+        if start < prev_end:
+            raise ValueError(f"세액표 구간이 겹칩니다: {start} < {prev_end}")
+    return parsed
+
+
+class TaxTable:
+    """간이세액표 (정렬 배열 + 부양가족 수 × 구간 세액 행렬)"""
+
+    def __init__(self, data):
+        """
+        Args:
+            data (dict): tax_table_2024.json 내용
+                (tax_brackets, high_income_brackets)
+        """
+        brackets = _parse_brackets(data["tax_brackets"])
+        high_brackets = _parse_brackets(data.get("high_income_brackets", {}))
+
+        # 부양가족 수 키 ('1' ~ '11') → 행 번호
+        dependent_keys = sorted(
+            {key for _, _, taxes in brackets for key in taxes}
+            | {key for _, _, info in high_brackets for key in info["base_tax"]},
+            key=int,
+        )
+        self.dependent_rows = {key: row for row, key in enumerate(dependent_keys)}
+        self.dependents = np.array([int(key) for key in dependent_keys], dtype=np.int64)
+
+        # 1천만원 이하 구간
+        self.lower = np.array([start for start, _, _ in brackets], dtype=np.int64)
+        self.upper = np.array([end for _, end, _ in brackets], dtype=np.int64)
+        # 세액이 없는 부양가족 수는 0원 (presence 행렬로 구분)
+        self.taxes = np.zeros((len(dependent_keys), len(brackets)), dtype=np.int64)
+        self.has_tax = np.zeros(self.taxes.shape, dtype=bool)
+        for column, (_, _, taxes) in enumerate(brackets):
+            for key, tax in taxes.items():
+                self.taxes[self.dependent_rows[key], column] = tax
+                self.has_tax[self.dependent_rows[key], column] = True
+
+        # 1천만원 초과 구간
+        self.high_lower = np.array([s for s, _, _ in high_brackets], dtype=np.int64)
+        self.high_upper = np.array([e for _, e, _ in high_brackets], dtype=np.int64)
+        self.high_rate = np.array(
+            [info["rate"] for _, _, info in high_brackets], dtype=np.float64
+        )
+        self.high_addition = np.array(
+            [info["addition"] for _, _, info in high_brackets], dtype=np.int64
+        )
+        self.high_base_tax = np.zeros(
+            (len(dependent_keys), len(high_brackets)), dtype=np.int64
+        )
+        self.high_has_base_tax = np.zeros(self.high_base_tax.shape, dtype=bool)
+        for column, (_, _, info) in enumerate(high_brackets):
+            for key, tax in info["base_tax"].items():
+                self.high_base_tax[self.dependent_rows[key], column] = tax
+                self.high_has_base_tax[self.dependent_rows[key], column] = True
+
+        # 단건 조회용 파이썬 리스트 (NumPy 스칼라 변환 비용 회피)
+        self._lower = self.lower.tolist()
+        self._upper = self.upper.tolist()
+        self._taxes = [
+            [
+                tax if present else None
+                for tax, present in zip(tax_row.tolist(), present_row.tolist())
+            ]
+            for tax_row, present_row in zip(self.taxes, self.has_tax)
+        ]
+        self._high_lower = self.high_lower.tolist()
+        self._high_upper = self.high_upper.tolist()
+        self._high_rate = self.high_rate.tolist()
+        self._high_addition = self.high_addition.tolist()
+        self._high_base_tax = [
+            [
+                tax if present else None
+                for tax, present in zip(tax_row.tolist(), present_row.tolist())
+            ]
+            for tax_row, present_row in zip(self.high_base_tax, self.high_has_base_tax)
+        ]
+
+        # 닫힌 구간 조회에서 경계값(앞 구간 상한 = 뒤 구간 하한)이 속하는 구간
+        self._inclusive_boundaries = {
+            value: self._binary_search_inclusive(value)
+            for value in set(self._lower) & set(self._upper)
+        }
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TAX_TABLE_PATH):
+        """JSON 파일에서 세액표 생성"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _row(self, dependents):
+        """부양가족 수의 행 번호 (세액표에 없으면 None)"""
+        return self.dependent_rows.get(str(dependents))
+
+    def bracket_index(self, income):
+        """소득이 속한 1천만원 이하 구간 번호 (하한 ≤ 소득 < 상한, 없으면 None)"""
+        index = bisect_right(self._lower, income) - 1
+        if index >= 0 and income < self._upper[index]:
+            return index
+        return None
+
+    def high_bracket_index(self, income):
+        """소득이 속한 1천만원 초과 구간 번호 (하한 ≤ 소득 < 상한, 없으면 None)"""
+        index = bisect_right(self._high_lower, income) - 1
+        if index >= 0 and income < self._high_upper[index]:
+            return index
+        return None
+
+    def monthly_tax(self, income, dependents):
+        """
+        월 소득세 조회 (InsuranceCalculator 기준)
+
+        1천만원 이상은 기준세액 + 초과금액 × 98% × 세율 + 추가금액,
+        그 외에는 간이세액표 세액을 반환합니다. 구간은 하한 ≤ 소득 < 상한이며,
+        구간이나 부양가족 수가 세액표에 없으면 0원입니다.
+        """
+        row = self._row(dependents)
+        if income >= HIGH_INCOME_THRESHOLD:
+            index = self.high_bracket_index(income)
+            if index is not None:
+                base_tax = None if row is None else self._high_base_tax[row][index]
+                excess_amount = income - HIGH_INCOME_THRESHOLD
+                return int(
+                    (base_tax or 0)
+                    + (excess_amount * 0.98 * self._high_rate[index])
+                    + self._high_addition[index]
+                )  # 2% 세액공제 적용
+
+        index = self.bracket_index(income)
+        if index is None or row is None:
+            return 0
+        return self._taxes[row][index] or 0
+
+    def monthly_tax_batch(self, incomes, dependents):
+        """
+        월 소득세 일괄 조회 (monthly_tax 와 동일한 결과)
+
+        Args:
+            incomes (array-like): 과세 소득 (정수 또는 실수)
+            dependents (array-like): 부양가족 수 (정수, incomes 와 같은 길이)
+
+        Returns:
+            np.ndarray: 소득세 (int64)
+        """
+        incomes = np.asarray(incomes)
+        incomes = incomes.astype(
+            np.int64 if incomes.dtype.kind in "iub" else np.float64, copy=False
+        )
+        dependents = np.asarray(dependents, dtype=np.int64)
+        result = np.zeros(incomes.shape, dtype=np.int64)
+        if incomes.size == 0:
+            return result
+
+        # 부양가족 수 → 행 번호 (세액표에 없으면 -1)
+        rows = np.searchsorted(self.dependents, dependents)
+        rows = np.minimum(rows, self.dependents.size - 1)
+        rows = np.where(self.dependents[rows] == dependents, rows, -1)
+        known = rows >= 0
+        safe_rows = np.maximum(rows, 0)
+
+        # 1천만원 이하 구간 (1천만원 이상이지만 초과 구간에 없는 소득 포함)
+        index = np.searchsorted(self.lower, incomes, side="right") - 1
+        safe_index = np.clip(index, 0, max(self.lower.size - 1, 0))
+        in_bracket = (
+            (index >= 0)
+            & (incomes < self.upper[safe_index])
+            & known
+            & self.has_tax[safe_rows, safe_index]
+        )
+        result[in_bracket] = self.taxes[safe_rows, safe_index][in_bracket]
+
+        if self.high_lower.size:
+            high_index = np.searchsorted(self.high_lower, incomes, side="right") - 1
+            safe_high = np.clip(high_index, 0, self.high_lower.size - 1)
+            is_high = (
+                (incomes >= HIGH_INCOME_THRESHOLD)
+                & (high_index >= 0)
+                & (incomes < self.high_upper[safe_high])
+            )
+            base_tax = np.where(
+                known & self.high_has_base_tax[safe_rows, safe_high],
+                self.high_base_tax[safe_rows, safe_high],
+                0,
+            )
+            excess_amount = incomes - HIGH_INCOME_THRESHOLD
+            high_tax = (
+                base_tax
+                + (excess_amount * 0.98 * self.high_rate[safe_high])
+                + self.high_addition[safe_high]
+            )
+            result[is_high] = np.trunc(high_tax[is_high]).astype(np.int64)
+        return result
+
+    def _binary_search_inclusive(self, income):
+        """닫힌 구간(하한 ≤ 소득 ≤ 상한) 이진 검색 (경계값 처리 기준)"""
+        left, right = 0, len(self._lower) - 1
+        while left <= right:
+            mid = (left + right) // 2
+            if self._lower[mid] <= income <= self._upper[mid]:
+                return mid
+            elif income < self._lower[mid]:
+                right = mid - 1
+            else:
+                left = mid + 1
+        return None
+
+    def inclusive_bracket_index(self, income):
+        """
+        닫힌 구간(하한 ≤ 소득 ≤ 상한) 기준 구간 번호 (없으면 None)
+
+        경계값은 두 구간에 모두 속하므로, 기존 이진 검색이 고르던 구간을
+        세액표 생성 시 미리 계산해 둔 값으로 반환합니다.
+        """
+        if income in self._inclusive_boundaries:
+            return self._inclusive_boundaries[income]
+        index = bisect_right(self._lower, income) - 1
+        if index >= 0 and income <= self._upper[index]:
+            return index
+        return None
+
+    def simplified_tax(self, income, dependents):
+        """
+        간이세액표 세액 조회 (generate_payment_data.TaxCalculator 기준)
+
+        1천만원 이하는 닫힌 구간 세액, 초과는 기준세액 + int(초과금액 × 98% × 세율)
+        + 추가금액입니다. 세액표에 없는 부양가족 수는 KeyError 가 발생합니다.
+        """
+        key = str(dependents)
+        if income <= HIGH_INCOME_THRESHOLD:
+            index = self.inclusive_bracket_index(income)
+            if index is None:
+                return 0
+            tax = self._taxes[self.dependent_rows[key]][index]
+            if tax is None:
+                raise KeyError(key)
+            return tax
+
+        # 초과 구간도 닫힌 구간이며, 경계값은 앞 구간에 속함
+        index = bisect_left(self._high_upper, income)
+        if index < len(self._high_lower) and self._high_lower[index] <= income:
+            base_tax = self._high_base_tax[self.dependent_rows[key]][index]
+            if base_tax is None:
+                raise KeyError(key)
+            excess_amount = income - HIGH_INCOME_THRESHOLD
+            return (
+                base_tax
+                + int(excess_amount * 0.98 * self._high_rate[index])
+                + self._high_addition[index]
+            )
+        return 0
+
+
+_tax_tables = {}
+_tax_tables_lock = threading.Lock()
+
+
+def get_tax_table(path=DEFAULT_TAX_TABLE_PATH):
+    """프로세스 공용 세액표 반환 (파일 경로별로 최초 호출 시 한 번만 생성)"""
+    key = os.path.abspath(path)
+    table = _tax_tables.get(key)
+    if table is None:
+        with _tax_tables_lock:
+            table = _tax_tables.get(key)
+            if table is None:
+                table = TaxTable.from_file(key)
+                _tax_tables[key] = table
+    return table
@@ -19,10 +19,15 @@ import numpy as np
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
 from typing import List, Dict, Optional
-import json
 import logging
 from pathlib import Path
 from functools import lru_cache
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from utils.insurance_calculator import InsuranceCalculator as BatchInsuranceCalculator
+from utils.tax_table import TaxTable, get_tax_table
 
 # 로깅 설정
 logging.basicConfig(
@@ -141,11 +146,10 @@ class TaxCalculator:
         """세액표 로드"""
         self.tax_table = self._load_tax_table(tax_table_path)
 
-    def _load_tax_table(self, file_path: str) -> dict:
-        """간이세액표 데이터 로드"""
+    def _load_tax_table(self, file_path: str) -> TaxTable:
+        """간이세액표 데이터 로드 (경로별로 한 번만 변환한 세액표 공유)"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return get_tax_table(file_path)
         except Exception as e:
             logger.error(f"세액표 로드 실패: {str(e)}")
             raise
@@ -173,19 +177,7 @@ class TaxCalculator:
 
     def _lookup_tax_table(self, income: int, dependents: int) -> int:
         """간이세액표에서 해당 구간 세액 조회"""
-        # 1천만원 이하 구간
-        if income <= 10_000_000:
-            bracket = self._find_tax_bracket(income)
-            if bracket:
-                return self.tax_table["tax_brackets"][bracket][str(dependents)]
-            return 0
-
-        # 1천만원 초과 구간
-        for bracket, calc_info in self.tax_table["high_income_brackets"].items():
-            start, end = map(int, bracket.split("-"))  # 문자열 키를 숫자로 분리
-            if start <= income <= end:
-                return self._calculate_high_income_tax(income, calc_info, dependents)
-        return 0
+        return self.tax_table.simplified_tax(income, dependents)
 
     def _calculate_child_tax_credit(self, num_children: int) -> int:
         """자녀 세액공제액 계산"""
@@ -198,43 +190,6 @@ class TaxCalculator:
         else:
             return 29_160 + ((num_children - 2) * 25_000)
 
-    def _find_tax_bracket(self, income: int) -> Optional[str]:
-        """해당 소득이 속한 구간 찾기 (이진 검색)"""
-        brackets = sorted(
-            [
-                (int(start), int(end))
-                for bracket in self.tax_table["tax_brackets"].keys()
-                for start, end in [bracket.split("-")]
-            ]
-        )
-
-        left, right = 0, len(brackets) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            start, end = brackets[mid]
-
-            if start <= income <= end:
-                return f"{start}-{end}"
-            elif income < start:
-                right = mid - 1
-            else:
-                left = mid + 1
-
-        return None
-
-    def _calculate_high_income_tax(
-        self, income: int, calc_info: dict, dependents: int
-    ) -> int:
-        """고액 구간 세액 계산"""
-        # 부양가족 수에 따른 기준세액 가져오기
-        base_tax = calc_info["base_tax"][str(dependents)]
-        rate = calc_info["rate"]
-        addition = calc_info["addition"]
-
-        # 계산식: 기준세액 + (초과금액 × 98% × 세율) + 추가금액
-        excess_amount = income - 10_000_000
-        return base_tax + int(excess_amount * 0.98 * rate) + addition
-
 
 class SalaryCalculator:
     """급여 계산 클래스"""
@@ -314,6 +269,19 @@ class PayrollGenerator:
         self.insurance_calc = InsuranceCalculator()
         self.tax_calc = TaxCalculator()
         self.salary_calc = SalaryCalculator()
+        # 월별 4대보험 일괄 계산기 (이 파일의 요율/상한·하한 적용)
+        self.batch_insurance_calc = BatchInsuranceCalculator(
+            rates={
+                "NATIONAL_PENSION": InsuranceCalculator.NP_RATE,
+                "HEALTH_INSURANCE": InsuranceCalculator.HI_RATE,
+                "LONG_TERM_CARE": InsuranceCalculator.LTC_RATE,
+                "EMPLOYMENT_INSURANCE": InsuranceCalculator.EI_RATE,
+            },
+            pension_limits={
+                "MIN": InsuranceCalculator.NP_MIN_INCOME,
+                "MAX": InsuranceCalculator.NP_MAX_INCOME,
+            },
+        )
 
     def generate_payroll(
         self,
@@ -354,15 +322,14 @@ class PayrollGenerator:
                     days=5
                 )  # 급여 지급일 (20일 + 5일 = 25일)
 
-                for employee in employees:
-                    record = self._create_monthly_record(
-                        employee,
+                payment_records.extend(
+                    self._create_monthly_records(
+                        employees,
                         payment_date=payment_date,
                         work_period_start=work_period_start,
                         work_period_end=work_period_end,
                     )
-                    if record:
-                        payment_records.append(record)
+                )
 
                 # 다음 달로 이동
                 current_date = (current_date + timedelta(days=32)).replace(day=1)
@@ -403,107 +370,139 @@ class PayrollGenerator:
 
         return employees
 
-    def _create_monthly_record(
+    def _calculate_monthly_earnings(
         self,
         employee: Employee,
         payment_date: date,
         work_period_start: date,
         work_period_end: date,
-    ) -> Optional[PaymentRecord]:
-        """월별 급여 지급 내역 생성"""
-        try:
-            # 퇴사자 처리
-            if employee.status == "퇴사" and employee.resignation_date:
-                if work_period_start > employee.resignation_date:
-                    return None
-
-                # 퇴직금 계산 (퇴사월에만 지급)
-                severance_pay = self.salary_calc.calculate_severance_pay(
-                    employee=employee, resignation_date=employee.resignation_date
-                )
-
-                # 일할계산
-                monthly_base = self.salary_calc.calculate_prorated_salary(
-                    monthly_salary=employee.base_salary / 12,
-                    start_date=work_period_start,
-                    end_date=employee.resignation_date,
-                    payment_period_start=work_period_start,
-                    payment_period_end=work_period_end,
-                )
-            else:
-                monthly_base = int(employee.base_salary / 12)
-                severance_pay = 0
-
-            position_allowance = int(
-                self.salary_calc.calculate_position_allowance(employee.position)
+    ) -> Optional[dict]:
+        """월별 지급 항목 계산 (퇴사 이후 기간이면 None)"""
+        # 퇴사자 처리
+        if employee.status == "퇴사" and employee.resignation_date:
+            if work_period_start > employee.resignation_date:
+                return None
+
+            # 퇴직금 계산 (퇴사월에만 지급)
+            severance_pay = self.salary_calc.calculate_severance_pay(
+                employee=employee, resignation_date=employee.resignation_date
             )
-            bonus = self.salary_calc.calculate_bonus(employee, payment_date)
 
-            gross_salary = (
-                monthly_base
-                + position_allowance
-                + 100000  # 식대
-                + 100000  # 교통비
-                + bonus
-                + severance_pay  # 퇴직금 추가
+            # 일할계산
+            monthly_base = self.salary_calc.calculate_prorated_salary(
+                monthly_salary=employee.base_salary / 12,
+                start_date=work_period_start,
+                end_date=employee.resignation_date,
+                payment_period_start=work_period_start,
+                payment_period_end=work_period_end,
             )
+        else:
+            monthly_base = int(employee.base_salary / 12)
+            severance_pay = 0
 
-            # 2. 공제액 계산
-            national_pension = self.insurance_calc.calculate_national_pension(
-                gross_salary
-            )
-            health_insurance = self.insurance_calc.calculate_health_insurance(
-                gross_salary
-            )
-            long_term_care = self.insurance_calc.calculate_long_term_care(
-                health_insurance
-            )
-            employment_insurance = self.insurance_calc.calculate_employment_insurance(
-                gross_salary
-            )
+        position_allowance = int(
+            self.salary_calc.calculate_position_allowance(employee.position)
+        )
+        bonus = self.salary_calc.calculate_bonus(employee, payment_date)
+
+        gross_salary = (
+            monthly_base
+            + position_allowance
+            + 100000  # 식대
+            + 100000  # 교통비
+            + bonus
+            + severance_pay  # 퇴직금 추가
+        )
+        return {
+            "monthly_base": monthly_base,
+            "position_allowance": position_allowance,
+            "bonus": bonus,
+            "gross_salary": gross_salary,
+        }
 
-            income_tax, local_tax = self.tax_calc.calculate_tax(
-                monthly_income=gross_salary,
-                dependents=employee.dependents,
-                num_children=employee.tax_deductible_children,
-            )
+    def _create_monthly_records(
+        self,
+        employees: List[Employee],
+        payment_date: date,
+        work_period_start: date,
+        work_period_end: date,
+    ) -> List[PaymentRecord]:
+        """월별 급여 지급 내역 생성 (4대보험은 전체 직원 일괄 계산)"""
+        # 1. 직원별 지급 항목 계산
+        earnings = []
+        for employee in employees:
+            try:
+                values = self._calculate_monthly_earnings(
+                    employee, payment_date, work_period_start, work_period_end
+                )
+                if values:
+                    earnings.append((employee, values))
+            except Exception as e:
+                logger.error(f"월별 급여 지급 내역 생성 실패: {str(e)}")
 
-            # 3. 실지급액 계산
-            deductions = (
-                national_pension
-                + health_insurance
-                + long_term_care
-                + employment_insurance
-                + income_tax
-                + local_tax
-            )
-            net_salary = gross_salary - deductions
-
-            # 4. 지급 내역 생성
-            return PaymentRecord(
-                payment_id=f"{work_period_end.year}{work_period_end.month:02d}{employee.employee_id}",
-                employee_id=employee.employee_id,
-                payment_date=payment_date,
-                base_salary=monthly_base,
-                position_allowance=position_allowance,
-                overtime_pay=0,  # 추후 근태기록 기반으로 계산
-                night_shift_pay=0,  # 추후 근태기록 기반으로 계산
-                holiday_pay=0,  # 추후 근태기록 기반으로 계산
-                meal_allowance=100000,
-                transportation_allowance=100000,
-                bonus=bonus,
-                gross_salary=gross_salary,
-                national_pension=national_pension,
-                health_insurance=health_insurance,
-                long_term_care=long_term_care,
-                employment_insurance=employment_insurance,
-                income_tax=income_tax,
-                local_income_tax=local_tax,
-                net_salary=net_salary,
+        # 2. 공제액 계산 (4대보험 일괄 계산)
+        try:
+            insurances = self.batch_insurance_calc.calculate_insurances_batch(
+                [values["gross_salary"] for _, values in earnings]
             )
         except Exception as e:
             logger.error(f"월별 급여 지급 내역 생성 실패: {str(e)}")
-            return None
+            return []
+        insurances = {column: array.tolist() for column, array in insurances.items()}
+
+        records = []
+        for position, (employee, values) in enumerate(earnings):
+            try:
+                gross_salary = values["gross_salary"]
+                national_pension = insurances["national_pension"][position]
+                health_insurance = insurances["health_insurance"][position]
+                long_term_care = insurances["long_term_care"][position]
+                employment_insurance = insurances["employment_insurance"][position]
+
+                income_tax, local_tax = self.tax_calc.calculate_tax(
+                    monthly_income=gross_salary,
+                    dependents=employee.dependents,
+                    num_children=employee.tax_deductible_children,
+                )
+
+                # 3. 실지급액 계산
+                deductions = (
+                    national_pension
+                    + health_insurance
+                    + long_term_care
+                    + employment_insurance
+                    + income_tax
+                    + local_tax
+                )
+                net_salary = gross_salary - deductions
+
+                # 4. 지급 내역 생성
+                records.append(
+                    PaymentRecord(
+                        payment_id=f"{work_period_end.year}{work_period_end.month:02d}{employee.employee_id}",
+                        employee_id=employee.employee_id,
+                        payment_date=payment_date,
+                        base_salary=values["monthly_base"],
+                        position_allowance=values["position_allowance"],
+                        overtime_pay=0,  # 추후 근태기록 기반으로 계산
+                        night_shift_pay=0,  # 추후 근태기록 기반으로 계산
+                        holiday_pay=0,  # 추후 근태기록 기반으로 계산
+                        meal_allowance=100000,
+                        transportation_allowance=100000,
+                        bonus=values["bonus"],
+                        gross_salary=gross_salary,
+                        national_pension=national_pension,
+                        health_insurance=health_insurance,
+                        long_term_care=long_term_care,
+                        employment_insurance=employment_insurance,
+                        income_tax=income_tax,
+                        local_income_tax=local_tax,
+                        net_salary=net_salary,
+                    )
+                )
+            except Exception as e:
+                logger.error(f"월별 급여 지급 내역 생성 실패: {str(e)}")
+        return records
 
     def _save_payroll_to_file(
         self, payment_records: List[PaymentRecord], file_path: str
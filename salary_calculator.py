@@ -1,8 +1,12 @@
 from datetime import datetime, time, timedelta
 import pandas as pd
-import holidays
 import logging
 import math
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from utils.holiday_calendar import get_calendar
 
 
 class OvertimeCalculator:
@@ -11,7 +15,7 @@ class OvertimeCalculator:
         self.MONTHLY_WORK_HOURS = 209  # 월 소정근로시간
         self.NIGHT_START = time(22, 0)  # 야간근로 시작
         self.NIGHT_END = time(6, 0)  # 야간근로 종료
-        self.kr_holidays = holidays.KR()
+        self.calendar = get_calendar()
 
         # 로깅 설정
         logging.basicConfig(
@@ -245,10 +249,10 @@ class OvertimeCalculator:
 
     def _is_holiday(self, date_str: str) -> bool:
         """공휴일 여부 확인"""
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        return (
-            date_obj in self.kr_holidays or date_obj.weekday() >= 5
-        )  # 토,일 또는 공휴일
+        # 토,일, 공휴일 또는 회사 지정 휴무일
+        return self.calendar.is_holiday(
+            datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+        )
 
     def calculate_total_overtime_pay(
         self, attendance_data: pd.DataFrame, base_salary: float
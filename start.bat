@@ -1,3 +1,3 @@
 @echo off
-start cmd /k "cd backend && poetry run python run_server.py"
+start cmd /k "cd backend && set DB_PROFILE=prod&& poetry run python run_server.py"
 start cmd /k "cd frontend && npm start"
\ No newline at end of file